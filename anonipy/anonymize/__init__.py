@@ -10,17 +10,39 @@ Modules:
     generators: The module containing the generator classes.
     strategies: The module containing the strategy classes.
     pipeline: The module containing the pipeline class.
+    report: The module containing the pipeline run report.
+    stream: The module containing the stream anonymization.
+    async_anonymizer: The module containing the asynchronous anonymizer.
+    config: The module containing the configuration loading functions.
 
 Methods:
     anonymize(text, replacements):
         Anonymize the text based on the replacements.
+    anonymize_stream(chunks, extractor, strategy, lookback):
+        Anonymize the stream of text chunks.
 
 """
 
 from . import extractors
 from . import generators
 from . import strategies
+from . import stream
+from . import async_anonymizer
+from . import config
 from . import pipeline
+from . import report
 from .helpers import anonymize
+from .stream import anonymize_stream
 
-__all__ = ["extractors", "generators", "strategies", "anonymize", "pipeline"]
+__all__ = [
+    "extractors",
+    "generators",
+    "strategies",
+    "anonymize",
+    "anonymize_stream",
+    "pipeline",
+    "report",
+    "stream",
+    "async_anonymizer",
+    "config",
+]
@@ -0,0 +1,323 @@
+"""Module containing the `async_anonymizer`.
+
+The `async_anonymizer` module provides an asyncio facade over an extractor
+and a strategy, which batches the concurrent requests together.
+
+Classes:
+    AsyncAnonymizer: The class representing the asynchronous anonymizer.
+
+"""
+
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple, Union
+
+from .extractors import ExtractorInterface, MultiExtractor
+from .strategies import StrategyInterface
+from ..definitions import Entity, Replacement
+
+# =====================================
+# Main class
+# =====================================
+
+
+class AsyncAnonymizer:
+    """The class representing the asynchronous anonymizer.
+
+    The requests are queued and processed in micro-batches. A batch is
+    processed once it contains `max_batch_size` requests or when the first
+    request in it waited for `max_wait_ms` milliseconds. The batches are
+    processed in a separate thread, so the event loop is not blocked.
+
+    Examples:
+        >>> from anonipy.anonymize.async_anonymizer import AsyncAnonymizer
+        >>> async with AsyncAnonymizer(extractor, strategy) as anonymizer:
+        >>>     anonymized_text, replacements = await anonymizer.anonymize(text)
+
+    Attributes:
+        extractor (ExtractorInterface, MultiExtractor): The extractor to use for entity extraction.
+        strategy (StrategyInterface): The strategy to use for anonymization.
+        max_batch_size (int): The maximum number of requests in a batch.
+        max_wait_ms (float): The maximum number of milliseconds to wait for the batch to fill.
+        max_queue_size (int): The maximum number of queued requests. If `0`, the queue is unbounded.
+        stats (dict): The counters of the processed requests and batches.
+
+    Methods:
+        anonymize(text):
+            Extract the entities from the text and anonymize it.
+        extract(text):
+            Extract the entities from the text.
+        close():
+            Stop processing the requests.
+
+    """
+
+    def __init__(
+        self,
+        extractor: Union[ExtractorInterface, MultiExtractor],
+        strategy: Optional[StrategyInterface] = None,
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5.0,
+        max_queue_size: int = 0,
+    ):
+        """Initialize the asynchronous anonymizer.
+
+        Examples:
+            >>> from anonipy.anonymize.async_anonymizer import AsyncAnonymizer
+            >>> anonymizer = AsyncAnonymizer(extractor, strategy, max_batch_size=16, max_wait_ms=5)
+
+        Args:
+            extractor: The extractor to use for entity extraction.
+            strategy: The strategy to use for anonymization. Required by the `anonymize` method.
+            max_batch_size: The maximum number of requests in a batch.
+            max_wait_ms: The maximum number of milliseconds to wait for the batch to fill.
+            max_queue_size: The maximum number of queued requests. If `0`, the queue is unbounded.
+
+        Raises:
+            ValueError: If `max_batch_size` is not positive, or `max_wait_ms` or `max_queue_size` is negative.
+
+        """
+
+        if max_batch_size <= 0:
+            raise ValueError("The max_batch_size must be a positive number.")
+        if max_wait_ms < 0:
+            raise ValueError("The max_wait_ms must be a non-negative number.")
+        if max_queue_size < 0:
+            raise ValueError("The max_queue_size must be a non-negative number.")
+
+        self.extractor = extractor
+        self.strategy = strategy
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.max_queue_size = max_queue_size
+        self.stats = {"requests": 0, "batches": 0}
+        self._queue = None
+        self._wakeup = None
+        self._worker = None
+        self._executor = None
+
+    @property
+    def queue_size(self) -> int:
+        """The number of queued requests."""
+
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def __aenter__(self) -> "AsyncAnonymizer":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def anonymize(self, text: str) -> Tuple[str, List[Replacement]]:
+        """Extract the entities from the text and anonymize it.
+
+        Examples:
+            >>> anonymized_text, replacements = await anonymizer.anonymize(text)
+
+        Args:
+            text: The text to anonymize.
+
+        Returns:
+            The anonymized text.
+            The list of applied replacements.
+
+        Raises:
+            ValueError: If the strategy is not provided.
+            asyncio.QueueFull: If the request queue is full.
+
+        """
+
+        if self.strategy is None:
+            raise ValueError("The strategy must be provided to anonymize the text.")
+        return await self._submit(text, anonymize=True)
+
+    async def extract(self, text: str) -> List[Entity]:
+        """Extract the entities from the text.
+
+        Examples:
+            >>> entities = await anonymizer.extract(text)
+
+        Args:
+            text: The text to extract entities from.
+
+        Returns:
+            The list of extracted entities.
+
+        Raises:
+            asyncio.QueueFull: If the request queue is full.
+
+        """
+
+        return await self._submit(text, anonymize=False)
+
+    async def close(self) -> None:
+        """Stop processing the requests.
+
+        The pending requests are cancelled.
+
+        Examples:
+            >>> await anonymizer.close()
+
+        """
+
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, _, future = self._queue.get_nowait()
+                future.cancel()
+            self._queue = None
+            self._wakeup = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    # ===========================================
+    # Private methods
+    # ===========================================
+
+    async def _submit(self, text: str, anonymize: bool):
+        """Queue the request and wait for its result.
+
+        Args:
+            text: The text of the request.
+            anonymize: Whether to anonymize the text or only extract the entities.
+
+        Returns:
+            The result of the request.
+
+        Raises:
+            asyncio.QueueFull: If the request queue is full.
+
+        """
+
+        if self._worker is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._wakeup = asyncio.Event()
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="anonipy-async"
+            )
+            self._worker = asyncio.create_task(self._process_requests())
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((text, anonymize, future))
+        self._wakeup.set()
+        return await future
+
+    async def _process_requests(self) -> None:
+        """Collect the requests into batches and process them."""
+
+        while True:
+            batch = []
+            try:
+                await self._collect_batch(batch)
+                await self._run_batch(batch)
+            except asyncio.CancelledError:
+                for _, _, future in batch:
+                    future.cancel()
+                raise
+
+    async def _collect_batch(self, batch: List[tuple]) -> None:
+        """Collect the requests until the batch is full or the wait time passes.
+
+        Args:
+            batch: The list the collected requests are added to.
+
+        """
+
+        batch.append(await self._queue.get())
+        deadline = time.monotonic() + self.max_wait_ms / 1000
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                break
+
+    async def _run_batch(self, batch: List[tuple]) -> None:
+        """Process the batch in the executor and resolve the request futures.
+
+        Args:
+            batch: The list of (text, anonymize, future) requests.
+
+        """
+
+        # skip the requests that were cancelled while waiting
+        batch[:] = [request for request in batch if not request[2].done()]
+        if not batch:
+            return
+
+        self.stats["requests"] += len(batch)
+        self.stats["batches"] += 1
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(
+                self._executor, self._process_batch, list(batch)
+            )
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def _process_batch(self, batch: List[tuple]) -> list:
+        """Process the batch of requests.
+
+        The errors are isolated to the requests that raised them. If the
+        batched extraction fails, the texts are extracted one by one, so
+        only the requests whose texts fail receive the error.
+
+        Args:
+            batch: The list of (text, anonymize, future) requests.
+
+        Returns:
+            The list of results, or the raised errors, in the order of the requests.
+
+        """
+
+        texts = [text for text, _, _ in batch]
+        try:
+            outputs = self.extractor.batch(texts)
+        except Exception:
+            outputs = []
+            for text in texts:
+                try:
+                    outputs.append(self.extractor.batch([text])[0])
+                except Exception as e:
+                    outputs.append(e)
+
+        results = []
+        for (text, anonymize, _), output in zip(batch, outputs):
+            if isinstance(output, Exception):
+                results.append(output)
+                continue
+            _, entities = output
+            if not anonymize:
+                results.append(entities)
+                continue
+            try:
+                results.append(self.strategy.anonymize(text, entities))
+            except Exception as e:
+                results.append(e)
+        return results
@@ -0,0 +1,330 @@
+"""Module containing the `config`.
+
+The `config` module provides functions for building the extractors and the
+strategy from a configuration, stored as a JSON or YAML file.
+
+The configuration is a dictionary with the following keys:
+
+- `extractors`: The list of extractor configurations. Each contains the
+  `type` of the extractor (e.g. `NERExtractor`) and its arguments. The `lang`
+  argument is given as the language name (e.g. `ENGLISH`) or code (e.g. `en`).
+- `multi_extractor`: The arguments of the multi extractor, used when
+  multiple extractors are provided.
+- `strategy`: The strategy configuration, containing the `type` of the
+  strategy (e.g. `RedactionStrategy`) and its arguments. The `mapping` of the
+  pseudonymization strategy is given as the `module:function` import path.
+- `pipeline`: The arguments of the pipeline (e.g. `chunk_size`).
+
+The `RoutingExtractor` type contains its own `extractors` and
+`multi_extractor` keys, without the `lang` arguments. They are used to build
+the extractors of each language the texts are routed to, with the
+`languages` and `default_lang` given as the language names or codes.
+
+Examples:
+    ```yaml
+    extractors:
+      - type: NERExtractor
+        lang: ENGLISH
+        labels:
+          - {label: name, type: string}
+      - type: PatternExtractor
+        labels:
+          - {label: date, type: date, regex: '\\d{4}-\\d{2}-\\d{2}'}
+    multi_extractor:
+      parallel: true
+      merge_policy: highest_score
+    strategy:
+      type: RedactionStrategy
+    pipeline:
+      chunk_size: 1048576
+      memory_budget: 4GB
+    ```
+
+Methods:
+    load_config(path):
+        Load the configuration from the JSON or YAML file.
+    build_extractor(config):
+        Build the extractor from the configuration.
+    build_strategy(config):
+        Build the strategy from the configuration.
+    build_pipeline(config):
+        Build the pipeline from the configuration.
+
+"""
+
+import os
+import json
+import importlib
+from functools import partial
+from typing import Any, Union
+
+from . import extractors as extractor_classes
+from . import strategies as strategy_classes
+
+from .extractors import ExtractorInterface, MultiExtractor, RoutingExtractor
+from .pipeline import Pipeline
+from .strategies import StrategyInterface
+from ..constants import LANGUAGES
+from ..utils.prescreen import PreScreener
+
+# =====================================
+# Helper functions
+# =====================================
+
+
+def _get_language(lang: Union[str, list, tuple]) -> tuple:
+    """Get the language from its name or code.
+
+    Args:
+        lang: The language name (e.g. `ENGLISH`), code (e.g. `en`) or tuple.
+
+    Returns:
+        The language tuple.
+
+    Raises:
+        ValueError: If the language is not supported.
+
+    """
+
+    if isinstance(lang, (list, tuple)):
+        return tuple(lang)
+    for name in dir(LANGUAGES):
+        value = getattr(LANGUAGES, name)
+        if isinstance(value, tuple) and lang.lower() in (name.lower(), value[0]):
+            return value
+    raise ValueError(f"The language is not supported: {lang}")
+
+
+def _import_object(path: str) -> Any:
+    """Import the object from its `module:attribute` path.
+
+    Args:
+        path: The import path of the object.
+
+    Returns:
+        The imported object.
+
+    Raises:
+        ValueError: If the path is not in the `module:attribute` format.
+
+    """
+
+    module_name, _, attribute = path.partition(":")
+    if not module_name or not attribute:
+        raise ValueError(
+            f"The import path must be in the module:attribute format: {path}"
+        )
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def _get_class(module, config: dict, interface: type) -> type:
+    """Get the class named by the configuration `type`.
+
+    Args:
+        module: The module containing the classes.
+        config: The configuration containing the `type`.
+        interface: The interface the class must implement.
+
+    Returns:
+        The class.
+
+    Raises:
+        ValueError: If the type is missing or not supported.
+
+    """
+
+    if "type" not in config:
+        raise ValueError("The configuration must contain the type.")
+    cls = getattr(module, config["type"], None)
+    if not isinstance(cls, type) or not issubclass(cls, interface):
+        raise ValueError(f"The type is not supported: {config['type']}")
+    return cls
+
+
+def _build_language_extractor(
+    config: dict, lang: tuple
+) -> Union[ExtractorInterface, MultiExtractor]:
+    """Build the extractor of the language for the routing extractor.
+
+    Args:
+        config: The routing extractor configuration, containing the `extractors` and the optional `multi_extractor` arguments.
+        lang: The language of the extractors.
+
+    Returns:
+        The extractor, or the multi extractor if multiple extractors are configured.
+
+    """
+
+    return build_extractor(
+        {
+            "extractors": [{**c, "lang": lang} for c in config.get("extractors", [])],
+            "multi_extractor": config.get("multi_extractor", {}),
+        }
+    )
+
+
+def _build_routing_extractor(kwargs: dict) -> RoutingExtractor:
+    """Build the routing extractor from its arguments.
+
+    Args:
+        kwargs: The arguments of the routing extractor, including the `extractors` and `multi_extractor` configurations.
+
+    Returns:
+        The routing extractor.
+
+    Raises:
+        ValueError: If no extractors are configured or a language is not supported.
+
+    """
+
+    kwargs = dict(kwargs)
+    language_config = {
+        "extractors": kwargs.pop("extractors", []),
+        "multi_extractor": kwargs.pop("multi_extractor", {}),
+    }
+    if len(language_config["extractors"]) == 0:
+        raise ValueError("The routing extractor must contain at least one extractor.")
+    if "languages" in kwargs:
+        kwargs["languages"] = [_get_language(lang) for lang in kwargs["languages"]]
+    if "default_lang" in kwargs:
+        kwargs["default_lang"] = _get_language(kwargs["default_lang"])
+    return RoutingExtractor(
+        partial(_build_language_extractor, language_config), **kwargs
+    )
+
+
+# =====================================
+# Main functions
+# =====================================
+
+
+def load_config(path: str) -> dict:
+    """Load the configuration from the JSON or YAML file.
+
+    The YAML files require the `pyyaml` package.
+
+    Examples:
+        >>> from anonipy.anonymize.config import load_config
+        >>> config = load_config("config.yaml")
+
+    Args:
+        path: The path to the configuration file.
+
+    Returns:
+        The configuration.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file format is not supported.
+
+    """
+
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"The file does not exist: {path}")
+
+    _, extension = os.path.splitext(path)
+    with open(path, "r", encoding="utf-8") as f:
+        if extension.lower() == ".json":
+            return json.load(f)
+        if extension.lower() in [".yaml", ".yml"]:
+            try:
+                import yaml
+            except ImportError as e:
+                raise ImportError(
+                    "The pyyaml package is required to load YAML configurations."
+                ) from e
+            return yaml.safe_load(f)
+    raise ValueError(f"The file format is not supported: {extension}")
+
+
+def build_extractor(config: dict) -> Union[ExtractorInterface, MultiExtractor]:
+    """Build the extractor from the configuration.
+
+    Examples:
+        >>> from anonipy.anonymize.config import build_extractor
+        >>> extractor = build_extractor(config)
+
+    Args:
+        config: The configuration containing the `extractors`.
+
+    Returns:
+        The extractor, or the multi extractor if multiple extractors are configured.
+
+    Raises:
+        ValueError: If no extractors are configured or an extractor type is not supported.
+
+    """
+
+    extractors = []
+    for extractor_config in config.get("extractors", []):
+        cls = _get_class(extractor_classes, extractor_config, ExtractorInterface)
+        kwargs = {k: v for k, v in extractor_config.items() if k != "type"}
+        if cls is RoutingExtractor:
+            extractors.append(_build_routing_extractor(kwargs))
+            continue
+        if "lang" in kwargs:
+            kwargs["lang"] = _get_language(kwargs["lang"])
+        if isinstance(kwargs.get("prescreen"), dict):
+            kwargs["prescreen"] = PreScreener(**kwargs["prescreen"])
+        if "path" in kwargs:
+            # load the precompiled extractor
+            extractors.append(cls.load(**kwargs))
+        else:
+            extractors.append(cls(**kwargs))
+
+    if len(extractors) == 0:
+        raise ValueError("The configuration must contain at least one extractor.")
+    if len(extractors) == 1:
+        return extractors[0]
+    return MultiExtractor(extractors, **config.get("multi_extractor", {}))
+
+
+def build_strategy(config: dict) -> StrategyInterface:
+    """Build the strategy from the configuration.
+
+    Examples:
+        >>> from anonipy.anonymize.config import build_strategy
+        >>> strategy = build_strategy(config)
+
+    Args:
+        config: The configuration containing the `strategy`.
+
+    Returns:
+        The strategy.
+
+    Raises:
+        ValueError: If the strategy is not configured or its type is not supported.
+
+    """
+
+    if "strategy" not in config:
+        raise ValueError("The configuration must contain the strategy.")
+    strategy_config = config["strategy"]
+    cls = _get_class(strategy_classes, strategy_config, StrategyInterface)
+    kwargs = {k: v for k, v in strategy_config.items() if k != "type"}
+    if isinstance(kwargs.get("mapping"), str):
+        kwargs["mapping"] = _import_object(kwargs["mapping"])
+    return cls(**kwargs)
+
+
+def build_pipeline(config: dict) -> Pipeline:
+    """Build the pipeline from the configuration.
+
+    Examples:
+        >>> from anonipy.anonymize.config import build_pipeline
+        >>> pipeline = build_pipeline(config)
+
+    Args:
+        config: The configuration containing the `extractors`, the `strategy` and the optional `pipeline` arguments.
+
+    Returns:
+        The pipeline.
+
+    Raises:
+        ValueError: If the extractors or the strategy are not configured correctly.
+
+    """
+
+    return Pipeline(
+        build_extractor(config), build_strategy(config), **config.get("pipeline", {})
+    )
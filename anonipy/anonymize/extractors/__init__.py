@@ -6,13 +6,24 @@ information within a document.
 Classes:
     NERExtractor: The class representing the named entity recognition (NER) extractor.
     PatternExtractor: The class representing the pattern extractor.
+    DictionaryExtractor: The class representing the dictionary extractor.
     MultiExtractor: The class representing the multi extractor.
+    RoutingExtractor: The class representing the language routing extractor.
 
 """
 
 from .interface import ExtractorInterface
+from .dictionary_extractor import DictionaryExtractor
 from .multi_extractor import MultiExtractor
 from .ner_extractor import NERExtractor
 from .pattern_extractor import PatternExtractor
+from .routing_extractor import RoutingExtractor
 
-__all__ = ["ExtractorInterface", "MultiExtractor", "NERExtractor", "PatternExtractor"]
+__all__ = [
+    "ExtractorInterface",
+    "DictionaryExtractor",
+    "MultiExtractor",
+    "NERExtractor",
+    "PatternExtractor",
+    "RoutingExtractor",
+]
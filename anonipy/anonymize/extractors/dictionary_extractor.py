@@ -0,0 +1,395 @@
+import importlib
+from typing import List, Tuple, Optional
+
+from spacy import displacy, util
+from spacy.tokens import Doc, Span
+from spacy.language import Language
+
+from ..helpers import (
+    convert_spacy_to_entity,
+    create_label_index,
+    create_spacy_entities,
+    detect_repeated_entities,
+    filter_entities,
+    get_doc_entity_spans,
+    run_pipeline_components,
+    set_doc_entity_spans,
+)
+from ...constants import LANGUAGES
+from ...definitions import Entity
+from ...utils.aho_corasick import AhoCorasick
+from ...utils.colors import get_label_color
+
+from .interface import ExtractorInterface
+
+# ===============================================
+# Helper functions
+# ===============================================
+
+
+def _is_word_char(c: str) -> bool:
+    """Check whether the character is a word character.
+
+    Args:
+        c: The character to check.
+
+    Returns:
+        `True` if the character is alphanumeric or an underscore, `False` otherwise.
+
+    """
+
+    return c.isalnum() or c == "_"
+
+
+# ===============================================
+# Extractor class
+# ===============================================
+
+
+class DictionaryExtractor(ExtractorInterface):
+    """The class representing the dictionary extractor.
+
+    The dictionary extractor finds the occurrences of the provided terms in
+    the text. The terms are compiled into an Aho-Corasick automaton, which can
+    be saved to disk and memory-mapped when loaded.
+
+    Examples:
+        >>> from anonipy.constants import LANGUAGES
+        >>> from anonipy.anonymize.extractors import DictionaryExtractor
+        >>> labels = [{"label": "name", "type": "string", "terms": ["John Doe", "Jane Doe"]}]
+        >>> extractor = DictionaryExtractor(labels, lang=LANGUAGES.ENGLISH)
+        >>> extractor("John Doe is a 19 year old software engineer.", detect_repeats=False)
+        Doc, [Entity]
+
+    Attributes:
+        labels (List[dict]): The list of labels to extract, without the terms.
+        label_index (dict): The mapping between the label names and their type, regex and compiled regex.
+        lang (str): The language of the text to extract.
+        case_sensitive (bool): Whether the terms are matched case-sensitively.
+        whole_word (bool): Whether the terms are matched only as whole words.
+        pipeline (Language): The spacy pipeline for extracting entities.
+        automaton (AhoCorasick): The automaton used to find the terms.
+
+    Methods:
+        __call__(self, text):
+            Extract the entities from the text.
+        annotate(self, doc):
+            Extract the entities from an already tokenized document.
+        display(self, doc):
+            Display the entities in the text.
+        save(self, path):
+            Save the compiled terms to the directory.
+        load(path):
+            Load the dictionary extractor from the directory.
+
+    """
+
+    def __init__(
+        self,
+        labels: List[dict],
+        *args,
+        lang: LANGUAGES = LANGUAGES.ENGLISH,
+        spacy_style: str = "ent",
+        case_sensitive: bool = False,
+        whole_word: bool = True,
+        automaton: Optional[AhoCorasick] = None,
+        **kwargs,
+    ):
+        """Initialize the dictionary extractor.
+
+        Examples:
+            >>> from anonipy.constants import LANGUAGES
+            >>> from anonipy.anonymize.extractors import DictionaryExtractor
+            >>> labels = [{"label": "name", "type": "string", "terms": ["John Doe", "Jane Doe"]}]
+            >>> extractor = DictionaryExtractor(labels, lang=LANGUAGES.ENGLISH)
+            DictionaryExtractor()
+
+        Args:
+            labels: The list of labels and their `terms` to extract.
+            lang: The language of the text to extract.
+            spacy_style: The style the entities should be stored in the spacy doc. Options: `ent` or `span`.
+            case_sensitive: Whether the terms are matched case-sensitively.
+            whole_word: Whether the terms are matched only as whole words. If `False`, the terms are also matched inside words and the entities are expanded to the containing tokens.
+            automaton: The precompiled automaton. If provided, the label terms are not compiled.
+
+        """
+
+        super().__init__(labels, *args, **kwargs)
+        self.lang = lang
+        self.spacy_style = spacy_style
+        self.whole_word = whole_word
+        self.labels = [{k: v for k, v in l.items() if k != "terms"} for l in labels]
+        self.label_index = create_label_index(self.labels)
+        self.automaton = automaton or self._prepare_automaton(labels, case_sensitive)
+        self.case_sensitive = self.automaton.case_sensitive
+        self.pipeline = self._prepare_pipeline()
+
+    def __call__(
+        self, text: str, detect_repeats: bool = False, *args, **kwargs
+    ) -> Tuple[Doc, List[Entity]]:
+        """Extract the entities from the text.
+
+        Examples:
+            >>> extractor("John Doe is a 19 year old software engineer.", detect_repeats=False)
+            Doc, [Entity]
+
+        Args:
+            text: The text to extract entities from.
+            detect_repeats: Whether to check text again for repeated entities.
+
+        Returns:
+            The spacy document.
+            The list of extracted entities.
+
+        """
+
+        doc = self.pipeline(text)
+        return self._extract_entities(doc, detect_repeats)
+
+    def annotate(
+        self, doc: Doc, detect_repeats: bool = False, *args, **kwargs
+    ) -> Tuple[Doc, List[Entity]]:
+        """Extract the entities from an already tokenized document.
+
+        The document must be tokenized with the tokenizer of the same language.
+        This allows multiple extractors to share the tokenization of the text.
+
+        Examples:
+            >>> doc = extractor.pipeline.make_doc("John Doe is a 19 year old software engineer.")
+            >>> extractor.annotate(doc, detect_repeats=False)
+            Doc, [Entity]
+
+        Args:
+            doc: The tokenized spacy document to extract entities from.
+            detect_repeats: Whether to check text again for repeated entities.
+
+        Returns:
+            The spacy document.
+            The list of extracted entities.
+
+        """
+
+        doc = run_pipeline_components(self.pipeline, doc)
+        return self._extract_entities(doc, detect_repeats)
+
+    def display(self, doc: Doc, page: bool = False, jupyter: bool = None) -> str:
+        """Display the entities in the text.
+
+        Examples:
+            >>> doc, entities = extractor("John Doe is a 19 year old software engineer.")
+            >>> extractor.display(doc)
+            HTML
+
+        Args:
+            doc: The spacy doc to display.
+            page: Whether to display the doc in a web browser.
+            jupyter: Whether to display the doc in a jupyter notebook.
+
+        Returns:
+            The HTML representation of the document and the extracted entities.
+
+        """
+
+        options = {
+            "colors": {l["label"]: get_label_color(l["label"]) for l in self.labels}
+        }
+        return displacy.render(
+            doc, style=self.spacy_style, options=options, page=page, jupyter=jupyter
+        )
+
+    def save(self, path: str) -> None:
+        """Save the compiled terms to the directory.
+
+        Examples:
+            >>> extractor.save("path/to/dictionary")
+
+        Args:
+            path: The directory to save the compiled terms to.
+
+        """
+
+        self.automaton.metadata = {
+            "labels": self.labels,
+            "whole_word": self.whole_word,
+        }
+        self.automaton.save(path)
+
+    @classmethod
+    def load(
+        cls,
+        path: str,
+        lang: LANGUAGES = LANGUAGES.ENGLISH,
+        spacy_style: str = "ent",
+        mmap: bool = True,
+    ) -> "DictionaryExtractor":
+        """Load the dictionary extractor from the directory.
+
+        Examples:
+            >>> from anonipy.anonymize.extractors import DictionaryExtractor
+            >>> extractor = DictionaryExtractor.load("path/to/dictionary")
+
+        Args:
+            path: The directory containing the saved dictionary extractor.
+            lang: The language of the text to extract.
+            spacy_style: The style the entities should be stored in the spacy doc. Options: `ent` or `span`.
+            mmap: Whether to memory-map the compiled terms instead of reading them into memory.
+
+        Returns:
+            The loaded dictionary extractor.
+
+        """
+
+        automaton = AhoCorasick.load(path, mmap=mmap)
+        return cls(
+            automaton.metadata["labels"],
+            lang=lang,
+            spacy_style=spacy_style,
+            whole_word=automaton.metadata["whole_word"],
+            automaton=automaton,
+        )
+
+    # ===========================================
+    # Private methods
+    # ===========================================
+
+    def _extract_entities(
+        self, doc: Doc, detect_repeats: bool
+    ) -> Tuple[Doc, List[Entity]]:
+        """Extract the entities from the processed spacy doc.
+
+        Args:
+            doc: The processed spacy doc.
+            detect_repeats: Whether to check text again for repeated entities.
+
+        Returns:
+            The spacy document.
+            The list of extracted entities.
+
+        """
+
+        self._match_terms(doc)
+        anoni_entities, spacy_entities = self._prepare_entities(doc)
+
+        if detect_repeats:
+            anoni_entities = detect_repeated_entities(
+                doc, anoni_entities, self.spacy_style
+            )
+
+        create_spacy_entities(doc, anoni_entities, self.spacy_style)
+
+        return doc, anoni_entities
+
+    def _match_terms(self, doc: Doc) -> None:
+        """Find the terms in the doc and store them as the doc entities.
+
+        The overlapping matches are resolved by keeping the longest ones. When
+        matching inside words, the matches are expanded to the containing tokens.
+
+        Args:
+            doc: The spacy doc to find the terms in.
+
+        """
+
+        text = doc.text
+        matches = [
+            Entity(text[start:end], self.labels[value]["label"], start, end, 1.0)
+            for start, end, value in self.automaton.finditer(text)
+            if not self.whole_word or self._is_whole_word(text, start, end)
+        ]
+
+        alignment_mode = "strict" if self.whole_word else "expand"
+        spans = []
+        for match in filter_entities(matches):
+            span = doc.char_span(
+                match.start_index,
+                match.end_index,
+                label=match.label,
+                alignment_mode=alignment_mode,
+            )
+            if not span:
+                continue
+            span._.score = 1.0
+            spans.append(span)
+        if not self.whole_word:
+            spans = util.filter_spans(spans)
+        set_doc_entity_spans(doc, spans, self.spacy_style)
+
+    def _is_whole_word(self, text: str, start: int, end: int) -> bool:
+        """Check whether the match is a whole word.
+
+        Args:
+            text: The text containing the match.
+            start: The start position of the match.
+            end: The end position of the match.
+
+        Returns:
+            `True` if the match is not surrounded by word characters, `False` otherwise.
+
+        """
+
+        return (start == 0 or not _is_word_char(text[start - 1])) and (
+            end == len(text) or not _is_word_char(text[end])
+        )
+
+    def _prepare_automaton(
+        self, labels: List[dict], case_sensitive: bool
+    ) -> AhoCorasick:
+        """Compile the label terms into the automaton.
+
+        Args:
+            labels: The list of labels and their terms.
+            case_sensitive: Whether the terms are matched case-sensitively.
+
+        Returns:
+            The compiled automaton.
+
+        """
+
+        terms, values = [], []
+        for i, label in enumerate(labels):
+            label_terms = label.get("terms", [])
+            terms.extend(label_terms)
+            values.extend([i] * len(label_terms))
+        return AhoCorasick.from_terms(terms, values, case_sensitive=case_sensitive)
+
+    def _prepare_pipeline(self) -> Language:
+        """Prepare the spacy pipeline.
+
+        Prepares the pipeline for processing the text in the corresponding
+        provided language.
+
+        Returns:
+            The spacy text processing and extraction pipeline.
+
+        """
+
+        # load the appropriate parser for the language
+        module_lang, class_lang = self.lang[0].lower(), self.lang[1].lower().title()
+        language_module = importlib.import_module(f"spacy.lang.{module_lang}")
+        language_class = getattr(language_module, class_lang)
+        # initialize the language parser
+        nlp = language_class()
+        nlp.add_pipe("sentencizer")
+        return nlp
+
+    def _prepare_entities(self, doc: Doc) -> Tuple[List[Entity], List[Span]]:
+        """Prepares the anonipy and spacy entities.
+
+        Args:
+            doc: The spacy doc to prepare.
+
+        Returns:
+            The list of anonipy entities.
+            The list of spacy entities.
+
+        """
+
+        anoni_entities = []
+        spacy_entities = []
+        for e in get_doc_entity_spans(doc, self.spacy_style):
+            label = self.label_index[e.label_]
+            anoni_entities.append(
+                convert_spacy_to_entity(e, label["type"], label["regex"])
+            )
+            spacy_entities.append(e)
+        return anoni_entities, spacy_entities
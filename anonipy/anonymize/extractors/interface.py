@@ -12,6 +12,8 @@ class ExtractorInterface:
     Methods:
         __call__(text):
             Extract entities from the text.
+        batch(texts):
+            Extract entities from each of the texts.
 
     """
 
@@ -20,3 +22,8 @@ class ExtractorInterface:
 
     def __call__(self, text: str, *args, **kwargs) -> Tuple[Doc, List[Entity]]:
         pass
+
+    def batch(
+        self, texts: List[str], *args, **kwargs
+    ) -> List[Tuple[Doc, List[Entity]]]:
+        return [self(text, *args, **kwargs) for text in texts]
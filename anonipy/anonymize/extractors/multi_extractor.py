@@ -1,14 +1,30 @@
-from typing import List, Tuple
+import re
+import time
 import itertools
+import threading
+from functools import partial
+from typing import Callable, List, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 
 from spacy import displacy
 from spacy.tokens import Doc
 
+from ...constants import MERGE_POLICIES
 from ...definitions import Entity
 from ...utils.colors import get_label_color
-from ..helpers import merge_entities
+from ..helpers import (
+    create_spacy_entities,
+    detect_repeated_entities,
+    merge_entities,
+    shift_entities,
+)
 
 from .interface import ExtractorInterface
+from .ner_extractor import NERExtractor
+
+# pattern of the characters that are left for the heavy extractors
+_UNRESOLVED_CHAR = re.compile(r"\w")
 
 # ===============================================
 # Extractor class
@@ -32,16 +48,44 @@ class MultiExtractor:
     Attributes:
         extractors (List[ExtractorInterface]):
             The list of extractors to use.
+        parallel (bool):
+            Whether to run the extractors concurrently.
+        max_workers (int):
+            The maximum number of threads used to run the extractors.
+        timeout (float):
+            The maximum number of seconds to wait for each extractor, counted from when it is submitted.
+        share_tokenization (bool):
+            Whether the extractors of the same language share the tokenized text.
+        cascade (bool):
+            Whether the NER extractors only process the lines not resolved by the other extractors.
+        cascade_score_th (float):
+            The minimum score of the entities that resolve the text in the cascade.
+        merge_policy (str):
+            The policy of resolving the overlapping entities of the extractors.
 
     Methods:
         __call__(self, text):
             Extract the entities fron the text using the provided extractors.
+        batch(self, texts):
+            Extract the entities from each of the texts.
         display(self, doc):
             Display the entities extracted from the text document.
+        close(self):
+            Shut down the threads used to run the extractors.
 
     """
 
-    def __init__(self, extractors: List[ExtractorInterface]):
+    def __init__(
+        self,
+        extractors: List[ExtractorInterface],
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+        share_tokenization: bool = True,
+        cascade: bool = False,
+        cascade_score_th: float = 1.0,
+        merge_policy: str = MERGE_POLICIES.LONGEST,
+    ):
         """Initialize the multi extractor.
 
         Examples:
@@ -56,14 +100,43 @@ class MultiExtractor:
 
         Args:
             extractors: The list of extractors to use.
+            parallel: Whether to run the extractors concurrently in a thread pool.
+            max_workers: The maximum number of threads. Defaults to the number of extractors.
+            timeout: The maximum number of seconds to wait for each extractor, counted from when it is submitted. Only used when `parallel=True`. After a timeout, the thread pool is replaced, so the extractor still running does not block the later calls.
+            share_tokenization: Whether to tokenize the text once per language and share it between the extractors.
+            cascade: Whether to first run the cheap extractors and then run the NER extractors only on the lines that contain text not covered by the cheap extractors' entities.
+            cascade_score_th: The minimum score of the cheap extractors' entities that are considered resolved in the cascade.
+            merge_policy: The policy of resolving the overlapping entities of the extractors. Options: `longest`, `highest_score`, `priority` (the extractors listed first are preferred) or `union`. The `union` policy keeps the overlapping entities, so it requires all extractors to use the `span` spacy style.
+
+        Raises:
+            ValueError: If no extractors are provided, an extractor is not valid, the timeout is not positive, the merge policy is not supported, or the `union` policy is used with the extractors not using the `span` spacy style.
 
         """
         if len(extractors) == 0:
             raise ValueError("At least one extractor must be provided.")
         if not all(isinstance(e, ExtractorInterface) for e in extractors):
             raise ValueError("All extractors must be instances of ExtractorInterface.")
+        if timeout is not None and timeout <= 0:
+            raise ValueError("The timeout must be a positive number.")
+        if not MERGE_POLICIES.is_valid(merge_policy):
+            raise ValueError(f"The merge policy is not supported: {merge_policy}")
+        if merge_policy == MERGE_POLICIES.UNION and any(
+            getattr(e, "spacy_style", "ent") != "span" for e in extractors
+        ):
+            raise ValueError(
+                "The union merge policy requires all extractors to use the span spacy style."
+            )
 
         self.extractors = extractors
+        self.parallel = parallel
+        self.max_workers = max_workers or len(extractors)
+        self.timeout = timeout
+        self.share_tokenization = share_tokenization
+        self.cascade = cascade
+        self.cascade_score_th = cascade_score_th
+        self.merge_policy = merge_policy
+        self._executor = None
+        self._executor_lock = threading.Lock()
 
     def __call__(
         self, text: str, detect_repeats: bool = False
@@ -82,13 +155,66 @@ class MultiExtractor:
             The list of extractor outputs containing the tuple (spacy document, extracted entities).
             The list of joint entities.
 
+        Raises:
+            TimeoutError: If an extractor does not finish within the timeout.
+
         """
 
-        extractor_outputs = [e(text, detect_repeats) for e in self.extractors]
-        joint_entities = merge_entities(extractor_outputs)
+        docs = self._tokenize(text)
+        if self.cascade:
+            extractor_outputs = self._run_cascade(text, docs, detect_repeats)
+        else:
+            extractor_outputs = self._run_tasks(
+                [
+                    (e, partial(self._run_extractor, e, text, doc, detect_repeats))
+                    for e, doc in zip(self.extractors, docs)
+                ]
+            )
+        joint_entities = merge_entities(extractor_outputs, self.merge_policy)
 
         return extractor_outputs, joint_entities
 
+    def batch(
+        self, texts: List[str], detect_repeats: bool = False
+    ) -> List[Tuple[List[Tuple[Doc, List[Entity]]], List[Entity]]]:
+        """Extract the entities from each of the texts.
+
+        Each extractor processes all texts with its `batch` method. In the
+        cascade mode, the texts are processed one by one.
+
+        Examples:
+            >>> extractor.batch(["John Doe is a software engineer.", "Jane Doe is a doctor."])
+            [([(Doc, [Entity]), (Doc, [Entity])], [Entity]), ([(Doc, [Entity]), (Doc, [Entity])], [Entity])]
+
+        Args:
+            texts: The texts to extract entities from.
+            detect_repeats: Whether to check text again for repeated entities.
+
+        Returns:
+            The list of the multi extractor outputs, in the order of the texts.
+
+        Raises:
+            TimeoutError: If an extractor does not finish within the timeout.
+
+        """
+
+        if self.cascade:
+            return [self(text, detect_repeats) for text in texts]
+
+        batch_outputs = self._run_tasks(
+            [(e, partial(e.batch, texts, detect_repeats)) for e in self.extractors]
+        )
+        outputs = []
+        for extractor_outputs in zip(*batch_outputs):
+            extractor_outputs = list(extractor_outputs)
+            outputs.append(
+                (
+                    extractor_outputs,
+                    merge_entities(extractor_outputs, self.merge_policy),
+                )
+            )
+        return outputs
+
     def display(self, doc: Doc, page: bool = False, jupyter: bool = None) -> str:
         """Display the entities in the text.
 
@@ -114,3 +240,291 @@ class MultiExtractor:
         return displacy.render(
             doc, style="ent", options=options, page=page, jupyter=jupyter
         )
+
+    def close(self) -> None:
+        """Shut down the threads used to run the extractors.
+
+        Examples:
+            >>> extractor = MultiExtractor(extractors, parallel=True)
+            >>> extractor.close()
+
+        """
+
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    # ===========================================
+    # Private methods
+    # ===========================================
+
+    def _tokenize(self, text: str) -> List[Optional[Doc]]:
+        """Tokenize the text once per language.
+
+        The first extractor of each language receives the tokenized doc, while
+        the other extractors of the same language receive its copies, made before
+        any extractor annotates it. Extractors that do not support the `annotate`
+        method receive None.
+
+        Args:
+            text: The text to tokenize.
+
+        Returns:
+            The list of tokenized docs, in the order of the extractors.
+
+        """
+
+        docs = []
+        shared_docs = {}
+        for extractor in self.extractors:
+            if not self.share_tokenization or not hasattr(extractor, "annotate"):
+                docs.append(None)
+                continue
+            key = tuple(extractor.lang)
+            if key in shared_docs:
+                docs.append(shared_docs[key].copy())
+                continue
+            doc = extractor.pipeline.make_doc(text)
+            if "sentencizer" in extractor.pipeline.pipe_names:
+                doc = extractor.pipeline.get_pipe("sentencizer")(doc)
+            shared_docs[key] = doc
+            docs.append(doc)
+        return docs
+
+    def _run_extractor(
+        self,
+        extractor: ExtractorInterface,
+        text: str,
+        doc: Optional[Doc],
+        detect_repeats: bool,
+    ) -> Tuple[Doc, List[Entity]]:
+        """Run the extractor on the tokenized doc or, if not available, the text.
+
+        Args:
+            extractor: The extractor to run.
+            text: The text to extract entities from.
+            doc: The tokenized doc or None.
+            detect_repeats: Whether to check text again for repeated entities.
+
+        Returns:
+            The extractor output.
+
+        """
+
+        if doc is None:
+            return extractor(text, detect_repeats)
+        return extractor.annotate(doc, detect_repeats)
+
+    def _run_cascade(
+        self, text: str, docs: List[Optional[Doc]], detect_repeats: bool
+    ) -> List[Tuple[Doc, List[Entity]]]:
+        """Run the cheap extractors first and the NER extractors on the unresolved text.
+
+        Args:
+            text: The text to extract entities from.
+            docs: The tokenized docs, in the order of the extractors.
+            detect_repeats: Whether to check text again for repeated entities.
+
+        Returns:
+            The list of extractor outputs, in the order of the extractors.
+
+        """
+
+        heavy = [isinstance(e, NERExtractor) for e in self.extractors]
+        cheap_ids = [i for i, is_heavy in enumerate(heavy) if not is_heavy]
+        heavy_ids = [i for i, is_heavy in enumerate(heavy) if is_heavy]
+
+        extractor_outputs = [None] * len(self.extractors)
+        cheap_outputs = self._run_tasks(
+            [
+                (
+                    self.extractors[i],
+                    partial(
+                        self._run_extractor,
+                        self.extractors[i],
+                        text,
+                        docs[i],
+                        detect_repeats,
+                    ),
+                )
+                for i in cheap_ids
+            ]
+        )
+        for i, output in zip(cheap_ids, cheap_outputs):
+            extractor_outputs[i] = output
+
+        resolved_entities = [
+            entity
+            for _, entities in cheap_outputs
+            for entity in entities
+            if entity.score >= self.cascade_score_th
+        ]
+        segments = self._get_unresolved_segments(text, resolved_entities)
+        heavy_outputs = self._run_tasks(
+            [
+                (
+                    self.extractors[i],
+                    partial(
+                        self._run_on_segments,
+                        self.extractors[i],
+                        text,
+                        docs[i],
+                        segments,
+                        detect_repeats,
+                    ),
+                )
+                for i in heavy_ids
+            ]
+        )
+        for i, output in zip(heavy_ids, heavy_outputs):
+            extractor_outputs[i] = output
+        return extractor_outputs
+
+    def _get_unresolved_segments(
+        self, text: str, entities: List[Entity]
+    ) -> List[Tuple[int, int]]:
+        """Get the text segments that are not resolved by the entities.
+
+        A line is resolved when all of its word characters are covered by the
+        entities. The consecutive unresolved lines are joined into one segment.
+
+        Args:
+            text: The text to segment.
+            entities: The entities resolving the text.
+
+        Returns:
+            The list of (start, end) character positions of the unresolved segments.
+
+        """
+
+        pieces = []
+        position = 0
+        for entity in sorted(entities, key=lambda e: e.start_index):
+            start = max(entity.start_index, position)
+            if entity.end_index <= start:
+                continue
+            pieces.append(text[position:start])
+            pieces.append(" " * (entity.end_index - start))
+            position = entity.end_index
+        pieces.append(text[position:])
+        unresolved_text = "".join(pieces)
+
+        segments = []
+        start = 0
+        for line in unresolved_text.splitlines(keepends=True):
+            end = start + len(line)
+            if _UNRESOLVED_CHAR.search(line):
+                if segments and segments[-1][1] == start:
+                    segments[-1] = (segments[-1][0], end)
+                else:
+                    segments.append((start, end))
+            start = end
+        return segments
+
+    def _run_on_segments(
+        self,
+        extractor: ExtractorInterface,
+        text: str,
+        doc: Optional[Doc],
+        segments: List[Tuple[int, int]],
+        detect_repeats: bool,
+    ) -> Tuple[Doc, List[Entity]]:
+        """Run the extractor on the text segments and map the entities to the text.
+
+        Args:
+            extractor: The extractor to run.
+            text: The text to extract entities from.
+            doc: The tokenized doc or None.
+            segments: The (start, end) character positions of the segments.
+            detect_repeats: Whether to check text again for repeated entities.
+
+        Returns:
+            The extractor output for the whole text.
+
+        """
+
+        entities = []
+        for start, end in segments:
+            _, segment_entities = extractor(text[start:end], False)
+            entities.extend(shift_entities(segment_entities, start))
+
+        if doc is None:
+            doc = extractor.pipeline.make_doc(text)
+        if detect_repeats:
+            entities = detect_repeated_entities(doc, entities, extractor.spacy_style)
+        create_spacy_entities(doc, entities, extractor.spacy_style)
+        return doc, entities
+
+    def _run_tasks(
+        self, tasks: List[Tuple[ExtractorInterface, Callable]]
+    ) -> List[Tuple[Doc, List[Entity]]]:
+        """Run the extractor tasks sequentially or concurrently.
+
+        Args:
+            tasks: The list of (extractor, task) pairs.
+
+        Returns:
+            The list of task outputs, in the order of the tasks.
+
+        Raises:
+            TimeoutError: If an extractor does not finish within the timeout.
+
+        """
+
+        if not self.parallel:
+            return [task() for _, task in tasks]
+
+        executor = self._get_executor()
+        futures = []
+        for _, task in tasks:
+            futures.append((time.monotonic(), executor.submit(task)))
+
+        extractor_outputs = []
+        for (extractor, _), (submit_time, future) in zip(tasks, futures):
+            timeout = None
+            if self.timeout is not None:
+                # each extractor has its own deadline
+                timeout = max(0, submit_time + self.timeout - time.monotonic())
+            try:
+                extractor_outputs.append(future.result(timeout=timeout))
+            except FutureTimeoutError:
+                for _, f in futures:
+                    f.cancel()
+                # the running extractor cannot be cancelled and keeps its thread
+                self._replace_executor(executor)
+                raise TimeoutError(
+                    f"The extractor {type(extractor).__name__} did not finish within {self.timeout} seconds."
+                )
+        return extractor_outputs
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the thread pool running the extractors, creating it on the first use.
+
+        Returns:
+            The thread pool.
+
+        """
+
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="anonipy-extractor"
+                )
+            return self._executor
+
+    def _replace_executor(self, executor: ThreadPoolExecutor) -> None:
+        """Drop the thread pool with a stuck thread, so the next call creates a new one.
+
+        The stuck thread finishes its extractor and exits, and the other
+        threads finish the already submitted tasks.
+
+        Args:
+            executor: The thread pool to replace.
+
+        """
+
+        with self._executor_lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False)
@@ -1,7 +1,6 @@
-import re
 import warnings
 import importlib
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import torch
 from spacy import displacy
@@ -10,11 +9,15 @@ from spacy.language import Language
 
 from ..helpers import (
     convert_spacy_to_entity,
+    create_label_index,
     detect_repeated_entities,
     get_doc_entity_spans,
+    run_pipeline_components,
     create_spacy_entities,
 )
 from ...utils.regex import regex_mapping
+from ...utils.prescreen import PreScreener
+from ...utils.instrumentation import instrumentation
 from ...utils import gliner_spacy as _gliner_spacy  # noqa: F401 — registers factory
 from ...constants import LANGUAGES
 from ...definitions import Entity
@@ -40,6 +43,8 @@ class NERExtractor(ExtractorInterface):
 
     Attributes:
         labels (List[dict]): The list of labels to extract.
+        label_index (dict): The mapping between the label names and their type, regex and compiled regex.
+        prescreen (PreScreener): The pre-screener deciding which texts are processed by the model.
         lang (str): The language of the text to extract.
         score_th (float): The score threshold.
         use_gpu (bool): Whether to use GPU.
@@ -50,6 +55,10 @@ class NERExtractor(ExtractorInterface):
     Methods:
         __call__(self, text):
             Extract the entities from the text.
+        annotate(self, doc):
+            Extract the entities from an already tokenized document.
+        batch(self, texts):
+            Extract the entities from each of the texts in batches.
         display(self, doc):
             Display the entities in the text.
 
@@ -64,6 +73,7 @@ class NERExtractor(ExtractorInterface):
         use_gpu: bool = False,
         gliner_model: str = "E3-JSI/gliner-multi-pii-domains-v1",
         spacy_style: str = "ent",
+        prescreen: Optional[PreScreener] = None,
         **kwargs,
     ):
         """Initialize the named entity recognition (NER) extractor.
@@ -82,6 +92,7 @@ class NERExtractor(ExtractorInterface):
             use_gpu: Whether to use GPU.
             gliner_model: The gliner model to use to identify the entities.
             spacy_style: The style the entities should be stored in the spacy doc. Options: `ent` or `span`.
+            prescreen: The pre-screener used to skip the model on texts without entities. If `None`, all texts are processed.
 
         """
 
@@ -92,6 +103,8 @@ class NERExtractor(ExtractorInterface):
         self.gliner_model = gliner_model
         self.spacy_style = spacy_style
         self.labels = self._prepare_labels(labels)
+        self.label_index = create_label_index(self.labels)
+        self.prescreen = prescreen
 
         self.pipeline = self._prepare_pipeline()
 
@@ -114,17 +127,83 @@ class NERExtractor(ExtractorInterface):
 
         """
 
-        doc = self.pipeline(text)
-        anoni_entities, spacy_entities = self._prepare_entities(doc)
+        with instrumentation.stage("ner.tokenize", characters=len(text)):
+            doc = self.pipeline.make_doc(text)
+        doc = run_pipeline_components(
+            self.pipeline, doc, disable=self._get_disabled_components(text)
+        )
+        return self._extract_entities(doc, detect_repeats)
 
-        if detect_repeats:
-            anoni_entities = detect_repeated_entities(
-                doc, anoni_entities, self.spacy_style
-            )
+    def annotate(
+        self, doc: Doc, detect_repeats: bool = False, *args, **kwargs
+    ) -> Tuple[Doc, List[Entity]]:
+        """Extract the entities from an already tokenized document.
 
-        create_spacy_entities(doc, anoni_entities, self.spacy_style)
+        The document must be tokenized with the tokenizer of the same language.
+        This allows multiple extractors to share the tokenization of the text.
 
-        return doc, anoni_entities
+        Examples:
+            >>> doc = extractor.pipeline.make_doc("John Doe is a 19 year old software engineer.")
+            >>> extractor.annotate(doc, detect_repeats=False)
+            Doc, [Entity]
+
+        Args:
+            doc: The tokenized spacy document to extract entities from.
+            detect_repeats: Whether to check text again for repeated entities.
+
+        Returns:
+            The spacy document.
+            The list of extracted entities.
+
+        """
+
+        doc = run_pipeline_components(
+            self.pipeline, doc, disable=self._get_disabled_components(doc.text)
+        )
+        return self._extract_entities(doc, detect_repeats)
+
+    def batch(
+        self,
+        texts: List[str],
+        detect_repeats: bool = False,
+        batch_size: int = 8,
+        *args,
+        **kwargs,
+    ) -> List[Tuple[Doc, List[Entity]]]:
+        """Extract the entities from each of the texts in batches.
+
+        The texts of each batch are processed by the GLiNER model together.
+
+        Examples:
+            >>> extractor.batch(["John Doe is a software engineer.", "Jane Doe is a doctor."])
+            [(Doc, [Entity]), (Doc, [Entity])]
+
+        Args:
+            texts: The texts to extract entities from.
+            detect_repeats: Whether to check text again for repeated entities.
+            batch_size: The number of texts processed by the model together.
+
+        Returns:
+            The list of extractor outputs containing the tuple (spacy document, extracted entities), in the order of the texts.
+
+        """
+
+        outputs = [None] * len(texts)
+        model_ids = []
+        for i, text in enumerate(texts):
+            disable = self._get_disabled_components(text)
+            if disable:
+                outputs[i] = self._extract_entities(
+                    self.pipeline(text, disable=disable), detect_repeats
+                )
+            else:
+                model_ids.append(i)
+
+        model_texts = [texts[i] for i in model_ids]
+        docs = self.pipeline.pipe(model_texts, batch_size=batch_size)
+        for i, doc in zip(model_ids, docs):
+            outputs[i] = self._extract_entities(doc, detect_repeats)
+        return outputs
 
     def display(self, doc: Doc, page: bool = False, jupyter: bool = None) -> str:
         """Display the entities in the text.
@@ -155,6 +234,52 @@ class NERExtractor(ExtractorInterface):
     # Private methods
     # ===========================================
 
+    def _extract_entities(
+        self, doc: Doc, detect_repeats: bool
+    ) -> Tuple[Doc, List[Entity]]:
+        """Extract the entities from the processed spacy doc.
+
+        Args:
+            doc: The processed spacy doc.
+            detect_repeats: Whether to check text again for repeated entities.
+
+        Returns:
+            The spacy document.
+            The list of extracted entities.
+
+        """
+
+        with instrumentation.stage("ner.validate") as stage:
+            anoni_entities, spacy_entities = self._prepare_entities(doc)
+            stage.add("entities", len(anoni_entities))
+
+        if detect_repeats:
+            anoni_entities = detect_repeated_entities(
+                doc, anoni_entities, self.spacy_style
+            )
+
+        create_spacy_entities(doc, anoni_entities, self.spacy_style)
+
+        return doc, anoni_entities
+
+    def _get_disabled_components(self, text: str) -> List[str]:
+        """Get the pipeline components to skip for the text.
+
+        The GLiNER component is skipped when the pre-screener judges the text
+        to be free of entities.
+
+        Args:
+            text: The text to process.
+
+        Returns:
+            The names of the components to skip.
+
+        """
+
+        if self.prescreen is None or self.prescreen(text):
+            return []
+        return ["gliner_spacy"]
+
     def _prepare_labels(self, labels: List[dict]) -> List[dict]:
         """Prepare the labels for the extractor.
 
@@ -240,8 +365,10 @@ class NERExtractor(ExtractorInterface):
         anoni_entities = []
         spacy_entities = []
         for s in get_doc_entity_spans(doc, self.spacy_style):
-            label = list(filter(lambda x: x["label"] == s.label_, self.labels))[0]
-            if re.match(label["regex"], s.text):
-                anoni_entities.append(convert_spacy_to_entity(s, **label))
+            label = self.label_index[s.label_]
+            if label["compiled_regex"].match(s.text):
+                anoni_entities.append(
+                    convert_spacy_to_entity(s, label["type"], label["regex"])
+                )
                 spacy_entities.append(s)
         return anoni_entities, spacy_entities
@@ -1,4 +1,3 @@
-import re
 import importlib
 from typing import List, Tuple, Optional, Callable
 
@@ -9,14 +8,18 @@ from spacy.matcher import Matcher
 
 from ..helpers import (
     convert_spacy_to_entity,
+    create_label_index,
     detect_repeated_entities,
     get_doc_entity_spans,
+    run_pipeline_components,
     set_doc_entity_spans,
     create_spacy_entities,
 )
 from ...constants import LANGUAGES
 from ...definitions import Entity
 from ...utils.colors import get_label_color
+from ...utils.instrumentation import instrumentation
+from ...utils.regex import compile_regex
 
 from .interface import ExtractorInterface
 
@@ -38,6 +41,7 @@ class PatternExtractor(ExtractorInterface):
 
     Attributes:
         labels (List[dict]): The list of labels and patterns to extract.
+        label_index (dict): The mapping between the label names and their type, regex and compiled regex.
         lang (str): The language of the text to extract.
         pipeline (Language): The spacy pipeline for extracting entities.
         token_matchers (Matcher): The spacy token pattern matcher.
@@ -46,6 +50,8 @@ class PatternExtractor(ExtractorInterface):
     Methods:
         __call__(self, text):
             Extract the entities from the text.
+        annotate(self, doc):
+            Extract the entities from an already tokenized document.
         display(self, doc):
             Display the entities in the text.
 
@@ -78,6 +84,7 @@ class PatternExtractor(ExtractorInterface):
         super().__init__(labels, *args, **kwargs)
         self.lang = lang
         self.labels = labels
+        self.label_index = create_label_index(labels)
         self.spacy_style = spacy_style
         self.pipeline = self._prepare_pipeline()
         self.token_matchers = self._prepare_token_matchers()
@@ -102,19 +109,35 @@ class PatternExtractor(ExtractorInterface):
 
         """
 
-        doc = self.pipeline(text)
-        self.token_matchers(doc) if self.token_matchers else None
-        self.global_matchers(doc) if self.global_matchers else None
-        anoni_entities, spacy_entities = self._prepare_entities(doc)
+        with instrumentation.stage("pattern.tokenize", characters=len(text)):
+            doc = self.pipeline(text)
+        return self._extract_entities(doc, detect_repeats)
 
-        if detect_repeats:
-            anoni_entities = detect_repeated_entities(
-                doc, anoni_entities, self.spacy_style
-            )
+    def annotate(
+        self, doc: Doc, detect_repeats: bool = False, *args, **kwargs
+    ) -> Tuple[Doc, List[Entity]]:
+        """Extract the entities from an already tokenized document.
 
-        create_spacy_entities(doc, anoni_entities, self.spacy_style)
+        The document must be tokenized with the tokenizer of the same language.
+        This allows multiple extractors to share the tokenization of the text.
 
-        return doc, anoni_entities
+        Examples:
+            >>> doc = extractor.pipeline.make_doc("John Doe is a 19 year old software engineer.")
+            >>> extractor.annotate(doc, detect_repeats=False)
+            Doc, [Entity]
+
+        Args:
+            doc: The tokenized spacy document to extract entities from.
+            detect_repeats: Whether to check text again for repeated entities.
+
+        Returns:
+            The spacy document.
+            The list of extracted entities.
+
+        """
+
+        doc = run_pipeline_components(self.pipeline, doc)
+        return self._extract_entities(doc, detect_repeats)
 
     def display(self, doc: Doc, page: bool = False, jupyter: bool = None) -> str:
         """Display the entities in the text.
@@ -145,6 +168,36 @@ class PatternExtractor(ExtractorInterface):
     # Private methods
     # ===========================================
 
+    def _extract_entities(
+        self, doc: Doc, detect_repeats: bool
+    ) -> Tuple[Doc, List[Entity]]:
+        """Extract the entities from the processed spacy doc.
+
+        Args:
+            doc: The processed spacy doc.
+            detect_repeats: Whether to check text again for repeated entities.
+
+        Returns:
+            The spacy document.
+            The list of extracted entities.
+
+        """
+
+        with instrumentation.stage("pattern.match") as stage:
+            self.token_matchers(doc) if self.token_matchers else None
+            self.global_matchers(doc) if self.global_matchers else None
+            anoni_entities, spacy_entities = self._prepare_entities(doc)
+            stage.add("entities", len(anoni_entities))
+
+        if detect_repeats:
+            anoni_entities = detect_repeated_entities(
+                doc, anoni_entities, self.spacy_style
+            )
+
+        create_spacy_entities(doc, anoni_entities, self.spacy_style)
+
+        return doc, anoni_entities
+
     def _prepare_pipeline(self) -> Language:
         """Prepare the spacy pipeline.
 
@@ -202,7 +255,7 @@ class PatternExtractor(ExtractorInterface):
 
         def global_matchers(doc: Doc) -> None:
             for label in relevant_labels:
-                for match in re.finditer(label["regex"], doc.text):
+                for match in compile_regex(label["regex"]).finditer(doc.text):
                     # define the entity span
                     start, end = match.span(1) if match.lastindex else match.span(0)
                     entity = doc.char_span(start, end, label=label["label"])
@@ -231,8 +284,10 @@ class PatternExtractor(ExtractorInterface):
         anoni_entities = []
         spacy_entities = []
         for e in get_doc_entity_spans(doc, self.spacy_style):
-            label = list(filter(lambda x: x["label"] == e.label_, self.labels))[0]
-            anoni_entities.append(convert_spacy_to_entity(e, **label))
+            label = self.label_index[e.label_]
+            anoni_entities.append(
+                convert_spacy_to_entity(e, label["type"], label["regex"])
+            )
             spacy_entities.append(e)
         return anoni_entities, spacy_entities
 
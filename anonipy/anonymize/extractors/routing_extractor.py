@@ -0,0 +1,377 @@
+import re
+import threading
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from ...constants import LANGUAGES
+from ...definitions import Entity
+from ...utils.gliner_spacy import share_models
+from ...utils.language_detector import LanguageDetector
+from ..helpers import shift_entities
+
+from .interface import ExtractorInterface
+from .multi_extractor import MultiExtractor
+
+# the granularities of the language detection
+GRANULARITIES = ["document", "sentence"]
+
+# pattern of the boundaries between the sentences
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+|\n\s*")
+
+
+def _get_supported_languages() -> Dict[str, tuple]:
+    """Get the mapping between the codes and the supported languages.
+
+    Returns:
+        The mapping between the language codes and the language tuples.
+
+    """
+
+    return {
+        value[0]: value
+        for value in vars(LANGUAGES).values()
+        if isinstance(value, tuple)
+    }
+
+
+# ===============================================
+# Extractor class
+# ===============================================
+
+
+class RoutingExtractor(ExtractorInterface):
+    """The class representing the language routing extractor.
+
+    The language of each document, or of each sentence, is detected and the
+    text is processed by the extractor of the detected language. The
+    extractors are created on the first use, and the NER extractors of all
+    languages share the GLiNER model. The entities of the sentences are
+    shifted back to their positions in the original text.
+
+    Examples:
+        >>> from anonipy.anonymize.extractors import NERExtractor, RoutingExtractor
+        >>> labels = [{"label": "name", "type": "string"}]
+        >>> extractor = RoutingExtractor(
+        >>>     lambda lang: NERExtractor(labels, lang=lang), granularity="sentence"
+        >>> )
+        >>> extractor("John Doe is a software engineer. Janez Novak je zdravnik.")
+        [(LANGUAGES.ENGLISH, 0, (Doc, [Entity])), (LANGUAGES.SLOVENIAN, 33, (Doc, [Entity]))], [Entity]
+
+    Attributes:
+        create_extractor (Callable[[tuple], Union[ExtractorInterface, MultiExtractor]]):
+            The function creating the extractor of the language.
+        languages (List[tuple]):
+            The languages the texts are routed to.
+        default_lang (tuple):
+            The language of the texts whose language cannot be detected or is not supported.
+        granularity (str):
+            Whether the language is detected per `document` or per `sentence`.
+        min_sentence_length (int):
+            The minimum number of characters of the sentence to detect its language.
+        detector (LanguageDetector):
+            The language detector.
+        extractors (Dict[str, Union[ExtractorInterface, MultiExtractor]]):
+            The created extractors, keyed by the language code.
+
+    Methods:
+        __call__(self, text):
+            Extract the entities from the text with the extractors of its languages.
+        batch(self, texts):
+            Extract the entities from each of the texts.
+        route(self, text):
+            Split the text into the parts of the same language.
+        get_extractor(self, lang):
+            Get the extractor of the language.
+        close(self):
+            Shut down the threads used by the created extractors.
+
+    """
+
+    def __init__(
+        self,
+        create_extractor: Callable[[tuple], Union[ExtractorInterface, MultiExtractor]],
+        *args,
+        languages: Optional[List[tuple]] = None,
+        default_lang: tuple = LANGUAGES.ENGLISH,
+        granularity: str = "document",
+        min_sentence_length: int = 20,
+        detector: Optional[LanguageDetector] = None,
+        **kwargs,
+    ):
+        """Initialize the language routing extractor.
+
+        Examples:
+            >>> from anonipy.constants import LANGUAGES
+            >>> from anonipy.anonymize.extractors import PatternExtractor, RoutingExtractor
+            >>> extractor = RoutingExtractor(
+            >>>     lambda lang: PatternExtractor(labels, lang=lang),
+            >>>     languages=[LANGUAGES.ENGLISH, LANGUAGES.GERMAN],
+            >>> )
+            RoutingExtractor()
+
+        Args:
+            create_extractor: The function creating the extractor (or multi extractor) of the given language.
+            languages: The languages the texts are routed to. If `None`, all supported languages are used.
+            default_lang: The language of the texts whose language cannot be detected or is not in `languages`.
+            granularity: Whether the language is detected per `document` or per `sentence`.
+            min_sentence_length: The minimum number of characters of the sentence to detect its language. The shorter sentences take the language of the preceding sentence.
+            detector: The language detector. If `None`, the detector of the `languages` is created on the first use, and loads the language models on demand.
+
+        Raises:
+            ValueError: If the granularity or a language is not supported, or the default language is not in `languages`.
+
+        """
+
+        super().__init__([], *args, **kwargs)
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"The granularity is not supported: {granularity}")
+
+        supported_languages = _get_supported_languages()
+        languages = (
+            list(supported_languages.values()) if languages is None else list(languages)
+        )
+        for lang in languages + [default_lang]:
+            if supported_languages.get(lang[0]) != tuple(lang):
+                raise ValueError(f"The language is not supported: {lang}")
+        if tuple(default_lang) not in [tuple(lang) for lang in languages]:
+            raise ValueError("The default language must be one of the languages.")
+
+        self.create_extractor = create_extractor
+        self.languages = [tuple(lang) for lang in languages]
+        self.default_lang = tuple(default_lang)
+        self.granularity = granularity
+        self.min_sentence_length = min_sentence_length
+        self.detector = detector
+        self.extractors: Dict[str, Union[ExtractorInterface, MultiExtractor]] = {}
+        self._language_index = {lang[0]: lang for lang in self.languages}
+        # the GLiNER models shared by the extractors of all languages
+        self._models = {}
+        self._lock = threading.Lock()
+
+    def __call__(
+        self, text: str, detect_repeats: bool = False, *args, **kwargs
+    ) -> Tuple[List[Tuple[tuple, int, tuple]], List[Entity]]:
+        """Extract the entities from the text with the extractors of its languages.
+
+        Examples:
+            >>> extractor("John Doe is a software engineer.")
+            [(LANGUAGES.ENGLISH, 0, (Doc, [Entity]))], [Entity]
+
+        Args:
+            text: The text to extract entities from.
+            detect_repeats: Whether to check text again for repeated entities.
+
+        Returns:
+            The list of the routed parts, containing the tuple (language, start index of the part, extractor output).
+            The list of the extracted entities, with the indices in the text.
+
+        """
+
+        return self.batch([text], detect_repeats)[0]
+
+    def batch(
+        self, texts: List[str], detect_repeats: bool = False, *args, **kwargs
+    ) -> List[Tuple[List[Tuple[tuple, int, tuple]], List[Entity]]]:
+        """Extract the entities from each of the texts.
+
+        The parts of all texts in the same language are processed with a
+        single `batch` call of the language extractor.
+
+        Examples:
+            >>> extractor.batch(["John Doe is a software engineer.", "Janez Novak je zdravnik."])
+            [([(LANGUAGES.ENGLISH, 0, (Doc, [Entity]))], [Entity]), ([(LANGUAGES.SLOVENIAN, 0, (Doc, [Entity]))], [Entity])]
+
+        Args:
+            texts: The texts to extract entities from.
+            detect_repeats: Whether to check text again for repeated entities.
+
+        Returns:
+            The list of the routing extractor outputs, in the order of the texts.
+
+        """
+
+        routes = self._route_batch(texts)
+
+        # group the parts of the texts by their language
+        parts_per_language: Dict[tuple, List[Tuple[int, int, str]]] = {}
+        for i, (text, parts) in enumerate(zip(texts, routes)):
+            for j, (lang, start, end) in enumerate(parts):
+                parts_per_language.setdefault(lang, []).append((i, j, text[start:end]))
+
+        part_outputs = [[None] * len(parts) for parts in routes]
+        for lang, parts in parts_per_language.items():
+            outputs = self.get_extractor(lang).batch(
+                [part for _, _, part in parts], detect_repeats
+            )
+            for (i, j, _), output in zip(parts, outputs):
+                part_outputs[i][j] = output
+
+        results = []
+        for parts, outputs in zip(routes, part_outputs):
+            entities = []
+            for (_, start, _), output in zip(parts, outputs):
+                entities.extend(
+                    shift_entities(output[1], start) if start else output[1]
+                )
+            results.append(
+                (
+                    [
+                        (lang, start, output)
+                        for (lang, start, _), output in zip(parts, outputs)
+                    ],
+                    entities,
+                )
+            )
+        return results
+
+    def route(self, text: str) -> List[Tuple[tuple, int, int]]:
+        """Split the text into the parts of the same language.
+
+        In the `sentence` granularity, the consecutive sentences of the same
+        language are joined into a single part.
+
+        Examples:
+            >>> extractor.route("John Doe is a software engineer. Janez Novak je zdravnik.")
+            [(LANGUAGES.ENGLISH, 0, 33), (LANGUAGES.SLOVENIAN, 33, 57)]
+
+        Args:
+            text: The text to split.
+
+        Returns:
+            The list of the parts, containing the tuple (language, start index, end index).
+
+        """
+
+        return self._route_batch([text])[0]
+
+    def get_extractor(self, lang: tuple) -> Union[ExtractorInterface, MultiExtractor]:
+        """Get the extractor of the language.
+
+        The extractor is created on the first use. The GLiNER models loaded
+        by the created extractors are shared between the languages.
+
+        Examples:
+            >>> extractor.get_extractor(LANGUAGES.ENGLISH)
+            NERExtractor()
+
+        Args:
+            lang: The language of the extractor.
+
+        Returns:
+            The extractor of the language.
+
+        """
+
+        with self._lock:
+            if lang[0] not in self.extractors:
+                with share_models(self._models):
+                    self.extractors[lang[0]] = self.create_extractor(lang)
+            return self.extractors[lang[0]]
+
+    def close(self) -> None:
+        """Shut down the threads used by the created extractors."""
+
+        for extractor in self.extractors.values():
+            if isinstance(extractor, MultiExtractor):
+                extractor.close()
+
+    # ===========================================
+    # Private methods
+    # ===========================================
+
+    def _route_batch(self, texts: List[str]) -> List[List[Tuple[tuple, int, int]]]:
+        """Split each of the texts into the parts of the same language.
+
+        The languages of all texts, or of all their sentences, are detected
+        together.
+
+        Args:
+            texts: The texts to split.
+
+        Returns:
+            The list of the parts of each text, in the order of the texts.
+
+        """
+
+        if self.granularity == "document":
+            return [
+                [(lang or self.default_lang, 0, len(text))]
+                for text, lang in zip(texts, self._detect_batch(texts))
+            ]
+
+        sentences = []
+        for text in texts:
+            boundaries = [m.end() for m in _SENTENCE_BOUNDARY.finditer(text)]
+            boundaries = sorted({0, len(text), *boundaries})
+            sentences.append(list(zip(boundaries[:-1], boundaries[1:])))
+        sentence_texts = [
+            text[start:end]
+            for text, spans in zip(texts, sentences)
+            for start, end in spans
+            if len(text[start:end].strip()) >= self.min_sentence_length
+        ]
+        detected = iter(self._detect_batch(sentence_texts))
+        languages = [
+            [
+                (
+                    next(detected)
+                    if len(text[start:end].strip()) >= self.min_sentence_length
+                    else None
+                )
+                for start, end in spans
+            ]
+            for text, spans in zip(texts, sentences)
+        ]
+
+        # the texts without the detected sentences are detected as a whole
+        undetected = [i for i, langs in enumerate(languages) if not any(langs)]
+        fallback = dict(
+            zip(undetected, self._detect_batch([texts[i] for i in undetected]))
+        )
+
+        routes = []
+        for i, (text, spans, langs) in enumerate(zip(texts, sentences, languages)):
+            if not spans:
+                routes.append([(fallback[i] or self.default_lang, 0, 0)])
+                continue
+            # the short sentences take the language of the preceding sentence
+            detected = [lang for lang in langs if lang is not None]
+            lang = detected[0] if detected else fallback[i] or self.default_lang
+            parts = []
+            for (start, end), sentence_lang in zip(spans, langs):
+                lang = sentence_lang or lang
+                if parts and parts[-1][0] == lang:
+                    parts[-1] = (lang, parts[-1][1], end)
+                else:
+                    parts.append((lang, start, end))
+            routes.append(parts)
+        return routes
+
+    def _detect_batch(self, texts: List[str]) -> List[Optional[tuple]]:
+        """Detect the languages of the texts.
+
+        Args:
+            texts: The texts to detect the languages of.
+
+        Returns:
+            The detected languages. The language is the default language if the detected language is not supported, or `None` if the language cannot be detected.
+
+        """
+
+        if len(self._language_index) == 1:
+            return [self.default_lang] * len(texts)
+        ids = [i for i, text in enumerate(texts) if text.strip()]
+        languages = [None] * len(texts)
+        if not ids:
+            return languages
+        if self.detector is None:
+            with self._lock:
+                if self.detector is None:
+                    # only the models of the detected languages are loaded
+                    self.detector = LanguageDetector(
+                        languages=self.languages, preload_models=False
+                    )
+        codes = self.detector.detect_batch([texts[i] for i in ids])
+        for i, (code, _) in zip(ids, codes):
+            if code is not None:
+                languages[i] = self._language_index.get(code, self.default_lang)
+        return languages
@@ -3,11 +3,10 @@ import warnings
 import datetime
 from typing import Union
 
-import dateparser
 from babel.dates import format_datetime
 
 from ...definitions import Entity
-from ...utils.datetime_format import detect_datetime_format
+from ...utils.datetime_format import detect_datetime_format, parse_datetime
 from ...constants import DATE_TRANSFORM_VARIANTS, LANGUAGES
 
 from .interface import GeneratorInterface
@@ -198,7 +197,7 @@ class DateGenerator(GeneratorInterface):
                     entity.text, self.lang
                 )
             else:
-                entity_date = dateparser.parse(entity.text, languages=[self.lang])
+                entity_date = parse_datetime(entity.text, self.lang)
                 date_format = self.date_format
 
         # validate the input values
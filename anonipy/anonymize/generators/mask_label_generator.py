@@ -208,13 +208,14 @@ class MaskLabelGenerator(GeneratorInterface):
 
         """
 
+        regex = entity.compiled_regex
         substitute_chunks = []
         for mask, suggestion in zip(masks, suggestions):
             suggestion = suggestion if type(suggestion) == list else [suggestion]
             viable_suggestions = list(
                 filter(
                     lambda x: x["token_str"] != mask["true_text"]
-                    and re.match(entity.regex, x["token_str"])
+                    and regex.match(x["token_str"])
                     and x["token_str"] not in STOPWORDS,
                     suggestion,
                 )
@@ -1,8 +1,66 @@
-import random
 import warnings
+from typing import List, Optional
+
+import numpy as np
+
 from .interface import GeneratorInterface
 from ...definitions import Entity
 
+# =====================================
+# Helper functions
+# =====================================
+
+
+def _luhn_checksum(digits: List[int]) -> int:
+    """Computes the Luhn checksum of the digits.
+
+    Args:
+        digits: The digits to compute the checksum of.
+
+    Returns:
+        The Luhn checksum (the number is valid when the checksum is 0).
+
+    """
+
+    total = 0
+    for idx, digit in enumerate(reversed(digits)):
+        if idx % 2 == 1:
+            digit = digit * 2
+            digit = digit - 9 if digit > 9 else digit
+        total += digit
+    return total % 10
+
+
+def _is_luhn_valid(digits: List[int]) -> bool:
+    """Checks if the digits pass the Luhn check.
+
+    Args:
+        digits: The digits to check.
+
+    Returns:
+        `True` if the digits pass the Luhn check, `False` otherwise.
+
+    """
+
+    return len(digits) > 1 and _luhn_checksum(digits) == 0
+
+
+def _set_luhn_check_digit(digits: List[int]) -> List[int]:
+    """Replaces the last digit with the Luhn check digit.
+
+    Args:
+        digits: The digits to update.
+
+    Returns:
+        The digits with the valid Luhn check digit.
+
+    """
+
+    digits = digits[:-1] + [0]
+    digits[-1] = (10 - _luhn_checksum(digits)) % 10
+    return digits
+
+
 # =====================================
 # Main class
 # =====================================
@@ -16,24 +74,35 @@ class NumberGenerator(GeneratorInterface):
         >>> generator = NumberGenerator()
         >>> generator.generate(entity)
 
+    Attributes:
+        rng (numpy.random.Generator): The random number generator.
+
     Methods:
-        generate(self, entity):
+        generate(self, entity, preserve_luhn):
             Generates a substitute for the numeric entity.
+        generate_batch(self, entities, preserve_luhn):
+            Generates the substitutes for a list of numeric entities.
 
     """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, seed: Optional[int] = None, **kwargs):
         """Initializes the number generator.
 
         Examples:
             >>> from anonipy.anonymize.generators import NumberGenerator
-            >>> generator = NumberGenerator()
+            >>> generator = NumberGenerator(seed=42)
+
+        Args:
+            seed: The seed of the random number generator. If `None`, the generated numbers are not reproducible.
 
         """
 
         super().__init__(*args, **kwargs)
+        self.rng = np.random.default_rng(seed)
 
-    def generate(self, entity: Entity, *args, **kwargs) -> str:
+    def generate(
+        self, entity: Entity, *args, preserve_luhn: bool = False, **kwargs
+    ) -> str:
         """Generates the substitute for the numeric entity.
 
         Examples:
@@ -44,6 +113,7 @@ class NumberGenerator(GeneratorInterface):
 
         Args:
             entity: The numeric entity to generate the numeric substitute.
+            preserve_luhn: Whether the substitute of a Luhn valid number should also be Luhn valid.
 
         Returns:
             The generated numeric substitute.
@@ -53,6 +123,67 @@ class NumberGenerator(GeneratorInterface):
 
         """
 
+        return self.generate_batch([entity], preserve_luhn=preserve_luhn)[0]
+
+    def generate_batch(
+        self, entities: List[Entity], *args, preserve_luhn: bool = False, **kwargs
+    ) -> List[str]:
+        """Generates the substitutes for a list of numeric entities.
+
+        The digits of all substitutes are drawn at once, while the non-digit
+        characters of the entities are kept in place.
+
+        Examples:
+            >>> from anonipy.anonymize.generators import NumberGenerator
+            >>> generator = NumberGenerator(seed=42)
+            >>> generator.generate_batch(entities)
+            ["1234567890", "123-45-6789"]
+
+        Args:
+            entities: The numeric entities to generate the numeric substitutes.
+            preserve_luhn: Whether the substitutes of Luhn valid numbers should also be Luhn valid.
+
+        Returns:
+            The generated numeric substitutes in the order of the entities.
+
+        Raises:
+            ValueError: If the entity type is not `integer`, `float`, `phone_number` or `custom`.
+
+        """
+
+        for entity in entities:
+            self._validate_entity(entity)
+
+        digit_counts = [sum(c.isdigit() for c in e.text) for e in entities]
+        digits = self.rng.integers(0, 10, size=sum(digit_counts)).tolist()
+
+        substitutes = []
+        offset = 0
+        for entity, count in zip(entities, digit_counts):
+            new_digits = digits[offset : offset + count]
+            offset += count
+            if preserve_luhn:
+                old_digits = [int(c) for c in entity.text if c.isdigit()]
+                if _is_luhn_valid(old_digits):
+                    new_digits = _set_luhn_check_digit(new_digits)
+            substitutes.append(self._fill_digits(entity.text, new_digits))
+        return substitutes
+
+    # =================================
+    # Private methods
+    # =================================
+
+    def _validate_entity(self, entity: Entity) -> None:
+        """Validates the entity type.
+
+        Args:
+            entity: The entity to validate.
+
+        Raises:
+            ValueError: If the entity type is not `integer`, `float`, `phone_number` or `custom`.
+
+        """
+
         if entity.type in ["custom"]:
             warnings.warn(
                 "The entity type is `custom`. Make sure the generator is returning appropriate values."
@@ -61,6 +192,18 @@ class NumberGenerator(GeneratorInterface):
             raise ValueError(
                 "The entity type must be `integer`, `float`, `phone_number` or `custom` to generate numbers."
             )
-        return "".join(
-            [str(random.randint(0, 9)) if d.isdigit() else d for d in entity.text]
-        )
+
+    def _fill_digits(self, text: str, digits: List[int]) -> str:
+        """Replaces the digits in the text with the provided digits.
+
+        Args:
+            text: The text containing the digits to replace.
+            digits: The digits used as replacements.
+
+        Returns:
+            The text with the replaced digits.
+
+        """
+
+        digits = iter(digits)
+        return "".join([str(next(digits)) if c.isdigit() else c for c in text])
@@ -1,12 +1,16 @@
 import re
-from typing import List, Union, Tuple, Iterable, Set
+from typing import List, Optional, Union, Tuple, Iterable
 import itertools
 
+import numpy as np
+
 from spacy import util
 from spacy.tokens import Span, Doc
+from spacy.language import Language
 
-from ..definitions import Entity, Replacement
-from ..constants import ENTITY_TYPES
+from ..definitions import Entity, EntityBatch, Replacement
+from ..constants import ENTITY_TYPES, MERGE_POLICIES
+from ..utils.regex import compile_regex
 
 # =====================================
 # Entity converters
@@ -43,29 +47,79 @@ def convert_spacy_to_entity(
     )
 
 
+# =====================================
+# Label helpers
+# =====================================
+
+
+def create_label_index(labels: List[dict]) -> dict:
+    """Create the index of the labels.
+
+    The index maps each label name to its type, regex and compiled regex.
+    If a label is defined multiple times, the first definition is used.
+
+    Args:
+        labels: The list of labels to index.
+
+    Returns:
+        The mapping between the label names and the label attributes.
+
+    """
+
+    label_index = {}
+    for label in labels:
+        if label["label"] in label_index:
+            continue
+        regex = label.get("regex")
+        label_index[label["label"]] = {
+            "type": label.get("type"),
+            "regex": regex,
+            "compiled_regex": compile_regex(regex) if regex is not None else None,
+        }
+    return label_index
+
+
 # =====================================
 # Anonymization function
 # =====================================
 
 
-def anonymize(text: str, replacements: List[Replacement]) -> str:
+def anonymize(text: str, replacements: Union[List[Replacement], EntityBatch]) -> str:
     """Anonymize a text based on a list of replacements.
 
+    The replacements can also be given as the entity batch with the
+    anonymized texts, which is applied in a single pass over the text. The
+    replacements must not overlap.
+
     Examples:
         >>> from anonipy.anonymize import anonymize
         >>> anonymize(text, replacements)
 
     Args:
         text: The text to anonymize.
-        replacements: The list of replacements to apply.
+        replacements: The list of replacements, or the entity batch with the anonymized texts, to apply.
 
     Returns:
         The anonymized text.
 
+    Raises:
+        ValueError: If the replacements overlap.
+
     """
 
+    if isinstance(replacements, EntityBatch):
+        return _anonymize_batch(text, replacements)
+
     s_replacements = sorted(replacements, key=lambda x: x["start_index"], reverse=True)
 
+    for current, previous in zip(s_replacements, s_replacements[1:]):
+        if previous["end_index"] > current["start_index"]:
+            raise ValueError(
+                "The replacements overlap: "
+                f"[{previous['start_index']}, {previous['end_index']}) and "
+                f"[{current['start_index']}, {current['end_index']})"
+            )
+
     anonymized_text = text
     for replacement in s_replacements:
         anonymized_text = (
@@ -76,63 +130,298 @@ def anonymize(text: str, replacements: List[Replacement]) -> str:
     return anonymized_text, s_replacements[::-1]
 
 
+def _anonymize_batch(text: str, replacements: EntityBatch) -> Tuple[str, EntityBatch]:
+    """Anonymize a text based on the entity batch with the anonymized texts.
+
+    Args:
+        text: The text to anonymize.
+        replacements: The entity batch with the anonymized texts.
+
+    Returns:
+        The anonymized text.
+        The entity batch sorted by the start index.
+
+    Raises:
+        ValueError: If the anonymized texts are not set, or the replacements overlap.
+
+    """
+
+    if replacements.anonymized_texts is None:
+        raise ValueError("The anonymized texts of the entities are not set.")
+
+    replacements = replacements.sort()
+    if (replacements.starts[1:] < replacements.ends[:-1]).any():
+        raise ValueError("The replacements overlap.")
+    pieces, position = [], 0
+    for start, end, anonymized_text in zip(
+        replacements.starts.tolist(),
+        replacements.ends.tolist(),
+        replacements.anonymized_texts,
+    ):
+        pieces.append(text[position:start])
+        pieces.append(anonymized_text)
+        position = end
+    pieces.append(text[position:])
+    return "".join(pieces), replacements
+
+
 # =====================================
 # Entity helpers
 # =====================================
 
 
-def merge_entities(extractor_outputs: List[Tuple[Doc, List[Entity]]]) -> List[Entity]:
+def merge_entities(
+    extractor_outputs: List[Tuple[Doc, Union[List[Entity], EntityBatch]]],
+    policy: str = MERGE_POLICIES.LONGEST,
+) -> Union[List[Entity], EntityBatch]:
     """Merges the entities returned by the extractors.
 
+    The overlapping entities are resolved with the merge policy:
+
+    - `longest`: the longer entity is kept.
+    - `highest_score`: the entity with the higher score is kept.
+    - `priority`: the entity of the extractor listed first is kept.
+    - `union`: all entities are kept, only the duplicates are removed. The
+      entities may overlap, so the policy is meant for the `span` spacy style,
+      and the overlapping entities cannot be anonymized.
+
+    The ties are resolved by the longer entity, then the earlier start, and
+    then the order of the extractors. If all extractors return entity
+    batches, they are merged into a batch.
+
+    Examples:
+        >>> from anonipy.anonymize.helpers import merge_entities
+        >>> merge_entities(extractor_outputs, policy="highest_score")
+        [Entity(...), Entity(...)]
+
     Args:
         extractor_outputs: The list of extractor outputs.
+        policy: The policy of resolving the overlapping entities. Options: `longest`, `highest_score`, `priority` or `union`.
 
     Returns:
-        The merged entities list.
+        The merged entities, sorted by the start index.
+
+    Raises:
+        ValueError: If the merge policy is not supported.
 
     """
 
+    if not MERGE_POLICIES.is_valid(policy):
+        raise ValueError(f"The merge policy is not supported: {policy}")
     if len(extractor_outputs) == 0:
         return []
     if len(extractor_outputs) == 1:
         return extractor_outputs[0][1]
 
-    joint_entities = filter_entities(
-        list(itertools.chain.from_iterable([entity[1] for entity in extractor_outputs]))
+    sources = np.repeat(
+        np.arange(len(extractor_outputs)),
+        [len(output[1]) for output in extractor_outputs],
     )
-    return joint_entities
+    if all(isinstance(output[1], EntityBatch) for output in extractor_outputs):
+        batch = EntityBatch.concatenate([output[1] for output in extractor_outputs])
+        return batch[
+            _select_entities(
+                batch.starts, batch.ends, batch.scores, sources, batch.label_ids, policy
+            )
+        ]
+
+    entities = list(
+        itertools.chain.from_iterable([output[1] for output in extractor_outputs])
+    )
+    starts, ends, scores, label_ids = _get_entity_arrays(entities)
+    selected = _select_entities(starts, ends, scores, sources, label_ids, policy)
+    return [entities[i] for i in selected.tolist()]
 
 
-def filter_entities(entities: Iterable[Entity]) -> List[Entity]:
+def filter_entities(
+    entities: Union[Iterable[Entity], EntityBatch],
+) -> Union[List[Entity], EntityBatch]:
     """Filters the entities based on their start and end indices.
 
+    The longer entities are preferred over the overlapping shorter ones, and
+    the earlier entities over the overlapping entities of the same length.
+    The entity batch is filtered on its arrays, without creating the entities.
+
     Args:
-        entities: The entities to filter.
+        entities: The entities, or the entity batch, to filter.
 
     Returns:
-        The filtered entities.
+        The filtered entities, or the filtered entity batch, sorted by the start index.
 
     """
 
-    def get_sort_key(entity):
-        return (
-            entity.end_index - entity.start_index,
-            -entity.start_index,
-        )
+    if isinstance(entities, EntityBatch):
+        return entities[
+            _select_entities(
+                entities.starts,
+                entities.ends,
+                entities.scores,
+                None,
+                entities.label_ids,
+                MERGE_POLICIES.LONGEST,
+            )
+        ]
+
+    entities = list(entities)
+    starts, ends, scores, label_ids = _get_entity_arrays(entities)
+    selected = _select_entities(
+        starts, ends, scores, None, label_ids, MERGE_POLICIES.LONGEST
+    )
+    return [entities[i] for i in selected.tolist()]
+
+
+def _get_entity_arrays(entities: List[Entity]) -> Tuple[np.ndarray, ...]:
+    """Get the arrays of the entity attributes used to resolve the overlaps.
+
+    Args:
+        entities: The list of entities.
+
+    Returns:
+        The arrays of the start indices, end indices, scores and label ids.
+
+    """
+
+    n = len(entities)
+    starts = np.fromiter((e.start_index for e in entities), dtype=np.int64, count=n)
+    ends = np.fromiter((e.end_index for e in entities), dtype=np.int64, count=n)
+    scores = np.fromiter((e.score for e in entities), dtype=np.float64, count=n)
+    label_index = {}
+    label_ids = np.fromiter(
+        (label_index.setdefault(e.label, len(label_index)) for e in entities),
+        dtype=np.int64,
+        count=n,
+    )
+    return starts, ends, scores, label_ids
+
+
+def _select_entities(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    scores: np.ndarray,
+    sources: Optional[np.ndarray],
+    label_ids: np.ndarray,
+    policy: str,
+) -> np.ndarray:
+    """Select the entities that are kept by the merge policy.
+
+    The entities are sorted by their start index once, and a single sweep
+    over the running maximum of the end indices splits them into the groups
+    of the transitively overlapping entities. The entities without overlaps
+    are kept without further processing, while the entities in each group
+    are visited by their priority and kept if they do not overlap the
+    entities already kept. The overlaps are checked with a prefix-maximum
+    tree of the kept end indices, so the selection takes O(n log n) time
+    and does not depend on the length of the text.
+
+    Args:
+        starts: The start indices of the entities.
+        ends: The end indices of the entities.
+        scores: The scores of the entities.
+        sources: The indices of the extractors of the entities. If `None`, all entities have the same source.
+        label_ids: The label ids of the entities.
+        policy: The merge policy.
+
+    Returns:
+        The indices of the selected entities, sorted by the start index.
+
+    """
+
+    n = len(starts)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    if sources is None:
+        sources = np.zeros(n, dtype=np.int64)
+
+    if policy == MERGE_POLICIES.UNION:
+        # keep the first of the entities with the same span and label
+        order = np.lexsort((sources, label_ids, ends, starts))
+        keys = np.stack([starts[order], ends[order], label_ids[order]])
+        first = np.ones(n, dtype=bool)
+        first[1:] = np.any(keys[:, 1:] != keys[:, :-1], axis=0)
+        return order[first]
+
+    lengths = ends - starts
+    if policy == MERGE_POLICIES.HIGHEST_SCORE:
+        priority = np.lexsort((sources, starts, -lengths, -scores))
+    elif policy == MERGE_POLICIES.PRIORITY:
+        priority = np.lexsort((starts, -lengths, sources))
+    else:
+        priority = np.lexsort((sources, starts, -lengths))
+    rank = np.empty(n, dtype=np.int64)
+    rank[priority] = np.arange(n)
+
+    # the empty entities occupy their start position
+    occupied_ends = np.maximum(ends, starts + 1)
+    order = np.argsort(starts, kind="stable")
+    reach = np.maximum.accumulate(occupied_ends[order])
+    groups = np.empty(n, dtype=np.int64)
+    groups[order] = np.concatenate([[0], np.cumsum(starts[order][1:] >= reach[:-1])])
+    group_sizes = np.bincount(groups)
+    is_single = group_sizes[groups] == 1
+
+    # visit the entities of each group by their priority
+    selected = [np.flatnonzero(is_single)]
+    overlapping = np.flatnonzero(~is_single)
+    overlapping = overlapping[np.lexsort((rank[overlapping], groups[overlapping]))]
+    # the entity overlaps the kept entities if the kept entities starting
+    # before its end reach past its start; the entities of the preceding
+    # groups end before the start of the group, so they never overlap
+    coordinates = np.unique(starts[overlapping])
+    positions = np.searchsorted(coordinates, starts[overlapping]) + 1
+    bounds = np.searchsorted(coordinates, occupied_ends[overlapping])
+    # the Fenwick tree of the maximum end index of the kept entities
+    tree = [float("-inf")] * (len(coordinates) + 1)
+    kept = []
+    for i, position, bound, start, end in zip(
+        overlapping.tolist(),
+        positions.tolist(),
+        bounds.tolist(),
+        starts[overlapping].tolist(),
+        occupied_ends[overlapping].tolist(),
+    ):
+        reach = float("-inf")
+        while bound > 0:
+            reach = max(reach, tree[bound])
+            bound -= bound & -bound
+        if reach > start:
+            continue
+        while position < len(tree):
+            tree[position] = max(tree[position], end)
+            position += position & -position
+        kept.append(i)
+    selected.append(np.array(kept, dtype=np.int64))
+
+    selected = np.concatenate(selected)
+    return selected[np.lexsort((selected, starts[selected]))]
 
-    sorted_entities = sorted(entities, key=get_sort_key, reverse=True)
-    result = []
-    seen_tokens: Set[int] = set()
-    for entity in sorted_entities:
-        # Check for end - 1 here because boundaries are inclusive
-        if (
-            entity.start_index not in seen_tokens
-            and entity.end_index - 1 not in seen_tokens
-        ):
-            result.append(entity)
-            seen_tokens.update(range(entity.start_index, entity.end_index))
-    result = sorted(result, key=lambda entity: entity.start_index)
-    return result
+
+def shift_entities(entities: Iterable[Entity], offset: int) -> List[Entity]:
+    """Shifts the entity positions by the offset.
+
+    Used to map the entities extracted from a part of the text back to the
+    positions in the whole text.
+
+    Args:
+        entities: The entities to shift.
+        offset: The number of characters to shift the entities by.
+
+    Returns:
+        The list of shifted entities.
+
+    """
+
+    return [
+        Entity(
+            text=entity.text,
+            label=entity.label,
+            start_index=entity.start_index + offset,
+            end_index=entity.end_index + offset,
+            score=entity.score,
+            type=entity.type,
+            regex=entity.regex,
+        )
+        for entity in entities
+    ]
 
 
 def detect_repeated_entities(
@@ -199,7 +488,7 @@ def create_spacy_entities(doc: Doc, entities: List[Entity], spacy_style: str) ->
             continue
         span._.score = entity.score
         if spacy_style == "ent":
-            updated_spans = util.filter_spans(updated_spans + (span,))
+            updated_spans = util.filter_spans(list(updated_spans) + [span])
         elif spacy_style == "span":
             updated_spans.append(span)
         else:
@@ -208,6 +497,33 @@ def create_spacy_entities(doc: Doc, entities: List[Entity], spacy_style: str) ->
     set_doc_entity_spans(doc, updated_spans, spacy_style)
 
 
+def run_pipeline_components(
+    nlp: Language, doc: Doc, disable: Iterable[str] = ()
+) -> Doc:
+    """Run the spacy pipeline components on an already tokenized doc.
+
+    The `sentencizer` component is skipped if the doc already contains
+    the sentence boundaries.
+
+    Args:
+        nlp: The spacy pipeline whose components are run.
+        doc: The tokenized spacy doc.
+        disable: The names of the components to skip.
+
+    Returns:
+        The processed spacy doc.
+
+    """
+
+    for name, component in nlp.pipeline:
+        if name in disable:
+            continue
+        if name == "sentencizer" and doc.has_annotation("SENT_START"):
+            continue
+        doc = component(doc)
+    return doc
+
+
 def get_doc_entity_spans(doc: Doc, spacy_style: str) -> List[Span]:
     """Get the spacy doc entity spans.
 
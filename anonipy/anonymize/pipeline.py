@@ -9,12 +9,55 @@ Classes:
 """
 
 import os
+import time
+import hashlib
 import warnings
-from typing import Union, List
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Union, List, Tuple
 
 from .extractors import ExtractorInterface, MultiExtractor
 from .strategies import StrategyInterface
-from ..utils.file_system import open_file, write_file
+from .stream import StreamAnonymizer
+from .report import RunReport, create_file_record, record_duration
+from ..utils.instrumentation import instrumentation
+from ..utils.memory import AdaptiveBatcher, is_out_of_memory_error
+from ..utils.file_system import (
+    open_file,
+    read_text_chunks,
+    write_file,
+    write_text_chunks,
+)
+
+# =====================================
+# Helper functions
+# =====================================
+
+
+def get_shard(relative_path: str, shard_count: int) -> int:
+    """Get the shard the file is assigned to.
+
+    The assignment is based on the hash of the relative file path, so it is
+    the same on all machines and does not depend on the other files.
+
+    Examples:
+        >>> from anonipy.anonymize.pipeline import get_shard
+        >>> get_shard("subfolder/example.txt", 4)
+        2
+
+    Args:
+        relative_path: The path of the file relative to the input directory.
+        shard_count: The number of shards.
+
+    Returns:
+        The index of the shard, between `0` and `shard_count - 1`.
+
+    """
+
+    key = relative_path.replace(os.sep, "/").encode("utf-8")
+    digest = hashlib.sha1(key).digest()
+    return int.from_bytes(digest[:8], "big") % shard_count
+
 
 # =====================================
 # Pipeline class
@@ -34,9 +77,12 @@ class Pipeline:
     Attributes:
         extractor (ExtractorInterface, MultiExtractor, List[ExtractorInterface]): The extractor to use for entity extraction.
         strategy (StrategyInterface): The strategy to use for anonymization.
+        chunk_size (int): The size in bytes of the chunks in which the large text files are streamed.
+        report (RunReport): The report of the last anonymization run.
+        batcher (AdaptiveBatcher): The scheduler of the memory-aware extraction batches, if the memory budget is set.
 
     Methods:
-        anonymize(input_dir, output_dir, flatten=False):
+        anonymize(input_dir, output_dir, flatten=False, shard_index=0, shard_count=1, workers=1, report_path=None):
             Anonymize files in the input directory and save the anonymized files to the output directory.
 
     """
@@ -45,6 +91,9 @@ class Pipeline:
         self,
         extractor: Union[ExtractorInterface, MultiExtractor, List[ExtractorInterface]],
         strategy: StrategyInterface,
+        chunk_size: Optional[int] = None,
+        memory_budget: Optional[Union[int, str]] = None,
+        max_batch_size: int = 64,
     ):
         """Initialize the pipeline.
 
@@ -57,6 +106,9 @@ class Pipeline:
         Args:
             extractor: The extractor to use for entity extraction.
             strategy: The strategy to use for anonymization.
+            chunk_size: The size in bytes of the chunks in which the text files larger than it are read, anonymized and written. If `None`, the files are processed whole.
+            memory_budget: The maximum resident set size of the process, as the number of bytes or the string with the unit (e.g. `4GB`). If set, the entities of the files are extracted in batches whose size adapts to the budget. If `None`, the files are processed one by one.
+            max_batch_size: The maximum number of files extracted in a batch, when the memory budget is set.
 
         """
 
@@ -74,18 +126,60 @@ class Pipeline:
         if not isinstance(strategy, StrategyInterface):
             raise ValueError("Strategy must be a StrategyInterface.")
 
-        self.strategy = strategy
+        if chunk_size is not None and chunk_size <= 0:
+            raise ValueError("Chunk size must be a positive number.")
 
-    def anonymize(self, input_dir: str, output_dir: str, flatten: bool = False) -> dict:
+        self.strategy = strategy
+        self.chunk_size = chunk_size
+        self.report = None
+        self.batcher = (
+            AdaptiveBatcher(memory_budget, max_batch_size=max_batch_size)
+            if memory_budget is not None
+            else None
+        )
+
+    def anonymize(
+        self,
+        input_dir: str,
+        output_dir: str,
+        flatten: bool = False,
+        shard_index: int = 0,
+        shard_count: int = 1,
+        workers: int = 1,
+        report_path: Optional[str] = None,
+    ) -> dict:
         """Anonymize files in the input directory and save the anonymized files to the output directory.
 
+        The files can be split into disjoint shards, processed on different
+        machines. The files are assigned to the shards by the hash of their
+        relative path. When sharding or using multiple workers, the anonymized
+        files are numbered by their position in the sorted input directory, so
+        the outputs and mappings of the shards can be merged without conflicts.
+
+        When the memory budget is set, the entities of the files are extracted
+        in batches. The batch size adapts to the memory used by the previous
+        batches, and the batches running out of memory are retried in smaller
+        batches, so a single large file does not stop the whole run.
+
+        The run is recorded in the `report` attribute, containing the size,
+        stage durations, entities per label and skip reason of each file, and
+        the throughput and latency statistics of the run.
+
+        Examples:
+            >>> pipeline.anonymize("/path/to/input_dir", "/path/to/output_dir", shard_index=0, shard_count=4)
+            >>> pipeline.anonymize("/path/to/input_dir", "/path/to/output_dir", report_path="report.json")
+
         Args:
             input_dir: The path to the input directory containing files to be anonymized.
             output_dir: The path to the output directory where anonymized files will be saved.
             flatten: Whether to flatten the output directory structure. Defaults to False.
+            shard_index: The index of the shard to anonymize, between `0` and `shard_count - 1`.
+            shard_count: The number of shards the files are split into.
+            workers: The number of threads anonymizing the files. The threads share the extractor.
+            report_path: The path to the JSON or CSV file the run report is saved to. If `None`, the report is not saved.
 
         Raises:
-            ValueError: If the input directory does not exist or if the input and output directories are the same.
+            ValueError: If the input directory does not exist, if the input and output directories are the same, if the shard or workers arguments are invalid, if multiple workers are used with the memory budget, or if the report format is not supported.
 
         Returns:
             A dictionary mapping the original file paths to the anonymized file paths.
@@ -98,76 +192,459 @@ class Pipeline:
         if os.path.abspath(input_dir) == os.path.abspath(output_dir):
             raise ValueError("Input and output directories cannot be the same.")
 
+        if shard_count < 1 or not 0 <= shard_index < shard_count:
+            raise ValueError(
+                "Shard count must be positive and shard index must be between 0 and shard count - 1."
+            )
+
+        if workers < 1:
+            raise ValueError("Workers must be a positive number.")
+
+        if workers > 1 and self.batcher is not None:
+            raise ValueError(
+                "The memory budget is probed for the whole process and cannot be used with multiple workers."
+            )
+
+        if report_path is not None and not report_path.lower().endswith(
+            (".json", ".csv")
+        ):
+            raise ValueError("Report path must be a JSON or CSV file.")
+
         if not os.path.exists(output_dir):
             os.makedirs(output_dir, exist_ok=True)
 
-        anonymized_files_count = 1
-        file_name_mapping = {}
+        files = [
+            (number, relative_path)
+            for number, relative_path in enumerate(self._list_files(input_dir), 1)
+            if shard_count == 1 or get_shard(relative_path, shard_count) == shard_index
+        ]
 
-        for root, _, files in os.walk(input_dir):
-            for file_name in files:
-                file_path = os.path.join(root, file_name)
+        file_name_mapping = {}
+        self.report = RunReport()
+        self.report.start()
+        records = [
+            create_file_record(
+                relative_path, os.path.getsize(os.path.join(input_dir, relative_path))
+            )
+            for _, relative_path in files
+        ]
+
+        def add_mapping(relative_path: str, output_file_path: str) -> None:
+            file_path_before = os.path.join(input_dir.split(os.sep)[-1], relative_path)
+            file_path_after = os.path.relpath(output_file_path, output_dir)
+            file_name_mapping[file_path_before] = os.path.join(
+                output_dir.split(os.sep)[-1], file_path_after
+            )
 
-                try:
-                    anonymized_text = self._anonymize_file(file_path)
-                    if anonymized_text is None:
-                        continue
-                except Exception as e:
-                    warnings.warn(f"Problems while processing file {file_path}: {e}")
+        if workers == 1:
+            file_paths = [os.path.join(input_dir, path) for _, path in files]
+            if self.batcher is not None:
+                extracted_files = self.batcher.map(
+                    self._extract_files, list(zip(file_paths, records))
+                )
+            else:
+                extracted_files = [None] * len(files)
+
+            # number the anonymized files consecutively, unless sharding
+            anonymized_files_count = 1
+            for (number, relative_path), file_path, record, extracted in zip(
+                files, file_paths, records, extracted_files
+            ):
+                output_file_path = self._get_output_file_path(
+                    output_dir,
+                    relative_path,
+                    anonymized_files_count if shard_count == 1 else number,
+                    flatten,
+                )
+                is_anonymized = self._process_file(
+                    file_path, output_file_path, record, extracted
+                )
+                self.report.add_file(record)
+                if not is_anonymized:
                     continue
-
-                _, ext = os.path.splitext(file_name)
-                output_file_name = f"file{anonymized_files_count}_anony{ext}"
                 anonymized_files_count += 1
+                add_mapping(relative_path, output_file_path)
+        else:
+            # number the anonymized files by their position in the input directory
+            output_file_paths = [
+                self._get_output_file_path(output_dir, relative_path, number, flatten)
+                for number, relative_path in files
+            ]
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                anonymized = list(
+                    executor.map(
+                        self._process_file,
+                        [os.path.join(input_dir, path) for _, path in files],
+                        output_file_paths,
+                        records,
+                    )
+                )
+            for (_, relative_path), output_file_path, is_anonymized, record in zip(
+                files, output_file_paths, anonymized, records
+            ):
+                self.report.add_file(record)
+                if is_anonymized:
+                    add_mapping(relative_path, output_file_path)
+
+        self.report.stop()
+        if report_path is not None:
+            self.report.save(report_path)
+        return file_name_mapping
 
-                relative_path = os.path.relpath(file_path, input_dir)
+    # =====================================
+    # Private methods
+    # =====================================
 
-                if flatten:
-                    output_file_path = os.path.join(output_dir, output_file_name)
-                else:
-                    output_file_path = os.path.join(
-                        output_dir, os.path.dirname(relative_path), output_file_name
-                    )
-                    os.makedirs(os.path.dirname(output_file_path), exist_ok=True)
+    def _list_files(self, input_dir: str) -> List[str]:
+        """List the files in the input directory in a deterministic order.
 
-                write_file(anonymized_text, output_file_path)
+        Args:
+            input_dir: The path to the input directory.
 
-                file_path_before = os.path.join(
-                    input_dir.split(os.sep)[-1], relative_path
-                )
-                file_path_after = os.path.relpath(output_file_path, output_dir)
-                file_name_mapping[file_path_before] = os.path.join(
-                    output_dir.split(os.sep)[-1], file_path_after
-                )
+        Returns:
+            The sorted list of the file paths relative to the input directory.
 
-        return file_name_mapping
+        """
 
-    def _anonymize_file(self, file_path: str) -> Union[str, None]:
-        """Anonymize a single file.
+        relative_paths = []
+        for root, dirs, files in os.walk(input_dir):
+            dirs.sort()
+            for file_name in sorted(files):
+                file_path = os.path.join(root, file_name)
+                relative_paths.append(os.path.relpath(file_path, input_dir))
+        return relative_paths
+
+    def _get_output_file_path(
+        self, output_dir: str, relative_path: str, number: int, flatten: bool
+    ) -> str:
+        """Get the path of the anonymized file.
+
+        Args:
+            output_dir: The path to the output directory.
+            relative_path: The path of the file relative to the input directory.
+            number: The number of the anonymized file.
+            flatten: Whether to flatten the output directory structure.
+
+        Returns:
+            The path of the anonymized file.
+
+        """
+
+        _, ext = os.path.splitext(relative_path)
+        output_file_name = f"file{number}_anony{ext}"
+        if flatten:
+            return os.path.join(output_dir, output_file_name)
+        return os.path.join(
+            output_dir, os.path.dirname(relative_path), output_file_name
+        )
+
+    def _process_file(
+        self,
+        file_path: str,
+        output_file_path: str,
+        record: Optional[dict] = None,
+        extracted: Optional[tuple] = None,
+    ) -> bool:
+        """Anonymize the file and save it to the output path.
 
         Args:
             file_path: The path to the file to be anonymized.
+            output_file_path: The path to the anonymized file.
+            record: The report record of the file, updated with its statistics.
+            extracted: The (text, entities) tuple of the file extracted in a batch. If `None`, the file is read and extracted.
 
         Returns:
-            The anonymized text or None if the file is empty or if entity extraction fails.
+            `True` if the file was anonymized, `False` if it was skipped.
 
         """
 
-        original_text = open_file(file_path)
+        if record is None:
+            record = create_file_record(file_path)
+
+        with record_duration(record, "total"):
+            streamed = self._is_streamed(file_path)
+            try:
+                if streamed:
+                    # the anonymized chunks are written while processing
+                    os.makedirs(os.path.dirname(output_file_path), exist_ok=True)
+                    anonymized = self._anonymize_file_stream(
+                        file_path, output_file_path, record
+                    )
+                else:
+                    anonymized_text = self._anonymize_file(file_path, record, extracted)
+                    anonymized = anonymized_text is not None
+                if not anonymized:
+                    return False
+            except Exception as e:
+                warnings.warn(f"Problems while processing file {file_path}: {e}")
+                record["status"] = "failed"
+                record["skip_reason"] = f"error: {e}"
+                return False
+
+            if not streamed:
+                os.makedirs(os.path.dirname(output_file_path), exist_ok=True)
+                with (
+                    instrumentation.stage("pipeline.write", files=1) as stage,
+                    record_duration(record, "write"),
+                ):
+                    write_file(anonymized_text, output_file_path)
+                    stage.add("bytes", os.path.getsize(output_file_path))
+
+        record["status"] = "anonymized"
+        record["output_file"] = output_file_path
+        return True
+
+    def _read_file(self, file_path: str, record: dict) -> Union[str, None]:
+        """Read the text of the file.
+
+        Args:
+            file_path: The path to the file to be read.
+            record: The report record of the file, updated with its statistics.
+
+        Returns:
+            The text of the file or None if the file cannot be read or is empty.
+
+        """
+
+        with (
+            instrumentation.stage(
+                "pipeline.read", files=1, bytes=os.path.getsize(file_path)
+            ),
+            record_duration(record, "read"),
+        ):
+            original_text = open_file(file_path)
         if original_text is None or not original_text.strip():
             warnings.warn(
                 f"Skipping file {file_path}: Failed to read or file is empty."
             )
+            record["skip_reason"] = "empty"
             return None
+        return original_text
+
+    def _extract_files(self, files: List[Tuple[str, dict]]) -> List[Optional[tuple]]:
+        """Read the files and extract their entities in a single batch.
+
+        The streamed files are skipped, as they are extracted chunk by chunk.
+        The out-of-memory errors are raised for the adaptive batcher to retry
+        the files in smaller batches, unless the batch cannot be reduced. The
+        records are then restored, so the retried files are not reported
+        twice. On the other errors, the files are extracted one by one, so
+        only the failing files are skipped.
+
+        Args:
+            files: The list of (file path, report record) tuples.
+
+        Returns:
+            The list of the (text, entities) tuples, in the order of the files. The text is None if the file was skipped, and the tuple is None if the file is streamed.
+
+        """
+
+        outputs = [None] * len(files)
+        snapshots = [dict(record) for _, record in files]
+        batch_ids, texts = [], []
+        for i, (file_path, record) in enumerate(files):
+            if self._is_streamed(file_path):
+                continue
+            with record_duration(record, "total"):
+                try:
+                    text = self._read_file(file_path, record)
+                except Exception as e:
+                    warnings.warn(f"Problems while processing file {file_path}: {e}")
+                    record["status"] = "failed"
+                    record["skip_reason"] = f"error: {e}"
+                    text = None
+            outputs[i] = (text, [])
+            if text is not None:
+                batch_ids.append(i)
+                texts.append(text)
+        if not texts:
+            return outputs
+
+        start_time = time.perf_counter()
+        try:
+            with instrumentation.stage("pipeline.extract") as stage:
+                extractor_outputs = self.extractor.batch(texts)
+                stage.add("entities", sum(len(e) for _, e in extractor_outputs))
+        except Exception as e:
+            if not is_out_of_memory_error(e):
+                return self._extract_files_separately(files, batch_ids, texts, outputs)
+            if len(files) > self.batcher.min_batch_size:
+                # the files are read again when the batch is retried
+                for (_, record), snapshot in zip(files, snapshots):
+                    record.clear()
+                    record.update(snapshot)
+                raise
+            for i in batch_ids:
+                file_path, record = files[i]
+                warnings.warn(f"Problems while processing file {file_path}: {e}")
+                record["status"] = "failed"
+                record["skip_reason"] = f"error: {e}"
+                outputs[i] = (None, [])
+            return outputs
+
+        # the extraction time is shared by the files of the batch
+        duration = (time.perf_counter() - start_time) / len(texts)
+        for i, text, (_, entities) in zip(batch_ids, texts, extractor_outputs):
+            _, record = files[i]
+            record["extract_s"] += duration
+            record["total_s"] += duration
+            outputs[i] = (text, entities)
+        return outputs
+
+    def _extract_files_separately(
+        self,
+        files: List[Tuple[str, dict]],
+        batch_ids: List[int],
+        texts: List[str],
+        outputs: List[Optional[tuple]],
+    ) -> List[Optional[tuple]]:
+        """Extract the entities of the files one by one.
+
+        Args:
+            files: The list of (file path, report record) tuples.
+            batch_ids: The positions of the read files in the list of files.
+            texts: The texts of the read files.
+            outputs: The list of the (text, entities) tuples, updated with the extracted entities.
+
+        Returns:
+            The list of the (text, entities) tuples, in the order of the files.
+
+        """
 
-        _, entities = self.extractor(original_text)
+        for i, text in zip(batch_ids, texts):
+            file_path, record = files[i]
+            try:
+                with (
+                    instrumentation.stage("pipeline.extract") as stage,
+                    record_duration(record, "extract"),
+                    record_duration(record, "total"),
+                ):
+                    _, entities = self.extractor(text)
+                    stage.add("entities", len(entities))
+            except Exception as e:
+                warnings.warn(f"Problems while processing file {file_path}: {e}")
+                record["status"] = "failed"
+                record["skip_reason"] = f"error: {e}"
+                outputs[i] = (None, [])
+                continue
+            outputs[i] = (text, entities)
+        return outputs
+
+    def _anonymize_file(
+        self, file_path: str, record: dict, extracted: Optional[tuple] = None
+    ) -> Union[str, None]:
+        """Anonymize a single file.
+
+        Args:
+            file_path: The path to the file to be anonymized.
+            record: The report record of the file, updated with its statistics.
+            extracted: The (text, entities) tuple of the file extracted in a batch. If `None`, the file is read and extracted.
+
+        Returns:
+            The anonymized text or None if the file is empty or if entity extraction fails.
+
+        """
 
+        if extracted is not None:
+            original_text, entities = extracted
+            if original_text is None:
+                # the file was skipped while extracting the batch
+                return None
+        else:
+            original_text = self._read_file(file_path, record)
+            if original_text is None:
+                return None
+            with (
+                instrumentation.stage("pipeline.extract") as stage,
+                record_duration(record, "extract"),
+            ):
+                _, entities = self.extractor(original_text)
+                stage.add("entities", len(entities))
+
+        record["entities"] = len(entities)
+        record["entities_per_label"] = dict(Counter(e.label for e in entities))
         if not entities:
             warnings.warn(
                 f"Skipping file {file_path}: Entity extraction returned None."
             )
+            record["skip_reason"] = "no_entities"
             return None
 
-        anonymized_text, _ = self.strategy.anonymize(original_text, entities)
+        with (
+            instrumentation.stage("pipeline.anonymize") as stage,
+            record_duration(record, "anonymize"),
+        ):
+            anonymized_text, replacements = self.strategy.anonymize(
+                original_text, entities
+            )
+            stage.add("replacements", len(replacements))
 
         return anonymized_text
+
+    def _is_streamed(self, file_path: str) -> bool:
+        """Check whether the file is anonymized in chunks.
+
+        Args:
+            file_path: The path to the file.
+
+        Returns:
+            `True` if the file is a text file larger than the chunk size, `False` otherwise.
+
+        """
+
+        _, ext = os.path.splitext(file_path)
+        return (
+            self.chunk_size is not None
+            and ext.lower() == ".txt"
+            and os.path.getsize(file_path) > self.chunk_size
+        )
+
+    def _anonymize_file_stream(
+        self, file_path: str, output_file_path: str, record: dict
+    ) -> bool:
+        """Anonymize a single text file chunk by chunk.
+
+        The anonymized chunks are written to a temporary file, which replaces
+        the output file once all chunks are anonymized. The entities are
+        replaced consistently across the chunks.
+
+        Args:
+            file_path: The path to the text file to be anonymized.
+            output_file_path: The path to the anonymized file.
+            record: The report record of the file, updated with its statistics.
+
+        Returns:
+            `True` if the file was anonymized, `False` if no entities were found.
+
+        """
+
+        stream = StreamAnonymizer(self.extractor, self.strategy)
+        chunks = read_text_chunks(file_path, self.chunk_size)
+
+        temp_file_path = f"{output_file_path}.part"
+        try:
+            with (
+                instrumentation.stage(
+                    "pipeline.stream", files=1, bytes=os.path.getsize(file_path)
+                ) as stage,
+                record_duration(record, "stream"),
+            ):
+                write_text_chunks(stream(chunks), temp_file_path)
+                stage.add("entities", stream.entities_count)
+        except Exception:
+            if os.path.exists(temp_file_path):
+                os.remove(temp_file_path)
+            raise
+
+        record["entities"] = stream.entities_count
+        record["entities_per_label"] = dict(stream.entities_per_label)
+        if stream.entities_count == 0:
+            os.remove(temp_file_path)
+            warnings.warn(
+                f"Skipping file {file_path}: Entity extraction returned None."
+            )
+            record["skip_reason"] = "no_entities"
+            return False
+
+        os.replace(temp_file_path, output_file_path)
+        return True
@@ -0,0 +1,348 @@
+"""Module containing the `report`.
+
+The `report` module provides a class for collecting the per-file statistics
+of a pipeline run and summarizing them into the throughput and latency
+statistics, which are saved as a JSON or CSV file.
+
+Classes:
+    RunReport: The class representing the report of the pipeline run.
+
+Methods:
+    create_file_record(file, size_bytes):
+        Create the record of the processed file.
+    record_duration(record, stage):
+        Measure the duration of the stage and add it to the file record.
+
+"""
+
+import os
+import csv
+import json
+import time
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+import numpy as np
+
+# the stages measured for each file; the streamed files are read, anonymized
+# and written in a single `stream` stage
+STAGES = ["read", "extract", "anonymize", "write", "stream"]
+
+# the latency percentiles reported in the summary
+PERCENTILES = [50, 90, 95, 99]
+
+# the columns of the CSV report
+CSV_COLUMNS = [
+    "file",
+    "output_file",
+    "status",
+    "skip_reason",
+    "size_bytes",
+    *[f"{stage}_s" for stage in STAGES],
+    "total_s",
+    "entities",
+    "entities_per_label",
+]
+
+# =====================================
+# Helper functions
+# =====================================
+
+
+def create_file_record(file: str, size_bytes: int = 0) -> dict:
+    """Create the record of the processed file.
+
+    Examples:
+        >>> from anonipy.anonymize.report import create_file_record
+        >>> record = create_file_record("subfolder/example.txt", 1024)
+
+    Args:
+        file: The path of the file relative to the input directory.
+        size_bytes: The size of the file in bytes.
+
+    Returns:
+        The file record with the zero durations and no entities.
+
+    """
+
+    return {
+        "file": file,
+        "output_file": None,
+        "status": "skipped",
+        "skip_reason": None,
+        "size_bytes": size_bytes,
+        **{f"{stage}_s": 0.0 for stage in STAGES},
+        "total_s": 0.0,
+        "entities": 0,
+        "entities_per_label": {},
+    }
+
+
+@contextmanager
+def record_duration(record: Optional[dict], stage: str) -> Iterator[None]:
+    """Measure the duration of the stage and add it to the file record.
+
+    Examples:
+        >>> from anonipy.anonymize.report import record_duration
+        >>> with record_duration(record, "extract"):
+        >>>     entities = extractor(text)
+
+    Args:
+        record: The file record. If `None`, the duration is not recorded.
+        stage: The name of the stage.
+
+    """
+
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        if record is not None:
+            record[f"{stage}_s"] += time.perf_counter() - start_time
+
+
+def _get_percentiles(values: List[float]) -> dict:
+    """Get the latency percentiles of the values.
+
+    Args:
+        values: The list of the durations in seconds.
+
+    Returns:
+        The dictionary of the percentiles and the maximum of the values.
+
+    """
+
+    if not values:
+        return {**{f"p{p}": 0.0 for p in PERCENTILES}, "max": 0.0}
+    percentiles = np.percentile(values, PERCENTILES)
+    return {
+        **{f"p{p}": float(v) for p, v in zip(PERCENTILES, percentiles)},
+        "max": float(max(values)),
+    }
+
+
+# =====================================
+# Main class
+# =====================================
+
+
+class RunReport:
+    """The class representing the report of the pipeline run.
+
+    The report contains a record for each processed file, with its size, the
+    durations of the processing stages, the number of entities per label, its
+    status (`anonymized`, `skipped` or `failed`) and the reason it was not
+    anonymized. The summary aggregates the records into the throughput and
+    latency statistics of the run.
+
+    Examples:
+        >>> from anonipy.anonymize.report import RunReport
+        >>> report = RunReport()
+        >>> report.start()
+        >>> report.add_file(record)
+        >>> report.stop()
+        >>> report.save("report.json")
+
+    Attributes:
+        files (List[dict]): The records of the processed files.
+        start_time (float): The wall clock time the run started at.
+        end_time (float): The wall clock time the run ended at.
+        slowest_count (int): The number of the slowest files listed in the summary.
+
+    Methods:
+        start():
+            Mark the start of the run.
+        stop():
+            Mark the end of the run.
+        add_file(record):
+            Add the record of the processed file.
+        get_summary():
+            Get the aggregate statistics of the run.
+        to_dict():
+            Get the summary and the file records.
+        save(path, format=None):
+            Save the report as a JSON or CSV file.
+
+    """
+
+    def __init__(self, slowest_count: int = 10):
+        """Initialize the run report.
+
+        Examples:
+            >>> from anonipy.anonymize.report import RunReport
+            >>> report = RunReport(slowest_count=5)
+
+        Args:
+            slowest_count: The number of the slowest files listed in the summary.
+
+        Raises:
+            ValueError: If `slowest_count` is negative.
+
+        """
+
+        if slowest_count < 0:
+            raise ValueError("The slowest_count must be a non-negative number.")
+
+        self.files: List[dict] = []
+        self.start_time = None
+        self.end_time = None
+        self.slowest_count = slowest_count
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Mark the start of the run."""
+
+        self.start_time = time.time()
+        self.end_time = None
+
+    def stop(self) -> None:
+        """Mark the end of the run."""
+
+        self.end_time = time.time()
+
+    def add_file(self, record: dict) -> None:
+        """Add the record of the processed file.
+
+        The method is thread-safe, so the records can be added by the workers.
+
+        Examples:
+            >>> report.add_file(create_file_record("example.txt", 1024))
+
+        Args:
+            record: The file record, created with the `create_file_record` function.
+
+        """
+
+        with self._lock:
+            self.files.append(record)
+
+    def get_summary(self) -> dict:
+        """Get the aggregate statistics of the run.
+
+        The throughput is computed over the wall clock duration of the run,
+        and the latency percentiles over the total durations of the files.
+
+        Examples:
+            >>> summary = report.get_summary()
+            >>> summary["docs_per_s"]
+            12.5
+
+        Returns:
+            The dictionary of the aggregate statistics.
+
+        """
+
+        with self._lock:
+            files = list(self.files)
+
+        if self.start_time is None:
+            duration = sum(record["total_s"] for record in files)
+        else:
+            end_time = self.end_time if self.end_time is not None else time.time()
+            duration = end_time - self.start_time
+
+        statuses = Counter(record["status"] for record in files)
+        size_bytes = sum(record["size_bytes"] for record in files)
+        entities = sum(record["entities"] for record in files)
+        entities_per_label = Counter()
+        for record in files:
+            entities_per_label.update(record["entities_per_label"])
+        skip_reasons = Counter(
+            record["skip_reason"] for record in files if record["skip_reason"]
+        )
+
+        def per_second(value: float) -> float:
+            return value / duration if duration > 0 else 0.0
+
+        slowest = sorted(files, key=lambda record: record["total_s"], reverse=True)
+        return {
+            "files": len(files),
+            "anonymized": statuses["anonymized"],
+            "skipped": statuses["skipped"],
+            "failed": statuses["failed"],
+            "size_bytes": size_bytes,
+            "entities": entities,
+            "entities_per_label": dict(entities_per_label),
+            "skip_reasons": dict(skip_reasons),
+            "duration_s": duration,
+            "docs_per_s": per_second(len(files)),
+            "mb_per_s": per_second(size_bytes / 1_000_000),
+            "entities_per_s": per_second(entities),
+            "latency_s": {
+                "total": _get_percentiles([record["total_s"] for record in files]),
+                **{
+                    stage: _get_percentiles([record[f"{stage}_s"] for record in files])
+                    for stage in STAGES
+                },
+            },
+            "slowest_files": [
+                {"file": record["file"], "total_s": record["total_s"]}
+                for record in slowest[: self.slowest_count]
+            ],
+        }
+
+    def to_dict(self) -> dict:
+        """Get the summary and the file records.
+
+        Examples:
+            >>> report.to_dict()
+            {"summary": {...}, "files": [...]}
+
+        Returns:
+            The dictionary containing the `summary` and the `files` records.
+
+        """
+
+        with self._lock:
+            files = sorted(self.files, key=lambda record: record["file"])
+        return {"summary": self.get_summary(), "files": files}
+
+    def save(self, path: str, format: Optional[str] = None) -> None:
+        """Save the report as a JSON or CSV file.
+
+        The JSON file contains the summary and the file records, while the CSV
+        file contains a row for each file record, with the entities per label
+        stored as a JSON object.
+
+        Examples:
+            >>> report.save("report.json")
+            >>> report.save("report.csv")
+
+        Args:
+            path: The path to the report file.
+            format: The format of the report, either `json` or `csv`. If `None`, it is inferred from the file extension.
+
+        Raises:
+            ValueError: If the format is not supported.
+
+        """
+
+        if format is None:
+            _, extension = os.path.splitext(path)
+            format = extension.lstrip(".")
+        format = format.lower()
+        if format not in ["json", "csv"]:
+            raise ValueError(f"The report format is not supported: {format}")
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        report = self.to_dict()
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            if format == "json":
+                json.dump(report, f, indent=2, ensure_ascii=False)
+                return
+            writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
+            writer.writeheader()
+            for record in report["files"]:
+                writer.writerow(
+                    {
+                        **record,
+                        "entities_per_label": json.dumps(
+                            record["entities_per_label"], ensure_ascii=False
+                        ),
+                    }
+                )
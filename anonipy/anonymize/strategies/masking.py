@@ -1,8 +1,8 @@
 import re
-from typing import List, Tuple
+from typing import List, Tuple, Union
 
 from .interface import StrategyInterface
-from ...definitions import Entity, Replacement
+from ...definitions import Entity, EntityBatch, Replacement
 from ..helpers import anonymize
 
 # =====================================
@@ -43,8 +43,8 @@ class MaskingStrategy(StrategyInterface):
         self.substitute_label = substitute_label or "*"
 
     def anonymize(
-        self, text: str, entities: List[Entity], *args, **kwargs
-    ) -> Tuple[str, List[Replacement]]:
+        self, text: str, entities: Union[List[Entity], EntityBatch], *args, **kwargs
+    ) -> Tuple[str, Union[List[Replacement], EntityBatch]]:
         """Anonymize the text using the masking strategy.
 
         Examples:
@@ -54,14 +54,26 @@ class MaskingStrategy(StrategyInterface):
 
         Args:
             text: The text to anonymize.
-            entities: The list of entities to anonymize.
+            entities: The list of entities, or the entity batch, to anonymize.
 
         Returns:
             The anonymized text.
-            The list of applied replacements.
+            The list of applied replacements, or the entity batch with the anonymized texts.
 
         """
 
+        if isinstance(entities, EntityBatch):
+            # the entities with the same text share the mask
+            entity_texts = entities.get_texts()
+            masks = {}
+            for entity_text in entity_texts:
+                if entity_text not in masks:
+                    masks[entity_text] = self._mask_text(entity_text)
+            return anonymize(
+                text,
+                entities.with_anonymized_texts([masks[t] for t in entity_texts]),
+            )
+
         replacements = [self._create_replacement(ent) for ent in entities]
         anonymized_text, replacements = anonymize(text, replacements)
         return anonymized_text, replacements
@@ -82,13 +94,13 @@ class MaskingStrategy(StrategyInterface):
         """
 
         mask = self._create_mask(entity)
-        return {
-            "original_text": entity.text,
-            "label": entity.label,
-            "start_index": entity.start_index,
-            "end_index": entity.end_index,
-            "anonymized_text": mask,
-        }
+        return Replacement(
+            original_text=entity.text,
+            label=entity.label,
+            start_index=entity.start_index,
+            end_index=entity.end_index,
+            anonymized_text=mask,
+        )
 
     def _create_mask(self, entity: Entity) -> str:
         """Creates a mask for the entity.
@@ -101,10 +113,20 @@ class MaskingStrategy(StrategyInterface):
 
         """
 
+        return self._mask_text(entity.text)
+
+    def _mask_text(self, text: str) -> str:
+        """Creates a mask for the entity text.
+
+        Args:
+            text: The entity text to create the mask for.
+
+        Returns:
+            The created mask.
+
+        """
+
         # TODO: add random length substitution
         return " ".join(
-            [
-                self.substitute_label * len(chunk)
-                for chunk in re.split(r"\s+", entity.text)
-            ]
+            [self.substitute_label * len(chunk) for chunk in re.split(r"\s+", text)]
         )
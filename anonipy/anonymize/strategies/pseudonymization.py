@@ -1,8 +1,9 @@
-from typing import List, Tuple, Callable
+from typing import List, Tuple, Callable, Union
 
 from .interface import StrategyInterface
-from ...definitions import Entity, Replacement
+from ...definitions import Entity, EntityBatch, Replacement
 from ..helpers import anonymize
+from ...utils.instrumentation import instrumentation
 
 # =====================================
 # Main class
@@ -42,8 +43,8 @@ class PseudonymizationStrategy(StrategyInterface):
         self.mapping = mapping
 
     def anonymize(
-        self, text: str, entities: List[Entity], *args, **kwargs
-    ) -> Tuple[str, List[Replacement]]:
+        self, text: str, entities: Union[List[Entity], EntityBatch], *args, **kwargs
+    ) -> Tuple[str, Union[List[Replacement], EntityBatch]]:
         """Anonymize the text using the pseudonymization strategy.
 
         Examples:
@@ -53,14 +54,22 @@ class PseudonymizationStrategy(StrategyInterface):
 
         Args:
             text: The text to anonymize.
-            entities: The list of entities to anonymize.
+            entities: The list of entities, or the entity batch, to anonymize.
 
         Returns:
             The anonymized text.
-            The list of applied replacements.
+            The list of applied replacements, or the entity batch with the anonymized texts.
 
         """
 
+        if isinstance(entities, EntityBatch):
+            return anonymize(
+                text,
+                entities.with_anonymized_texts(
+                    self._create_anonymized_texts(text, entities)
+                ),
+            )
+
         replacements = []
         for ent in entities:
             replacement = self._create_replacement(ent, text, replacements)
@@ -73,7 +82,7 @@ class PseudonymizationStrategy(StrategyInterface):
     # ===========================================
 
     def _create_replacement(
-        self, entity: Entity, text: str, replacements: List[dict]
+        self, entity: Entity, text: str, replacements: List[Replacement]
     ) -> Replacement:
         """Creates a replacement for the entity.
 
@@ -90,16 +99,40 @@ class PseudonymizationStrategy(StrategyInterface):
         # check if the replacement already exists
         anonymized_text = self._check_replacement(entity, replacements)
         # create a new replacement if it doesn't exist
-        anonymized_text = (
-            self.mapping(text, entity) if not anonymized_text else anonymized_text
+        if not anonymized_text:
+            with instrumentation.stage("strategy.mapping", replacements=1):
+                anonymized_text = self.mapping(text, entity)
+        return Replacement(
+            original_text=entity.text,
+            label=entity.label,
+            start_index=entity.start_index,
+            end_index=entity.end_index,
+            anonymized_text=anonymized_text,
         )
-        return {
-            "original_text": entity.text,
-            "label": entity.label,
-            "start_index": entity.start_index,
-            "end_index": entity.end_index,
-            "anonymized_text": anonymized_text,
-        }
+
+    def _create_anonymized_texts(self, text: str, entities: EntityBatch) -> List[str]:
+        """Creates the anonymized texts of the entity batch.
+
+        The entities with the same text share the anonymized text, so the
+        mapping is called once per distinct entity text.
+
+        Args:
+            text: The text to anonymize.
+            entities: The entity batch to create the anonymized texts for.
+
+        Returns:
+            The anonymized texts, in the order of the entities.
+
+        """
+
+        pseudonyms = {}
+        anonymized_texts = []
+        for i, entity_text in enumerate(entities.get_texts()):
+            if entity_text not in pseudonyms:
+                with instrumentation.stage("strategy.mapping", replacements=1):
+                    pseudonyms[entity_text] = self.mapping(text, entities[i])
+            anonymized_texts.append(pseudonyms[entity_text])
+        return anonymized_texts
 
     def _check_replacement(
         self, entity: Entity, replacements: List[Replacement]
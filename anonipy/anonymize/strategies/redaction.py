@@ -1,7 +1,7 @@
-from typing import List, Tuple
+from typing import List, Tuple, Union
 
 from .interface import StrategyInterface
-from ...definitions import Entity, Replacement
+from ...definitions import Entity, EntityBatch, Replacement
 from ..helpers import anonymize
 
 # =====================================
@@ -42,8 +42,8 @@ class RedactionStrategy(StrategyInterface):
         self.substitute_label = substitute_label or "[REDACTED]"
 
     def anonymize(
-        self, text: str, entities: List[Entity], *args, **kwargs
-    ) -> Tuple[str, List[Replacement]]:
+        self, text: str, entities: Union[List[Entity], EntityBatch], *args, **kwargs
+    ) -> Tuple[str, Union[List[Replacement], EntityBatch]]:
         """Anonymize the text using the redaction strategy.
 
         Examples:
@@ -53,14 +53,20 @@ class RedactionStrategy(StrategyInterface):
 
         Args:
             text: The text to anonymize.
-            entities: The list of entities to anonymize.
+            entities: The list of entities, or the entity batch, to anonymize.
 
         Returns:
             The anonymized text.
-            The list of applied replacements.
+            The list of applied replacements, or the entity batch with the anonymized texts.
 
         """
 
+        if isinstance(entities, EntityBatch):
+            return anonymize(
+                text,
+                entities.with_anonymized_texts([self.substitute_label] * len(entities)),
+            )
+
         replacements = [self._create_replacement(ent) for ent in entities]
         anonymized_text, replacements = anonymize(text, replacements)
         return anonymized_text, replacements
@@ -80,10 +86,10 @@ class RedactionStrategy(StrategyInterface):
 
         """
 
-        return {
-            "original_text": entity.text,
-            "label": entity.label,
-            "start_index": entity.start_index,
-            "end_index": entity.end_index,
-            "anonymized_text": self.substitute_label,
-        }
+        return Replacement(
+            original_text=entity.text,
+            label=entity.label,
+            start_index=entity.start_index,
+            end_index=entity.end_index,
+            anonymized_text=self.substitute_label,
+        )
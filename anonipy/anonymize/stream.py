@@ -0,0 +1,350 @@
+"""Module containing the `stream` anonymization.
+
+The `stream` module provides a class for anonymizing unbounded text streams,
+such as live logs or socket feeds, which are received in chunks.
+
+Classes:
+    StreamAnonymizer: The class representing the stream anonymizer.
+
+Methods:
+    anonymize_stream(chunks, extractor, strategy, lookback):
+        Anonymize the stream of text chunks.
+
+"""
+
+import re
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .extractors import ExtractorInterface, MultiExtractor
+from .strategies import StrategyInterface
+from .helpers import anonymize, shift_entities
+from ..definitions import Entity, Replacement
+
+# pattern of the whitespace used to align the finalized text to words
+_WHITESPACE = re.compile(r"\s")
+
+# =====================================
+# Main class
+# =====================================
+
+
+class StreamAnonymizer:
+    """The class representing the stream anonymizer.
+
+    The stream anonymizer holds back the last `lookback` characters of the
+    received text, so that the entities crossing the chunk boundaries are
+    extracted when the next chunk arrives. The last `lookback` characters of
+    the finalized text are used as the left context of the extraction. The
+    extraction runs once the buffer holds more than twice the `lookback`
+    characters, and the anonymized text is yielded as soon as it is finalized.
+
+    The replacements of the entities are stored and reused, so that the same
+    entity is replaced in the same way across the whole stream. At most
+    `max_pseudonyms` replacements are stored, and the least recently used
+    ones are removed first, so the memory stays bounded on infinite streams.
+
+    Examples:
+        >>> from anonipy.anonymize.stream import StreamAnonymizer
+        >>> stream = StreamAnonymizer(extractor, strategy)
+        >>> for anonymized_chunk in stream.anonymize_stream(chunks):
+        >>>     print(anonymized_chunk)
+
+    Attributes:
+        extractor (ExtractorInterface, MultiExtractor): The extractor to use for entity extraction.
+        strategy (StrategyInterface): The strategy to use for anonymization.
+        lookback (int): The number of characters held back for the next chunk and used as the left context.
+        pseudonyms (OrderedDict[Tuple[str, str], str]): The mapping between the (original text, label) pairs and the anonymized texts of the entities, ordered from the least to the most recently used.
+        max_pseudonyms (int): The maximum number of stored replacements. If `None`, the number is not bounded.
+        entities_count (int): The number of anonymized entities.
+        entities_per_label (Dict[str, int]): The number of anonymized entities per label.
+
+    Methods:
+        __call__(chunks):
+            Anonymize the stream of text chunks. Calls the `anonymize_stream` method.
+        anonymize_stream(chunks):
+            Anonymize the stream of text chunks.
+
+    """
+
+    def __init__(
+        self,
+        extractor: Union[ExtractorInterface, MultiExtractor],
+        strategy: StrategyInterface,
+        lookback: int = 256,
+        pseudonyms: Optional[Dict[Tuple[str, str], str]] = None,
+        max_pseudonyms: Optional[int] = 100_000,
+    ):
+        """Initialize the stream anonymizer.
+
+        Examples:
+            >>> from anonipy.anonymize.stream import StreamAnonymizer
+            >>> stream = StreamAnonymizer(extractor, strategy, lookback=256)
+
+        Args:
+            extractor: The extractor to use for entity extraction.
+            strategy: The strategy to use for anonymization.
+            lookback: The number of characters held back for the next chunk and used as the left context.
+            pseudonyms: The initial mapping between the (original text, label) pairs and the anonymized texts of the entities.
+            max_pseudonyms: The maximum number of stored replacements. If `0`, the replacements are not reused. If `None`, the number is not bounded.
+
+        Raises:
+            ValueError: If `lookback` or `max_pseudonyms` is negative.
+
+        """
+
+        if lookback < 0:
+            raise ValueError("The lookback must be a non-negative number.")
+        if max_pseudonyms is not None and max_pseudonyms < 0:
+            raise ValueError("The max_pseudonyms must be a non-negative number.")
+
+        self.extractor = extractor
+        self.strategy = strategy
+        self.lookback = lookback
+        self.max_pseudonyms = max_pseudonyms
+        self.pseudonyms: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        for key, anonymized_text in (pseudonyms or {}).items():
+            self._store_pseudonym(key, anonymized_text)
+        self.entities_count = 0
+        self.entities_per_label = {}
+
+    def __call__(self, chunks: Iterable[str]) -> Iterator[str]:
+        """Anonymize the stream of text chunks.
+
+        Examples:
+            >>> for anonymized_chunk in stream(chunks):
+            >>>     print(anonymized_chunk)
+
+        Args:
+            chunks: The text chunks to anonymize.
+
+        Returns:
+            The iterator over the anonymized text chunks.
+
+        """
+
+        return self.anonymize_stream(chunks)
+
+    def anonymize_stream(self, chunks: Iterable[str]) -> Iterator[str]:
+        """Anonymize the stream of text chunks.
+
+        The yielded chunks do not correspond to the received chunks, but their
+        concatenation is the anonymized concatenation of the received chunks.
+
+        Examples:
+            >>> for anonymized_chunk in stream.anonymize_stream(chunks):
+            >>>     print(anonymized_chunk)
+
+        Args:
+            chunks: The text chunks to anonymize.
+
+        Returns:
+            The iterator over the anonymized text chunks.
+
+        """
+
+        context, buffer = "", ""
+        for chunk in chunks:
+            buffer += chunk
+            # wait for enough text to amortize the extraction
+            if len(buffer) <= 2 * self.lookback:
+                continue
+            anonymized_text, context, buffer = self._finalize(context, buffer)
+            if anonymized_text:
+                yield anonymized_text
+
+        if buffer:
+            anonymized_text, _, _ = self._finalize(context, buffer, final=True)
+            yield anonymized_text
+
+    # ===========================================
+    # Private methods
+    # ===========================================
+
+    def _finalize(
+        self, context: str, buffer: str, final: bool = False
+    ) -> Tuple[str, str, str]:
+        """Anonymize the finalized part of the buffer.
+
+        Args:
+            context: The finalized text preceding the buffer.
+            buffer: The text not finalized yet.
+            final: Whether the stream ended and the whole buffer is finalized.
+
+        Returns:
+            The anonymized finalized text.
+            The context for the next extraction.
+            The remaining buffer.
+
+        """
+
+        _, entities = self.extractor(context + buffer)
+        # keep only the entities within the buffer, the entities starting in
+        # the context are clipped to their part within the buffer
+        entities = [
+            e if e.start_index >= 0 else self._clip_entity(e, buffer)
+            for e in shift_entities(entities, -len(context))
+            if e.end_index > 0
+        ]
+
+        cut = len(buffer) if final else self._find_cut(buffer, entities)
+        segment = buffer[:cut]
+        entities = [e for e in entities if e.end_index <= cut]
+        anonymized_segment = self._anonymize_segment(segment, entities)
+
+        context = (context + segment)[-self.lookback :] if self.lookback else ""
+        return anonymized_segment, context, buffer[cut:]
+
+    def _clip_entity(self, entity: Entity, buffer: str) -> Entity:
+        """Clip the entity starting in the context to the start of the buffer.
+
+        The entity is found only once the buffer provides the rest of its
+        text, so its part within the buffer must still be anonymized.
+
+        Args:
+            entity: The entity starting before the buffer.
+            buffer: The text not finalized yet.
+
+        Returns:
+            The entity covering the part of the entity within the buffer.
+
+        """
+
+        return Entity(
+            text=buffer[: entity.end_index],
+            label=entity.label,
+            start_index=0,
+            end_index=entity.end_index,
+            score=entity.score,
+            type=entity.type,
+            regex=entity.regex,
+        )
+
+    def _find_cut(self, buffer: str, entities: List[Entity]) -> int:
+        """Find the position up to which the buffer is finalized.
+
+        The position is moved before the held back characters, to the start of
+        the word and outside of the entities.
+
+        Args:
+            buffer: The text not finalized yet.
+            entities: The entities within the buffer.
+
+        Returns:
+            The position up to which the buffer is finalized.
+
+        """
+
+        cut = len(buffer) - self.lookback
+        # align the cut to the start of the word
+        for i in range(cut - 1, -1, -1):
+            if _WHITESPACE.match(buffer[i]):
+                cut = i + 1
+                break
+        # do not cut the entities
+        moved = True
+        while moved:
+            moved = False
+            for e in entities:
+                if e.start_index < cut < e.end_index:
+                    cut, moved = e.start_index, True
+        return cut
+
+    def _anonymize_segment(self, segment: str, entities: List[Entity]) -> str:
+        """Anonymize the segment, reusing the stored replacements.
+
+        Args:
+            segment: The finalized text to anonymize.
+            entities: The entities within the segment.
+
+        Returns:
+            The anonymized segment.
+
+        """
+
+        if not entities:
+            return segment
+
+        known_entities, new_entities = [], []
+        for e in entities:
+            anonymized_text = self.pseudonyms.get((e.text, e.label))
+            if anonymized_text is None:
+                new_entities.append(e)
+            else:
+                self.pseudonyms.move_to_end((e.text, e.label))
+                known_entities.append((e, anonymized_text))
+
+        replacements: List[Replacement] = []
+        if new_entities:
+            _, replacements = self.strategy.anonymize(segment, new_entities)
+            for r in replacements:
+                key = (r["original_text"], r.get("label"))
+                if key not in self.pseudonyms:
+                    self._store_pseudonym(key, r["anonymized_text"])
+        replacements = replacements + [
+            Replacement(
+                original_text=e.text,
+                label=e.label,
+                start_index=e.start_index,
+                end_index=e.end_index,
+                anonymized_text=anonymized_text,
+            )
+            for e, anonymized_text in known_entities
+        ]
+
+        self.entities_count += len(entities)
+        for e in entities:
+            self.entities_per_label[e.label] = (
+                self.entities_per_label.get(e.label, 0) + 1
+            )
+        anonymized_segment, _ = anonymize(segment, replacements)
+        return anonymized_segment
+
+    def _store_pseudonym(self, key: Tuple[str, str], anonymized_text: str) -> None:
+        """Store the replacement of the entity, removing the least recently used ones.
+
+        Args:
+            key: The (original text, label) pair of the entity.
+            anonymized_text: The anonymized text of the entity.
+
+        """
+
+        if self.max_pseudonyms == 0:
+            return
+        self.pseudonyms[key] = anonymized_text
+        self.pseudonyms.move_to_end(key)
+        if self.max_pseudonyms is not None:
+            while len(self.pseudonyms) > self.max_pseudonyms:
+                self.pseudonyms.popitem(last=False)
+
+
+# =====================================
+# Main function
+# =====================================
+
+
+def anonymize_stream(
+    chunks: Iterable[str],
+    extractor: Union[ExtractorInterface, MultiExtractor],
+    strategy: StrategyInterface,
+    lookback: int = 256,
+) -> Iterator[str]:
+    """Anonymize the stream of text chunks.
+
+    Examples:
+        >>> from anonipy.anonymize import anonymize_stream
+        >>> for anonymized_chunk in anonymize_stream(chunks, extractor, strategy):
+        >>>     print(anonymized_chunk)
+
+    Args:
+        chunks: The text chunks to anonymize.
+        extractor: The extractor to use for entity extraction.
+        strategy: The strategy to use for anonymization.
+        lookback: The number of characters held back for the next chunk and used as the left context.
+
+    Returns:
+        The iterator over the anonymized text chunks.
+
+    """
+
+    return StreamAnonymizer(extractor, strategy, lookback=lookback)(chunks)
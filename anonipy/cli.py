@@ -0,0 +1,182 @@
+"""Module containing the `cli` entry point.
+
+The `cli` module provides the `anonipy` command, which anonymizes the files in
+a directory with the pipeline built from the configuration file (see the
+`anonipy.anonymize.config` module).
+
+The files can be split into disjoint shards and anonymized on multiple
+machines. Each machine runs the same command with its own `--shard-index`.
+The files are assigned to the shards by the hash of their relative path, and
+the anonymized files are numbered by their position in the input directory,
+so the outputs and the file mappings of the shards can be merged.
+
+Examples:
+    ```bash
+    anonipy --config config.yaml input_dir output_dir --shard-index 0 --shard-count 4 --workers 2
+    ```
+
+Methods:
+    main(args):
+        Run the anonymization pipeline from the command line.
+
+"""
+
+import os
+import sys
+import json
+import argparse
+from typing import List, Optional
+
+from .anonymize.config import build_pipeline, load_config
+
+# =====================================
+# Helper functions
+# =====================================
+
+
+def _parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse the command line arguments.
+
+    Args:
+        args: The command line arguments. If `None`, the system arguments are used.
+
+    Returns:
+        The parsed arguments.
+
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="anonipy",
+        description="Anonymize the files in the input directory.",
+    )
+    parser.add_argument("input_dir", help="The directory with the files to anonymize.")
+    parser.add_argument(
+        "output_dir", help="The directory to save the anonymized files to."
+    )
+    parser.add_argument(
+        "--config", required=True, help="The path to the JSON or YAML configuration."
+    )
+    parser.add_argument(
+        "--flatten",
+        action="store_true",
+        help="Save all anonymized files directly into the output directory.",
+    )
+    parser.add_argument(
+        "--shard-index",
+        type=int,
+        default=0,
+        help="The index of the shard to anonymize, between 0 and shard count - 1.",
+    )
+    parser.add_argument(
+        "--shard-count",
+        type=int,
+        default=1,
+        help="The number of shards the files are split into.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="The number of threads anonymizing the files.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=None,
+        help="The size in bytes of the chunks in which the large text files are streamed.",
+    )
+    parser.add_argument(
+        "--memory-budget",
+        default=None,
+        help="The maximum memory of the process (e.g. 4GB), to which the extraction batches are adapted.",
+    )
+    parser.add_argument(
+        "--mapping",
+        default=None,
+        help="The path to save the file mapping to. Defaults to the shard mapping file in the output directory.",
+    )
+    parser.add_argument(
+        "--report",
+        default=None,
+        help="The path to the JSON or CSV file to save the run report to.",
+    )
+    return parser.parse_args(args)
+
+
+def get_mapping_path(output_dir: str, shard_index: int, shard_count: int) -> str:
+    """Get the default path of the shard file mapping.
+
+    Examples:
+        >>> from anonipy.cli import get_mapping_path
+        >>> get_mapping_path("output_dir", 0, 4)
+        "output_dir/mapping.shard-00000-of-00004.json"
+
+    Args:
+        output_dir: The path to the output directory.
+        shard_index: The index of the shard.
+        shard_count: The number of shards.
+
+    Returns:
+        The path of the file mapping.
+
+    """
+
+    return os.path.join(
+        output_dir, f"mapping.shard-{shard_index:05d}-of-{shard_count:05d}.json"
+    )
+
+
+# =====================================
+# Main function
+# =====================================
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    """Run the anonymization pipeline from the command line.
+
+    The file mapping of the anonymized shard is saved as JSON. The mappings
+    of all shards have disjoint keys and can be merged into a single mapping.
+
+    Examples:
+        >>> from anonipy.cli import main
+        >>> main(["--config", "config.yaml", "input_dir", "output_dir"])
+
+    Args:
+        args: The command line arguments. If `None`, the system arguments are used.
+
+    """
+
+    args = _parse_args(args)
+    config = load_config(args.config)
+    for key in ["chunk_size", "memory_budget"]:
+        if getattr(args, key) is not None:
+            pipeline_config = {**config.get("pipeline", {}), key: getattr(args, key)}
+            config = {**config, "pipeline": pipeline_config}
+    pipeline = build_pipeline(config)
+
+    file_name_mapping = pipeline.anonymize(
+        args.input_dir,
+        args.output_dir,
+        flatten=args.flatten,
+        shard_index=args.shard_index,
+        shard_count=args.shard_count,
+        workers=args.workers,
+        report_path=args.report,
+    )
+
+    mapping_path = args.mapping or get_mapping_path(
+        args.output_dir, args.shard_index, args.shard_count
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(mapping_path)), exist_ok=True)
+    with open(mapping_path, "w", encoding="utf-8") as f:
+        json.dump(file_name_mapping, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+    print(
+        f"Anonymized {len(file_name_mapping)} files of shard {args.shard_index + 1}/{args.shard_count}. "
+        f"The file mapping is saved to {mapping_path}.",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,14 @@
 """Module containing the `constants`.
 
 The `constants` module provides a set of predefined constants used in the package.
-These include supported languages, types of entities, and date transformation
-variants.
+These include supported languages, types of entities, date transformation
+variants, and entity merge policies.
 
 Classes:
     LANGUAGES: Predefined supported languages.
     ENTITY_TYPES: Predefined types of entities.
     DATE_TRANSFORM_VARIANTS: Predefined types of the date transformation variants.
+    MERGE_POLICIES: Predefined policies of merging the overlapping entities.
 
 """
 
@@ -143,3 +144,49 @@ class DATE_TRANSFORM_VARIANTS:
 
         """
         return value in cls.values()
+
+
+class MERGE_POLICIES:
+    """The supported policies of merging the overlapping entities.
+
+    Attributes:
+        LONGEST (Literal["longest"]): Keep the longest of the overlapping entities.
+        HIGHEST_SCORE (Literal["highest_score"]): Keep the overlapping entity with the highest score.
+        PRIORITY (Literal["priority"]): Keep the overlapping entity of the extractor listed first.
+        UNION (Literal["union"]): Keep all entities, used with the `span` spacy style.
+
+    Methods:
+        values():
+            Return a list of all merge policies.
+        is_valid(value):
+            Check if the value is a valid merge policy.
+
+    """
+
+    LONGEST = "longest"
+    HIGHEST_SCORE = "highest_score"
+    PRIORITY = "priority"
+    UNION = "union"
+
+    @classmethod
+    def values(cls) -> List[str]:
+        """Return a list of all merge policies.
+
+        Returns:
+            The list of all merge policies.
+
+        """
+        return [cls.LONGEST, cls.HIGHEST_SCORE, cls.PRIORITY, cls.UNION]
+
+    @classmethod
+    def is_valid(cls, value: str) -> bool:
+        """Check if the value is a valid merge policy.
+
+        Args:
+            value: The value to check.
+
+        Returns:
+            `True` if the value is a valid merge policy, `False` otherwise.
+
+        """
+        return value in cls.values()
@@ -4,16 +4,17 @@ The `definitions` module provides a set of predefined types used in the package.
 
 Classes:
     Entity: The class representing the anonipy entity object.
+    EntityBatch: The class representing the columnar batch of anonipy entities.
     Replacement: The class representing the anonipy replacement object.
 
 """
 
 import re
-from typing import Union, TypedDict
-from typing_extensions import NotRequired
-from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Union
 
-from .utils.regex import regex_mapping
+import numpy as np
+
+from .utils.regex import regex_mapping, compile_regex, get_regex_group, DateMatcher
 from .constants import ENTITY_TYPES
 
 # ================================================
@@ -21,10 +22,19 @@ from .constants import ENTITY_TYPES
 # ================================================
 
 
-@dataclass
 class Entity:
     """The class representing the anonipy Entity object.
 
+    The entity stores its attributes in slots, so it does not allocate the
+    instance dictionary. If the regex is not provided, it is resolved from
+    the entity type when accessed.
+
+    Examples:
+        >>> from anonipy.definitions import Entity
+        >>> entity = Entity("John Doe", "name", 0, 8, type="string")
+        >>> entity.regex
+        ".*"
+
     Attributes:
         text (str): The text of the entity.
         label (str): The label of the entity.
@@ -36,19 +46,92 @@ class Entity:
 
     """
 
-    text: str
-    label: str
-    start_index: int
-    end_index: int
-    score: float = 1.0
-    type: ENTITY_TYPES = None
-    regex: Union[str, re.Pattern] = None
+    __slots__ = ("text", "label", "start_index", "end_index", "score", "type", "_regex")
+
+    def __init__(
+        self,
+        text: str,
+        label: str,
+        start_index: int,
+        end_index: int,
+        score: float = 1.0,
+        type: ENTITY_TYPES = None,
+        regex: Union[str, re.Pattern] = None,
+    ):
+        """Initialize the entity.
+
+        Examples:
+            >>> from anonipy.definitions import Entity
+            >>> entity = Entity("John Doe", "name", 0, 8, score=0.9, type="string")
+
+        Args:
+            text: The text of the entity.
+            label: The label of the entity.
+            start_index: The start index of the entity in the text.
+            end_index: The end index of the entity in the text.
+            score: The prediction score of the entity.
+            type: The type of the entity.
+            regex: The regular expression the entity must match. If `None`, the regex of the entity type is used.
+
+        Raises:
+            ValueError: If the entity is of the `custom` type and the regex is not provided.
+
+        """
+
+        if regex is None and type == "custom":
+            raise ValueError("Custom entities require a regex.")
+        self.text = text
+        self.label = label
+        self.start_index = start_index
+        self.end_index = end_index
+        self.score = score
+        self.type = type
+        self._regex = regex
+
+    @property
+    def regex(self) -> Union[str, re.Pattern]:
+        """The regular expression the entity must match.
+
+        Returns:
+            The regex of the entity, or the regex of the entity type if not provided.
+
+        """
+
+        if self._regex is None:
+            return regex_mapping[self.type]
+        return self._regex
+
+    @regex.setter
+    def regex(self, regex: Union[str, re.Pattern]) -> None:
+        self._regex = regex
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._as_tuple() == other._as_tuple()
 
-    def __post_init__(self):
-        if self.regex is None:
-            if self.type == "custom":
-                raise ValueError("Custom entities require a regex.")
-            self.regex = regex_mapping[self.type]
+    # the entities are mutable and compared by value, so they are not hashable
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"Entity(text={self.text!r}, label={self.label!r}, "
+            f"start_index={self.start_index!r}, end_index={self.end_index!r}, "
+            f"score={self.score!r}, type={self.type!r}, regex={self.regex!r})"
+        )
+
+    @property
+    def compiled_regex(self) -> Union[re.Pattern, DateMatcher]:
+        """The compiled regular expression the entity must match.
+
+        The compiled regex is cached and shared between entities with the same regex.
+
+        Returns:
+            The compiled regex.
+
+        """
+
+        return compile_regex(self.regex)
 
     def get_regex_group(self) -> Union[str, None]:
         """Get the regex group.
@@ -58,8 +141,7 @@ class Entity:
 
         """
 
-        p_match = re.match(r"^.*?\((.*)\).*$", self.regex)
-        return p_match.group(1) if p_match else self.regex
+        return get_regex_group(self.regex)
 
     def __str__(self) -> str:
         """String representation of the entity.
@@ -70,10 +152,475 @@ class Entity:
         """
         return f"Entity(text='{self.text}', label='{self.label}', start_index={self.start_index}, end_index={self.end_index}, type='{self.type}')"
 
+    # ===========================================
+    # Private methods
+    # ===========================================
+
+    def _as_tuple(self) -> tuple:
+        """Get the tuple of the entity attributes.
+
+        Returns:
+            The tuple of the entity attributes, with the resolved regex.
+
+        """
+
+        return (
+            self.text,
+            self.label,
+            self.start_index,
+            self.end_index,
+            self.score,
+            self.type,
+            self.regex,
+        )
+
+
+class EntityBatch:
+    """The class representing the columnar batch of anonipy entities.
+
+    The entities are stored in NumPy arrays instead of separate objects. The
+    labels, types and regexes are stored once in the vocabularies and
+    referenced by their ids. The entity texts are views into the source text,
+    created only when accessed. If the source text is not provided, the
+    entity texts are stored in a list.
+
+    The batch can be used instead of the list of entities by the
+    `filter_entities` and `merge_entities` helpers and by the strategies.
+
+    Examples:
+        >>> from anonipy.definitions import EntityBatch
+        >>> batch = EntityBatch.from_entities(entities, text)
+        >>> batch[batch.scores > 0.5].to_entities()
+        [Entity(...), Entity(...)]
+
+    Attributes:
+        starts (np.ndarray): The start indices of the entities.
+        ends (np.ndarray): The end indices of the entities.
+        label_ids (np.ndarray): The ids of the entity labels in the `labels` vocabulary.
+        scores (np.ndarray): The prediction scores of the entities.
+        type_ids (np.ndarray): The ids of the entity types in the `types` vocabulary.
+        regex_ids (np.ndarray): The ids of the entity regexes in the `regexes` vocabulary.
+        labels (List[str]): The vocabulary of the labels.
+        types (List[ENTITY_TYPES]): The vocabulary of the types.
+        regexes (List[Union[str, re.Pattern]]): The vocabulary of the regexes. The `None` regex is replaced by the regex of the entity type.
+        source_text (str): The text the entities were extracted from.
+        anonymized_texts (List[str]): The texts replacing the entities, set by the strategies.
+
+    Methods:
+        from_entities(entities, text=None):
+            Create the batch from the list of entities.
+        concatenate(batches):
+            Concatenate the batches of entities of the same text.
+        to_entities():
+            Convert the batch to the list of entities.
+        to_replacements():
+            Convert the batch to the list of replacements.
+        get_text(index):
+            Get the text of the entity.
+        get_texts():
+            Get the texts of all entities.
+        with_anonymized_texts(anonymized_texts):
+            Create the copy of the batch with the anonymized texts.
+        sort():
+            Sort the entities by their start index.
+
+    """
+
+    def __init__(
+        self,
+        starts: Sequence[int],
+        ends: Sequence[int],
+        label_ids: Sequence[int],
+        labels: List[str],
+        scores: Optional[Sequence[float]] = None,
+        type_ids: Optional[Sequence[int]] = None,
+        types: Optional[List[ENTITY_TYPES]] = None,
+        regex_ids: Optional[Sequence[int]] = None,
+        regexes: Optional[List[Union[str, re.Pattern]]] = None,
+        source_text: Optional[str] = None,
+        texts: Optional[List[str]] = None,
+        anonymized_texts: Optional[List[str]] = None,
+    ):
+        """Initialize the entity batch.
+
+        Examples:
+            >>> from anonipy.definitions import EntityBatch
+            >>> batch = EntityBatch([0, 9], [8, 12], [0, 1], ["name", "age"], source_text="John Doe is 19.")
+
+        Args:
+            starts: The start indices of the entities.
+            ends: The end indices of the entities.
+            label_ids: The ids of the entity labels in the `labels` vocabulary.
+            labels: The vocabulary of the labels.
+            scores: The prediction scores of the entities. Defaults to `1.0`.
+            type_ids: The ids of the entity types in the `types` vocabulary. Defaults to `0`.
+            types: The vocabulary of the types. Defaults to `[None]`.
+            regex_ids: The ids of the entity regexes in the `regexes` vocabulary. Defaults to `0`.
+            regexes: The vocabulary of the regexes. Defaults to `[None]`.
+            source_text: The text the entities were extracted from.
+            texts: The texts of the entities, if the source text is not provided.
+            anonymized_texts: The texts replacing the entities.
+
+        Raises:
+            ValueError: If the arrays differ in length, or neither the source text nor the entity texts are provided.
+
+        """
+
+        size = len(starts)
+        self.starts = np.asarray(starts, dtype=np.int64)
+        self.ends = np.asarray(ends, dtype=np.int64)
+        self.label_ids = np.asarray(label_ids, dtype=np.int32)
+        self.scores = (
+            np.asarray(scores, dtype=np.float64)
+            if scores is not None
+            else np.ones(size, dtype=np.float64)
+        )
+        self.type_ids = (
+            np.asarray(type_ids, dtype=np.int32)
+            if type_ids is not None
+            else np.zeros(size, dtype=np.int32)
+        )
+        self.regex_ids = (
+            np.asarray(regex_ids, dtype=np.int32)
+            if regex_ids is not None
+            else np.zeros(size, dtype=np.int32)
+        )
+        self.labels = list(labels)
+        self.types = list(types) if types is not None else [None]
+        self.regexes = list(regexes) if regexes is not None else [None]
+        self.source_text = source_text
+        self.texts = list(texts) if texts is not None else None
+        self.anonymized_texts = (
+            list(anonymized_texts) if anonymized_texts is not None else None
+        )
+
+        arrays = [self.ends, self.label_ids, self.scores, self.type_ids]
+        lists = [self.texts, self.anonymized_texts]
+        if any(len(a) != size for a in arrays + [self.regex_ids]) or any(
+            values is not None and len(values) != size for values in lists
+        ):
+            raise ValueError("The entity columns must have the same length.")
+        if source_text is None and texts is None:
+            raise ValueError("Either the source text or the entity texts are required.")
+
+    @classmethod
+    def from_entities(
+        cls, entities: Iterable[Entity], text: Optional[str] = None
+    ) -> "EntityBatch":
+        """Create the batch from the list of entities.
+
+        Examples:
+            >>> from anonipy.definitions import EntityBatch
+            >>> batch = EntityBatch.from_entities(entities, text)
+
+        Args:
+            entities: The entities to store in the batch.
+            text: The text the entities were extracted from. The entity texts must match the spans of the text. If `None`, the entity texts are stored.
+
+        Returns:
+            The entity batch.
+
+        """
+
+        entities = list(entities)
+        labels, types, regexes = {}, {}, {}
+        return cls(
+            starts=[e.start_index for e in entities],
+            ends=[e.end_index for e in entities],
+            label_ids=[labels.setdefault(e.label, len(labels)) for e in entities],
+            labels=list(labels),
+            scores=[e.score for e in entities],
+            type_ids=[types.setdefault(e.type, len(types)) for e in entities],
+            types=list(types) or None,
+            regex_ids=[regexes.setdefault(e.regex, len(regexes)) for e in entities],
+            regexes=list(regexes) or None,
+            source_text=text,
+            texts=[e.text for e in entities] if text is None else None,
+        )
+
+    @classmethod
+    def concatenate(cls, batches: Sequence["EntityBatch"]) -> "EntityBatch":
+        """Concatenate the batches of entities of the same text.
+
+        The vocabularies of the batches are merged.
+
+        Examples:
+            >>> from anonipy.definitions import EntityBatch
+            >>> batch = EntityBatch.concatenate([ner_batch, pattern_batch])
+
+        Args:
+            batches: The batches to concatenate.
+
+        Returns:
+            The concatenated entity batch.
+
+        Raises:
+            ValueError: If no batches are provided.
+
+        """
+
+        if len(batches) == 0:
+            raise ValueError("At least one batch is required.")
+
+        def merge_vocabulary(name: str, ids: str) -> tuple:
+            vocabulary, columns = {}, []
+            for batch in batches:
+                mapping = np.array(
+                    [
+                        vocabulary.setdefault(value, len(vocabulary))
+                        for value in getattr(batch, name)
+                    ],
+                    dtype=np.int32,
+                )
+                columns.append(mapping[getattr(batch, ids)])
+            return np.concatenate(columns), list(vocabulary)
 
-class Replacement(TypedDict):
+        label_ids, labels = merge_vocabulary("labels", "label_ids")
+        type_ids, types = merge_vocabulary("types", "type_ids")
+        regex_ids, regexes = merge_vocabulary("regexes", "regex_ids")
+        source_text = batches[0].source_text
+        if any(batch.source_text != source_text for batch in batches):
+            source_text = None
+        anonymized = [batch.anonymized_texts for batch in batches]
+        return cls(
+            starts=np.concatenate([batch.starts for batch in batches]),
+            ends=np.concatenate([batch.ends for batch in batches]),
+            label_ids=label_ids,
+            labels=labels,
+            scores=np.concatenate([batch.scores for batch in batches]),
+            type_ids=type_ids,
+            types=types,
+            regex_ids=regex_ids,
+            regexes=regexes,
+            source_text=source_text,
+            texts=(
+                [t for batch in batches for t in batch.get_texts()]
+                if source_text is None
+                else None
+            ),
+            anonymized_texts=(
+                [t for texts in anonymized for t in texts]
+                if all(texts is not None for texts in anonymized)
+                else None
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __iter__(self) -> Iterator[Entity]:
+        return iter(self.to_entities())
+
+    def __getitem__(
+        self, key: Union[int, slice, np.ndarray, Sequence[int]]
+    ) -> Union[Entity, "EntityBatch"]:
+        """Get the entity or the batch of the selected entities.
+
+        Examples:
+            >>> batch[0]
+            Entity(...)
+            >>> batch[batch.scores > 0.5]
+            EntityBatch(...)
+
+        Args:
+            key: The index of the entity, or the slice, boolean mask or indices of the entities.
+
+        Returns:
+            The entity if the key is an integer, the batch of the selected entities otherwise.
+
+        """
+
+        if isinstance(key, (int, np.integer)):
+            index = int(key) if key >= 0 else len(self) + int(key)
+            return Entity(
+                text=self.get_text(index),
+                label=self.labels[self.label_ids[index]],
+                start_index=int(self.starts[index]),
+                end_index=int(self.ends[index]),
+                score=float(self.scores[index]),
+                type=self.types[self.type_ids[index]],
+                regex=self.regexes[self.regex_ids[index]],
+            )
+
+        indices = np.arange(len(self))[key]
+        return EntityBatch(
+            starts=self.starts[indices],
+            ends=self.ends[indices],
+            label_ids=self.label_ids[indices],
+            labels=self.labels,
+            scores=self.scores[indices],
+            type_ids=self.type_ids[indices],
+            types=self.types,
+            regex_ids=self.regex_ids[indices],
+            regexes=self.regexes,
+            source_text=self.source_text,
+            texts=(
+                [self.texts[i] for i in indices.tolist()]
+                if self.texts is not None
+                else None
+            ),
+            anonymized_texts=(
+                [self.anonymized_texts[i] for i in indices.tolist()]
+                if self.anonymized_texts is not None
+                else None
+            ),
+        )
+
+    def __repr__(self) -> str:
+        return f"EntityBatch(size={len(self)}, labels={self.labels})"
+
+    def get_text(self, index: int) -> str:
+        """Get the text of the entity.
+
+        Examples:
+            >>> batch.get_text(0)
+            "John Doe"
+
+        Args:
+            index: The index of the entity.
+
+        Returns:
+            The text of the entity.
+
+        """
+
+        if self.texts is not None:
+            return self.texts[index]
+        return self.source_text[self.starts[index] : self.ends[index]]
+
+    def to_entities(self) -> List[Entity]:
+        """Convert the batch to the list of entities.
+
+        Examples:
+            >>> batch.to_entities()
+            [Entity(...), Entity(...)]
+
+        Returns:
+            The list of entities.
+
+        """
+
+        labels = [self.labels[i] for i in self.label_ids.tolist()]
+        types = [self.types[i] for i in self.type_ids.tolist()]
+        regexes = [self.regexes[i] for i in self.regex_ids.tolist()]
+        return [
+            Entity(text, label, start, end, score, type, regex)
+            for text, label, start, end, score, type, regex in zip(
+                self.get_texts(),
+                labels,
+                self.starts.tolist(),
+                self.ends.tolist(),
+                self.scores.tolist(),
+                types,
+                regexes,
+            )
+        ]
+
+    def to_replacements(self) -> List["Replacement"]:
+        """Convert the batch to the list of replacements.
+
+        Examples:
+            >>> anonymized_text, replacements = strategy.anonymize(text, batch)
+            >>> replacements.to_replacements()
+            [{"original_text": "John Doe", ...}]
+
+        Returns:
+            The list of replacements.
+
+        Raises:
+            ValueError: If the anonymized texts are not set.
+
+        """
+
+        if self.anonymized_texts is None:
+            raise ValueError("The anonymized texts of the entities are not set.")
+        return [
+            Replacement(
+                original_text=text,
+                label=self.labels[label_id],
+                start_index=start,
+                end_index=end,
+                anonymized_text=anonymized_text,
+            )
+            for text, label_id, start, end, anonymized_text in zip(
+                self.get_texts(),
+                self.label_ids.tolist(),
+                self.starts.tolist(),
+                self.ends.tolist(),
+                self.anonymized_texts,
+            )
+        ]
+
+    def with_anonymized_texts(self, anonymized_texts: List[str]) -> "EntityBatch":
+        """Create the copy of the batch with the anonymized texts.
+
+        Examples:
+            >>> replacements = batch.with_anonymized_texts(["[REDACTED]"] * len(batch))
+
+        Args:
+            anonymized_texts: The texts replacing the entities.
+
+        Returns:
+            The entity batch with the anonymized texts.
+
+        Raises:
+            ValueError: If the number of the anonymized texts differs from the number of entities.
+
+        """
+
+        if len(anonymized_texts) != len(self):
+            raise ValueError("The entity columns must have the same length.")
+        batch = self[:]
+        batch.anonymized_texts = list(anonymized_texts)
+        return batch
+
+    def sort(self) -> "EntityBatch":
+        """Sort the entities by their start index.
+
+        Examples:
+            >>> batch.sort()
+            EntityBatch(...)
+
+        Returns:
+            The batch of the sorted entities.
+
+        """
+
+        return self[np.argsort(self.starts, kind="stable")]
+
+    def get_texts(self) -> List[str]:
+        """Get the texts of all entities.
+
+        Examples:
+            >>> batch.get_texts()
+            ["John Doe", "19"]
+
+        Returns:
+            The list of the entity texts.
+
+        """
+
+        if self.texts is not None:
+            return self.texts
+        text = self.source_text
+        return [text[s:e] for s, e in zip(self.starts.tolist(), self.ends.tolist())]
+
+
+class Replacement(dict):
     """The class representing the anonipy Replacement object.
 
+    The replacement is a dictionary, so it can be serialized to JSON and
+    used with the dictionary methods. The `original_text` and `label` keys
+    are optional, and are only present if they are set.
+
+    Examples:
+        >>> from anonipy.definitions import Replacement
+        >>> replacement = Replacement(start_index=0, end_index=8, anonymized_text="[NAME]")
+        >>> replacement["anonymized_text"]
+        "[NAME]"
+        >>> replacement
+        {"start_index": 0, "end_index": 8, "anonymized_text": "[NAME]"}
+
     Attributes:
         original_text (str): The original text of the entity.
         label (str): The label of the entity.
@@ -83,8 +630,36 @@ class Replacement(TypedDict):
 
     """
 
-    original_text: NotRequired[str]
-    label: NotRequired[str]
-    start_index: int
-    end_index: int
-    anonymized_text: str
+    __slots__ = ()
+
+    def __init__(
+        self,
+        *,
+        start_index: int,
+        end_index: int,
+        anonymized_text: str,
+        original_text: Optional[str] = None,
+        label: Optional[str] = None,
+    ):
+        """Initialize the replacement.
+
+        Examples:
+            >>> from anonipy.definitions import Replacement
+            >>> replacement = Replacement(original_text="John Doe", label="name", start_index=0, end_index=8, anonymized_text="[NAME]")
+
+        Args:
+            start_index: The start index of the entity in the text.
+            end_index: The end index of the entity in the text.
+            anonymized_text: The anonymized text replacing the original.
+            original_text: The original text of the entity.
+            label: The label of the entity.
+
+        """
+
+        if original_text is not None:
+            self["original_text"] = original_text
+        if label is not None:
+            self["label"] = label
+        self["start_index"] = start_index
+        self["end_index"] = end_index
+        self["anonymized_text"] = anonymized_text
@@ -0,0 +1,590 @@
+"""Module containing the `serve` entry point.
+
+The `serve` module provides a HTTP server exposing the anonymization over
+the network. The extractors and the strategy are loaded once from the
+configuration file (see the `anonipy.anonymize.config` module) and shared
+between all requests, which are batched together by the asynchronous
+anonymizer.
+
+The server exposes the following endpoints:
+
+- `POST /extract`: Extract the entities from the `text` or `texts`.
+- `POST /anonymize`: Anonymize the `text` or `texts`.
+- `GET /health`: Check whether the server is running.
+- `GET /metrics`: Get the server and batching metrics.
+
+When the request queue is full, the requests are rejected with the
+`503 Service Unavailable` status and the `Retry-After` header.
+
+Examples:
+    ```bash
+    python -m anonipy.serve --config config.yaml --port 8000
+    curl -X POST localhost:8000/anonymize -d '{"text": "John Doe was born on 1995-01-01."}'
+    ```
+
+Classes:
+    AnonymizationServer: The class representing the anonymization HTTP server.
+
+Methods:
+    main(args):
+        Run the anonymization server from the command line.
+
+"""
+
+import time
+import json
+import asyncio
+import argparse
+from http import HTTPStatus
+from typing import List, Optional, Tuple
+
+from .anonymize.async_anonymizer import AsyncAnonymizer
+from .anonymize.config import build_extractor, build_strategy, load_config
+from .definitions import Entity
+
+# the endpoints accepting the texts
+_TEXT_ENDPOINTS = ["/extract", "/anonymize"]
+# the endpoints returning the server state
+_STATE_ENDPOINTS = ["/health", "/metrics"]
+# the maximum number of the request header lines
+_MAX_HEADERS = 100
+
+# =====================================
+# Helper functions
+# =====================================
+
+
+def _entity_to_dict(entity: Entity) -> dict:
+    """Convert the entity to a JSON serializable dictionary.
+
+    Args:
+        entity: The entity to convert.
+
+    Returns:
+        The dictionary with the entity attributes.
+
+    """
+
+    return {
+        "text": entity.text,
+        "label": entity.label,
+        "start_index": entity.start_index,
+        "end_index": entity.end_index,
+        "score": float(entity.score),
+        "type": entity.type,
+    }
+
+
+class _HTTPError(Exception):
+    """The error returned to the client as the HTTP response."""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+# =====================================
+# Main class
+# =====================================
+
+
+class AnonymizationServer:
+    """The class representing the anonymization HTTP server.
+
+    Examples:
+        >>> from anonipy.serve import AnonymizationServer
+        >>> anonymizer = AsyncAnonymizer(extractor, strategy, max_queue_size=1024)
+        >>> server = AnonymizationServer(anonymizer, port=8000)
+        >>> await server.serve_forever()
+
+    Attributes:
+        anonymizer (AsyncAnonymizer): The anonymizer processing the requests.
+        host (str): The host the server listens on.
+        port (int): The port the server listens on. Set to the bound port once started.
+        max_body_size (int): The maximum size of the request body in bytes.
+        retry_after (int): The number of seconds the clients are asked to wait when the queue is full.
+        stats (dict): The counters of the requests per endpoint and responses per status.
+
+    Methods:
+        start():
+            Start listening for the requests.
+        serve_forever():
+            Start the server and process the requests until cancelled.
+        close():
+            Stop the server and the anonymizer.
+        get_metrics():
+            Get the server and batching metrics.
+
+    """
+
+    def __init__(
+        self,
+        anonymizer: AsyncAnonymizer,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        max_body_size: int = 1048576,
+        retry_after: int = 1,
+    ):
+        """Initialize the anonymization server.
+
+        Examples:
+            >>> from anonipy.serve import AnonymizationServer
+            >>> server = AnonymizationServer(anonymizer, host="0.0.0.0", port=8000)
+
+        Args:
+            anonymizer: The anonymizer processing the requests.
+            host: The host the server listens on.
+            port: The port the server listens on. If `0`, a free port is used.
+            max_body_size: The maximum size of the request body in bytes.
+            retry_after: The number of seconds the clients are asked to wait when the queue is full.
+
+        """
+
+        self.anonymizer = anonymizer
+        self.host = host
+        self.port = port
+        self.max_body_size = max_body_size
+        self.retry_after = retry_after
+        self.stats = {"requests": {}, "responses": {}, "rejected_texts": 0}
+        self._server = None
+        self._start_time = None
+
+    async def start(self) -> None:
+        """Start listening for the requests.
+
+        Examples:
+            >>> await server.start()
+
+        """
+
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._start_time = time.monotonic()
+
+    async def serve_forever(self) -> None:
+        """Start the server and process the requests until cancelled.
+
+        Examples:
+            >>> await server.serve_forever()
+
+        """
+
+        if self._server is None:
+            await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        """Stop the server and the anonymizer.
+
+        Examples:
+            >>> await server.close()
+
+        """
+
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self.anonymizer.close()
+
+    def get_metrics(self) -> dict:
+        """Get the server and batching metrics.
+
+        Examples:
+            >>> server.get_metrics()
+            {"uptime_s": 10.0, "requests": {"/anonymize": 5}, ...}
+
+        Returns:
+            The metrics of the server.
+
+        """
+
+        anonymizer_stats = self.anonymizer.stats
+        batches = anonymizer_stats["batches"]
+        return {
+            "uptime_s": (
+                time.monotonic() - self._start_time if self._start_time else 0.0
+            ),
+            "requests": dict(self.stats["requests"]),
+            "responses": dict(self.stats["responses"]),
+            "rejected_texts": self.stats["rejected_texts"],
+            "queue_size": self.anonymizer.queue_size,
+            "max_queue_size": self.anonymizer.max_queue_size,
+            "processed_texts": anonymizer_stats["requests"],
+            "batches": batches,
+            "mean_batch_size": (
+                anonymizer_stats["requests"] / batches if batches > 0 else 0.0
+            ),
+        }
+
+    # ===========================================
+    # Private methods
+    # ===========================================
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Process the requests received over the connection.
+
+        Args:
+            reader: The connection reader.
+            writer: The connection writer.
+
+        """
+
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    request = await self._read_request(reader)
+                except _HTTPError as e:
+                    await self._write_response(
+                        writer, e.status, {"error": e.message}, keep_alive=False
+                    )
+                    break
+                if request is None:
+                    break
+                method, path, headers, body = request
+                keep_alive = headers.get("connection", "").lower() != "close"
+
+                status, payload, extra_headers = await self._dispatch(
+                    method, path, body
+                )
+                await self._write_response(
+                    writer, status, payload, keep_alive, extra_headers
+                )
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _read_request(
+        self, reader: asyncio.StreamReader
+    ) -> Optional[Tuple[str, str, dict, bytes]]:
+        """Read the HTTP request.
+
+        Args:
+            reader: The connection reader.
+
+        Returns:
+            The request method, path, headers and body, or `None` if the connection is closed.
+
+        Raises:
+            _HTTPError: If the request is malformed, its headers or body are too large, or its body is not sent with the Content-Length header.
+
+        """
+
+        try:
+            request_line = await reader.readline()
+        except (ValueError, asyncio.LimitOverrunError):
+            raise _HTTPError(HTTPStatus.BAD_REQUEST, "The request line is too long.")
+        if not request_line.strip():
+            return None
+        parts = request_line.decode("latin-1").split()
+        if len(parts) != 3:
+            raise _HTTPError(HTTPStatus.BAD_REQUEST, "Malformed request line.")
+        method, path, _ = parts
+
+        headers = {}
+        for _ in range(_MAX_HEADERS + 1):
+            try:
+                line = await reader.readline()
+            except (ValueError, asyncio.LimitOverrunError):
+                raise _HTTPError(
+                    HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
+                    "The request header line is too long.",
+                )
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        else:
+            raise _HTTPError(
+                HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
+                f"The request has more than {_MAX_HEADERS} header lines.",
+            )
+
+        # only the bodies with the Content-Length header are supported
+        transfer_encoding = headers.get("transfer-encoding", "").lower()
+        if "chunked" in transfer_encoding:
+            raise _HTTPError(
+                HTTPStatus.LENGTH_REQUIRED,
+                "The chunked body is not supported, use the Content-Length header.",
+            )
+        if transfer_encoding and transfer_encoding != "identity":
+            raise _HTTPError(
+                HTTPStatus.NOT_IMPLEMENTED,
+                f"The transfer encoding is not supported: {transfer_encoding}",
+            )
+
+        try:
+            content_length = int(headers.get("content-length", 0))
+        except ValueError:
+            raise _HTTPError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length header.")
+        if content_length < 0:
+            raise _HTTPError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length header.")
+        if content_length > self.max_body_size:
+            raise _HTTPError(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                f"The request body exceeds {self.max_body_size} bytes.",
+            )
+        body = await reader.readexactly(content_length) if content_length else b""
+        return method, path.split("?")[0], headers, body
+
+    async def _write_response(
+        self,
+        writer: asyncio.StreamWriter,
+        status: HTTPStatus,
+        payload: dict,
+        keep_alive: bool,
+        extra_headers: Optional[dict] = None,
+    ) -> None:
+        """Write the JSON response.
+
+        Args:
+            writer: The connection writer.
+            status: The response status.
+            payload: The response payload.
+            keep_alive: Whether the connection is kept open.
+            extra_headers: The additional response headers.
+
+        """
+
+        self.stats["responses"][status.value] = (
+            self.stats["responses"].get(status.value, 0) + 1
+        )
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        headers = {
+            "Content-Type": "application/json; charset=utf-8",
+            "Content-Length": str(len(body)),
+            "Connection": "keep-alive" if keep_alive else "close",
+            **(extra_headers or {}),
+        }
+        head = f"HTTP/1.1 {status.value} {status.phrase}\r\n" + "".join(
+            f"{name}: {value}\r\n" for name, value in headers.items()
+        )
+        writer.write(head.encode("latin-1") + b"\r\n" + body)
+        await writer.drain()
+
+    async def _dispatch(
+        self, method: str, path: str, body: bytes
+    ) -> Tuple[HTTPStatus, dict, dict]:
+        """Dispatch the request to the endpoint.
+
+        Args:
+            method: The request method.
+            path: The request path.
+            body: The request body.
+
+        Returns:
+            The response status, payload and additional headers.
+
+        """
+
+        if path not in _TEXT_ENDPOINTS + _STATE_ENDPOINTS:
+            return HTTPStatus.NOT_FOUND, {"error": f"Unknown endpoint: {path}"}, {}
+        expected_method = "POST" if path in _TEXT_ENDPOINTS else "GET"
+        if method != expected_method:
+            return (
+                HTTPStatus.METHOD_NOT_ALLOWED,
+                {"error": f"The {path} endpoint only accepts {expected_method}."},
+                {"Allow": expected_method},
+            )
+
+        self.stats["requests"][path] = self.stats["requests"].get(path, 0) + 1
+        if path == "/health":
+            return HTTPStatus.OK, {"status": "ok"}, {}
+        if path == "/metrics":
+            return HTTPStatus.OK, self.get_metrics(), {}
+
+        try:
+            texts, is_batch = self._parse_texts(body)
+            if path == "/anonymize" and self.anonymizer.strategy is None:
+                raise _HTTPError(
+                    HTTPStatus.NOT_IMPLEMENTED,
+                    "The anonymization strategy is not configured.",
+                )
+            results = await self._process_texts(texts, anonymize=path == "/anonymize")
+        except _HTTPError as e:
+            headers = {}
+            if e.status == HTTPStatus.SERVICE_UNAVAILABLE:
+                headers["Retry-After"] = str(self.retry_after)
+            return e.status, {"error": e.message}, headers
+        except Exception as e:
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(e)}, {}
+
+        return HTTPStatus.OK, {"results": results} if is_batch else results[0], {}
+
+    def _parse_texts(self, body: bytes) -> Tuple[List[str], bool]:
+        """Parse the texts from the request body.
+
+        Args:
+            body: The request body containing the `text` or the list of `texts`.
+
+        Returns:
+            The list of texts.
+            Whether the texts were provided as a list.
+
+        Raises:
+            _HTTPError: If the body does not contain the texts.
+
+        """
+
+        try:
+            data = json.loads(body.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            raise _HTTPError(HTTPStatus.BAD_REQUEST, "The body must be a JSON object.")
+
+        if isinstance(data, dict) and isinstance(data.get("text"), str):
+            return [data["text"]], False
+        if (
+            isinstance(data, dict)
+            and isinstance(data.get("texts"), list)
+            and all(isinstance(text, str) for text in data["texts"])
+        ):
+            return data["texts"], True
+        raise _HTTPError(
+            HTTPStatus.BAD_REQUEST,
+            "The body must contain the text string or the texts list of strings.",
+        )
+
+    async def _process_texts(self, texts: List[str], anonymize: bool) -> List[dict]:
+        """Process the texts with the anonymizer.
+
+        Args:
+            texts: The texts to process.
+            anonymize: Whether to anonymize the texts or only extract the entities.
+
+        Returns:
+            The list of results, in the order of the texts.
+
+        Raises:
+            _HTTPError: If the request queue cannot hold the texts.
+
+        """
+
+        # reject the whole request when the queue cannot hold it
+        max_queue_size = self.anonymizer.max_queue_size
+        if max_queue_size and self.anonymizer.queue_size + len(texts) > max_queue_size:
+            self.stats["rejected_texts"] += len(texts)
+            raise _HTTPError(
+                HTTPStatus.SERVICE_UNAVAILABLE, "The request queue is full."
+            )
+
+        process = self.anonymizer.anonymize if anonymize else self.anonymizer.extract
+        try:
+            outputs = await asyncio.gather(*[process(text) for text in texts])
+        except asyncio.QueueFull:
+            self.stats["rejected_texts"] += len(texts)
+            raise _HTTPError(
+                HTTPStatus.SERVICE_UNAVAILABLE, "The request queue is full."
+            )
+
+        if anonymize:
+            return [
+                {"anonymized_text": anonymized_text, "replacements": replacements}
+                for anonymized_text, replacements in outputs
+            ]
+        return [
+            {"entities": [_entity_to_dict(entity) for entity in entities]}
+            for entities in outputs
+        ]
+
+
+# =====================================
+# Main function
+# =====================================
+
+
+def _parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse the command line arguments.
+
+    Args:
+        args: The command line arguments. If `None`, the system arguments are used.
+
+    Returns:
+        The parsed arguments.
+
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="python -m anonipy.serve",
+        description="Run the anonipy anonymization HTTP server.",
+    )
+    parser.add_argument(
+        "--config", required=True, help="The path to the JSON or YAML configuration."
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="The host to listen on.")
+    parser.add_argument("--port", type=int, default=8000, help="The port to listen on.")
+    parser.add_argument(
+        "--max-batch-size",
+        type=int,
+        default=16,
+        help="The maximum number of texts processed in a batch.",
+    )
+    parser.add_argument(
+        "--max-wait-ms",
+        type=float,
+        default=5.0,
+        help="The maximum number of milliseconds to wait for the batch to fill.",
+    )
+    parser.add_argument(
+        "--max-queue-size",
+        type=int,
+        default=1024,
+        help="The maximum number of queued texts. If 0, the queue is unbounded.",
+    )
+    parser.add_argument(
+        "--max-body-size",
+        type=int,
+        default=1048576,
+        help="The maximum size of the request body in bytes.",
+    )
+    return parser.parse_args(args)
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    """Run the anonymization server from the command line.
+
+    Examples:
+        >>> from anonipy.serve import main
+        >>> main(["--config", "config.yaml", "--port", "8000"])
+
+    Args:
+        args: The command line arguments. If `None`, the system arguments are used.
+
+    """
+
+    args = _parse_args(args)
+    config = load_config(args.config)
+    anonymizer = AsyncAnonymizer(
+        build_extractor(config),
+        build_strategy(config) if "strategy" in config else None,
+        max_batch_size=args.max_batch_size,
+        max_wait_ms=args.max_wait_ms,
+        max_queue_size=args.max_queue_size,
+    )
+    server = AnonymizationServer(
+        anonymizer,
+        host=args.host,
+        port=args.port,
+        max_body_size=args.max_body_size,
+    )
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -6,11 +6,27 @@ Modules:
     regex: The module containing the regex utilities and functions.
     file_system: The module containing the file system utilities and functions.
     language_detector: The module containing the language detector.
+    prescreen: The module containing the text pre-screener.
+    aho_corasick: The module containing the Aho-Corasick automaton.
+    instrumentation: The module containing the stage timers and counters.
+    memory: The module containing the memory probes and the adaptive batcher.
 
 """
 
 from ..utils import regex
 from . import file_system
 from . import language_detector
+from . import prescreen
+from . import aho_corasick
+from . import instrumentation
+from . import memory
 
-__all__ = ["regex", "file_system", "language_detector"]
+__all__ = [
+    "regex",
+    "file_system",
+    "language_detector",
+    "prescreen",
+    "aho_corasick",
+    "instrumentation",
+    "memory",
+]
@@ -0,0 +1,354 @@
+"""The module containing the `aho_corasick` utilities.
+
+The `aho_corasick` module contains the `AhoCorasick` class, an automaton used
+to find all occurrences of a large list of terms in a single pass over the
+text. The automaton is stored in flat numpy arrays, which can be saved to disk
+and memory-mapped when loaded.
+
+Classes:
+    AhoCorasick: The class representing the Aho-Corasick automaton.
+
+"""
+
+import os
+import json
+from bisect import bisect_left
+from typing import Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+# the arrays describing the automaton
+_ARRAY_NAMES = [
+    "edge_offsets",
+    "edge_chars",
+    "edge_targets",
+    "fail",
+    "dict_link",
+    "depth",
+    "values",
+]
+_META_FILE = "meta.json"
+
+# =====================================
+# Helper functions
+# =====================================
+
+
+def _normalize(text: str, case_sensitive: bool) -> str:
+    """Normalize the text without changing its length.
+
+    Args:
+        text: The text to normalize.
+        case_sensitive: Whether to keep the case of the characters.
+
+    Returns:
+        The normalized text.
+
+    """
+
+    if case_sensitive:
+        return text
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    # some characters change the length when lowercased
+    return "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+
+def _common_prefix_length(a: str, b: str) -> int:
+    """Get the length of the common prefix of two strings.
+
+    Args:
+        a: The first string.
+        b: The second string.
+
+    Returns:
+        The length of the common prefix.
+
+    """
+
+    length = min(len(a), len(b))
+    for i in range(length):
+        if a[i] != b[i]:
+            return i
+    return length
+
+
+# =====================================
+# Main class
+# =====================================
+
+
+class AhoCorasick:
+    """The class representing the Aho-Corasick automaton.
+
+    Examples:
+        >>> from anonipy.utils.aho_corasick import AhoCorasick
+        >>> automaton = AhoCorasick.from_terms(["John Doe", "Jane"], [0, 1], case_sensitive=False)
+        >>> list(automaton.finditer("jane and John Doe"))
+        [(0, 4, 1), (9, 17, 0)]
+
+    Attributes:
+        case_sensitive (bool): Whether the terms are matched case-sensitively.
+        metadata (dict): The additional metadata stored with the automaton.
+        cache_size (int): The maximum number of cached automaton states.
+
+    Methods:
+        from_terms(terms, values, case_sensitive):
+            Compile the automaton from the terms.
+        load(path, mmap):
+            Load the automaton from the directory.
+        save(path):
+            Save the automaton to the directory.
+        finditer(text):
+            Find all occurrences of the terms in the text.
+
+    """
+
+    def __init__(
+        self,
+        arrays: dict,
+        case_sensitive: bool = True,
+        metadata: Optional[dict] = None,
+        cache_size: int = 100000,
+    ):
+        """Initializes the automaton.
+
+        Use the `from_terms` or `load` methods to create the automaton.
+
+        Args:
+            arrays: The arrays describing the automaton.
+            case_sensitive: Whether the terms are matched case-sensitively.
+            metadata: The additional metadata stored with the automaton.
+            cache_size: The maximum number of cached automaton states.
+
+        """
+
+        self.case_sensitive = case_sensitive
+        self.metadata = metadata or {}
+        self.cache_size = cache_size
+        for name in _ARRAY_NAMES:
+            setattr(self, name, arrays[name])
+        self._states = {}
+
+    def __len__(self) -> int:
+        """The number of terms in the automaton."""
+
+        return int(np.count_nonzero(np.asarray(self.values) >= 0))
+
+    @classmethod
+    def from_terms(
+        cls,
+        terms: Iterable[str],
+        values: Iterable[int],
+        case_sensitive: bool = True,
+        metadata: Optional[dict] = None,
+    ) -> "AhoCorasick":
+        """Compile the automaton from the terms.
+
+        If a term is provided multiple times, the first value is used.
+
+        Examples:
+            >>> from anonipy.utils.aho_corasick import AhoCorasick
+            >>> automaton = AhoCorasick.from_terms(["John Doe", "Jane"], [0, 1])
+
+        Args:
+            terms: The terms to find.
+            values: The non-negative values returned with the matches of the terms.
+            case_sensitive: Whether the terms are matched case-sensitively.
+            metadata: The additional metadata stored with the automaton.
+
+        Returns:
+            The compiled automaton.
+
+        Raises:
+            ValueError: If a value is negative.
+
+        """
+
+        term_values = {}
+        for term, value in zip(terms, values):
+            if value < 0:
+                raise ValueError("The term values must be non-negative.")
+            term = _normalize(term, case_sensitive)
+            if term and term not in term_values:
+                term_values[term] = value
+
+        # create the trie nodes from the sorted terms, sharing the prefixes
+        parent, chars, depth, node_values = [-1], [0], [0], [-1]
+        path, previous = [0], ""
+        for term in sorted(term_values):
+            prefix_length = _common_prefix_length(previous, term)
+            del path[prefix_length + 1 :]
+            for d in range(prefix_length, len(term)):
+                path.append(len(parent))
+                parent.append(path[d])
+                chars.append(ord(term[d]))
+                depth.append(d + 1)
+                node_values.append(-1)
+            node_values[path[-1]] = term_values[term]
+            previous = term
+
+        # group the edges by their parent node (the children are sorted by character)
+        n_nodes = len(parent)
+        parent_array = np.array(parent[1:], dtype=np.int64)
+        edge_targets = np.argsort(parent_array, kind="stable").astype(np.int32) + 1
+        edge_chars = np.array(chars, dtype=np.int32)[edge_targets]
+        edge_offsets = np.zeros(n_nodes + 1, dtype=np.int64)
+        edge_offsets[1:] = np.cumsum(np.bincount(parent_array, minlength=n_nodes))
+
+        # create the failure and dictionary links in the breadth-first order
+        offsets_list = edge_offsets.tolist()
+        chars_list = edge_chars.tolist()
+        targets_list = edge_targets.tolist()
+
+        def goto(state: int, char: int) -> int:
+            start, end = offsets_list[state], offsets_list[state + 1]
+            i = bisect_left(chars_list, char, start, end)
+            return targets_list[i] if i < end and chars_list[i] == char else -1
+
+        fail, dict_link = [0] * n_nodes, [-1] * n_nodes
+        for node in np.argsort(np.array(depth), kind="stable").tolist()[1:]:
+            state = fail[parent[node]] if parent[node] != 0 else -1
+            while state >= 0:
+                target = goto(state, chars[node])
+                if target >= 0:
+                    fail[node] = target
+                    break
+                state = fail[state] if state != 0 else -1
+            link = fail[node]
+            dict_link[node] = link if node_values[link] >= 0 else dict_link[link]
+
+        arrays = {
+            "edge_offsets": edge_offsets,
+            "edge_chars": edge_chars,
+            "edge_targets": edge_targets,
+            "fail": np.array(fail, dtype=np.int32),
+            "dict_link": np.array(dict_link, dtype=np.int32),
+            "depth": np.array(depth, dtype=np.int32),
+            "values": np.array(node_values, dtype=np.int32),
+        }
+        return cls(arrays, case_sensitive=case_sensitive, metadata=metadata)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "AhoCorasick":
+        """Load the automaton from the directory.
+
+        Examples:
+            >>> from anonipy.utils.aho_corasick import AhoCorasick
+            >>> automaton = AhoCorasick.load("path/to/automaton")
+
+        Args:
+            path: The directory containing the saved automaton.
+            mmap: Whether to memory-map the arrays instead of reading them into memory.
+
+        Returns:
+            The loaded automaton.
+
+        Raises:
+            FileNotFoundError: If the directory does not contain a saved automaton.
+
+        """
+
+        meta_path = os.path.join(path, _META_FILE)
+        if not os.path.exists(meta_path):
+            raise FileNotFoundError(f"The automaton does not exist: {path}")
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+
+        mmap_mode = "r" if mmap else None
+        arrays = {
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+            for name in _ARRAY_NAMES
+        }
+        return cls(
+            arrays, case_sensitive=meta["case_sensitive"], metadata=meta["metadata"]
+        )
+
+    def save(self, path: str) -> None:
+        """Save the automaton to the directory.
+
+        Examples:
+            >>> automaton.save("path/to/automaton")
+
+        Args:
+            path: The directory to save the automaton to.
+
+        """
+
+        os.makedirs(path, exist_ok=True)
+        for name in _ARRAY_NAMES:
+            np.save(os.path.join(path, f"{name}.npy"), np.asarray(getattr(self, name)))
+        meta = {"case_sensitive": self.case_sensitive, "metadata": self.metadata}
+        with open(os.path.join(path, _META_FILE), "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """Find all occurrences of the terms in the text.
+
+        The occurrences are found in a single pass over the text and include
+        the overlapping occurrences.
+
+        Examples:
+            >>> list(automaton.finditer("jane and John Doe"))
+            [(0, 4, 1), (9, 17, 0)]
+
+        Args:
+            text: The text to search.
+
+        Returns:
+            The iterator over the (start, end, value) tuples, ordered by the end position.
+
+        """
+
+        state = 0
+        children, fail, output = self._get_state(state)
+        for i, char in enumerate(_normalize(text, self.case_sensitive)):
+            char = ord(char)
+            while char not in children and state != 0:
+                state = fail
+                children, fail, output = self._get_state(state)
+            if char in children:
+                state = children[char]
+                children, fail, output = self._get_state(state)
+            node = output
+            while node >= 0:
+                yield i + 1 - int(self.depth[node]), i + 1, int(self.values[node])
+                node = int(self.dict_link[node])
+
+    # =================================
+    # Private methods
+    # =================================
+
+    def _get_state(self, state: int) -> Tuple[dict, int, int]:
+        """Get the transitions, failure link and first output of the state.
+
+        The states are read from the (possibly memory-mapped) arrays and cached.
+
+        Args:
+            state: The automaton state.
+
+        Returns:
+            The mapping between the characters and the next states.
+            The failure link of the state.
+            The first state whose term ends in this state or -1.
+
+        """
+
+        cached = self._states.get(state)
+        if cached is not None:
+            return cached
+
+        start, end = int(self.edge_offsets[state]), int(self.edge_offsets[state + 1])
+        children = dict(
+            zip(
+                self.edge_chars[start:end].tolist(),
+                self.edge_targets[start:end].tolist(),
+            )
+        )
+        output = state if self.values[state] >= 0 else int(self.dict_link[state])
+        cached = (children, int(self.fail[state]), output)
+        if len(self._states) >= self.cache_size:
+            self._states.clear()
+        self._states[state] = cached
+        return cached
@@ -1,10 +1,12 @@
 import re
 import datetime
+import threading
 import warnings
-from typing import Tuple
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
 import dateparser
-from babel.dates import format_datetime, format_datetime
+from babel.dates import format_datetime, get_day_names, get_month_names
 
 # =====================================
 # Constants
@@ -110,6 +112,237 @@ POSSIBLE_FORMATS = [
     "EEE, MMM d, yyyy",
 ]
 
+# the order in which the numeric day and month appear, if ambiguous
+NUMERIC_DATE_ORDER = {"en": "MDY"}
+DEFAULT_NUMERIC_DATE_ORDER = "DMY"
+
+_TIME_PATTERN = (
+    r"(?:[ T](?P<hour>\d{1,2}):(?P<minute>\d{2})(?::(?P<second>\d{2}))?)?"
+    r"(?:[ ]?(?P<ampm>[APap][mM]))?"
+)
+
+FAST_NUMERIC_YEAR_FIRST = re.compile(
+    r"^(?P<year>\d{4})(?P<sep>[-/. ])(?P<month>\d{1,2})(?P=sep)(?P<day>\d{1,2})"
+    + _TIME_PATTERN
+    + r"$"
+)
+FAST_NUMERIC_YEAR_LAST = re.compile(
+    r"^(?P<first>\d{1,2})(?P<sep>[-/. ])(?P<second_>\d{1,2})(?P=sep)(?P<year>\d{4})"
+    + _TIME_PATTERN
+    + r"$"
+)
+FAST_MONTH_NAME = re.compile(
+    r"^(?:(?P<weekday>[^\W\d_]+),?[ ])?"
+    r"(?:"
+    r"(?P<day>\d{1,2})\.?[ ](?P<particle>de[ ])?(?P<month>[^\W\d_]+)\.?"
+    r"|"
+    r"(?P<month_>[^\W\d_]+)\.?[ ](?P<day_>\d{1,2})\.?"
+    r"),?[ ](?P<particle_>de[ ])?(?P<year>\d{4})" + _TIME_PATTERN + r"$"
+)
+# the languages using the `de` particle in the dates
+DATE_PARTICLE_LANGUAGES = ["es"]
+
+_FAST_PATH_COUNTS = {"hits": 0, "misses": 0}
+# the lock of the counters, updated from multiple threads
+_FAST_PATH_LOCK = threading.Lock()
+
+
+# =====================================
+# Fast-path datetime parser
+# =====================================
+
+
+@lru_cache(maxsize=None)
+def _get_month_lookup(lang: str) -> Dict[str, int]:
+    """Gets the mapping between the month names and month numbers.
+
+    Args:
+        lang: The language of the month names.
+
+    Returns:
+        The mapping between the lowercased month names and month numbers.
+
+    """
+
+    lookup = {}
+    for context in ["format", "stand-alone"]:
+        for width in ["wide", "abbreviated"]:
+            names = get_month_names(width, context=context, locale=lang)
+            for month, name in names.items():
+                lookup[name.lower().rstrip(".")] = month
+    return lookup
+
+
+@lru_cache(maxsize=None)
+def _get_weekday_names(lang: str) -> set:
+    """Gets the weekday names.
+
+    Args:
+        lang: The language of the weekday names.
+
+    Returns:
+        The set of lowercased weekday names.
+
+    """
+
+    names = set()
+    for context in ["format", "stand-alone"]:
+        for width in ["wide", "abbreviated"]:
+            days = get_day_names(width, context=context, locale=lang)
+            names.update(name.lower().rstrip(".") for name in days.values())
+    return names
+
+
+def _build_datetime(
+    year: int, month: int, day: int, match: re.Match
+) -> Optional[datetime.datetime]:
+    """Builds the datetime object from the matched date parts.
+
+    Args:
+        year: The year of the date.
+        month: The month of the date.
+        day: The day of the date.
+        match: The regex match containing the (optional) time groups.
+
+    Returns:
+        The datetime object or None if the date parts are not valid.
+
+    """
+
+    hour = int(match.group("hour") or 0)
+    minute = int(match.group("minute") or 0)
+    second = int(match.group("second") or 0)
+    ampm = match.group("ampm")
+    if ampm is not None:
+        if hour > 12:
+            return None
+        if ampm.lower() == "pm" and hour < 12:
+            hour += 12
+        elif ampm.lower() == "am" and hour == 12:
+            hour = 0
+    try:
+        return datetime.datetime(year, month, day, hour, minute, second)
+    except ValueError:
+        return None
+
+
+def _fast_parse_datetime(text: str, lang: str) -> Optional[datetime.datetime]:
+    """Parses the common numeric and month name datetime strings.
+
+    Only unambiguous strings are parsed; all other strings return None
+    and should be parsed with `dateparser`.
+
+    Args:
+        text: The datetime string to parse.
+        lang: The language of the datetime string.
+
+    Returns:
+        The parsed datetime or None if the string is not supported.
+
+    """
+
+    match = FAST_NUMERIC_YEAR_FIRST.match(text)
+    if match:
+        year, month, day = (int(match.group(g)) for g in ["year", "month", "day"])
+        if month > 12:
+            return None
+        return _build_datetime(year, month, day, match)
+
+    match = FAST_NUMERIC_YEAR_LAST.match(text)
+    if match:
+        first, second = int(match.group("first")), int(match.group("second_"))
+        order = NUMERIC_DATE_ORDER.get(lang, DEFAULT_NUMERIC_DATE_ORDER)
+        if order == "MDY" and first <= 12:
+            month, day = first, second
+        elif second <= 12:
+            day, month = first, second
+        else:
+            return None
+        return _build_datetime(int(match.group("year")), month, day, match)
+
+    match = FAST_MONTH_NAME.match(text)
+    if match:
+        weekday = match.group("weekday")
+        if weekday and weekday.lower() not in _get_weekday_names(lang):
+            return None
+        particle = match.group("particle") or match.group("particle_")
+        if particle and lang not in DATE_PARTICLE_LANGUAGES:
+            return None
+        name = match.group("month") or match.group("month_")
+        month = _get_month_lookup(lang).get(name.lower())
+        if month is None:
+            return None
+        day = int(match.group("day") or match.group("day_"))
+        return _build_datetime(int(match.group("year")), month, day, match)
+
+    return None
+
+
+def parse_datetime(text: str, lang: str) -> Optional[datetime.datetime]:
+    """Parses the datetime string.
+
+    The common numeric and month name formats are parsed directly. All other
+    formats are parsed using `dateparser`.
+
+    Examples:
+        >>> from anonipy.utils.datetime_format import parse_datetime
+        >>> parse_datetime("17-06-2023 14:30", "en")
+        datetime.datetime(2023, 6, 17, 14, 30)
+
+    Args:
+        text: The datetime string to parse.
+        lang: The language of the datetime string.
+
+    Returns:
+        The parsed datetime or None if the string could not be parsed.
+
+    """
+
+    parsed_datetime = _fast_parse_datetime(text.strip(), lang)
+    with _FAST_PATH_LOCK:
+        _FAST_PATH_COUNTS["hits" if parsed_datetime is not None else "misses"] += 1
+    if parsed_datetime is not None:
+        return parsed_datetime
+
+    # Suppress all DeprecationWarnings from dateparser's internal strptime usage
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=DeprecationWarning)
+        return dateparser.parse(text, languages=[lang])
+
+
+def get_fast_path_stats() -> dict:
+    """Gets the statistics of the fast-path datetime parser.
+
+    Examples:
+        >>> from anonipy.utils.datetime_format import get_fast_path_stats
+        >>> get_fast_path_stats()
+        {"hits": 10, "misses": 2, "hit_rate": 0.8333333333333334}
+
+    Returns:
+        The number of fast-path hits, misses and the hit rate.
+
+    """
+
+    with _FAST_PATH_LOCK:
+        counts = dict(_FAST_PATH_COUNTS)
+    total = counts["hits"] + counts["misses"]
+    hit_rate = counts["hits"] / total if total > 0 else 0.0
+    return {**counts, "hit_rate": hit_rate}
+
+
+def reset_fast_path_stats() -> None:
+    """Resets the statistics of the fast-path datetime parser.
+
+    Examples:
+        >>> from anonipy.utils.datetime_format import reset_fast_path_stats
+        >>> reset_fast_path_stats()
+
+    """
+
+    with _FAST_PATH_LOCK:
+        _FAST_PATH_COUNTS["hits"] = 0
+        _FAST_PATH_COUNTS["misses"] = 0
+
 
 # =====================================
 # Auto date format detector
@@ -131,10 +364,7 @@ def detect_datetime_format(datetime: str, lang: str) -> Tuple[datetime.datetime,
     fdatetime = _prepare_datetime(datetime, lang)
 
     try:
-        # Suppress all DeprecationWarnings from dateparser's internal strptime usage
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", category=DeprecationWarning)
-            parsed_datetime = dateparser.parse(fdatetime, languages=[lang])
+        parsed_datetime = parse_datetime(fdatetime, lang)
 
         for FMT in POSSIBLE_FORMATS:
             try:
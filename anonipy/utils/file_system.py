@@ -7,6 +7,10 @@ Methods:
         Opens a file and returns its content as a string.
     write_file(text, file_path, encode):
         Writes the text to a file.
+    read_text_chunks(file_path, chunk_size):
+        Reads a text file in sentence-aligned chunks using memory mapping.
+    write_text_chunks(chunks, file_path, encode):
+        Writes the text chunks to a file one by one.
     open_json(file_path):
         Opens a JSON file and returns its content as a dictionary.
     write_json(data, file_path):
@@ -17,7 +21,8 @@ Methods:
 import os
 import re
 import json
-from typing import Union
+import mmap
+from typing import Iterable, Iterator, Union
 
 from docx import Document
 from pypdf import PdfReader
@@ -25,6 +30,12 @@ from pypdf import PdfReader
 # Define namespaces
 WORD_NAMESPACES = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
 
+# Define the chunk boundaries (line ends, sentence ends or whitespace)
+CHUNK_BOUNDARY_SEARCH_SIZE = 65536
+_LINE_END = re.compile(rb"\n")
+_SENTENCE_END = re.compile(rb"[.!?][ \t\r\n]+")
+_WHITESPACE = re.compile(rb"[ \t\r\n]+")
+
 # =====================================
 # Helper functions
 # =====================================
@@ -165,6 +176,53 @@ def _extract_text_from_word(doc_path: str) -> str:
     return document_text
 
 
+# =====================================
+# Chunk helpers
+# =====================================
+
+
+def _find_chunk_end(buffer: mmap.mmap, start: int, chunk_size: int) -> int:
+    """Finds the end of the chunk starting at the position.
+
+    The chunk ends after the last line end, sentence end or whitespace within
+    the chunk size. If there is none, the chunk ends at the last UTF-8
+    character boundary.
+
+    Args:
+        buffer: The memory-mapped file.
+        start: The start position of the chunk.
+        chunk_size: The maximum size of the chunk in bytes.
+
+    Returns:
+        The end position of the chunk.
+
+    """
+
+    end = start + chunk_size
+    if end >= len(buffer):
+        return len(buffer)
+
+    search_start = max(start + 1, end - CHUNK_BOUNDARY_SEARCH_SIZE)
+    for pattern in [_LINE_END, _SENTENCE_END, _WHITESPACE]:
+        boundary = None
+        for match in pattern.finditer(buffer, search_start, end):
+            boundary = match.end()
+        if boundary is not None:
+            return boundary
+
+    # do not split the multi-byte characters
+    boundary = end
+    while boundary > start and buffer[boundary] & 0xC0 == 0x80:
+        boundary -= 1
+    if boundary > start:
+        return boundary
+    # the chunk is smaller than the first character
+    end = start + 1
+    while end < len(buffer) and buffer[end] & 0xC0 == 0x80:
+        end += 1
+    return end
+
+
 # =====================================
 # Main functions
 # =====================================
@@ -284,3 +342,98 @@ def write_json(data: dict, file_path: str) -> None:
 
     with open(file_path, "w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=4)
+
+
+def read_text_chunks(file_path: str, chunk_size: int = 1048576) -> Iterator[str]:
+    """Reads a text file in sentence-aligned chunks using memory mapping.
+
+    The file is memory-mapped and decoded one chunk at a time, which keeps the
+    memory usage flat for large files. The chunks end at line ends, sentence
+    ends or whitespace, whenever possible. The file must be UTF-8 encoded.
+    The `\\r\\n` and `\\r` line ends are translated to `\\n`, as when the file
+    is read with `open_file`.
+
+    Examples:
+        >>> from anonipy.utils import file_system
+        >>> for chunk in file_system.read_text_chunks("path/to/file.txt"):
+        >>>     print(chunk)
+
+    Args:
+        file_path: The path to the text file.
+        chunk_size: The maximum size of the chunks in bytes.
+
+    Returns:
+        The iterator over the text chunks.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If `chunk_size` is not positive.
+
+    """
+
+    if not os.path.isfile(file_path):
+        raise FileNotFoundError(f"The file does not exist: {file_path}")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive number")
+    if os.path.getsize(file_path) == 0:
+        return
+
+    with open(file_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            start, after_cr = 0, False
+            while start < len(buffer):
+                end = _find_chunk_end(buffer, start, chunk_size)
+                with memoryview(buffer)[start:end] as view:
+                    chunk = str(view, encoding="utf-8")
+                start = end
+                # the `\r\n` line end split between the chunks
+                if after_cr and chunk.startswith("\n"):
+                    chunk = chunk[1:]
+                after_cr = chunk.endswith("\r")
+                chunk = chunk.replace("\r\n", "\n").replace("\r", "\n")
+                if chunk:
+                    yield chunk
+
+
+def write_text_chunks(
+    chunks: Iterable[str], file_path: str, encode: Union[str, bool] = True
+) -> None:
+    """Writes the text chunks to a file one by one.
+
+    Examples:
+        >>> from anonipy.utils import file_system
+        >>> file_system.write_text_chunks(["Hello, ", "World!"], "path/to/file.txt")
+
+    Args:
+        chunks: The text chunks to write to the file.
+        file_path: The path to the file.
+        encode: The encoding to use.
+
+    Raises:
+        TypeError: If `file_path` is not a string; `encode` is not a string or a boolean; a chunk is not a string.
+        FileNotFoundError: If the directory does not exist.
+
+    """
+
+    if not isinstance(file_path, str):
+        raise TypeError("file_path must be a string")
+
+    if not isinstance(encode, str) and not isinstance(encode, bool):
+        raise TypeError("encode must be a string or a boolean")
+
+    if not os.path.exists(os.path.dirname(file_path)):
+        raise FileNotFoundError(
+            f"The directory does not exist: {os.path.dirname(file_path)}"
+        )
+
+    encoding = None
+    if isinstance(encode, str):
+        encoding = encode
+    elif isinstance(encode, bool):
+        encoding = "utf-8" if encode else None
+
+    with open(file_path, "w", encoding=encoding) as f:
+        for chunk in chunks:
+            if not isinstance(chunk, str):
+                raise TypeError("chunks must be strings")
+            f.write(chunk)
@@ -3,12 +3,22 @@
 Replaces the external `gliner-spacy` package which has a bug where it
 passes `load_tokenizer=False` to `GLiNER.from_pretrained()` for non-ONNX
 models, preventing proper embedding resizing.
+
+The components created within the `share_models` context share the GLiNER
+models with the same identifier and device, so that multiple pipelines
+(e.g. one for each language) load the model only once.
 """
 
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
 from gliner import GLiNER
 from spacy.language import Language
 from spacy.tokens import Span
 
+from .instrumentation import instrumentation
+
 Span.set_extension("score", default=0, force=True)
 
 DEFAULT_CONFIG = {
@@ -20,6 +30,55 @@ DEFAULT_CONFIG = {
     "map_location": "cpu",
 }
 
+# the models shared by the components created within the `share_models` context
+_shared_models: Optional[dict] = None
+_shared_models_lock = threading.RLock()
+
+
+@contextmanager
+def share_models(models: dict) -> Iterator[dict]:
+    """Share the GLiNER models of the components created within the context.
+
+    The models are stored in the provided dictionary, keyed by the model
+    identifier and the device, so the dictionary can be reused between the
+    contexts. The contexts are serialized between the threads.
+
+    Examples:
+        >>> from anonipy.utils.gliner_spacy import share_models
+        >>> models = {}
+        >>> with share_models(models):
+        >>>     extractors = [NERExtractor(labels, lang=lang) for lang in languages]
+
+    Args:
+        models: The dictionary storing the shared models.
+
+    Returns:
+        The dictionary storing the shared models.
+
+    """
+
+    global _shared_models
+    with _shared_models_lock:
+        previous = _shared_models
+        _shared_models = models
+        try:
+            yield models
+        finally:
+            _shared_models = previous
+
+
+def _load_model(gliner_model: str, map_location: str) -> GLiNER:
+    """Load the GLiNER model, reusing the shared model if available."""
+
+    if _shared_models is None:
+        return GLiNER.from_pretrained(gliner_model, map_location=map_location)
+    key = (gliner_model, map_location)
+    if key not in _shared_models:
+        _shared_models[key] = GLiNER.from_pretrained(
+            gliner_model, map_location=map_location
+        )
+    return _shared_models[key]
+
 
 @Language.factory(
     "gliner_spacy",
@@ -52,10 +111,7 @@ class GlinerSpacy:
         map_location: str,
     ):
         self.nlp = nlp
-        self.model = GLiNER.from_pretrained(
-            gliner_model,
-            map_location=map_location,
-        )
+        self.model = _load_model(gliner_model, map_location)
         self.labels = labels
         self.chunk_size = chunk_size
         self.style = style
@@ -64,8 +120,78 @@ class GlinerSpacy:
     def __call__(self, doc):
         """Process a spacy Doc through the GLiNER model."""
 
-        # Chunk text on word boundaries
-        text = doc.text
+        # Run prediction on each chunk
+        all_entities = []
+        offset = 0
+        with instrumentation.stage("gliner.predict", docs=1) as stage:
+            for chunk in self._chunk_text(doc.text):
+                chunk_entities = self.model.predict_entities(
+                    chunk,
+                    self.labels,
+                    flat_ner=self.style != "span",
+                    threshold=self.threshold,
+                )
+                all_entities.extend(self._shift_entities(chunk_entities, offset))
+                offset += len(chunk)
+                stage.add("chunks")
+            stage.add("entities", len(all_entities))
+
+        return self._set_entities(doc, all_entities)
+
+    def pipe(self, docs, batch_size: int = 8):
+        """Process a stream of spacy Docs through the GLiNER model in batches.
+
+        The chunks of all docs in the batch are predicted together.
+        """
+
+        batch = []
+        for doc in docs:
+            batch.append(doc)
+            if len(batch) == batch_size:
+                yield from self._process_batch(batch, batch_size)
+                batch = []
+        if batch:
+            yield from self._process_batch(batch, batch_size)
+
+    def _process_batch(self, docs, batch_size: int):
+        """Process a batch of spacy Docs with a single model call."""
+
+        chunks, owners = [], []
+        for i, doc in enumerate(docs):
+            offset = 0
+            for chunk in self._chunk_text(doc.text):
+                chunks.append(chunk)
+                owners.append((i, offset))
+                offset += len(chunk)
+
+        # older GLiNER versions only provide the batch_predict_entities method
+        predict = getattr(self.model, "inference", None)
+        if predict is None:
+            predict = self.model.batch_predict_entities
+        with instrumentation.stage(
+            "gliner.predict", docs=len(docs), chunks=len(chunks)
+        ) as stage:
+            predictions = (
+                predict(
+                    chunks,
+                    self.labels,
+                    flat_ner=self.style != "span",
+                    threshold=self.threshold,
+                    batch_size=batch_size,
+                )
+                if chunks
+                else []
+            )
+            stage.add("entities", sum(len(p) for p in predictions))
+
+        doc_entities = [[] for _ in docs]
+        for (i, offset), chunk_entities in zip(owners, predictions):
+            doc_entities[i].extend(self._shift_entities(chunk_entities, offset))
+        return [self._set_entities(doc, e) for doc, e in zip(docs, doc_entities)]
+
+    def _chunk_text(self, text: str) -> list:
+        """Chunk text on word boundaries."""
+
         chunks = []
         start = 0
         while start < len(text):
@@ -74,30 +200,24 @@ class GlinerSpacy:
                 end += 1
             chunks.append(text[start:end])
             start = end
+        return chunks
 
-        # Run prediction on each chunk
-        all_entities = []
-        offset = 0
-        for chunk in chunks:
-            flat_ner = self.style != "span"
-            chunk_entities = self.model.predict_entities(
-                chunk,
-                self.labels,
-                flat_ner=flat_ner,
-                threshold=self.threshold,
-            )
-            for entity in chunk_entities:
-                all_entities.append(
-                    {
-                        "start": offset + entity["start"],
-                        "end": offset + entity["end"],
-                        "label": entity["label"],
-                        "score": entity["score"],
-                    }
-                )
-            offset += len(chunk)
+    def _shift_entities(self, chunk_entities: list, offset: int) -> list:
+        """Map the chunk entities to the positions in the doc text."""
+
+        return [
+            {
+                "start": offset + entity["start"],
+                "end": offset + entity["end"],
+                "label": entity["label"],
+                "score": entity["score"],
+            }
+            for entity in chunk_entities
+        ]
+
+    def _set_entities(self, doc, all_entities: list):
+        """Create spacy spans and store them on the doc."""
 
-        # Create spacy spans and store on doc
         spans = []
         for ent in all_entities:
             span = doc.char_span(ent["start"], ent["end"], label=ent["label"])
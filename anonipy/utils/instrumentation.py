@@ -0,0 +1,576 @@
+"""The module containing the `instrumentation` utilities.
+
+The `instrumentation` module contains the registry of the stage timers, used
+to measure where the time goes when anonymizing the texts. Each stage records
+its wall time and the counters of the processed items (e.g. chunks, entities,
+replacements and bytes), which are aggregated per stage name. The stages can
+also be exported as OpenTelemetry-compatible spans.
+
+The package stages are recorded by the shared `instrumentation` registry,
+which is disabled by default. When disabled, the stages are not recorded and
+add only the cost of a function call.
+
+Examples:
+    >>> from anonipy.utils.instrumentation import instrumentation
+    >>> with instrumentation.collect():
+    >>>     pipeline.anonymize("input_dir", "output_dir")
+    >>> instrumentation.get_stats()
+    {"pipeline.read": {"calls": 3, "total_s": 0.02, "bytes": 12034, ...}, ...}
+
+Classes:
+    Instrumentation: The class representing the registry of the stage timers.
+    Stage: The class representing the timed stage.
+    SpanRecorder: The class recording the stages as OpenTelemetry-compatible spans.
+    OpenTelemetryExporter: The class exporting the stages to the OpenTelemetry tracer.
+
+Attributes:
+    instrumentation (Instrumentation): The registry recording the package stages.
+
+"""
+
+import time
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional
+
+# the identifier of the currently open stage, used to link the spans
+_current_span_id: ContextVar[Optional[int]] = ContextVar(
+    "anonipy_current_span_id", default=None
+)
+
+# =====================================
+# Stage classes
+# =====================================
+
+
+class _NoopStage:
+    """The stage returned by the disabled registry, which records nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopStage":
+        return self
+
+    def __exit__(self, *args) -> None:
+        return None
+
+    def add(self, key: str, value: int = 1) -> None:
+        return None
+
+
+_NOOP_STAGE = _NoopStage()
+
+
+class Stage:
+    """The class representing the timed stage.
+
+    Use the `Instrumentation.stage` method to create the stage.
+
+    Examples:
+        >>> with instrumentation.stage("pipeline.read") as stage:
+        >>>     text = open_file(file_path)
+        >>>     stage.add("bytes", len(text))
+
+    Attributes:
+        name (str): The name of the stage.
+        counts (dict): The counters of the processed items.
+        start_time (float): The wall clock start time in seconds since the epoch.
+        duration (float): The duration of the stage in seconds.
+
+    Methods:
+        add(key, value):
+            Increase the counter of the processed items.
+
+    """
+
+    __slots__ = (
+        "registry",
+        "name",
+        "counts",
+        "start_time",
+        "duration",
+        "span_id",
+        "parent_id",
+        "_start",
+        "_token",
+        "_handles",
+    )
+
+    def __init__(self, registry: "Instrumentation", name: str, counts: dict):
+        self.registry = registry
+        self.name = name
+        self.counts = counts
+        self.start_time = None
+        self.duration = None
+        self.span_id = None
+        self.parent_id = None
+
+    def __enter__(self) -> "Stage":
+        self.start_time = time.time()
+        if self.registry.exporters:
+            self.span_id = self.registry._next_span_id()
+            self.parent_id = _current_span_id.get()
+            self._token = _current_span_id.set(self.span_id)
+            self._handles = [(e, e.start(self)) for e in self.registry.exporters]
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.duration = time.perf_counter() - self._start
+        if self.span_id is not None:
+            _current_span_id.reset(self._token)
+            for exporter, handle in self._handles:
+                exporter.end(self, handle, exc)
+        self.registry._record(self)
+
+    def add(self, key: str, value: int = 1) -> None:
+        """Increase the counter of the processed items.
+
+        Examples:
+            >>> stage.add("entities", len(entities))
+
+        Args:
+            key: The name of the counter.
+            value: The value to add to the counter.
+
+        """
+
+        self.counts[key] = self.counts.get(key, 0) + value
+
+
+# =====================================
+# Registry class
+# =====================================
+
+
+class Instrumentation:
+    """The class representing the registry of the stage timers.
+
+    Examples:
+        >>> from anonipy.utils.instrumentation import Instrumentation
+        >>> registry = Instrumentation(enabled=True)
+        >>> with registry.stage("extract") as stage:
+        >>>     doc, entities = extractor(text)
+        >>>     stage.add("entities", len(entities))
+        >>> registry.get_stats()
+        {"extract": {"calls": 1, "total_s": 0.1, "min_s": 0.1, "max_s": 0.1, "mean_s": 0.1, "entities": 2}}
+
+    Attributes:
+        enabled (bool): Whether the stages are recorded.
+        exporters (List[SpanRecorder, OpenTelemetryExporter]): The exporters of the stage spans.
+
+    Methods:
+        stage(name, **counts):
+            Create the timed stage.
+        collect():
+            Record the stages within the context.
+        get_stats():
+            Get the aggregated statistics of the stages.
+        merge(stats):
+            Merge the statistics of another run.
+        reset():
+            Reset the aggregated statistics.
+        enable():
+            Enable the recording of the stages.
+        disable():
+            Disable the recording of the stages.
+        add_exporter(exporter):
+            Add the exporter of the stage spans.
+        remove_exporter(exporter):
+            Remove the exporter of the stage spans.
+
+    """
+
+    def __init__(self, enabled: bool = False, exporters: Optional[list] = None):
+        """Initialize the registry of the stage timers.
+
+        Examples:
+            >>> from anonipy.utils.instrumentation import Instrumentation, SpanRecorder
+            >>> registry = Instrumentation(enabled=True, exporters=[SpanRecorder()])
+
+        Args:
+            enabled: Whether the stages are recorded.
+            exporters: The exporters of the stage spans.
+
+        """
+
+        self.enabled = enabled
+        self.exporters = list(exporters or [])
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._span_ids = 0
+
+    def stage(self, name: str, **counts) -> Stage:
+        """Create the timed stage.
+
+        When the registry is disabled, a shared stage recording nothing is
+        returned.
+
+        Examples:
+            >>> with instrumentation.stage("pipeline.write", bytes=len(text)):
+            >>>     write_file(text, file_path)
+
+        Args:
+            name: The name of the stage.
+            **counts: The initial counters of the processed items.
+
+        Returns:
+            The stage to be used as the context manager.
+
+        """
+
+        if not self.enabled:
+            return _NOOP_STAGE
+        return Stage(self, name, counts)
+
+    @contextmanager
+    def collect(self) -> Iterator["Instrumentation"]:
+        """Record the stages within the context.
+
+        The statistics are reset when entering the context and the previous
+        enabled state is restored when leaving it.
+
+        Examples:
+            >>> with instrumentation.collect():
+            >>>     pipeline.anonymize("input_dir", "output_dir")
+            >>> instrumentation.get_stats()
+
+        Returns:
+            The registry.
+
+        """
+
+        enabled = self.enabled
+        self.reset()
+        self.enabled = True
+        try:
+            yield self
+        finally:
+            self.enabled = enabled
+
+    def get_stats(self) -> Dict[str, dict]:
+        """Get the aggregated statistics of the stages.
+
+        Examples:
+            >>> instrumentation.get_stats()
+            {"pipeline.read": {"calls": 3, "total_s": 0.02, "min_s": 0.005, "max_s": 0.01, "mean_s": 0.0067, "bytes": 12034}}
+
+        Returns:
+            The statistics of each stage, containing the number of calls, the total, minimum, maximum and mean wall time in seconds, and the summed counters.
+
+        """
+
+        with self._lock:
+            stats = {name: dict(stage) for name, stage in self._stats.items()}
+        for stage in stats.values():
+            stage["mean_s"] = stage["total_s"] / stage["calls"]
+        return stats
+
+    def merge(self, stats: Dict[str, dict]) -> None:
+        """Merge the statistics of another run.
+
+        Used to aggregate the statistics of multiple runs or processes.
+
+        Examples:
+            >>> instrumentation.merge(other_registry.get_stats())
+
+        Args:
+            stats: The statistics returned by the `get_stats` method.
+
+        """
+
+        with self._lock:
+            for name, other in stats.items():
+                stage = self._stats.get(name)
+                if stage is None:
+                    self._stats[name] = {
+                        k: v for k, v in other.items() if k != "mean_s"
+                    }
+                    continue
+                for key, value in other.items():
+                    if key == "mean_s":
+                        continue
+                    elif key == "min_s":
+                        stage[key] = min(stage[key], value)
+                    elif key == "max_s":
+                        stage[key] = max(stage[key], value)
+                    else:
+                        stage[key] = stage.get(key, 0) + value
+
+    def reset(self) -> None:
+        """Reset the aggregated statistics.
+
+        Examples:
+            >>> instrumentation.reset()
+
+        """
+
+        with self._lock:
+            self._stats = {}
+
+    def enable(self) -> None:
+        """Enable the recording of the stages.
+
+        Examples:
+            >>> instrumentation.enable()
+
+        """
+
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Disable the recording of the stages.
+
+        Examples:
+            >>> instrumentation.disable()
+
+        """
+
+        self.enabled = False
+
+    def add_exporter(self, exporter) -> None:
+        """Add the exporter of the stage spans.
+
+        Examples:
+            >>> instrumentation.add_exporter(SpanRecorder())
+
+        Args:
+            exporter: The exporter implementing the `start(stage)` and `end(stage, handle, exception)` methods.
+
+        """
+
+        self.exporters.append(exporter)
+
+    def remove_exporter(self, exporter) -> None:
+        """Remove the exporter of the stage spans.
+
+        Examples:
+            >>> instrumentation.remove_exporter(recorder)
+
+        Args:
+            exporter: The exporter to remove.
+
+        """
+
+        self.exporters.remove(exporter)
+
+    # =================================
+    # Private methods
+    # =================================
+
+    def _next_span_id(self) -> int:
+        """Get the next span identifier.
+
+        Returns:
+            The unique span identifier.
+
+        """
+
+        with self._lock:
+            self._span_ids += 1
+            return self._span_ids
+
+    def _record(self, stage: Stage) -> None:
+        """Add the finished stage to the aggregated statistics.
+
+        Args:
+            stage: The finished stage.
+
+        """
+
+        with self._lock:
+            stats = self._stats.get(stage.name)
+            if stats is None:
+                stats = self._stats[stage.name] = {
+                    "calls": 0,
+                    "total_s": 0.0,
+                    "min_s": stage.duration,
+                    "max_s": stage.duration,
+                }
+            stats["calls"] += 1
+            stats["total_s"] += stage.duration
+            stats["min_s"] = min(stats["min_s"], stage.duration)
+            stats["max_s"] = max(stats["max_s"], stage.duration)
+            for key, value in stage.counts.items():
+                stats[key] = stats.get(key, 0) + value
+
+
+# =====================================
+# Exporter classes
+# =====================================
+
+
+class SpanRecorder:
+    """The class recording the stages as OpenTelemetry-compatible spans.
+
+    The spans are stored as dictionaries with the fields of the OpenTelemetry
+    span data model, which can be serialized to JSON.
+
+    Examples:
+        >>> from anonipy.utils.instrumentation import SpanRecorder
+        >>> recorder = SpanRecorder()
+        >>> instrumentation.add_exporter(recorder)
+        >>> recorder.spans
+        [{"name": "pipeline.read", "span_id": 1, "parent_id": None, "start_time_unix_nano": ..., "end_time_unix_nano": ..., "attributes": {"bytes": 12034}, "status": "OK"}]
+
+    Attributes:
+        spans (List[dict]): The recorded spans, in the order they ended.
+
+    Methods:
+        start(stage):
+            Start the span of the stage.
+        end(stage, handle, exception):
+            End the span of the stage.
+        clear():
+            Remove the recorded spans.
+
+    """
+
+    def __init__(self):
+        """Initialize the span recorder.
+
+        Examples:
+            >>> from anonipy.utils.instrumentation import SpanRecorder
+            >>> recorder = SpanRecorder()
+
+        """
+
+        self.spans: List[dict] = []
+        self._lock = threading.Lock()
+
+    def start(self, stage: Stage) -> None:
+        """Start the span of the stage.
+
+        Args:
+            stage: The started stage.
+
+        """
+
+        return None
+
+    def end(
+        self, stage: Stage, handle: None, exception: Optional[BaseException]
+    ) -> None:
+        """End the span of the stage.
+
+        Args:
+            stage: The finished stage.
+            handle: The value returned by the `start` method.
+            exception: The exception raised within the stage, if any.
+
+        """
+
+        start_time = int(stage.start_time * 1e9)
+        span = {
+            "name": stage.name,
+            "span_id": stage.span_id,
+            "parent_id": stage.parent_id,
+            "start_time_unix_nano": start_time,
+            "end_time_unix_nano": start_time + int(stage.duration * 1e9),
+            "attributes": dict(stage.counts),
+            "status": "ERROR" if exception is not None else "OK",
+        }
+        with self._lock:
+            self.spans.append(span)
+
+    def clear(self) -> None:
+        """Remove the recorded spans.
+
+        Examples:
+            >>> recorder.clear()
+
+        """
+
+        with self._lock:
+            self.spans = []
+
+
+class OpenTelemetryExporter:
+    """The class exporting the stages to the OpenTelemetry tracer.
+
+    Requires the `opentelemetry-api` package. The stages are exported as
+    spans of the provided tracer, nested by the OpenTelemetry context.
+
+    Examples:
+        >>> from anonipy.utils.instrumentation import OpenTelemetryExporter
+        >>> instrumentation.add_exporter(OpenTelemetryExporter())
+
+    Attributes:
+        tracer (opentelemetry.trace.Tracer): The tracer creating the spans.
+
+    Methods:
+        start(stage):
+            Start the span of the stage.
+        end(stage, handle, exception):
+            End the span of the stage.
+
+    """
+
+    def __init__(self, tracer=None):
+        """Initialize the OpenTelemetry exporter.
+
+        Examples:
+            >>> from anonipy.utils.instrumentation import OpenTelemetryExporter
+            >>> exporter = OpenTelemetryExporter()
+
+        Args:
+            tracer: The tracer creating the spans. If `None`, the `anonipy` tracer of the global tracer provider is used.
+
+        Raises:
+            ImportError: If the `opentelemetry-api` package is not installed.
+
+        """
+
+        try:
+            from opentelemetry import trace
+        except ImportError as e:
+            raise ImportError(
+                "The opentelemetry-api package is required to export the spans."
+            ) from e
+
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer("anonipy")
+
+    def start(self, stage: Stage):
+        """Start the span of the stage.
+
+        Args:
+            stage: The started stage.
+
+        Returns:
+            The span and the context manager activating it.
+
+        """
+
+        span = self.tracer.start_span(
+            stage.name, start_time=int(stage.start_time * 1e9)
+        )
+        activation = self._trace.use_span(span, end_on_exit=False)
+        activation.__enter__()
+        return span, activation
+
+    def end(self, stage: Stage, handle, exception: Optional[BaseException]) -> None:
+        """End the span of the stage.
+
+        Args:
+            stage: The finished stage.
+            handle: The span and the context manager returned by the `start` method.
+            exception: The exception raised within the stage, if any.
+
+        """
+
+        span, activation = handle
+        span.set_attributes(stage.counts)
+        if exception is not None:
+            span.record_exception(exception)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        activation.__exit__(None, None, None)
+        span.end(end_time=int(stage.start_time * 1e9) + int(stage.duration * 1e9))
+
+
+# =====================================
+# Shared registry
+# =====================================
+
+instrumentation = Instrumentation()
@@ -8,9 +8,35 @@ Classes:
 
 """
 
-from typing import Tuple
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple, Union
+
+from lingua import IsoCode639_1, Language, LanguageDetectorBuilder
+
+from ..constants import LANGUAGES
+
+# =====================================
+# Helper functions
+# =====================================
+
+
+def _get_fingerprint(text: str) -> bytes:
+    """Get the fingerprint of the text used as the cache key.
+
+    Args:
+        text: The text to fingerprint.
+
+    Returns:
+        The 16-byte digest of the text.
+
+    """
+
+    return hashlib.blake2b(
+        text.encode("utf-8", "surrogatepass"), digest_size=16
+    ).digest()
 
-from lingua import LanguageDetectorBuilder
 
 # =====================================
 # Main class
@@ -20,6 +46,11 @@ from lingua import LanguageDetectorBuilder
 class LanguageDetector:
     """The class representing the language detector.
 
+    The detected languages are stored in the LRU cache, keyed by the
+    fingerprint of the text, so the repeated texts are detected only once.
+    The candidate languages can be restricted to a subset, and their models
+    can be loaded on demand instead of when the detector is created.
+
     Examples:
         >>> from anonipy.utils.language_detector import LanguageDetector
         >>> detector = LanguageDetector()
@@ -27,6 +58,9 @@ class LanguageDetector:
 
     Attributes:
         detector (lingua.LanguageDetector): The language detector.
+        languages (List[str]): The ISO 639-1 codes of the candidate languages.
+        cache_size (int): The maximum number of the cached detections.
+        stats (dict): The counters of the cache hits and misses.
 
     Methods:
         __call__(text, output_standard):
@@ -35,28 +69,75 @@ class LanguageDetector:
         detect(text, output_standard):
             Detect the language of a text.
 
+        detect_batch(texts, output_standard):
+            Detect the languages of multiple texts in parallel.
+
+        clear_cache():
+            Remove the cached detections.
+
+        unload_models():
+            Unload the language models from memory.
+
     """
 
-    def __init__(self, low_accuracy: bool = False):
+    def __init__(
+        self,
+        low_accuracy: bool = False,
+        supported_only: bool = False,
+        cache_size: int = 4096,
+        languages: Optional[List[Union[str, tuple]]] = None,
+        preload_models: bool = True,
+    ):
         """Initializes the language detector.
 
         Examples:
             >>> from anonipy.utils.language_detector import LanguageDetector
-            >>> detector = LanguageDetector()
+            >>> detector = LanguageDetector(supported_only=True)
+            >>> detector = LanguageDetector(languages=["en", "de", "sl"], preload_models=False)
 
         Args:
             low_accuracy: Whether to use the low accuracy mode.
+            supported_only: Whether to only detect the languages in `LANGUAGES.supported_languages()`.
+            cache_size: The maximum number of the cached detections. If `0`, the detections are not cached.
+            languages: The candidate languages, as the language tuples (e.g. `LANGUAGES.ENGLISH`) or the ISO 639-1 codes. At least two distinct languages are required. If `None`, all languages are candidates.
+            preload_models: Whether to load the language models when the detector is created. If `False`, each model is loaded when it is first needed. The low accuracy mode always loads the models on demand.
+
+        Raises:
+            ValueError: If the cache size is negative, a language is not supported, fewer than two distinct languages are provided, or both `languages` and `supported_only` are provided.
 
         """
 
-        # Prepare the language detector for all languages
-        builder = LanguageDetectorBuilder.from_all_languages()
-        builder = (
-            builder.with_low_accuracy_mode()
-            if low_accuracy
-            else builder.with_preloaded_language_models()
-        )
+        if cache_size < 0:
+            raise ValueError("The cache_size must be a non-negative number.")
+        if languages is not None and supported_only:
+            raise ValueError(
+                "The languages and supported_only cannot be used together."
+            )
+
+        if supported_only:
+            languages = LANGUAGES.supported_languages()
+        if languages is not None:
+            # Prepare the language detector for the candidate languages
+            iso_codes = [self._get_iso_code(lang) for lang in languages]
+            if len(set(iso_codes)) < 2:
+                raise ValueError(
+                    "At least two distinct languages are required for the detection."
+                )
+            builder = LanguageDetectorBuilder.from_iso_codes_639_1(*iso_codes)
+        else:
+            # Prepare the language detector for all languages
+            iso_codes = [language.iso_code_639_1 for language in Language.all()]
+            builder = LanguageDetectorBuilder.from_all_languages()
+        if low_accuracy:
+            builder = builder.with_low_accuracy_mode()
+        elif preload_models:
+            builder = builder.with_preloaded_language_models()
         self.detector = builder.build()
+        self.languages = sorted(code.name.lower() for code in set(iso_codes))
+        self.cache_size = cache_size
+        self.stats = {"hits": 0, "misses": 0}
+        self._cache: "OrderedDict[bytes, Optional[Language]]" = OrderedDict()
+        self._lock = threading.Lock()
 
     def __call__(
         self, text: str, output_standard: str = "iso_code_639_1"
@@ -95,12 +176,160 @@ class LanguageDetector:
             output_standard: The output standard.
 
         Returns:
-            The language code.
-            The full name of the language.
+            The language code, or `None` if the language cannot be detected.
+            The full name of the language, or `None` if the language cannot be detected.
+
+        """
+
+        fingerprint = _get_fingerprint(text)
+        found, language = self._get_cached(fingerprint)
+        if not found:
+            language = self.detector.detect_language_of(text)
+            self._set_cached(fingerprint, language)
+        return self._format_language(language, output_standard)
+
+    def detect_batch(
+        self, texts: List[str], output_standard: str = "iso_code_639_1"
+    ) -> List[Tuple[str, str]]:
+        """Detects the languages of multiple texts in parallel.
+
+        The texts that are not cached are detected with a single call of the
+        lingua parallel detection, and the repeated texts are detected once.
+
+        Examples:
+            >>> from anonipy.utils.language_detector import LanguageDetector
+            >>> detector = LanguageDetector()
+            >>> detector.detect_batch(["Hello, how are you?", "Živijo, kako si?"])
+            [("en", "English"), ("sl", "Slovenian")]
+
+        Args:
+            texts: The texts to detect the languages of.
+            output_standard: The output standard.
+
+        Returns:
+            The list of the tuples (language code, full name of the language), in the order of the texts.
+
+        """
+
+        fingerprints = [_get_fingerprint(text) for text in texts]
+        languages = {}
+        missing = {}
+        for fingerprint, text in zip(fingerprints, texts):
+            if fingerprint in languages or fingerprint in missing:
+                continue
+            found, language = self._get_cached(fingerprint)
+            if found:
+                languages[fingerprint] = language
+            else:
+                missing[fingerprint] = text
+
+        if missing:
+            detected = self.detector.detect_languages_in_parallel_of(
+                list(missing.values())
+            )
+            for fingerprint, language in zip(missing.keys(), detected):
+                languages[fingerprint] = language
+                self._set_cached(fingerprint, language)
+
+        return [
+            self._format_language(languages[fingerprint], output_standard)
+            for fingerprint in fingerprints
+        ]
+
+    def clear_cache(self) -> None:
+        """Remove the cached detections."""
+
+        with self._lock:
+            self._cache.clear()
+
+    def unload_models(self) -> None:
+        """Unload the language models from memory.
+
+        The models are loaded again when they are needed. The cached
+        detections are kept.
+
+        """
+
+        self.detector.unload_language_models()
+
+    # ===========================================
+    # Private methods
+    # ===========================================
+
+    def _get_iso_code(self, lang: Union[str, tuple]) -> IsoCode639_1:
+        """Get the ISO 639-1 code of the language.
+
+        Args:
+            lang: The language tuple or the ISO 639-1 code.
+
+        Returns:
+            The ISO 639-1 code.
+
+        Raises:
+            ValueError: If the language is not supported.
+
+        """
+
+        code = lang[0] if isinstance(lang, (tuple, list)) else lang
+        try:
+            return IsoCode639_1.from_str(code)
+        except ValueError:
+            raise ValueError(f"The language is not supported: {lang}") from None
+
+    def _get_cached(self, fingerprint: bytes) -> Tuple[bool, Optional[Language]]:
+        """Get the cached language of the text.
+
+        Args:
+            fingerprint: The fingerprint of the text.
+
+        Returns:
+            Whether the language is cached.
+            The cached language.
+
+        """
+
+        with self._lock:
+            if fingerprint not in self._cache:
+                self.stats["misses"] += 1
+                return False, None
+            self._cache.move_to_end(fingerprint)
+            self.stats["hits"] += 1
+            return True, self._cache[fingerprint]
+
+    def _set_cached(self, fingerprint: bytes, language: Optional[Language]) -> None:
+        """Store the language of the text in the cache.
+
+        Args:
+            fingerprint: The fingerprint of the text.
+            language: The detected language.
+
+        """
+
+        if self.cache_size == 0:
+            return
+        with self._lock:
+            self._cache[fingerprint] = language
+            self._cache.move_to_end(fingerprint)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _format_language(
+        self, language: Optional[Language], output_standard: str
+    ) -> Tuple[str, str]:
+        """Format the detected language.
+
+        Args:
+            language: The detected language.
+            output_standard: The output standard.
+
+        Returns:
+            The language code, or `None` if the language is not detected.
+            The full name of the language, or `None` if the language is not detected.
 
         """
 
-        language = self.detector.detect_language_of(text)
+        if language is None:
+            return None, None
         iso_code = getattr(language, output_standard).name.lower()
         full_name = language.name.lower().title()
         # use the correct name for Slovenian
@@ -0,0 +1,397 @@
+"""Module containing the `memory` utilities.
+
+The `memory` module provides functions for probing the memory usage of the
+process, and a class for processing items in batches whose size adapts to
+stay under a memory budget.
+
+Classes:
+    AdaptiveBatcher: The class representing the memory-aware batch scheduler.
+
+Methods:
+    get_memory_usage():
+        Get the resident set size of the process.
+    get_peak_memory_usage():
+        Get the peak resident set size of the process.
+    reset_peak_memory_usage():
+        Reset the peak resident set size of the process.
+    parse_memory_size(size):
+        Parse the memory size into the number of bytes.
+    is_out_of_memory_error(error):
+        Check whether the error is caused by running out of memory.
+
+"""
+
+import re
+import gc
+import os
+import sys
+from typing import Callable, Iterator, List, Sequence, Union
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    # the resource module is not available on Windows
+    resource = None
+
+# the multipliers of the memory size units
+MEMORY_UNITS = {
+    "": 1,
+    "b": 1,
+    "kb": 1000,
+    "mb": 1000**2,
+    "gb": 1000**3,
+    "tb": 1000**4,
+    "kib": 1024,
+    "mib": 1024**2,
+    "gib": 1024**3,
+    "tib": 1024**4,
+}
+
+# the messages of the errors raised when the memory allocation fails
+OUT_OF_MEMORY_MESSAGES = [
+    "out of memory",
+    "can't allocate memory",
+    "cannot allocate memory",
+    "not enough memory",
+]
+
+_MEMORY_SIZE_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([a-zA-Z]*)\s*$")
+
+# =====================================
+# Helper functions
+# =====================================
+
+
+def _get_max_rss() -> int:
+    """Get the lifetime peak resident set size reported by the resource module.
+
+    Returns:
+        The peak resident set size in bytes, or `0` if it is not available.
+
+    """
+
+    if resource is None:
+        return 0
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # the value is in bytes on macOS and in kilobytes elsewhere
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def get_memory_usage() -> int:
+    """Get the resident set size of the process.
+
+    Examples:
+        >>> from anonipy.utils.memory import get_memory_usage
+        >>> get_memory_usage()
+        104857600
+
+    Returns:
+        The resident set size in bytes. If it is not available, the peak resident set size is returned.
+
+    """
+
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return _get_max_rss()
+
+
+def get_peak_memory_usage() -> int:
+    """Get the peak resident set size of the process.
+
+    The peak is measured since the last `reset_peak_memory_usage` call, or
+    since the start of the process.
+
+    Examples:
+        >>> from anonipy.utils.memory import get_peak_memory_usage
+        >>> get_peak_memory_usage()
+        157286400
+
+    Returns:
+        The peak resident set size in bytes.
+
+    """
+
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return _get_max_rss()
+
+
+def reset_peak_memory_usage() -> bool:
+    """Reset the peak resident set size of the process.
+
+    The reset is only supported on Linux.
+
+    Examples:
+        >>> from anonipy.utils.memory import reset_peak_memory_usage
+        >>> reset_peak_memory_usage()
+        True
+
+    Returns:
+        `True` if the peak was reset, `False` otherwise.
+
+    """
+
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def parse_memory_size(size: Union[int, float, str]) -> int:
+    """Parse the memory size into the number of bytes.
+
+    Examples:
+        >>> from anonipy.utils.memory import parse_memory_size
+        >>> parse_memory_size("1.5GB")
+        1500000000
+        >>> parse_memory_size("512MiB")
+        536870912
+
+    Args:
+        size: The number of bytes, or the string with the number and the unit (e.g. `512MB` or `2GiB`).
+
+    Returns:
+        The number of bytes.
+
+    Raises:
+        ValueError: If the size is not valid or not positive.
+
+    """
+
+    if isinstance(size, str):
+        match = _MEMORY_SIZE_PATTERN.match(size)
+        if match is None or match.group(2).lower() not in MEMORY_UNITS:
+            raise ValueError(f"The memory size is not valid: {size}")
+        size = float(match.group(1)) * MEMORY_UNITS[match.group(2).lower()]
+    if size <= 0:
+        raise ValueError(f"The memory size must be a positive number: {size}")
+    return int(size)
+
+
+def is_out_of_memory_error(error: BaseException) -> bool:
+    """Check whether the error is caused by running out of memory.
+
+    Besides the `MemoryError`, the errors raised by the PyTorch allocators
+    (e.g. `torch.cuda.OutOfMemoryError`) are recognized by their message.
+
+    Examples:
+        >>> from anonipy.utils.memory import is_out_of_memory_error
+        >>> is_out_of_memory_error(RuntimeError("CUDA out of memory."))
+        True
+
+    Args:
+        error: The raised error.
+
+    Returns:
+        `True` if the error is caused by running out of memory, `False` otherwise.
+
+    """
+
+    if isinstance(error, MemoryError):
+        return True
+    if isinstance(error, RuntimeError):
+        message = str(error).lower()
+        return any(m in message for m in OUT_OF_MEMORY_MESSAGES)
+    return False
+
+
+# =====================================
+# Main class
+# =====================================
+
+
+class AdaptiveBatcher:
+    """The class representing the memory-aware batch scheduler.
+
+    The items are processed in batches. The peak resident set size of the
+    process is probed during each batch and used to estimate the memory
+    needed per item. The size of the next batch is the number of items that
+    fit under the memory budget, but at most double the previous size. If
+    the peak exceeds the budget, or the batch fails with an out-of-memory
+    error, the batch size is reduced by the backoff factor and the failed
+    batch is retried. The batch size does not grow back to the size that
+    exceeded the budget.
+
+    The memory is probed for the whole process, so the batches should not be
+    processed concurrently with other memory-intensive work.
+
+    Examples:
+        >>> from anonipy.utils.memory import AdaptiveBatcher
+        >>> batcher = AdaptiveBatcher("4GB")
+        >>> outputs = list(batcher.map(extractor.batch, texts))
+
+    Attributes:
+        memory_budget (int): The maximum resident set size of the process in bytes.
+        batch_size (int): The size of the next batch.
+        min_batch_size (int): The minimum batch size.
+        max_batch_size (int): The maximum batch size.
+        backoff (float): The factor the batch size is multiplied with when exceeding the budget.
+        stats (dict): The counters of the processed batches and items, the backoffs and the peak memory usage.
+
+    Methods:
+        map(process, items):
+            Process the items in adaptive batches.
+
+    """
+
+    def __init__(
+        self,
+        memory_budget: Union[int, str],
+        batch_size: int = 1,
+        min_batch_size: int = 1,
+        max_batch_size: int = 64,
+        backoff: float = 0.5,
+    ):
+        """Initialize the adaptive batcher.
+
+        Examples:
+            >>> from anonipy.utils.memory import AdaptiveBatcher
+            >>> batcher = AdaptiveBatcher("4GB", batch_size=4, max_batch_size=32)
+
+        Args:
+            memory_budget: The maximum resident set size of the process, as the number of bytes or the string with the unit (e.g. `4GB`).
+            batch_size: The size of the first batch, used to probe the memory usage.
+            min_batch_size: The minimum batch size.
+            max_batch_size: The maximum batch size.
+            backoff: The factor the batch size is multiplied with when exceeding the budget, between `0` and `1`.
+
+        Raises:
+            ValueError: If the memory budget is not valid, the batch sizes are not positive or ordered, or the backoff is not between `0` and `1`.
+
+        """
+
+        if not 1 <= min_batch_size <= batch_size <= max_batch_size:
+            raise ValueError(
+                "The batch sizes must be positive and min_batch_size <= batch_size <= max_batch_size."
+            )
+        if not 0 < backoff < 1:
+            raise ValueError("The backoff must be between 0 and 1.")
+
+        self.memory_budget = parse_memory_size(memory_budget)
+        self.batch_size = batch_size
+        self.min_batch_size = min_batch_size
+        self.max_batch_size = max_batch_size
+        self.backoff = backoff
+        self.stats = {"batches": 0, "items": 0, "backoffs": 0, "peak_memory": 0}
+        # the smallest batch size that exceeded the memory budget
+        self._exceeded_batch_size = None
+
+    def map(self, process: Callable[[List], Sequence], items: Sequence) -> Iterator:
+        """Process the items in adaptive batches.
+
+        The outputs are yielded in the order of the items, once their batch is
+        processed, so the outputs of the previous batches can be released
+        before the next batch is processed.
+
+        Examples:
+            >>> for output in batcher.map(extractor.batch, texts):
+            >>>     print(output)
+
+        Args:
+            process: The function processing the list of items and returning the list of outputs.
+            items: The items to process.
+
+        Returns:
+            The iterator over the outputs, in the order of the items.
+
+        Raises:
+            ValueError: If the process does not return an output for each item.
+            Exception: The errors raised by the process, including the out-of-memory errors of the batches of the minimum size.
+
+        """
+
+        start = 0
+        while start < len(items):
+            batch = list(items[start : start + self.batch_size])
+            try:
+                outputs = self._process_batch(process, batch)
+            except Exception as e:
+                if not is_out_of_memory_error(e) or len(batch) <= self.min_batch_size:
+                    raise
+                # release the memory of the failed batch before retrying
+                gc.collect()
+                self._back_off(len(batch))
+                continue
+            start += len(batch)
+            yield from outputs
+
+    # ===========================================
+    # Private methods
+    # ===========================================
+
+    def _process_batch(self, process: Callable[[List], Sequence], batch: List) -> list:
+        """Process the batch and adapt the size of the next batch.
+
+        Args:
+            process: The function processing the list of items.
+            batch: The items of the batch.
+
+        Returns:
+            The list of the outputs.
+
+        Raises:
+            ValueError: If the process does not return an output for each item.
+
+        """
+
+        is_reset = reset_peak_memory_usage()
+        baseline = get_memory_usage()
+        outputs = list(process(batch))
+        if len(outputs) != len(batch):
+            raise ValueError("The process must return an output for each item.")
+        # without the reset, the peak is the lifetime peak of the process
+        peak = get_peak_memory_usage() if is_reset else get_memory_usage()
+        peak = max(peak, get_memory_usage())
+
+        self.stats["batches"] += 1
+        self.stats["items"] += len(batch)
+        self.stats["peak_memory"] = max(self.stats["peak_memory"], peak)
+        self._adapt(len(batch), baseline, peak)
+        return outputs
+
+    def _adapt(self, size: int, baseline: int, peak: int) -> None:
+        """Adapt the batch size to the memory usage of the processed batch.
+
+        Args:
+            size: The size of the processed batch.
+            baseline: The resident set size before the batch.
+            peak: The peak resident set size during the batch.
+
+        """
+
+        if peak > self.memory_budget:
+            self._back_off(size)
+            return
+
+        item_memory = (peak - baseline) / size
+        if item_memory <= 0:
+            target = 2 * size
+        else:
+            # fill the remaining memory with the items of the same size
+            target = size + int((self.memory_budget - peak) / item_memory)
+        limit = self.max_batch_size
+        if self._exceeded_batch_size is not None:
+            limit = min(limit, self._exceeded_batch_size - 1)
+        self.batch_size = max(self.min_batch_size, min(target, 2 * size, limit))
+
+    def _back_off(self, size: int) -> None:
+        """Reduce the batch size by the backoff factor.
+
+        Args:
+            size: The size of the batch that exceeded the memory budget.
+
+        """
+
+        self.stats["backoffs"] += 1
+        if self._exceeded_batch_size is None or size < self._exceeded_batch_size:
+            self._exceeded_batch_size = size
+        self.batch_size = max(self.min_batch_size, int(size * self.backoff))
@@ -0,0 +1,293 @@
+"""The module containing the `prescreen` utilities.
+
+The `prescreen` module contains the `PreScreener` class, which is used to
+quickly decide whether a text can contain entities before running the
+(expensive) named entity recognition model on it.
+
+Classes:
+    PreScreener: The class representing the text pre-screener.
+
+"""
+
+import re
+import warnings
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    # imported only for annotations, as definitions imports the utils
+    from ..definitions import Entity
+
+# =====================================
+# Heuristic patterns
+# =====================================
+
+_DIGIT = re.compile(r"\d")
+_WORD = re.compile(r"[^\W\d_]+")
+_SENTENCE_BOUNDARY = re.compile(r"[.!?\n]")
+_SYMBOLS = ("@",)
+
+# =====================================
+# Main class
+# =====================================
+
+
+class PreScreener:
+    """The class representing the text pre-screener.
+
+    The pre-screener uses cheap heuristics to decide whether a text may contain
+    entities. A text passes the pre-screen if it contains digits, an `@`
+    symbol, a lexicon term, or capitalized words that do not start a sentence.
+
+    Examples:
+        >>> from anonipy.utils.prescreen import PreScreener
+        >>> prescreen = PreScreener(lexicon=["patient", "address"])
+        >>> prescreen("The order has been shipped.")
+        False
+
+    Attributes:
+        lexicon (List[str]): The lexicon terms indicating the text may contain entities.
+        min_digits (int): The minimum number of digits indicating the text may contain entities.
+        min_capitalized (int): The minimum number of capitalized non-sentence-initial words indicating the text may contain entities.
+        min_recall (float): The minimum recall on the labeled sample required to keep the pre-screener enabled.
+        enabled (bool): Whether the pre-screener skips texts. Disabled when the recall guard fails.
+        stats (dict): The counters of the screened and skipped texts.
+
+    Methods:
+        __call__(text):
+            Screen the text. Calls the `screen` method.
+        screen(text):
+            Screen the text and update the counters.
+        may_contain_entities(text):
+            Check whether the text may contain entities.
+        evaluate(samples):
+            Evaluate the pre-screener on a labeled sample and apply the recall guard.
+        reset_stats():
+            Reset the counters.
+
+    """
+
+    def __init__(
+        self,
+        lexicon: Optional[List[str]] = None,
+        min_digits: int = 1,
+        min_capitalized: int = 1,
+        min_recall: float = 1.0,
+    ):
+        """Initializes the pre-screener.
+
+        Examples:
+            >>> from anonipy.utils.prescreen import PreScreener
+            >>> prescreen = PreScreener(lexicon=["patient", "address"], min_recall=0.99)
+
+        Args:
+            lexicon: The lexicon terms indicating the text may contain entities. Matched case-insensitively as whole words.
+            min_digits: The minimum number of digits indicating the text may contain entities. If `0`, digits are ignored.
+            min_capitalized: The minimum number of capitalized non-sentence-initial words indicating the text may contain entities. If `0`, capitalization is ignored.
+            min_recall: The minimum recall on the labeled sample required to keep the pre-screener enabled.
+
+        Raises:
+            ValueError: If `min_recall` is not between 0 and 1.
+
+        """
+
+        if not 0 <= min_recall <= 1:
+            raise ValueError("The min_recall must be between 0 and 1.")
+
+        self.lexicon = lexicon or []
+        self.min_digits = min_digits
+        self.min_capitalized = min_capitalized
+        self.min_recall = min_recall
+        self.enabled = True
+        self.stats = {"screened": 0, "skipped": 0}
+        self._lexicon_regex = self._prepare_lexicon_regex(self.lexicon)
+
+    def __call__(self, text: str) -> bool:
+        """Screen the text.
+
+        Examples:
+            >>> prescreen("John Doe is a 19 year old software engineer.")
+            True
+
+        Args:
+            text: The text to screen.
+
+        Returns:
+            `True` if the text should be processed, `False` if it can be skipped.
+
+        """
+
+        return self.screen(text)
+
+    @property
+    def skip_rate(self) -> float:
+        """The share of the screened texts that were skipped."""
+
+        if self.stats["screened"] == 0:
+            return 0.0
+        return self.stats["skipped"] / self.stats["screened"]
+
+    def screen(self, text: str) -> bool:
+        """Screen the text and update the counters.
+
+        Examples:
+            >>> prescreen.screen("The order has been shipped.")
+            False
+
+        Args:
+            text: The text to screen.
+
+        Returns:
+            `True` if the text should be processed, `False` if it can be skipped.
+
+        """
+
+        self.stats["screened"] += 1
+        if not self.enabled or self.may_contain_entities(text):
+            return True
+        self.stats["skipped"] += 1
+        return False
+
+    def may_contain_entities(self, text: str) -> bool:
+        """Check whether the text may contain entities.
+
+        Examples:
+            >>> prescreen.may_contain_entities("Call me at 555-0100.")
+            True
+
+        Args:
+            text: The text to check.
+
+        Returns:
+            `True` if the text may contain entities, `False` otherwise.
+
+        """
+
+        if self.min_digits > 0 and self._count_digits(text) >= self.min_digits:
+            return True
+        if any(symbol in text for symbol in _SYMBOLS):
+            return True
+        if self._lexicon_regex is not None and self._lexicon_regex.search(text):
+            return True
+        if (
+            self.min_capitalized > 0
+            and self._count_capitalized(text) >= self.min_capitalized
+        ):
+            return True
+        return False
+
+    def evaluate(self, samples: Iterable[Tuple[str, List["Entity"]]]) -> dict:
+        """Evaluate the pre-screener on a labeled sample and apply the recall guard.
+
+        If the recall is below `min_recall`, the pre-screener is disabled and
+        all texts are processed.
+
+        Examples:
+            >>> prescreen.evaluate([("John Doe is a patient.", entities)])
+            {"samples": 1, "skipped": 0, "skip_rate": 0.0, "entities": 1, "missed_entities": 0, "recall": 1.0, "enabled": True}
+
+        Args:
+            samples: The list of (text, entities) pairs.
+
+        Returns:
+            The evaluation counters.
+
+        """
+
+        n_samples, n_skipped, n_entities, n_missed = 0, 0, 0, 0
+        for text, entities in samples:
+            n_samples += 1
+            n_entities += len(entities)
+            if not self.may_contain_entities(text):
+                n_skipped += 1
+                n_missed += len(entities)
+
+        recall = 1.0 if n_entities == 0 else 1 - n_missed / n_entities
+        self.enabled = recall >= self.min_recall
+        if not self.enabled:
+            warnings.warn(
+                f"The pre-screen recall {recall:.4f} is below {self.min_recall}. Disabling the pre-screen."
+            )
+
+        return {
+            "samples": n_samples,
+            "skipped": n_skipped,
+            "skip_rate": n_skipped / n_samples if n_samples > 0 else 0.0,
+            "entities": n_entities,
+            "missed_entities": n_missed,
+            "recall": recall,
+            "enabled": self.enabled,
+        }
+
+    def reset_stats(self) -> None:
+        """Reset the counters.
+
+        Examples:
+            >>> prescreen.reset_stats()
+
+        """
+
+        self.stats = {"screened": 0, "skipped": 0}
+
+    # =================================
+    # Private methods
+    # =================================
+
+    def _prepare_lexicon_regex(self, lexicon: List[str]) -> Optional[re.Pattern]:
+        """Prepare the regex matching the lexicon terms.
+
+        Args:
+            lexicon: The lexicon terms.
+
+        Returns:
+            The compiled regex or `None` if the lexicon is empty.
+
+        """
+
+        if len(lexicon) == 0:
+            return None
+        terms = sorted({re.escape(term) for term in lexicon}, key=len, reverse=True)
+        return re.compile(r"\b(?:" + "|".join(terms) + r")\b", re.IGNORECASE)
+
+    def _count_digits(self, text: str) -> int:
+        """Count the digits in the text, stopping at `min_digits`.
+
+        Args:
+            text: The text to count the digits in.
+
+        Returns:
+            The number of digits, at most `min_digits`.
+
+        """
+
+        count = 0
+        for _ in _DIGIT.finditer(text):
+            count += 1
+            if count >= self.min_digits:
+                break
+        return count
+
+    def _count_capitalized(self, text: str) -> int:
+        """Count the capitalized words that do not start a sentence, stopping at `min_capitalized`.
+
+        Args:
+            text: The text to count the capitalized words in.
+
+        Returns:
+            The number of capitalized words, at most `min_capitalized`.
+
+        """
+
+        count = 0
+        previous_end = None
+        for match in _WORD.finditer(text):
+            word = match.group()
+            is_initial = previous_end is None or _SENTENCE_BOUNDARY.search(
+                text, previous_end, match.start()
+            )
+            previous_end = match.end()
+            if is_initial or len(word) < 2 or not word[0].isupper():
+                continue
+            count += 1
+            if count >= self.min_capitalized:
+                break
+        return count
@@ -4,19 +4,30 @@ The `regex` module provides the regex definitions and functions used within the
 
 Classes:
     RegexMapping: The class representing the mapping for data type to the corresponding regex.
+    DateMatcher: The class representing the prefiltered date regex matcher.
+
+Methods:
+    compile_regex(regex):
+        Compiles the regex, using the cache of compiled regexes.
+    get_regex_group(regex):
+        Gets the content of the first regex group.
 
 Attributes:
     REGEX_STRING (str): The regex definition for string.
     REGEX_INTEGER (str): The regex definition for integer.
     REGEX_FLOAT (str): The regex definition for float.
     REGEX_DATE (str): The regex definition for date.
+    REGEX_DATE_BRANCHES (dict): The regex branches for date, grouped by language.
     REGEX_EMAIL_ADDRESS (str): The regex definition for email address.
     REGEX_PHONE_NUMBER (str): The regex definition for phone number.
     REGEX_WEBSITE_URL (str): The regex definition for website URL.
 
 """
 
+import re
+from functools import lru_cache
 from collections import defaultdict
+from typing import Iterator, Optional, Tuple, Union
 
 from ..constants import ENTITY_TYPES
 
@@ -33,81 +44,97 @@ REGEX_INTEGER = r"\d+"
 REGEX_FLOAT = r"[\d\.,]+"
 """The regex definition for float."""
 
+REGEX_DATE_BRANCHES = {
+    "numeric": [
+        r"(\d{4}[-/.\s]\d{1,2}[-/.\s]\d{1,2}(?:[ T]\d{2}:\d{2}:\d{2})?)",
+        r"(\d{1,2}[-/.\s]\d{1,2}[-/.\s]\d{4}(?:[ T]\d{2}:\d{2}:\d{2})?)",
+        r"(\d{1,2}[-/.\s]\d{1,2}[-/.\s]\d{4}(?:[ T]\d{2}:\d{2})?)",
+        r"(\d{4}[-/.\s]\d{1,2}[-/.\s]\d{1,2}(?:[ T]\d{2}:\d{2})?)",
+        r"(\d{4}[-/.\s]\d{1,2}[-/.\s]\d{1,2}(?:[ T]\d{2}:\d{2} [APap][mM])?)",
+        r"(\d{1,2}[-/.\s]\d{1,2}[-/.\s]\d{4}(?:[ T]\d{2}:\d{2} [APap][mM])?)",
+        r"(\d{1,2}[-/.\s]\d{1,2}[-/.\s]\d{4}(?:[ ]?\d{2}:\d{2}:\d{2})?)",
+        r"(\d{4}[-/.\s]\d{1,2}[-/.\s]\d{1,2}(?:[ ]?\d{2}:\d{2}:\d{2})?)",
+    ],
+    "en": [
+        r"(\d{1,2}[ ](January|February|March|April|May|June|July|August|September|October|November|December)[ ]\d{4}(?:[ ]?\d{2}:\d{2}:\d{2})?)",
+        r"(\d{1,2}[ ](Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[ ]\d{4}(?:[ ]?\d{2}:\d{2}:\d{2})?)",
+        r"(\d{1,2}[ ](January|February|March|April|May|June|July|August|September|October|November|December)[ ]\d{4}(?:[ ]?\d{2}:\d{2}[ ]?[APap][mM])?)",
+        r"(\d{1,2}[ ](Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[ ]\d{4}(?:[ ]?\d{2}:\d{2}[ ]?[APap][mM])?)",
+        r"([A-Za-z]+,[ ]\d{1,2}[ ](January|February|March|April|May|June|July|August|September|October|November|December),?[ ]\d{4}(?:[ ]?\d{2}:\d{2}:\d{2})?)",
+        r"([A-Za-z]+,[ ](January|February|March|April|May|June|July|August|September|October|November|December)[ ]\d{1,2},?[ ]\d{4}(?:[ ]?\d{2}:\d{2}:\d{2})?)",
+        r"([A-Za-z]+,[ ]\d{1,2}[ ](January|February|March|April|May|June|July|August|September|October|November|December),?[ ]\d{4}(?:[ ]?\d{2}:\d{2}[ ]?[APap][mM])?)",
+        r"([A-Za-z]+,[ ](January|February|March|April|May|June|July|August|September|October|November|December)[ ]\d{1,2},?[ ]\d{4}(?:[ ]?\d{2}:\d{2}[ ]?[APap][mM])?)",
+    ],
+    "nl": [
+        r"(\d{1,2}[\.]?[ ](januari|februari|maart|april|mei|juni|juli|augustus|september|oktober|november|december)[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"(\d{1,2}[\.]?[ ](jan|feb|mrt|apr|mei|jun|jul|aug|sep|okt|nov|dec)[\.]?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"([A-Za-z]+,?[ ]\d{1,2}[\.]?[ ](januari|februari|maart|april|mei|juni|juli|augustus|september|oktober|november|december),?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"([A-Za-z]+,?[ ](januari|februari|maart|april|mei|juni|juli|augustus|september|oktober|november|december)[ ]\d{1,2},?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+    ],
+    "fr": [
+        r"(\d{1,2}(er)?[ ](janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"(\d{1,2}(er)?[ ](jan|févr|mars|avr|mai|juin|juil|août|sept|oct|nov|déc)[\.]?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"([A-Za-zÀ-ÿ]+,?[ ]\d{1,2}(er)?[ ](janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre),?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"([A-Za-zÀ-ÿ]+,?[ ](janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)[ ]\d{1,2}(er)?,?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+    ],
+    "de": [
+        r"(\d{1,2}[\.]?[ ](Januar|Februar|März|April|Mai|Juni|Juli|August|September|Oktober|November|Dezember)[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"(\d{1,2}[\.]?[ ](Jan|Feb|Mär|Apr|Mai|Jun|Jul|Aug|Sep|Okt|Nov|Dez)[\.]?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"([A-Za-zäöüßÄÖÜ]+,?[ ]\d{1,2}[\.]?[ ](Januar|Februar|März|April|Mai|Juni|Juli|August|September|Oktober|November|Dezember)[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"([A-Za-zäöüßÄÖÜ]+,?[ ](Januar|Februar|März|April|Mai|Juni|Juli|August|September|Oktober|November|Dezember)[ ]\d{1,2}[\.]?,?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+    ],
+    "el": [
+        r"(\d{1,2}η?[ ](Ιανουαρίου|Φεβρουαρίου|Μαρτίου|Απριλίου|Μαΐου|Ιουνίου|Ιουλίου|Αυγούστου|Σεπτεμβρίου|Οκτωβρίου|Νοεμβρίου|Δεκεμβρίου)( του)?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"(\d{1,2}i?[ ](Ianouariou|Fevrouariou|Martiou|Apriliou|Maiou|Iouniou|Iouliou|Avgoustou|Septemvriou|Oktovriou|Noemvriou|Dekemvriou)( tou)?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"(\d{1,2}η?[ ](Ιαν|Φεβ|Μάρ|Απρ|Μάι|Ιούν|Ιούλ|Aυγ|Σεπ|Οκτ|Νοε|Δεκ)[\.]?( του)?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"(\d{1,2}i?[ ](Ian|Feb|Mar|Apr|Mai|Iou|Ioul|Avg|Sep|Okt|Noe|Dek)[\.]?( tou)?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"([\u0370-\u03FF]+,?[ ]\d{1,2}η?[ ](Ιανουαρίου|Φεβρουαρίου|Μαρτίου|Απριλίου|Μαΐου|Ιουνίου|Ιουλίου|Αυγούστου|Σεπτεμβρίου|Οκτωβρίου|Νοεμβρίου|Δεκεμβρίου),?( του)?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"([A-Za-z]+,?[ ]\d{1,2}i?[ ](Ianouariou|Fevrouariou|Martiou|Apriliou|Maiou|Iouniou|Iouliou|Avgoustou|Septemvriou|Oktovriou|Noemvriou|Dekemvriou),?( tou)?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"([\u0370-\u03FF]+,?[ ](Ιανουαρίου|Φεβρουαρίου|Μαρτίου|Απριλίου|Μαΐου|Ιουνίου|Ιουλίου|Αυγούστου|Σεπτεμβρίου|Οκτωβρίου|Νοεμβρίου|Δεκεμβρίου)[ ]\d{1,2}η?,?( του)?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"([A-Za-z]+,?[ ](Ianouariou|Fevrouariou|Martiou|Apriliou|Maiou|Iouniou|Iouliou|Avgoustou|Septemvriou|Oktovriou|Noemvriou|Dekemvriou)[ ]\d{1,2}i?,?( tou)?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+    ],
+    "it": [
+        r"(\d{1,2}°?[ ](gennaio|febbraio|marzo|aprile|maggio|giugno|luglio|agosto|settembre|ottobre|novembre|dicembre)[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"(\d{1,2}°?[ ](gen|feb|mar|apr|mag|giu|lug|ago|set|ott|nov|dic)[\.]?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"([A-Za-zÀ-ÿ]+,?[ ]\d{1,2}°?[ ](gennaio|febbraio|marzo|aprile|maggio|giugno|luglio|agosto|settembre|ottobre|novembre|dicembre),?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"([A-Za-zÀ-ÿ]+,?[ ](gennaio|febbraio|marzo|aprile|maggio|giugno|luglio|agosto|settembre|ottobre|novembre|dicembre)[ ]\d{1,2}°?,?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+    ],
+    "sl": [
+        r"(\d{1,2}[\.]?[ ](januar|februar|marec|april|maj|junij|julij|avgust|september|oktober|november|december)[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"(\d{1,2}[\.]?[ ](januarja|februarja|marca|aprila|maja|junija|julija|avgusta|septembra|oktobra|novembra|decembra)[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"(\d{1,2}[\.]?[ ](jan|feb|mar|apr|maj|jun|jul|avg|sep|okt|nov|dec)[\.]?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"([A-Za-zčšžČŠŽ]+,?[ ]\d{1,2}[\.]?[ ](januar|februar|marec|april|maj|junij|julij|avgust|september|oktober|november|december)[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"([A-Za-zčšžČŠŽ]+,?[ ]\d{1,2}[\.]?[ ](januarja|februarja|marca|aprila|maja|junija|julija|avgusta|septembra|oktobra|novembra|decembra)[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+    ],
+    "es": [
+        r"(\d{1,2}°?( de)?[ ](enero|febrero|marzo|abril|mayo|junio|julio|agosto|septiembre|octubre|noviembre|diciembre)( de)?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"(\d{1,2}°?( de)?[ ](ene|feb|mar|abr|may|jun|jul|ago|sept|oct|nov|dic)[\.]?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"([A-Za-zÀ-ÿ]+,?[ ]\d{1,2}°?( de)?[ ](enero|febrero|marzo|abril|mayo|junio|julio|augusto|septiembre|octubre|noviembre|diciembre),?( de)?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"([A-Za-zÀ-ÿ]+,?[ ](enero|febrero|marzo|abril|mayo|junio|julio|augusto|septiembre|octubre|noviembre|diciembre)[ ]\d{1,2}°?,?( de)?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+    ],
+    "uk": [
+        r"(\d{1,2}[\.]?[ ](січень|лютий|березень|квітень|травень|червень|липень|серпень|вересень|жовтень|листопад|грудень)[ ]\d{4}( року| рік)?(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"(\d{1,2}[\.]?[ ](sichen|lyutyi|berezen|kviten|traven|cherven|lypen|serpen|veresen|zhovten|lystopad|gruden)[ ]\d{4}( roku)?(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"(\d{1,2}[\.]?[ ](січ|лют|бер|кві|тра|чер|лип|сер|вер|жов|лис|гру)[\.]?[ ]\d{4}( року| рік)?(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"(\d{1,2}[\.]?[ ](sich|lyut|ber|kvi|tra|cher|lyp|ser|ver|zhov|lys|gru)[\.]?[ ]\d{4}( roku)?(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"([А-ЩЬЮЯҐЄІЇа-щьюяґєії]+,?[ ]\d{1,2}[\.]?[ ](січень|лютий|березень|квітень|травень|червень|липень|серпень|вересень|жовтень|листопад|грудень)[ ]\d{4}( року)?(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"([A-Za-z]+,?[ ]\d{1,2}[\.]?[ ](sichen|lyutyi|berezen|kviten|traven|cherven|lypen|serpen|veresen|zhovten|lystopad|gruden)[ ]\d{4}( roku)?(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"([А-ЩЬЮЯҐЄІЇа-щьюяґєії]+,?[ ](січень|лютий|березень|квітень|травень|червень|липень|серпень|вересень|жовтень|листопад|грудень)[ ]\d{1,2}[\.]?,?[ ]\d{4}( року)?(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"([A-Za-z]+,?[ ](sichen|lyutyi|berezen|kviten|traven|cherven|lypen|serpen|veresen|zhovten|lystopad|gruden)[ ]\d{1,2}[\.]?,?[ ]\d{4}( roku)?(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"(\d{1,2}[\.]?[ ](січня|лютого|березня|квітня|травня|червня|липня|серпня|вересня|жовтня|листопада|грудня)[ ]\d{4}( року| рік)?(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"(\d{1,2}[\.]?[ ](sichnia|liutoho|bereznia|kvitnia|travniia|chervnia|lypnia|serpnia|veresnia|zhovtnia|lystopada|hrudnia)[ ]\d{4}( roku)?(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"([А-ЩЬЮЯҐЄІЇа-щьюяґєії]+,?[ ]\d{1,2}[\.]?[ ](січня|лютого|березня|квітня|травня|червня|липня|серпня|вересня|жовтня|листопада|грудня)[ ]\d{4}( року| рік)?(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"([A-Za-z]+,?[ ]\d{1,2}[\.]?[ ](sichnia|liutoho|bereznia|kvitnia|travniia|chervnia|lypnia|serpnia|veresnia|zhovtnia|lystopada|hrudnia)[ ]\d{4}( roku)?(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"([А-ЩЬЮЯҐЄІЇа-щьюяґєії]+,?[ ](січня|лютого|березня|квітня|травня|червня|липня|серпня|вересня|жовтня|листопада|грудня)[ ]\d{1,2}[\.]?,?[ ]\d{4}( року| рік)?(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+        r"([A-Za-z]+,?[ ](sichnia|liutoho|bereznia|kvitnia|travniia|chervnia|lypnia|serpnia|veresnia|zhovtnia|lystopada|hrudnia)[ ]\d{1,2}[\.]?,?[ ]\d{4}( roku)?(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)",
+    ],
+}
+"""The regex branches for dates, grouped by the language of the month names."""
+
 REGEX_DATE = (
     r"("
-    r"(\d{4}[-/.\s]\d{1,2}[-/.\s]\d{1,2}(?:[ T]\d{2}:\d{2}:\d{2})?)|"
-    r"(\d{1,2}[-/.\s]\d{1,2}[-/.\s]\d{4}(?:[ T]\d{2}:\d{2}:\d{2})?)|"
-    r"(\d{1,2}[-/.\s]\d{1,2}[-/.\s]\d{4}(?:[ T]\d{2}:\d{2})?)|"
-    r"(\d{4}[-/.\s]\d{1,2}[-/.\s]\d{1,2}(?:[ T]\d{2}:\d{2})?)|"
-    r"(\d{4}[-/.\s]\d{1,2}[-/.\s]\d{1,2}(?:[ T]\d{2}:\d{2} [APap][mM])?)|"
-    r"(\d{1,2}[-/.\s]\d{1,2}[-/.\s]\d{4}(?:[ T]\d{2}:\d{2} [APap][mM])?)|"
-    r"(\d{1,2}[-/.\s]\d{1,2}[-/.\s]\d{4}(?:[ ]?\d{2}:\d{2}:\d{2})?)|"
-    r"(\d{4}[-/.\s]\d{1,2}[-/.\s]\d{1,2}(?:[ ]?\d{2}:\d{2}:\d{2})?)|"
-    # English dates
-    r"(\d{1,2}[ ](January|February|March|April|May|June|July|August|September|October|November|December)[ ]\d{4}(?:[ ]?\d{2}:\d{2}:\d{2})?)|"
-    r"(\d{1,2}[ ](Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[ ]\d{4}(?:[ ]?\d{2}:\d{2}:\d{2})?)|"
-    r"(\d{1,2}[ ](January|February|March|April|May|June|July|August|September|October|November|December)[ ]\d{4}(?:[ ]?\d{2}:\d{2}[ ]?[APap][mM])?)|"
-    r"(\d{1,2}[ ](Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[ ]\d{4}(?:[ ]?\d{2}:\d{2}[ ]?[APap][mM])?)|"
-    r"([A-Za-z]+,[ ]\d{1,2}[ ](January|February|March|April|May|June|July|August|September|October|November|December),?[ ]\d{4}(?:[ ]?\d{2}:\d{2}:\d{2})?)|"
-    r"([A-Za-z]+,[ ](January|February|March|April|May|June|July|August|September|October|November|December)[ ]\d{1,2},?[ ]\d{4}(?:[ ]?\d{2}:\d{2}:\d{2})?)|"
-    r"([A-Za-z]+,[ ]\d{1,2}[ ](January|February|March|April|May|June|July|August|September|October|November|December),?[ ]\d{4}(?:[ ]?\d{2}:\d{2}[ ]?[APap][mM])?)|"
-    r"([A-Za-z]+,[ ](January|February|March|April|May|June|July|August|September|October|November|December)[ ]\d{1,2},?[ ]\d{4}(?:[ ]?\d{2}:\d{2}[ ]?[APap][mM])?)|"
-    # Dutch dates
-    r"(\d{1,2}[\.]?[ ](januari|februari|maart|april|mei|juni|juli|augustus|september|oktober|november|december)[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"(\d{1,2}[\.]?[ ](jan|feb|mrt|apr|mei|jun|jul|aug|sep|okt|nov|dec)[\.]?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"([A-Za-z]+,?[ ]\d{1,2}[\.]?[ ](januari|februari|maart|april|mei|juni|juli|augustus|september|oktober|november|december),?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"([A-Za-z]+,?[ ](januari|februari|maart|april|mei|juni|juli|augustus|september|oktober|november|december)[ ]\d{1,2},?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    # French dates
-    r"(\d{1,2}(er)?[ ](janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"(\d{1,2}(er)?[ ](jan|févr|mars|avr|mai|juin|juil|août|sept|oct|nov|déc)[\.]?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"([A-Za-zÀ-ÿ]+,?[ ]\d{1,2}(er)?[ ](janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre),?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"([A-Za-zÀ-ÿ]+,?[ ](janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)[ ]\d{1,2}(er)?,?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    # German dates
-    r"(\d{1,2}[\.]?[ ](Januar|Februar|März|April|Mai|Juni|Juli|August|September|Oktober|November|Dezember)[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"(\d{1,2}[\.]?[ ](Jan|Feb|Mär|Apr|Mai|Jun|Jul|Aug|Sep|Okt|Nov|Dez)[\.]?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"([A-Za-zäöüßÄÖÜ]+,?[ ]\d{1,2}[\.]?[ ](Januar|Februar|März|April|Mai|Juni|Juli|August|September|Oktober|November|Dezember)[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"([A-Za-zäöüßÄÖÜ]+,?[ ](Januar|Februar|März|April|Mai|Juni|Juli|August|September|Oktober|November|Dezember)[ ]\d{1,2}[\.]?,?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    # Greek dates
-    r"(\d{1,2}η?[ ](Ιανουαρίου|Φεβρουαρίου|Μαρτίου|Απριλίου|Μαΐου|Ιουνίου|Ιουλίου|Αυγούστου|Σεπτεμβρίου|Οκτωβρίου|Νοεμβρίου|Δεκεμβρίου)( του)?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"(\d{1,2}i?[ ](Ianouariou|Fevrouariou|Martiou|Apriliou|Maiou|Iouniou|Iouliou|Avgoustou|Septemvriou|Oktovriou|Noemvriou|Dekemvriou)( tou)?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"(\d{1,2}η?[ ](Ιαν|Φεβ|Μάρ|Απρ|Μάι|Ιούν|Ιούλ|Aυγ|Σεπ|Οκτ|Νοε|Δεκ)[\.]?( του)?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"(\d{1,2}i?[ ](Ian|Feb|Mar|Apr|Mai|Iou|Ioul|Avg|Sep|Okt|Noe|Dek)[\.]?( tou)?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"([\u0370-\u03FF]+,?[ ]\d{1,2}η?[ ](Ιανουαρίου|Φεβρουαρίου|Μαρτίου|Απριλίου|Μαΐου|Ιουνίου|Ιουλίου|Αυγούστου|Σεπτεμβρίου|Οκτωβρίου|Νοεμβρίου|Δεκεμβρίου),?( του)?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"([A-Za-z]+,?[ ]\d{1,2}i?[ ](Ianouariou|Fevrouariou|Martiou|Apriliou|Maiou|Iouniou|Iouliou|Avgoustou|Septemvriou|Oktovriou|Noemvriou|Dekemvriou),?( tou)?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"([\u0370-\u03FF]+,?[ ](Ιανουαρίου|Φεβρουαρίου|Μαρτίου|Απριλίου|Μαΐου|Ιουνίου|Ιουλίου|Αυγούστου|Σεπτεμβρίου|Οκτωβρίου|Νοεμβρίου|Δεκεμβρίου)[ ]\d{1,2}η?,?( του)?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"([A-Za-z]+,?[ ](Ianouariou|Fevrouariou|Martiou|Apriliou|Maiou|Iouniou|Iouliou|Avgoustou|Septemvriou|Oktovriou|Noemvriou|Dekemvriou)[ ]\d{1,2}i?,?( tou)?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    # Italian dates
-    r"(\d{1,2}°?[ ](gennaio|febbraio|marzo|aprile|maggio|giugno|luglio|agosto|settembre|ottobre|novembre|dicembre)[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"(\d{1,2}°?[ ](gen|feb|mar|apr|mag|giu|lug|ago|set|ott|nov|dic)[\.]?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"([A-Za-zÀ-ÿ]+,?[ ]\d{1,2}°?[ ](gennaio|febbraio|marzo|aprile|maggio|giugno|luglio|agosto|settembre|ottobre|novembre|dicembre),?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"([A-Za-zÀ-ÿ]+,?[ ](gennaio|febbraio|marzo|aprile|maggio|giugno|luglio|agosto|settembre|ottobre|novembre|dicembre)[ ]\d{1,2}°?,?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    # Slovenian dates
-    r"(\d{1,2}[\.]?[ ](januar|februar|marec|april|maj|junij|julij|avgust|september|oktober|november|december)[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"(\d{1,2}[\.]?[ ](januarja|februarja|marca|aprila|maja|junija|julija|avgusta|septembra|oktobra|novembra|decembra)[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"(\d{1,2}[\.]?[ ](jan|feb|mar|apr|maj|jun|jul|avg|sep|okt|nov|dec)[\.]?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"([A-Za-zčšžČŠŽ]+,?[ ]\d{1,2}[\.]?[ ](januar|februar|marec|april|maj|junij|julij|avgust|september|oktober|november|december)[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"([A-Za-zčšžČŠŽ]+,?[ ]\d{1,2}[\.]?[ ](januarja|februarja|marca|aprila|maja|junija|julija|avgusta|septembra|oktobra|novembra|decembra)[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    # Spanish dates
-    r"(\d{1,2}°?( de)?[ ](enero|febrero|marzo|abril|mayo|junio|julio|agosto|septiembre|octubre|noviembre|diciembre)( de)?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"(\d{1,2}°?( de)?[ ](ene|feb|mar|abr|may|jun|jul|ago|sept|oct|nov|dic)[\.]?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"([A-Za-zÀ-ÿ]+,?[ ]\d{1,2}°?( de)?[ ](enero|febrero|marzo|abril|mayo|junio|julio|augusto|septiembre|octubre|noviembre|diciembre),?( de)?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"([A-Za-zÀ-ÿ]+,?[ ](enero|febrero|marzo|abril|mayo|junio|julio|augusto|septiembre|octubre|noviembre|diciembre)[ ]\d{1,2}°?,?( de)?[ ]\d{4}(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    # Ukrainian dates
-    r"(\d{1,2}[\.]?[ ](січень|лютий|березень|квітень|травень|червень|липень|серпень|вересень|жовтень|листопад|грудень)[ ]\d{4}( року| рік)?(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"(\d{1,2}[\.]?[ ](sichen|lyutyi|berezen|kviten|traven|cherven|lypen|serpen|veresen|zhovten|lystopad|gruden)[ ]\d{4}( roku)?(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"(\d{1,2}[\.]?[ ](січ|лют|бер|кві|тра|чер|лип|сер|вер|жов|лис|гру)[\.]?[ ]\d{4}( року| рік)?(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"(\d{1,2}[\.]?[ ](sich|lyut|ber|kvi|tra|cher|lyp|ser|ver|zhov|lys|gru)[\.]?[ ]\d{4}( roku)?(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"([А-ЩЬЮЯҐЄІЇа-щьюяґєії]+,?[ ]\d{1,2}[\.]?[ ](січень|лютий|березень|квітень|травень|червень|липень|серпень|вересень|жовтень|листопад|грудень)[ ]\d{4}( року)?(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"([A-Za-z]+,?[ ]\d{1,2}[\.]?[ ](sichen|lyutyi|berezen|kviten|traven|cherven|lypen|serpen|veresen|zhovten|lystopad|gruden)[ ]\d{4}( roku)?(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"([А-ЩЬЮЯҐЄІЇа-щьюяґєії]+,?[ ](січень|лютий|березень|квітень|травень|червень|липень|серпень|вересень|жовтень|листопад|грудень)[ ]\d{1,2}[\.]?,?[ ]\d{4}( року)?(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"([A-Za-z]+,?[ ](sichen|lyutyi|berezen|kviten|traven|cherven|lypen|serpen|veresen|zhovten|lystopad|gruden)[ ]\d{1,2}[\.]?,?[ ]\d{4}( roku)?(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"(\d{1,2}[\.]?[ ](січня|лютого|березня|квітня|травня|червня|липня|серпня|вересня|жовтня|листопада|грудня)[ ]\d{4}( року| рік)?(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"(\d{1,2}[\.]?[ ](sichnia|liutoho|bereznia|kvitnia|travniia|chervnia|lypnia|serpnia|veresnia|zhovtnia|lystopada|hrudnia)[ ]\d{4}( roku)?(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"([А-ЩЬЮЯҐЄІЇа-щьюяґєії]+,?[ ]\d{1,2}[\.]?[ ](січня|лютого|березня|квітня|травня|червня|липня|серпня|вересня|жовтня|листопада|грудня)[ ]\d{4}( року| рік)?(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"([A-Za-z]+,?[ ]\d{1,2}[\.]?[ ](sichnia|liutoho|bereznia|kvitnia|travniia|chervnia|lypnia|serpnia|veresnia|zhovtnia|lystopada|hrudnia)[ ]\d{4}( roku)?(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"([А-ЩЬЮЯҐЄІЇа-щьюяґєії]+,?[ ](січня|лютого|березня|квітня|травня|червня|липня|серпня|вересня|жовтня|листопада|грудня)[ ]\d{1,2}[\.]?,?[ ]\d{4}( року| рік)?(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)|"
-    r"([A-Za-z]+,?[ ](sichnia|liutoho|bereznia|kvitnia|travniia|chervnia|lypnia|serpnia|veresnia|zhovtnia|lystopada|hrudnia)[ ]\d{1,2}[\.]?,?[ ]\d{4}( roku)?(?:[ ]?\d{2}:\d{2}(?::\d{2})?)?)"
-    r")"
+    + "|".join(b for branches in REGEX_DATE_BRANCHES.values() for b in branches)
+    + r")"
 )
 """The regex definition for dates."""
 
@@ -125,6 +152,261 @@ REGEX_WEBSITE_URL = r"((https?|ftp|smtp):\/\/)?(www.)?([a-zA-Z0-9]+\.)+[a-z]{2,}
 """The regex definition for website URLs."""
 
 
+# =====================================
+# Date matcher
+# =====================================
+
+# the maximum number of characters between the start of a date match
+# (excluding the leading weekday word) and its four digit year
+DATE_MAX_PREFIX_LENGTH = 48
+# the maximum number of characters between the end of the year and the
+# end of a date match
+DATE_MAX_SUFFIX_LENGTH = 32
+
+_DIGIT_RUN = re.compile(r"\d{4,}")
+_WEEKDAY_CHARS = re.compile(
+    r"[A-Za-zÀ-ÿäöüßÄÖÜčšžČŠŽ\u0370-\u03FFА-ЩЬЮЯҐЄІЇа-щьюяґєії]"
+)
+_LITERAL_GROUP = re.compile(r"\(((?:[^\W\d_]+\|)+[^\W\d_]+)\)")
+_REGEX_GROUP = re.compile(r"^.*?\((.*)\).*$")
+
+
+class DateMatcher:
+    """The class representing the prefiltered date regex matcher.
+
+    The matcher returns the same matches as `REGEX_DATE`, but first finds the
+    candidate positions (four digit runs) and the month names of each language
+    in their surroundings. The regex is then only run around the candidate
+    positions, using only the numeric and the relevant language branches.
+
+    Examples:
+        >>> from anonipy.utils.regex import date_matcher
+        >>> [m.group(0) for m in date_matcher.finditer("Born on 17 June 2023.")]
+        ["17 June 2023"]
+
+    Attributes:
+        pattern (str): The regex definition the matcher is equivalent to.
+        literals (dict): The compiled month names regex of each language.
+
+    Methods:
+        match(text):
+            Match the date at the beginning of the text.
+        search(text):
+            Search for the first date in the text.
+        finditer(text):
+            Iterate over all non-overlapping dates in the text.
+
+    """
+
+    def __init__(self):
+        """Initialize the date matcher.
+
+        Examples:
+            >>> from anonipy.utils.regex import DateMatcher
+            >>> date_matcher = DateMatcher()
+
+        """
+
+        self.pattern = REGEX_DATE
+        self.literals = {}
+        for lang, branches in REGEX_DATE_BRANCHES.items():
+            if lang == "numeric":
+                continue
+            names = set()
+            for branch in branches:
+                for group in _LITERAL_GROUP.findall(branch):
+                    names.update(group.split("|"))
+            self.literals[lang] = re.compile(
+                "|".join(sorted(names, key=len, reverse=True))
+            )
+
+    def match(self, text: str) -> Optional[re.Match]:
+        """Match the date at the beginning of the text.
+
+        Examples:
+            >>> date_matcher.match("17 June 2023")
+            <re.Match object; span=(0, 12), match='17 June 2023'>
+
+        Args:
+            text: The text to match.
+
+        Returns:
+            The match object or None if the text does not start with a date.
+
+        """
+
+        if not _DIGIT_RUN.search(text):
+            return None
+        return self._get_pattern(self._get_languages(text, 0, len(text))).match(text)
+
+    def search(self, text: str) -> Optional[re.Match]:
+        """Search for the first date in the text.
+
+        Examples:
+            >>> date_matcher.search("Born on 17 June 2023.")
+            <re.Match object; span=(8, 20), match='17 June 2023'>
+
+        Args:
+            text: The text to search.
+
+        Returns:
+            The first match object or None if the text does not contain a date.
+
+        """
+
+        return next(self.finditer(text), None)
+
+    def finditer(self, text: str) -> Iterator[re.Match]:
+        """Iterate over all non-overlapping dates in the text.
+
+        Examples:
+            >>> [m.group(0) for m in date_matcher.finditer("Born on 17 June 2023.")]
+            ["17 June 2023"]
+
+        Args:
+            text: The text to search.
+
+        Returns:
+            The iterator over the match objects.
+
+        """
+
+        last_end = 0
+        for start, end in self._get_windows(text):
+            pattern = self._get_pattern(self._get_languages(text, start, end))
+            for match in pattern.finditer(text, max(start, last_end), end):
+                last_end = match.end()
+                yield match
+
+    # ===========================================
+    # Private methods
+    # ===========================================
+
+    def _get_windows(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Get the merged text windows that can contain a date.
+
+        Args:
+            text: The text to get the windows from.
+
+        Returns:
+            The iterator over the (start, end) windows.
+
+        """
+
+        window = None
+        for run in _DIGIT_RUN.finditer(text):
+            start = max(0, run.start() - DATE_MAX_PREFIX_LENGTH)
+            # the weekday word preceding the date can be of any length
+            while start > 0 and _WEEKDAY_CHARS.match(text, start - 1):
+                start -= 1
+            end = min(len(text), run.end() + DATE_MAX_SUFFIX_LENGTH)
+            if window is not None and start <= window[1]:
+                window = (window[0], end)
+                continue
+            if window is not None:
+                yield window
+            window = (start, end)
+        if window is not None:
+            yield window
+
+    def _get_languages(self, text: str, start: int, end: int) -> Tuple[str, ...]:
+        """Get the languages whose month names appear in the text window.
+
+        Args:
+            text: The text to check.
+            start: The start index of the window.
+            end: The end index of the window.
+
+        Returns:
+            The languages whose month names appear in the window.
+
+        """
+
+        return tuple(
+            lang
+            for lang, literals in self.literals.items()
+            if literals.search(text, start, end)
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_pattern(languages: Tuple[str, ...]) -> re.Pattern:
+        """Get the compiled date regex containing only the relevant branches.
+
+        Args:
+            languages: The languages whose branches are included.
+
+        Returns:
+            The compiled date regex.
+
+        """
+
+        branches = [
+            branch
+            for lang, lang_branches in REGEX_DATE_BRANCHES.items()
+            if lang == "numeric" or lang in languages
+            for branch in lang_branches
+        ]
+        return re.compile(r"(" + "|".join(branches) + r")")
+
+
+date_matcher = DateMatcher()
+"""The shorthand to the `DateMatcher` instance."""
+
+# =====================================
+# Regex compilers
+# =====================================
+
+
+@lru_cache(maxsize=1024)
+def compile_regex(regex: Union[str, re.Pattern]) -> Union[re.Pattern, DateMatcher]:
+    """Compiles the regex.
+
+    The compiled regexes are cached, so each regex is compiled only once.
+    The `REGEX_DATE` regex is compiled into the prefiltered `date_matcher`.
+
+    Examples:
+        >>> from anonipy.utils.regex import compile_regex
+        >>> compile_regex("[0-9]+").match("123")
+        <re.Match object; span=(0, 3), match='123'>
+
+    Args:
+        regex: The regex to compile.
+
+    Returns:
+        The compiled regex.
+
+    """
+
+    if isinstance(regex, re.Pattern):
+        return regex
+    if regex == REGEX_DATE:
+        return date_matcher
+    return re.compile(regex)
+
+
+@lru_cache(maxsize=1024)
+def get_regex_group(regex: Union[str, re.Pattern]) -> str:
+    """Gets the content of the first regex group.
+
+    Examples:
+        >>> from anonipy.utils.regex import get_regex_group
+        >>> get_regex_group("Person: (.*)")
+        ".*"
+
+    Args:
+        regex: The regex to get the group from.
+
+    Returns:
+        The content of the first regex group or the full regex if there is no group.
+
+    """
+
+    regex = regex.pattern if isinstance(regex, re.Pattern) else regex
+    p_match = _REGEX_GROUP.match(regex)
+    return p_match.group(1) if p_match else regex
+
+
 # =====================================
 # Define the regex definitions
 # =====================================
@@ -141,10 +423,14 @@ class RegexMapping:
     Attributes:
         regex_mapping (defaultdict):
             The mapping between the data type and the corresponding regex.
+        compiled_mapping (dict):
+            The mapping between the data type and the corresponding compiled regex.
 
     Methods:
         __getitem__(type):
             Gets the regex for the given type.
+        get_compiled(type):
+            Gets the compiled regex for the given type.
 
     """
 
@@ -166,6 +452,11 @@ class RegexMapping:
         self.regex_mapping[ENTITY_TYPES.EMAIL] = REGEX_EMAIL_ADDRESS
         self.regex_mapping[ENTITY_TYPES.PHONE_NUMBER] = REGEX_PHONE_NUMBER
         self.regex_mapping[ENTITY_TYPES.WEBSITE_URL] = REGEX_WEBSITE_URL
+        # Compile the regex mappings
+        self.compiled_mapping = {
+            regex_type: compile_regex(regex)
+            for regex_type, regex in self.regex_mapping.items()
+        }
 
     def __getitem__(self, regex_type: str) -> str:
         """Gets the regex for the given type.
@@ -185,6 +476,26 @@ class RegexMapping:
         """
         return self.regex_mapping[regex_type]
 
+    def get_compiled(self, regex_type: str) -> Union[re.Pattern, DateMatcher]:
+        """Gets the compiled regex for the given type.
+
+        Examples:
+            >>> from anonipy.anonymize.regex import RegexMapping
+            >>> regex_mapping = RegexMapping()
+            >>> regex_mapping.get_compiled("string")
+            re.compile('.*')
+
+        Args:
+            regex_type: The type of the entity.
+
+        Returns:
+            The compiled regex for the given type.
+
+        """
+        if regex_type not in self.compiled_mapping:
+            return compile_regex(self.regex_mapping.default_factory())
+        return self.compiled_mapping[regex_type]
+
 
 regex_mapping = RegexMapping()
 """The shorthand to the `RegexMapping` instance."""
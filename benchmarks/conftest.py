@@ -0,0 +1,160 @@
+"""Shared fixtures of the benchmark suite.
+
+The benchmarks use `pytest-benchmark` and are not part of the test suite.
+
+Usage:
+    pytest benchmarks --benchmark-json=benchmarks.json
+    pytest benchmarks --benchmark-autosave
+    pytest-benchmark compare 0001 0002
+
+The named entity recognition benchmarks use a local GLiNER stand-in, so no
+model is downloaded and the results measure the anonipy overhead only.
+
+"""
+
+import re
+import random
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from anonipy.definitions import Entity
+
+# =====================================
+# Synthetic data
+# =====================================
+
+FIRST_NAMES = ["John", "Jane", "Maria", "Luka", "Ana", "Peter", "Eva", "Marko"]
+LAST_NAMES = ["Doe", "Novak", "Smith", "Horvat", "Kranjc", "Miller", "Kos"]
+WORDS = (
+    "the patient was seen at the clinic for a routine examination of blood "
+    "pressure and heart rate and was advised to return in two weeks"
+).split()
+
+
+def create_text(n_sentences: int, seed: int = 42) -> str:
+    """Create a synthetic medical record with names, dates and numbers.
+
+    Args:
+        n_sentences: The number of sentences in the text.
+        seed: The random seed.
+
+    Returns:
+        The synthetic text.
+
+    """
+
+    rng = random.Random(seed)
+    sentences = []
+    for _ in range(n_sentences):
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        date = f"{rng.randint(2000, 2024)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        number = (
+            f"{rng.randint(100, 999)}-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}"
+        )
+        words = " ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 15)))
+        sentences.append(
+            f"On {date} {name} {words}, phone {number}.\n"
+            if rng.random() < 0.5
+            else f"The {words} on {date}.\n"
+        )
+    return "".join(sentences)
+
+
+def create_entities(text: str, n_overlapping: int = 0, seed: int = 42) -> list:
+    """Create the entities of the dates in the text, with overlapping entities.
+
+    Args:
+        text: The text to create the entities from.
+        n_overlapping: The number of additional overlapping entities.
+        seed: The random seed.
+
+    Returns:
+        The list of entities.
+
+    """
+
+    rng = random.Random(seed)
+    entities = [
+        Entity(m.group(), "date", m.start(), m.end(), 1.0, "date")
+        for m in re.finditer(r"\d{4}-\d{2}-\d{2}", text)
+    ]
+    for _ in range(n_overlapping):
+        e = rng.choice(entities)
+        start = max(0, e.start_index - rng.randint(0, 5))
+        end = min(len(text), e.end_index + rng.randint(-5, 5))
+        if start < end:
+            entities.append(
+                Entity(text[start:end], "date", start, end, rng.random(), "date")
+            )
+    return entities
+
+
+# =====================================
+# GLiNER stand-in
+# =====================================
+
+
+class TinyGLiNER:
+    """The GLiNER stand-in, predicting capitalized word pairs as the first label."""
+
+    PATTERN = re.compile(r"\b[A-Z][a-z]+ [A-Z][a-z]+\b")
+
+    def predict_entities(self, text, labels, flat_ner=True, threshold=0.5):
+        return [
+            {
+                "start": m.start(),
+                "end": m.end(),
+                "text": m.group(),
+                "label": labels[0],
+                "score": 0.9,
+            }
+            for m in self.PATTERN.finditer(text)
+        ]
+
+    def inference(self, texts, labels, flat_ner=True, threshold=0.5, batch_size=8):
+        return [
+            self.predict_entities(text, labels, flat_ner, threshold) for text in texts
+        ]
+
+
+@pytest.fixture(scope="session")
+def tiny_gliner():
+    """Replace the loading of the GLiNER models with the local stand-in."""
+
+    from gliner import GLiNER
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(GLiNER, "from_pretrained", lambda *args, **kwargs: TinyGLiNER())
+        yield
+
+
+# =====================================
+# Shared fixtures
+# =====================================
+
+
+@pytest.fixture(scope="session")
+def text():
+    """The synthetic text of about 30 KB."""
+    return create_text(400)
+
+
+@pytest.fixture(scope="session")
+def entities(text):
+    """The non-overlapping date entities of the text."""
+    return create_entities(text)
+
+
+@pytest.fixture(scope="session")
+def ner_labels():
+    return [{"label": "name", "type": "string"}]
+
+
+@pytest.fixture(scope="session")
+def pattern_labels():
+    return [
+        {"label": "date", "type": "date", "regex": r"\d{4}-\d{2}-\d{2}"},
+        {"label": "phone", "type": "phone_number", "regex": r"\d{3}-\d{3}-\d{4}"},
+    ]
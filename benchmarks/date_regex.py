@@ -0,0 +1,96 @@
+"""Benchmark of the prefiltered `date_matcher` against the plain `REGEX_DATE`.
+
+Usage:
+    python benchmarks/date_regex.py --words 200000 --date-ratio 0.002
+
+"""
+
+import re
+import time
+import random
+import argparse
+
+from anonipy.utils.regex import REGEX_DATE, date_matcher
+
+WORDS = (
+    "the patient was seen on at and with Dr John Doe for a routine "
+    "examination of blood pressure heart rate 12 345 Juni maart"
+).split()
+
+DATES = [
+    "17-06-2023",
+    "2023/06/17 14:30:00",
+    "17 June 2023",
+    "Saturday, June 17, 2023",
+    "17. Juni 2023",
+    "17 de junio de 2023",
+    "17 червня 2023",
+]
+
+
+def create_text(n_words: int, date_ratio: float, seed: int = 42) -> str:
+    """Creates a synthetic text with the given ratio of dates.
+
+    Args:
+        n_words: The number of words in the text.
+        date_ratio: The ratio of dates among the words.
+        seed: The random seed.
+
+    Returns:
+        The synthetic text.
+
+    """
+
+    rng = random.Random(seed)
+    words = [
+        rng.choice(DATES) if rng.random() < date_ratio else rng.choice(WORDS)
+        for _ in range(n_words)
+    ]
+    return " ".join(words)
+
+
+def time_call(fn, repeat: int) -> float:
+    """Returns the best wall time of the function call in seconds.
+
+    Args:
+        fn: The function to time.
+        repeat: The number of repetitions.
+
+    Returns:
+        The best wall time in seconds.
+
+    """
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, default=200000)
+    parser.add_argument("--date-ratio", type=float, default=0.002)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    text = create_text(args.words, args.date_ratio)
+    pattern = re.compile(REGEX_DATE)
+
+    baseline = [m.span() for m in pattern.finditer(text)]
+    prefiltered = [m.span() for m in date_matcher.finditer(text)]
+    assert baseline == prefiltered, "The matchers returned different matches."
+
+    t_baseline = time_call(lambda: list(pattern.finditer(text)), args.repeat)
+    t_prefiltered = time_call(lambda: list(date_matcher.finditer(text)), args.repeat)
+
+    print(f"text length:  {len(text)} characters, {len(baseline)} dates")
+    print(f"REGEX_DATE:   {t_baseline:.4f} s")
+    print(f"date_matcher: {t_prefiltered:.4f} s")
+    print(f"speedup:      {t_baseline / t_prefiltered:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmarks of the memory footprint of the entity objects.
+
+The benchmarks create the objects of a corpus with a million entities and
+store the traced memory per object in the `extra_info` of the results. Only
+the entities are slimmed, the replacements are plain dictionaries.
+
+"""
+
+import gc
+import tracemalloc
+
+import pytest
+
+from anonipy.definitions import Entity, EntityBatch
+
+N_ENTITIES = 1_000_000
+
+# =====================================
+# Helper functions
+# =====================================
+
+
+def create_corpus_entities() -> list:
+    """Create the entities of the million-entity corpus."""
+    return [
+        Entity("John Doe", "name", 10 * i, 10 * i + 8, 0.9, "string")
+        for i in range(N_ENTITIES)
+    ]
+
+
+def measure(benchmark, create, *args):
+    """Benchmark the creation of the objects and record their memory.
+
+    Args:
+        benchmark: The benchmark fixture.
+        create: The function creating the objects.
+        args: The arguments of the function.
+
+    Returns:
+        The created objects.
+
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        objects = create(*args)
+        memory, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["objects"] = len(objects)
+    benchmark.extra_info["memory_bytes"] = memory
+    benchmark.extra_info["bytes_per_object"] = memory / len(objects)
+    # time the creation without the tracing overhead
+    benchmark.pedantic(create, args=args, rounds=3, iterations=1)
+    return objects
+
+
+# =====================================
+# Benchmarks
+# =====================================
+
+
+@pytest.fixture(scope="module")
+def corpus_entities():
+    return create_corpus_entities()
+
+
+def test_entities_memory(benchmark):
+    entities = measure(benchmark, create_corpus_entities)
+    assert entities[0].regex == ".*"
+
+
+def test_entity_batch_memory(benchmark, corpus_entities):
+    batch = measure(benchmark, EntityBatch.from_entities, corpus_entities)
+    assert len(batch) == N_ENTITIES
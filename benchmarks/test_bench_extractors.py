@@ -0,0 +1,61 @@
+"""Benchmarks of the extractors."""
+
+import pytest
+
+from anonipy.anonymize.extractors import (
+    DictionaryExtractor,
+    MultiExtractor,
+    NERExtractor,
+    PatternExtractor,
+)
+
+from conftest import FIRST_NAMES, LAST_NAMES, create_text
+
+
+@pytest.fixture(scope="module")
+def ner_extractor(tiny_gliner, ner_labels):
+    return NERExtractor(ner_labels)
+
+
+@pytest.fixture(scope="module")
+def pattern_extractor(pattern_labels):
+    return PatternExtractor(pattern_labels)
+
+
+@pytest.fixture(scope="module")
+def dictionary_extractor():
+    terms = [f"{first} {last}" for first in FIRST_NAMES for last in LAST_NAMES]
+    return DictionaryExtractor([{"label": "name", "type": "string", "terms": terms}])
+
+
+@pytest.mark.parametrize("detect_repeats", [False, True])
+def test_pattern_extractor(benchmark, pattern_extractor, text, detect_repeats):
+    _, entities = benchmark(pattern_extractor, text, detect_repeats)
+    assert entities
+
+
+def test_dictionary_extractor(benchmark, dictionary_extractor, text):
+    _, entities = benchmark(dictionary_extractor, text)
+    assert entities
+
+
+def test_ner_extractor(benchmark, ner_extractor, text):
+    _, entities = benchmark(ner_extractor, text)
+    assert entities
+
+
+def test_ner_extractor_batch(benchmark, ner_extractor):
+    texts = [create_text(10, seed=i) for i in range(32)]
+    outputs = benchmark(ner_extractor.batch, texts)
+    assert len(outputs) == len(texts)
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_multi_extractor(
+    benchmark, ner_extractor, pattern_extractor, dictionary_extractor, text, parallel
+):
+    extractor = MultiExtractor(
+        [ner_extractor, pattern_extractor, dictionary_extractor], parallel=parallel
+    )
+    _, entities = benchmark(extractor, text)
+    assert entities
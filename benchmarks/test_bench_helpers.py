@@ -0,0 +1,71 @@
+"""Benchmarks of the anonymization helpers."""
+
+import pytest
+
+from anonipy.definitions import EntityBatch
+from anonipy.anonymize import anonymize
+from anonipy.anonymize.helpers import (
+    detect_repeated_entities,
+    filter_entities,
+    merge_entities,
+)
+from anonipy.anonymize.extractors import PatternExtractor
+
+from conftest import create_entities
+
+
+@pytest.mark.parametrize("n_overlapping", [0, 1000, 10000])
+def test_filter_entities(benchmark, text, n_overlapping):
+    entities = create_entities(text, n_overlapping=n_overlapping)
+    result = benchmark(filter_entities, entities)
+    assert len(result) <= len(entities)
+
+
+@pytest.mark.parametrize("n_overlapping", [0, 1000, 10000])
+def test_filter_entity_batch(benchmark, text, n_overlapping):
+    entities = EntityBatch.from_entities(
+        create_entities(text, n_overlapping=n_overlapping), text
+    )
+    result = benchmark(filter_entities, entities)
+    assert len(result) <= len(entities)
+
+
+def test_entity_batch_conversion(benchmark, text, entities):
+    batch = benchmark(EntityBatch.from_entities, entities, text)
+    assert batch.to_entities() == entities
+
+
+def test_anonymize(benchmark, text, entities):
+    replacements = [
+        {
+            "original_text": e.text,
+            "label": e.label,
+            "start_index": e.start_index,
+            "end_index": e.end_index,
+            "anonymized_text": "[REDACTED]",
+        }
+        for e in entities
+    ]
+    anonymized_text, _ = benchmark(anonymize, text, replacements)
+    assert entities[0].text not in anonymized_text
+
+
+def test_detect_repeated_entities(benchmark, text):
+    extractor = PatternExtractor(
+        [{"label": "date", "type": "date", "regex": r"\d{4}-\d{2}-\d{2}"}]
+    )
+    doc, entities = extractor(text)
+    # keep every tenth entity to find the repeats of
+    result = benchmark(detect_repeated_entities, doc, entities[::10], "ent")
+    assert len(result) >= len(entities[::10])
+
+
+@pytest.mark.parametrize("policy", ["longest", "highest_score", "priority", "union"])
+def test_merge_entities(benchmark, text, policy):
+    # three extractors with partially overlapping outputs
+    outputs = [
+        (None, create_entities(text, n_overlapping=10000, seed=seed))
+        for seed in range(3)
+    ]
+    result = benchmark(merge_entities, outputs, policy)
+    assert len(result) <= sum(len(entities) for _, entities in outputs)
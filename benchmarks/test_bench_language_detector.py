@@ -0,0 +1,73 @@
+"""Benchmarks of the startup time and memory of the language detector modes.
+
+Each mode is measured in a fresh process, as the loaded language models are
+shared by all detectors of the process. The startup time, the time of the
+first detection and the resident set size growth are stored in the
+`extra_info` of the results.
+
+"""
+
+import sys
+import json
+import subprocess
+
+import pytest
+
+MODES = {
+    "preloaded_all": {},
+    "lazy_all": {"preload_models": False},
+    "preloaded_supported": {"supported_only": True},
+    "lazy_supported": {"supported_only": True, "preload_models": False},
+    "lazy_subset": {"languages": ["en", "de", "sl"], "preload_models": False},
+    "low_accuracy": {"low_accuracy": True},
+}
+
+# the script measuring the detector in a fresh process
+SCRIPT = """
+import sys, json, time
+from anonipy.utils.memory import get_memory_usage
+from anonipy.utils.language_detector import LanguageDetector
+
+kwargs = json.loads(sys.argv[1])
+baseline = get_memory_usage()
+start = time.perf_counter()
+detector = LanguageDetector(**kwargs)
+init_s = time.perf_counter() - start
+init_rss = get_memory_usage() - baseline
+start = time.perf_counter()
+detector.detect("The patient was seen at the clinic for a routine examination.")
+detect_s = time.perf_counter() - start
+print(json.dumps({
+    "init_s": init_s,
+    "first_detect_s": detect_s,
+    "init_rss_bytes": init_rss,
+    "detect_rss_bytes": get_memory_usage() - baseline,
+}))
+"""
+
+
+def run_mode(kwargs: dict) -> dict:
+    """Measure the detector mode in a fresh process.
+
+    Args:
+        kwargs: The arguments of the language detector.
+
+    Returns:
+        The startup time, the first detection time and the resident set size growth.
+
+    """
+
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT, json.dumps(kwargs)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("mode", list(MODES))
+def test_language_detector_startup(benchmark, mode):
+    result = benchmark.pedantic(run_mode, args=(MODES[mode],), rounds=1, iterations=1)
+    benchmark.extra_info.update(result)
+    assert result["init_s"] >= 0
@@ -0,0 +1,59 @@
+"""End-to-end benchmarks of the anonymization pipeline."""
+
+import shutil
+import warnings
+
+import pytest
+
+from anonipy.anonymize.extractors import MultiExtractor, NERExtractor, PatternExtractor
+from anonipy.anonymize.pipeline import Pipeline
+from anonipy.anonymize.strategies import RedactionStrategy
+
+from conftest import create_text
+
+
+@pytest.fixture(scope="module")
+def pipeline(tiny_gliner, ner_labels, pattern_labels):
+    extractor = MultiExtractor(
+        [NERExtractor(ner_labels), PatternExtractor(pattern_labels)]
+    )
+    return Pipeline(extractor, RedactionStrategy())
+
+
+@pytest.fixture(scope="module")
+def input_dir(tmp_path_factory):
+    input_dir = tmp_path_factory.mktemp("input")
+    for i in range(50):
+        folder = input_dir / f"folder{i % 5}"
+        folder.mkdir(exist_ok=True)
+        (folder / f"record{i}.txt").write_text(create_text(20, seed=i), "utf-8")
+    return input_dir
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_pipeline(benchmark, pipeline, input_dir, tmp_path, workers):
+    output_dir = tmp_path / "output"
+
+    def run():
+        shutil.rmtree(output_dir, ignore_errors=True)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return pipeline.anonymize(str(input_dir), str(output_dir), workers=workers)
+
+    mapping = benchmark.pedantic(run, rounds=3, iterations=1)
+    assert len(mapping) == 50
+
+
+def test_pipeline_stream(benchmark, pipeline, tmp_path):
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    (input_dir / "log.txt").write_text(create_text(500), "utf-8")
+    output_dir = tmp_path / "output"
+    pipeline = Pipeline(pipeline.extractor, pipeline.strategy, chunk_size=16384)
+
+    def run():
+        shutil.rmtree(output_dir, ignore_errors=True)
+        return pipeline.anonymize(str(input_dir), str(output_dir))
+
+    mapping = benchmark.pedantic(run, rounds=3, iterations=1)
+    assert len(mapping) == 1
@@ -0,0 +1,39 @@
+"""Benchmarks of the anonymization strategies."""
+
+import pytest
+
+from anonipy.definitions import EntityBatch
+from anonipy.anonymize.strategies import (
+    MaskingStrategy,
+    PseudonymizationStrategy,
+    RedactionStrategy,
+)
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    [
+        RedactionStrategy(),
+        MaskingStrategy(),
+        PseudonymizationStrategy(mapping=lambda text, entity: "2000-01-01"),
+    ],
+    ids=["redaction", "masking", "pseudonymization"],
+)
+def test_strategy(benchmark, strategy, text, entities):
+    anonymized_text, replacements = benchmark(strategy.anonymize, text, entities)
+    assert len(replacements) == len(entities)
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    [
+        RedactionStrategy(),
+        MaskingStrategy(),
+        PseudonymizationStrategy(mapping=lambda text, entity: "2000-01-01"),
+    ],
+    ids=["redaction", "masking", "pseudonymization"],
+)
+def test_strategy_entity_batch(benchmark, strategy, text, entities):
+    batch = EntityBatch.from_entities(entities, text)
+    anonymized_text, replacements = benchmark(strategy.anonymize, text, batch)
+    assert len(replacements) == len(entities)
@@ -0,0 +1,72 @@
+"""Benchmarks of the generators and utilities."""
+
+import pytest
+
+from anonipy.anonymize.generators import DateGenerator, NumberGenerator
+from anonipy.definitions import Entity
+from anonipy.utils.datetime_format import detect_datetime_format
+from anonipy.utils.language_detector import LanguageDetector
+
+from conftest import create_text
+
+DATES = [
+    "2023-06-17",
+    "17-06-2023",
+    "17.06.2023",
+    "June 17, 2023",
+    "17 June 2023",
+    "2023/06/17 14:30:00",
+]
+
+
+@pytest.mark.parametrize("date", DATES)
+def test_detect_datetime_format(benchmark, date):
+    parsed, _ = benchmark(detect_datetime_format, date, "en")
+    assert parsed is not None
+
+
+def test_date_generator(benchmark):
+    generator = DateGenerator()
+    entity = Entity("2023-06-17", "date", 0, 10, 1.0, "date")
+    assert benchmark(generator.generate, entity)
+
+
+def test_number_generator_batch(benchmark):
+    generator = NumberGenerator(seed=42)
+    entities = [
+        Entity(f"{i:03d}-555-0100", "phone", 0, 12, 1.0, "phone_number")
+        for i in range(1000)
+    ]
+    substitutes = benchmark(generator.generate_batch, entities)
+    assert len(substitutes) == len(entities)
+
+
+@pytest.fixture(scope="module")
+def sentences():
+    return create_text(200).splitlines()
+
+
+@pytest.fixture(scope="module")
+def language_detector():
+    return LanguageDetector(supported_only=True)
+
+
+def test_language_detector_detect(benchmark, language_detector, sentences):
+    def detect():
+        language_detector.clear_cache()
+        return [language_detector.detect(sentence) for sentence in sentences]
+
+    assert len(benchmark(detect)) == len(sentences)
+
+
+def test_language_detector_detect_batch(benchmark, language_detector, sentences):
+    def detect_batch():
+        language_detector.clear_cache()
+        return language_detector.detect_batch(sentences)
+
+    assert len(benchmark(detect_batch)) == len(sentences)
+
+
+def test_language_detector_cached(benchmark, language_detector, sentences):
+    language_detector.detect_batch(sentences)
+    assert len(benchmark(language_detector.detect_batch, sentences)) == len(sentences)
@@ -0,0 +1,84 @@
+"""Tests for anonipy.utils.aho_corasick."""
+
+import numpy as np
+import pytest
+
+from anonipy.utils.aho_corasick import AhoCorasick
+
+# =====================================
+# Test AhoCorasick
+# =====================================
+
+
+@pytest.fixture
+def automaton():
+    return AhoCorasick.from_terms(["he", "she", "his", "hers"], [0, 1, 2, 3])
+
+
+def brute_force(terms, text):
+    first = {}
+    for i, term in enumerate(terms):
+        first.setdefault(term, i)
+    return sorted(
+        (s, s + len(t), v)
+        for t, v in first.items()
+        for s in range(len(text))
+        if text[s : s + len(t)] == t
+    )
+
+
+def test_finditer(automaton):
+    """Test that all overlapping occurrences are found."""
+    matches = sorted(automaton.finditer("ushers"))
+    assert matches == [(1, 4, 1), (2, 4, 0), (2, 6, 3)]
+
+
+def test_finditer_random():
+    """Test the automaton against the brute force search."""
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        terms = [
+            "".join(rng.choice(list("abc"), size=rng.integers(1, 5)))
+            for _ in range(rng.integers(1, 10))
+        ]
+        text = "".join(rng.choice(list("abc "), size=50))
+        automaton = AhoCorasick.from_terms(terms, range(len(terms)))
+        assert sorted(automaton.finditer(text)) == brute_force(terms, text)
+
+
+def test_case_insensitive():
+    """Test the case-insensitive matching."""
+    automaton = AhoCorasick.from_terms(["John Doe"], [0], case_sensitive=False)
+    assert list(automaton.finditer("JOHN DOE and john doe")) == [
+        (0, 8, 0),
+        (13, 21, 0),
+    ]
+
+
+def test_len(automaton):
+    """Test the number of terms."""
+    assert len(automaton) == 4
+    assert len(AhoCorasick.from_terms(["a", "a", ""], [0, 1, 2])) == 1
+
+
+def test_negative_value():
+    """Test that negative values raise ValueError."""
+    with pytest.raises(ValueError):
+        AhoCorasick.from_terms(["a"], [-1])
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load(automaton, tmp_path, mmap):
+    """Test that the loaded automaton finds the same occurrences."""
+    automaton.metadata = {"name": "test"}
+    automaton.save(tmp_path / "automaton")
+    loaded = AhoCorasick.load(tmp_path / "automaton", mmap=mmap)
+    assert isinstance(loaded.fail, np.memmap) == mmap
+    assert loaded.metadata == {"name": "test"}
+    assert list(loaded.finditer("ushers")) == list(automaton.finditer("ushers"))
+
+
+def test_load_missing(tmp_path):
+    """Test that loading a missing automaton raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        AhoCorasick.load(tmp_path / "missing")
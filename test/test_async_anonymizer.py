@@ -0,0 +1,184 @@
+"""Tests for anonipy.anonymize.async_anonymizer."""
+
+import asyncio
+import threading
+
+import pytest
+
+from anonipy.anonymize.async_anonymizer import AsyncAnonymizer
+from anonipy.anonymize.extractors import ExtractorInterface, PatternExtractor
+from anonipy.anonymize.strategies import PseudonymizationStrategy, RedactionStrategy
+
+# =====================================
+# Test Data
+# =====================================
+
+TEST_TEXTS = [f"Request {i} was sent on 2024-01-{i + 1:02d}." for i in range(10)]
+
+
+class _BatchRecordingExtractor(ExtractorInterface):
+    """Extractor stand-in that records the batch sizes and the thread."""
+
+    def __init__(self, extractor, fail=False, bad_text=None):
+        self.extractor = extractor
+        self.fail = fail
+        self.bad_text = bad_text
+        self.batch_sizes = []
+        self.threads = set()
+
+    def __call__(self, text, *args, **kwargs):
+        return self.extractor(text, *args, **kwargs)
+
+    def batch(self, texts, *args, **kwargs):
+        self.batch_sizes.append(len(texts))
+        self.threads.add(threading.current_thread().name)
+        if self.fail or self.bad_text in texts:
+            raise RuntimeError("the model failed")
+        return super().batch(texts, *args, **kwargs)
+
+
+@pytest.fixture(scope="module")
+def pattern_extractor():
+    return PatternExtractor(
+        [{"label": "date", "type": "date", "regex": r"\d{4}-\d{2}-\d{2}"}]
+    )
+
+
+# =====================================
+# Test AsyncAnonymizer
+# =====================================
+
+
+def test_init_invalid_inputs(pattern_extractor):
+    """Test that invalid batching parameters raise ValueError."""
+    with pytest.raises(ValueError):
+        AsyncAnonymizer(pattern_extractor, max_batch_size=0)
+    with pytest.raises(ValueError):
+        AsyncAnonymizer(pattern_extractor, max_wait_ms=-1)
+
+
+def test_anonymize_batches(pattern_extractor):
+    """Test that concurrent requests are batched and resolved individually."""
+    extractor = _BatchRecordingExtractor(pattern_extractor)
+    strategy = RedactionStrategy()
+
+    async def main():
+        async with AsyncAnonymizer(
+            extractor, strategy, max_batch_size=4, max_wait_ms=50
+        ) as anonymizer:
+            results = await asyncio.gather(
+                *[anonymizer.anonymize(text) for text in TEST_TEXTS]
+            )
+            return results, anonymizer.stats
+
+    results, stats = asyncio.run(main())
+
+    assert extractor.batch_sizes == [4, 4, 2]
+    assert stats == {"requests": 10, "batches": 3}
+    assert all(name.startswith("anonipy-async") for name in extractor.threads)
+    for text, (anonymized_text, replacements) in zip(TEST_TEXTS, results):
+        _, entities = pattern_extractor(text)
+        assert (anonymized_text, replacements) == strategy.anonymize(text, entities)
+
+
+def test_extract(pattern_extractor):
+    """Test the entity extraction requests."""
+
+    async def main():
+        async with AsyncAnonymizer(pattern_extractor) as anonymizer:
+            return await anonymizer.extract(TEST_TEXTS[0])
+
+    entities = asyncio.run(main())
+    assert [e.text for e in entities] == ["2024-01-01"]
+
+
+def test_anonymize_without_strategy(pattern_extractor):
+    """Test that anonymizing without a strategy raises ValueError."""
+
+    async def main():
+        async with AsyncAnonymizer(pattern_extractor) as anonymizer:
+            await anonymizer.anonymize(TEST_TEXTS[0])
+
+    with pytest.raises(ValueError):
+        asyncio.run(main())
+
+
+def test_anonymize_max_wait(pattern_extractor):
+    """Test that a single request is processed after the wait time."""
+    extractor = _BatchRecordingExtractor(pattern_extractor)
+
+    async def main():
+        async with AsyncAnonymizer(
+            extractor, RedactionStrategy(), max_batch_size=100, max_wait_ms=1
+        ) as anonymizer:
+            await anonymizer.anonymize(TEST_TEXTS[0])
+            await anonymizer.anonymize(TEST_TEXTS[1])
+
+    asyncio.run(main())
+    assert extractor.batch_sizes == [1, 1]
+
+
+def test_anonymize_error(pattern_extractor):
+    """Test that the batch errors are propagated to each request."""
+    extractor = _BatchRecordingExtractor(pattern_extractor, fail=True)
+
+    async def main():
+        async with AsyncAnonymizer(extractor, RedactionStrategy()) as anonymizer:
+            return await asyncio.gather(
+                *[anonymizer.anonymize(text) for text in TEST_TEXTS[:3]],
+                return_exceptions=True,
+            )
+
+    results = asyncio.run(main())
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_anonymize_error_isolated(pattern_extractor):
+    """Test that a failing request does not fail the other requests of the batch."""
+    bad_text = "This text breaks the model."
+    texts = [TEST_TEXTS[0], bad_text, TEST_TEXTS[1]]
+    extractor = _BatchRecordingExtractor(pattern_extractor, bad_text=bad_text)
+    strategy = RedactionStrategy()
+
+    async def main():
+        async with AsyncAnonymizer(
+            extractor, strategy, max_batch_size=3, max_wait_ms=50
+        ) as anonymizer:
+            return await asyncio.gather(
+                *[anonymizer.anonymize(text) for text in texts],
+                return_exceptions=True,
+            )
+
+    results = asyncio.run(main())
+    # the failed batch is retried text by text
+    assert extractor.batch_sizes == [3, 1, 1, 1]
+    assert isinstance(results[1], RuntimeError)
+    for text, result in zip([texts[0], texts[2]], [results[0], results[2]]):
+        _, entities = pattern_extractor(text)
+        assert result == strategy.anonymize(text, entities)
+
+
+def test_anonymize_strategy_error_isolated(pattern_extractor):
+    """Test that a failing anonymization does not fail the other requests."""
+
+    def mapping(text, entity):
+        if entity.text == "2024-01-02":
+            raise RuntimeError("the mapping failed")
+        return "[DATE]"
+
+    async def main():
+        async with AsyncAnonymizer(
+            pattern_extractor,
+            PseudonymizationStrategy(mapping=mapping),
+            max_batch_size=3,
+            max_wait_ms=50,
+        ) as anonymizer:
+            return await asyncio.gather(
+                *[anonymizer.anonymize(text) for text in TEST_TEXTS[:3]],
+                return_exceptions=True,
+            )
+
+    results = asyncio.run(main())
+    assert isinstance(results[1], RuntimeError)
+    assert results[0][0] == "Request 0 was sent on [DATE]."
+    assert results[2][0] == "Request 2 was sent on [DATE]."
@@ -0,0 +1,123 @@
+"""Tests for anonipy.cli."""
+
+import os
+import json
+import warnings
+
+import pytest
+
+from anonipy.cli import _parse_args, get_mapping_path, main
+
+# =====================================
+# Test Data
+# =====================================
+
+TEST_CONFIG = {
+    "extractors": [
+        {
+            "type": "PatternExtractor",
+            "labels": [{"label": "date", "type": "date", "regex": r"\d{4}-\d{2}-\d{2}"}],
+        }
+    ],
+    "strategy": {"type": "RedactionStrategy"},
+}
+
+
+@pytest.fixture
+def setup(tmp_path):
+    warnings.filterwarnings("ignore", category=UserWarning)
+    input_dir = tmp_path / "input"
+    for i in range(10):
+        folder = input_dir / f"folder{i % 2}"
+        folder.mkdir(parents=True, exist_ok=True)
+        (folder / f"file{i}.txt").write_text(
+            f"Sent on 2024-01-{i + 1:02d}.", encoding="utf-8"
+        )
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps(TEST_CONFIG), encoding="utf-8")
+    return tmp_path, str(input_dir), str(config_path)
+
+
+# =====================================
+# Test CLI
+# =====================================
+
+
+def test_parse_args():
+    """Test the command line arguments."""
+    args = _parse_args(
+        ["in", "out", "--config", "c.yaml", "--shard-index", "1", "--shard-count", "4"]
+    )
+    assert (args.input_dir, args.output_dir, args.config) == ("in", "out", "c.yaml")
+    assert (args.shard_index, args.shard_count, args.workers) == (1, 4, 1)
+    assert args.memory_budget is None
+    assert not args.flatten
+    with pytest.raises(SystemExit):
+        _parse_args(["in", "out"])
+
+
+def test_get_mapping_path():
+    """Test the default path of the shard mapping."""
+    assert get_mapping_path("out", 1, 4) == os.path.join(
+        "out", "mapping.shard-00001-of-00004.json"
+    )
+
+
+def test_main(setup):
+    """Test the anonymization of the directory."""
+    tmp_path, input_dir, config_path = setup
+    output_dir = str(tmp_path / "output")
+    report_path = str(tmp_path / "report.json")
+    main(
+        [
+            input_dir,
+            output_dir,
+            "--config",
+            config_path,
+            "--workers",
+            "2",
+            "--report",
+            report_path,
+        ]
+    )
+
+    with open(get_mapping_path(output_dir, 0, 1), "r", encoding="utf-8") as f:
+        mapping = json.load(f)
+    assert len(mapping) == 10
+    with open(report_path, "r", encoding="utf-8") as f:
+        assert json.load(f)["summary"]["anonymized"] == 10
+    for anonymized in mapping.values():
+        with open(tmp_path / anonymized, "r", encoding="utf-8") as f:
+            assert f.read() == "Sent on [REDACTED]."
+
+
+def test_main_shards(setup):
+    """Test that the shard mappings merge into the mapping of all files."""
+    tmp_path, input_dir, config_path = setup
+    merged = {}
+    for shard_index in range(3):
+        mapping_path = str(tmp_path / f"mapping{shard_index}.json")
+        main(
+            [
+                input_dir,
+                str(tmp_path / f"node{shard_index}" / "output"),
+                "--config",
+                config_path,
+                "--flatten",
+                "--shard-index",
+                str(shard_index),
+                "--shard-count",
+                "3",
+                "--mapping",
+                mapping_path,
+                "--memory-budget",
+                "64GB",
+            ]
+        )
+        with open(mapping_path, "r", encoding="utf-8") as f:
+            mapping = json.load(f)
+        assert not set(mapping) & set(merged)
+        merged.update(mapping)
+
+    assert len(merged) == 10
+    assert len(set(merged.values())) == 10
@@ -0,0 +1,185 @@
+"""Tests for anonipy.anonymize.config."""
+
+import json
+
+import pytest
+
+from anonipy.anonymize.config import (
+    build_extractor,
+    build_pipeline,
+    build_strategy,
+    load_config,
+)
+from anonipy.anonymize.extractors import (
+    MultiExtractor,
+    PatternExtractor,
+    RoutingExtractor,
+)
+from anonipy.anonymize.pipeline import Pipeline
+from anonipy.anonymize.strategies import (
+    MaskingStrategy,
+    PseudonymizationStrategy,
+    RedactionStrategy,
+)
+from anonipy.constants import LANGUAGES
+
+# =====================================
+# Test Data
+# =====================================
+
+TEST_CONFIG = {
+    "extractors": [
+        {
+            "type": "PatternExtractor",
+            "lang": "ENGLISH",
+            "labels": [{"label": "date", "type": "date", "regex": r"\d{4}-\d{2}-\d{2}"}],
+        },
+        {
+            "type": "DictionaryExtractor",
+            "lang": "en",
+            "labels": [{"label": "name", "type": "string", "terms": ["John Doe"]}],
+        },
+    ],
+    "multi_extractor": {"parallel": True},
+    "strategy": {"type": "MaskingStrategy", "substitute_label": "#"},
+}
+
+TEST_YAML_CONFIG = """
+extractors:
+  - type: PatternExtractor
+    labels:
+      - {label: date, type: date, regex: '\\d{4}-\\d{2}-\\d{2}'}
+strategy:
+  type: RedactionStrategy
+"""
+
+
+def mapping(text, entity):
+    return "[PSEUDONYM]"
+
+
+# =====================================
+# Test Config
+# =====================================
+
+
+def test_load_config_json(tmp_path):
+    """Test loading the JSON configuration."""
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps(TEST_CONFIG), encoding="utf-8")
+    assert load_config(str(path)) == TEST_CONFIG
+
+
+def test_load_config_yaml(tmp_path):
+    """Test loading the YAML configuration."""
+    pytest.importorskip("yaml")
+    path = tmp_path / "config.yaml"
+    path.write_text(TEST_YAML_CONFIG, encoding="utf-8")
+    config = load_config(str(path))
+    assert config["strategy"] == {"type": "RedactionStrategy"}
+    assert config["extractors"][0]["labels"][0]["regex"] == r"\d{4}-\d{2}-\d{2}"
+
+
+def test_load_config_invalid(tmp_path):
+    """Test loading the missing and unsupported configuration files."""
+    with pytest.raises(FileNotFoundError):
+        load_config(str(tmp_path / "missing.json"))
+    path = tmp_path / "config.txt"
+    path.write_text("", encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_config(str(path))
+
+
+def test_build_extractor():
+    """Test building the multi extractor from the configuration."""
+    extractor = build_extractor(TEST_CONFIG)
+    assert isinstance(extractor, MultiExtractor)
+    assert extractor.parallel
+    assert all(e.lang == LANGUAGES.ENGLISH for e in extractor.extractors)
+
+    _, entities = extractor("John Doe was born on 1995-01-01.")
+    assert [(e.text, e.label) for e in entities] == [
+        ("John Doe", "name"),
+        ("1995-01-01", "date"),
+    ]
+
+
+def test_build_extractor_single():
+    """Test that a single configured extractor is returned directly."""
+    extractor = build_extractor({"extractors": TEST_CONFIG["extractors"][:1]})
+    assert isinstance(extractor, PatternExtractor)
+
+
+def test_build_routing_extractor():
+    """Test building the routing extractor with the per-language extractors."""
+    extractor = build_extractor(
+        {
+            "extractors": [
+                {
+                    "type": "RoutingExtractor",
+                    "languages": ["ENGLISH", "de"],
+                    "default_lang": "de",
+                    "extractors": TEST_CONFIG["extractors"],
+                    "multi_extractor": {"merge_policy": "priority"},
+                }
+            ]
+        }
+    )
+    assert isinstance(extractor, RoutingExtractor)
+    assert extractor.languages == [LANGUAGES.ENGLISH, LANGUAGES.GERMAN]
+    assert extractor.default_lang == LANGUAGES.GERMAN
+
+    german = extractor.get_extractor(LANGUAGES.GERMAN)
+    assert isinstance(german, MultiExtractor)
+    assert german.merge_policy == "priority"
+    assert all(e.lang == LANGUAGES.GERMAN for e in german.extractors)
+
+
+def test_build_extractor_invalid():
+    """Test building the extractor from invalid configurations."""
+    with pytest.raises(ValueError):
+        build_extractor({"extractors": []})
+    with pytest.raises(ValueError):
+        build_extractor({"extractors": [{"type": "MissingExtractor", "labels": []}]})
+    with pytest.raises(ValueError):
+        build_extractor({"extractors": [{"type": "PatternExtractor", "lang": "xx"}]})
+
+
+def test_build_strategy():
+    """Test building the strategies from the configuration."""
+    strategy = build_strategy(TEST_CONFIG)
+    assert isinstance(strategy, MaskingStrategy)
+    assert strategy.substitute_label == "#"
+
+    strategy = build_strategy({"strategy": {"type": "RedactionStrategy"}})
+    assert isinstance(strategy, RedactionStrategy)
+
+    strategy = build_strategy(
+        {
+            "strategy": {
+                "type": "PseudonymizationStrategy",
+                "mapping": f"{__name__}:mapping",
+            }
+        }
+    )
+    assert isinstance(strategy, PseudonymizationStrategy)
+    assert strategy.mapping is mapping
+
+
+def test_build_strategy_invalid():
+    """Test building the strategy from invalid configurations."""
+    with pytest.raises(ValueError):
+        build_strategy({})
+    with pytest.raises(ValueError):
+        build_strategy({"strategy": {"type": "MissingStrategy"}})
+    with pytest.raises(ValueError):
+        build_strategy({"strategy": {"type": "PseudonymizationStrategy", "mapping": "x"}})
+
+
+def test_build_pipeline():
+    """Test building the pipeline from the configuration."""
+    pipeline = build_pipeline({**TEST_CONFIG, "pipeline": {"chunk_size": 1024}})
+    assert isinstance(pipeline, Pipeline)
+    assert isinstance(pipeline.extractor, MultiExtractor)
+    assert isinstance(pipeline.strategy, MaskingStrategy)
+    assert pipeline.chunk_size == 1024
@@ -0,0 +1,106 @@
+"""Tests for anonipy.utils.datetime_format."""
+
+import datetime
+import threading
+import warnings
+
+import dateparser
+import pytest
+
+from anonipy.utils.datetime_format import (
+    parse_datetime,
+    detect_datetime_format,
+    get_fast_path_stats,
+    reset_fast_path_stats,
+)
+
+# =====================================
+# Test Cases
+# =====================================
+
+FAST_PATH_CASES = [
+    {"text": "2023-06-17 14:30:00", "lang": "en"},
+    {"text": "17-06-2023", "lang": "en"},
+    {"text": "06-17-2023 14:30", "lang": "en"},
+    {"text": "05.06.2024", "lang": "en"},
+    {"text": "05.06.2024", "lang": "de"},
+    {"text": "17/06/2023 02:30 PM", "lang": "en"},
+    {"text": "Saturday, June 17, 2023", "lang": "en"},
+    {"text": "17 Jun 2023 14:30:00", "lang": "en"},
+    {"text": "17. Juni 2023", "lang": "de"},
+    {"text": "17 de junio de 2023", "lang": "es"},
+    {"text": "17 червня 2023", "lang": "uk"},
+    {"text": "17 Ιουνίου 2023", "lang": "el"},
+]
+
+FALLBACK_CASES = [
+    {"text": "06-17-2023", "lang": "de"},
+    {"text": "31-02-2023", "lang": "en"},
+    {"text": "17 de June de 2023", "lang": "en"},
+]
+
+# =====================================
+# Test Fast-Path Parser
+# =====================================
+
+
+@pytest.fixture(autouse=True)
+def reset_stats():
+    reset_fast_path_stats()
+
+
+def _dateparser_parse(text, lang):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=DeprecationWarning)
+        return dateparser.parse(text, languages=[lang])
+
+
+@pytest.mark.parametrize("test_case", FAST_PATH_CASES)
+def test_parse_datetime_fast_path(test_case):
+    """Test that the fast path matches dateparser and counts a hit."""
+    parsed = parse_datetime(test_case["text"], test_case["lang"])
+    assert parsed == _dateparser_parse(test_case["text"], test_case["lang"])
+    assert get_fast_path_stats()["hits"] == 1
+
+
+@pytest.mark.parametrize("test_case", FALLBACK_CASES)
+def test_parse_datetime_fallback(test_case):
+    """Test that unsupported strings fall back to dateparser."""
+    parsed = parse_datetime(test_case["text"], test_case["lang"])
+    assert parsed == _dateparser_parse(test_case["text"], test_case["lang"])
+    assert get_fast_path_stats()["misses"] == 1
+
+
+def test_fast_path_stats_hit_rate():
+    """Test the fast path hit rate computation."""
+    assert get_fast_path_stats() == {"hits": 0, "misses": 0, "hit_rate": 0.0}
+    parse_datetime("2023-06-17", "en")
+    parse_datetime("2023-06-17", "en")
+    parse_datetime("31-02-2023", "en")
+    stats = get_fast_path_stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+
+def test_fast_path_stats_threads():
+    """Test that the counters are not lost when parsing from multiple threads."""
+
+    def parse_dates():
+        for _ in range(500):
+            parse_datetime("2023-06-17", "en")
+
+    threads = [threading.Thread(target=parse_dates) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert get_fast_path_stats()["hits"] == 8 * 500
+
+
+def test_detect_datetime_format_uses_fast_path():
+    """Test that the format detection uses the fast path."""
+    parsed, date_format = detect_datetime_format("17-06-2023 14:30", "en")
+    assert parsed == datetime.datetime(2023, 6, 17, 14, 30)
+    assert date_format == "dd-MM-yyyy HH:mm"
+    assert get_fast_path_stats()["hits"] == 1
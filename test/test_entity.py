@@ -1,5 +1,8 @@
 """Tests for anonipy.definitions.Entity."""
 
+import re
+import pickle
+
 import pytest
 
 from anonipy.definitions import Entity
@@ -138,3 +141,68 @@ def test_explicit_regex_overrides_type_mapping():
         regex="\\d{2}-\\d{2}-\\d{4}",
     )
     assert entity.regex == "\\d{2}-\\d{2}-\\d{4}"
+
+
+def test_compiled_regex():
+    """Test that compiled_regex is the cached compiled entity regex."""
+    entity = Entity(
+        text="123", label="number", start_index=0, end_index=3, type="integer"
+    )
+    other = Entity(
+        text="456", label="number", start_index=4, end_index=7, type="integer"
+    )
+    assert entity.compiled_regex.match("123") is not None
+    assert entity.compiled_regex is other.compiled_regex
+
+
+def test_get_regex_group_with_compiled_regex():
+    """Test get_regex_group() with a compiled regex."""
+    entity = Entity(
+        text="John",
+        label="name",
+        start_index=0,
+        end_index=4,
+        regex=re.compile("Person: (.*)"),
+    )
+    assert entity.get_regex_group() == ".*"
+
+
+def test_slots():
+    """Test that the entity does not allocate the instance dictionary."""
+    entity = Entity(text="x", label="y", start_index=0, end_index=1)
+    assert not hasattr(entity, "__dict__")
+    with pytest.raises(AttributeError):
+        entity.unknown = "value"
+
+
+def test_regex_resolved_lazily():
+    """Test that the type regex is resolved on access and follows the type."""
+    entity = Entity(text="123", label="number", start_index=0, end_index=3)
+    assert entity.regex == ".*"
+    entity.type = "integer"
+    assert entity.regex == Entity(
+        text="123", label="number", start_index=0, end_index=3, type="integer"
+    ).regex
+    entity.regex = "\\d+"
+    assert entity.regex == "\\d+"
+
+
+def test_equality():
+    """Test that the entities are compared by their values."""
+    entity = Entity(text="x", label="y", start_index=0, end_index=1)
+    assert entity == Entity(text="x", label="y", start_index=0, end_index=1)
+    assert entity == Entity(
+        text="x", label="y", start_index=0, end_index=1, regex=".*"
+    )
+    assert entity != Entity(text="x", label="y", start_index=0, end_index=2)
+    assert entity != "x"
+
+
+def test_repr_and_pickle():
+    """Test the entity representation and pickling."""
+    entity = Entity(text="John", label="name", start_index=0, end_index=4)
+    assert repr(entity) == (
+        "Entity(text='John', label='name', start_index=0, end_index=4, "
+        "score=1.0, type=None, regex='.*')"
+    )
+    assert pickle.loads(pickle.dumps(entity)) == entity
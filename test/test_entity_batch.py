@@ -0,0 +1,111 @@
+"""Tests for anonipy.definitions.EntityBatch."""
+
+import numpy as np
+import pytest
+
+from anonipy.definitions import Entity, EntityBatch
+
+# =====================================
+# Test Data
+# =====================================
+
+TEST_TEXT = "John Doe was born on 2000-01-01 and lives in Ljubljana."
+TEST_ENTITIES = [
+    Entity("John Doe", "name", 0, 8, 0.9, "string"),
+    Entity("2000-01-01", "date", 21, 31, 1.0, "date"),
+    Entity("Ljubljana", "location", 45, 54, 0.75, "string"),
+]
+
+# =====================================
+# Test EntityBatch
+# =====================================
+
+
+@pytest.mark.parametrize("text", [TEST_TEXT, None])
+def test_from_entities(text):
+    """Test the conversion from and to the list of entities."""
+    batch = EntityBatch.from_entities(TEST_ENTITIES, text)
+    assert len(batch) == 3
+    assert batch.labels == ["name", "date", "location"]
+    assert batch.types == ["string", "date"]
+    assert batch.type_ids.tolist() == [0, 1, 0]
+    assert batch.starts.dtype == np.int64
+    assert batch.get_texts() == ["John Doe", "2000-01-01", "Ljubljana"]
+    assert (batch.texts is None) == (text is not None)
+    assert batch.to_entities() == TEST_ENTITIES
+    assert list(batch) == TEST_ENTITIES
+    assert batch[-1] == TEST_ENTITIES[-1]
+
+
+def test_from_entities_empty():
+    """Test the batch without entities."""
+    batch = EntityBatch.from_entities([], TEST_TEXT)
+    assert len(batch) == 0
+    assert batch.to_entities() == []
+
+
+def test_init_invalid():
+    """Test that inconsistent columns raise ValueError."""
+    with pytest.raises(ValueError):
+        EntityBatch([0, 5], [4], [0, 0], ["name"], source_text=TEST_TEXT)
+    with pytest.raises(ValueError):
+        EntityBatch([0], [4], [0], ["name"])
+    batch = EntityBatch.from_entities(TEST_ENTITIES, TEST_TEXT)
+    with pytest.raises(ValueError):
+        batch.with_anonymized_texts(["[REDACTED]"])
+    with pytest.raises(ValueError):
+        batch.to_replacements()
+
+
+def test_getitem():
+    """Test the selection of the entities by the mask, slice and indices."""
+    batch = EntityBatch.from_entities(TEST_ENTITIES, TEST_TEXT)
+    assert batch[batch.scores > 0.8].to_entities() == TEST_ENTITIES[:2]
+    assert batch[1:].to_entities() == TEST_ENTITIES[1:]
+    assert batch[np.array([2, 0])].to_entities() == [
+        TEST_ENTITIES[2],
+        TEST_ENTITIES[0],
+    ]
+    assert batch[::-1].sort().to_entities() == TEST_ENTITIES
+    # the selection shares the vocabularies
+    assert batch[batch.label_ids == batch.labels.index("date")].labels == batch.labels
+
+
+def test_concatenate():
+    """Test the concatenation of the batches with different vocabularies."""
+    first = EntityBatch.from_entities(TEST_ENTITIES[:1], TEST_TEXT)
+    second = EntityBatch.from_entities(TEST_ENTITIES[1:], TEST_TEXT)
+    batch = EntityBatch.concatenate([second, first])
+    assert batch.source_text == TEST_TEXT
+    assert batch.sort().to_entities() == TEST_ENTITIES
+
+    mixed = EntityBatch.concatenate(
+        [first, EntityBatch.from_entities(TEST_ENTITIES[1:])]
+    )
+    assert mixed.source_text is None
+    assert mixed.to_entities() == TEST_ENTITIES
+    with pytest.raises(ValueError):
+        EntityBatch.concatenate([])
+
+
+def test_to_replacements():
+    """Test the conversion to the list of replacements."""
+    batch = EntityBatch.from_entities(TEST_ENTITIES[:2], TEST_TEXT)
+    replacements = batch.with_anonymized_texts(["[NAME]", "[DATE]"])
+    assert batch.anonymized_texts is None
+    assert replacements.to_replacements() == [
+        {
+            "original_text": "John Doe",
+            "label": "name",
+            "start_index": 0,
+            "end_index": 8,
+            "anonymized_text": "[NAME]",
+        },
+        {
+            "original_text": "2000-01-01",
+            "label": "date",
+            "start_index": 21,
+            "end_index": 31,
+            "anonymized_text": "[DATE]",
+        },
+    ]
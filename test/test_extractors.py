@@ -1,15 +1,28 @@
 """Tests for anonipy.anonymize.extractors."""
 
+import time
 import warnings
+import threading
 
 import pytest
 import torch
 from transformers import logging
 
 from anonipy.definitions import Entity
-from anonipy.anonymize.extractors import NERExtractor, PatternExtractor, MultiExtractor
+from anonipy.anonymize.extractors import (
+    DictionaryExtractor,
+    ExtractorInterface,
+    NERExtractor,
+    PatternExtractor,
+    MultiExtractor,
+    RoutingExtractor,
+)
 from anonipy.constants import LANGUAGES
+from anonipy.utils.prescreen import PreScreener
+from anonipy.utils.regex import REGEX_EMAIL_ADDRESS
+from anonipy.utils.language_detector import LanguageDetector
 from anonipy.anonymize.helpers import filter_entities
+from anonipy.anonymize.strategies import RedactionStrategy
 from test.conftest import HAS_GPU
 
 # disable transformers logging
@@ -346,6 +359,20 @@ def test_ner_extractor_extract_default_params(ner_extractor):
         assert p_entity.score >= 0.5
 
 
+@pytest.mark.slow
+def test_ner_extractor_prescreen(ner_extractor):
+    """Test that the NER extractor skips the model on pre-screened texts."""
+    extractor = NERExtractor(
+        ner_extractor.labels, lang=LANGUAGES.ENGLISH, prescreen=PreScreener()
+    )
+    doc, entities = extractor("the order has been shipped.")
+    assert entities == []
+    assert doc.text == "the order has been shipped."
+    _, entities = extractor(TEST_ORIGINAL_TEXT)
+    assert len(entities) > 0
+    assert extractor.prescreen.stats == {"screened": 2, "skipped": 1}
+
+
 @pytest.mark.slow
 def test_ner_extractor_extract_default_params_input():
     """Test NER extraction with explicit default model."""
@@ -840,3 +867,431 @@ def test_multi_extractor_detect_repeats_true():
         assert p_entity.type == t_entity.type
         assert p_entity.regex == t_entity.regex
         assert p_entity.score >= 0.5
+
+
+class _SleepExtractor(ExtractorInterface):
+    """Extractor stand-in that waits before returning the pattern entities."""
+
+    def __init__(self, extractor, delay):
+        self.extractor = extractor
+        self.labels = extractor.labels
+        self.delay = delay
+
+    def __call__(self, text, detect_repeats=False, *args, **kwargs):
+        time.sleep(self.delay)
+        return self.extractor(text, detect_repeats)
+
+
+class _RecordingNERExtractor(NERExtractor):
+    """NER extractor stand-in that records the texts it is called with."""
+
+    def __init__(self, extractor):
+        self.extractor = extractor
+        self.labels = extractor.labels
+        self.lang = extractor.lang
+        self.spacy_style = extractor.spacy_style
+        self.pipeline = extractor.pipeline
+        self.texts = []
+
+    def __call__(self, text, detect_repeats=False, *args, **kwargs):
+        self.texts.append(text)
+        return self.extractor(text, detect_repeats)
+
+
+def test_multi_extractor_parallel(pattern_extractor):
+    """Test that parallel execution returns the outputs in extractor order."""
+    slow_extractor = _SleepExtractor(pattern_extractor, delay=0.2)
+    date_extractor = PatternExtractor(
+        [{"label": "date", "type": "date", "regex": r"(\d{2}-\d{2}-\d{4})"}]
+    )
+    sequential = MultiExtractor([slow_extractor, date_extractor])
+    parallel = MultiExtractor([slow_extractor, date_extractor], parallel=True)
+
+    seq_outputs, seq_entities = sequential(TEST_ORIGINAL_TEXT, detect_repeats=True)
+    par_outputs, par_entities = parallel(TEST_ORIGINAL_TEXT, detect_repeats=True)
+    parallel.close()
+
+    assert len(par_outputs) == len(seq_outputs)
+    for (_, seq_ents), (_, par_ents) in zip(seq_outputs, par_outputs):
+        assert [str(e) for e in par_ents] == [str(e) for e in seq_ents]
+    assert [str(e) for e in par_entities] == [str(e) for e in seq_entities]
+
+
+def test_multi_extractor_parallel_timeout(pattern_extractor):
+    """Test that a slow extractor raises TimeoutError."""
+    slow_extractor = _SleepExtractor(pattern_extractor, delay=1.0)
+    extractor = MultiExtractor([pattern_extractor, slow_extractor], parallel=True, timeout=0.1)
+    with pytest.raises(TimeoutError):
+        extractor(TEST_ORIGINAL_TEXT)
+    extractor.close()
+
+
+def test_multi_extractor_timeout_replaces_threads(pattern_extractor):
+    """Test that the extractor stuck after a timeout does not block the later calls."""
+    slow_extractor = _SleepExtractor(pattern_extractor, delay=1.0)
+    extractor = MultiExtractor(
+        [pattern_extractor, slow_extractor], parallel=True, max_workers=1, timeout=0.3
+    )
+    with pytest.raises(TimeoutError):
+        extractor(TEST_ORIGINAL_TEXT)
+    # the only thread of the first pool is still running the slow extractor
+    slow_extractor.delay = 0
+    _, entities = extractor(TEST_ORIGINAL_TEXT)
+    assert entities
+    extractor.close()
+
+
+def test_multi_extractor_executor_thread_safe(pattern_extractor):
+    """Test that the concurrent calls create a single thread pool."""
+    extractor = MultiExtractor([pattern_extractor], parallel=True)
+    barrier = threading.Barrier(8)
+    executors = []
+
+    def get_executor():
+        barrier.wait()
+        executors.append(extractor._get_executor())
+
+    threads = [threading.Thread(target=get_executor) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(executor) for executor in executors}) == 1
+    extractor.close()
+
+
+def test_multi_extractor_invalid_timeout(pattern_extractor):
+    """Test that a non-positive timeout raises ValueError."""
+    with pytest.raises(ValueError):
+        MultiExtractor([pattern_extractor], parallel=True, timeout=0)
+
+
+def test_multi_extractor_share_tokenization(pattern_extractor):
+    """Test that shared tokenization returns the same entities as separate runs."""
+    date_extractor = PatternExtractor(
+        [{"label": "date", "type": "date", "regex": r"(\d{2}-\d{2}-\d{4})"}]
+    )
+    shared = MultiExtractor([pattern_extractor, date_extractor])
+    separate = MultiExtractor(
+        [pattern_extractor, date_extractor], share_tokenization=False
+    )
+
+    shared_outputs, shared_entities = shared(TEST_ORIGINAL_TEXT, detect_repeats=True)
+    separate_outputs, separate_entities = separate(TEST_ORIGINAL_TEXT, detect_repeats=True)
+
+    assert shared_outputs[0][0] is not shared_outputs[1][0]
+    assert shared_outputs[0][0].vocab is shared_outputs[1][0].vocab
+    for (s_doc, s_ents), (p_doc, p_ents) in zip(shared_outputs, separate_outputs):
+        assert [str(e) for e in s_ents] == [str(e) for e in p_ents]
+        assert [(e.start_char, e.end_char, e.label_) for e in s_doc.ents] == [
+            (e.start_char, e.end_char, e.label_) for e in p_doc.ents
+        ]
+    assert [str(e) for e in shared_entities] == [str(e) for e in separate_entities]
+
+
+def test_multi_extractor_merge_policy():
+    """Test that the merge policy resolves the overlapping entities."""
+    text = "Call John Doe Smith today."
+    first = PatternExtractor([{"label": "name", "type": "string", "regex": r"John Doe"}])
+    second = PatternExtractor(
+        [{"label": "name", "type": "string", "regex": r"John Doe Smith"}]
+    )
+    _, longest = MultiExtractor([first, second])(text)
+    assert [e.text for e in longest] == ["John Doe Smith"]
+    _, priority = MultiExtractor([first, second], merge_policy="priority")(text)
+    assert [e.text for e in priority] == ["John Doe"]
+    with pytest.raises(ValueError):
+        MultiExtractor([first, second], merge_policy="invalid")
+
+
+def test_multi_extractor_union_policy():
+    """Test that the union policy keeps the overlapping entities as spans."""
+    text = "Call John Doe Smith today."
+    labels = [
+        [{"label": "name", "type": "string", "regex": r"John Doe"}],
+        [{"label": "name", "type": "string", "regex": r"John Doe Smith"}],
+    ]
+    # the overlapping entities cannot be stored in the ent spacy style
+    with pytest.raises(ValueError):
+        MultiExtractor(
+            [PatternExtractor(label) for label in labels], merge_policy="union"
+        )
+
+    extractors = [PatternExtractor(label, spacy_style="span") for label in labels]
+    _, union = MultiExtractor(extractors, merge_policy="union")(text)
+    assert [e.text for e in union] == ["John Doe", "John Doe Smith"]
+    # the overlapping entities cannot be anonymized
+    with pytest.raises(ValueError):
+        RedactionStrategy().anonymize(text, union)
+
+
+TEST_CASCADE_TEXT = """\
+john@example.com
+jane@example.com 123-45-6789
+Contact John Doe for details.
+Or send a message to John Doe.
+bob@example.com
+"""
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_multi_extractor_cascade(parallel):
+    """Test that the cascade runs the NER extractors only on the unresolved lines."""
+    email_extractor = PatternExtractor(
+        [
+            {"label": "email", "type": "email", "regex": REGEX_EMAIL_ADDRESS},
+            {"label": "ssn", "type": "string", "regex": r"\d{3}-\d{2}-\d{4}"},
+        ]
+    )
+    name_extractor = PatternExtractor(
+        [{"label": "name", "type": "string", "regex": r"John Doe"}]
+    )
+    ner_extractor = _RecordingNERExtractor(name_extractor)
+    extractor = MultiExtractor(
+        [ner_extractor, email_extractor], parallel=parallel, cascade=True
+    )
+    outputs, entities = extractor(TEST_CASCADE_TEXT)
+    extractor.close()
+
+    assert ner_extractor.texts == [
+        "Contact John Doe for details.\nOr send a message to John Doe.\n"
+    ]
+    ner_doc, ner_entities = outputs[0]
+    assert ner_doc.text == TEST_CASCADE_TEXT
+    assert [(e.text, e.start_index) for e in ner_entities] == [
+        ("John Doe", TEST_CASCADE_TEXT.index("John Doe")),
+        ("John Doe", TEST_CASCADE_TEXT.rindex("John Doe")),
+    ]
+    assert [e.text for e in ner_doc.ents] == ["John Doe", "John Doe"]
+    for entity in entities:
+        assert TEST_CASCADE_TEXT[entity.start_index : entity.end_index] == entity.text
+
+    reference = MultiExtractor([name_extractor, email_extractor])
+    _, reference_entities = reference(TEST_CASCADE_TEXT)
+    assert [str(e) for e in entities] == [str(e) for e in reference_entities]
+
+
+def test_multi_extractor_cascade_score_th(pattern_extractor):
+    """Test that entities below the cascade score threshold do not resolve the text."""
+    email_extractor = PatternExtractor([{"label": "email", "type": "email", "regex": REGEX_EMAIL_ADDRESS}])
+    name_extractor = PatternExtractor(
+        [{"label": "name", "type": "string", "regex": r"John Doe"}]
+    )
+    ner_extractor = _RecordingNERExtractor(name_extractor)
+    extractor = MultiExtractor(
+        [email_extractor, ner_extractor], cascade=True, cascade_score_th=1.5
+    )
+    extractor(TEST_CASCADE_TEXT)
+    assert ner_extractor.texts == [TEST_CASCADE_TEXT]
+
+
+# =====================================
+# Test Dictionary Extractor
+# =====================================
+
+TEST_DICTIONARY_LABELS = [
+    {"label": "name", "type": "string", "terms": ["John Doe", "John", "Jane Smith"]},
+    {"label": "medicine", "type": "string", "terms": ["Ibuprofen", "Lisinopril"]},
+]
+
+
+@pytest.fixture(scope="module")
+def dictionary_extractor():
+    return DictionaryExtractor(TEST_DICTIONARY_LABELS, lang=LANGUAGES.ENGLISH)
+
+
+def test_dictionary_extractor_init(dictionary_extractor):
+    """Test DictionaryExtractor instantiation."""
+    assert isinstance(dictionary_extractor, ExtractorInterface)
+    assert all("terms" not in l for l in dictionary_extractor.labels)
+    assert len(dictionary_extractor.automaton) == 5
+
+
+def test_dictionary_extractor_extract(dictionary_extractor):
+    """Test that the longest whole-word terms are extracted case-insensitively."""
+    text = "JOHN DOE takes ibuprofen, Johnny takes Lisinopril."
+    doc, entities = dictionary_extractor(text)
+    assert [(e.text, e.label, e.start_index, e.score) for e in entities] == [
+        ("JOHN DOE", "name", 0, 1.0),
+        ("ibuprofen", "medicine", 15, 1.0),
+        ("Lisinopril", "medicine", 39, 1.0),
+    ]
+    assert [e.text for e in doc.ents] == ["JOHN DOE", "ibuprofen", "Lisinopril"]
+
+
+def test_dictionary_extractor_options():
+    """Test the case-sensitive and partial word matching."""
+    extractor = DictionaryExtractor(
+        TEST_DICTIONARY_LABELS, case_sensitive=True, whole_word=False
+    )
+    _, entities = extractor("JOHN DOE, Johnny and ibuprofen")
+    assert [(e.text, e.start_index) for e in entities] == [("Johnny", 10)]
+
+
+def test_dictionary_extractor_save_load(dictionary_extractor, tmp_path):
+    """Test that the loaded extractor returns the same entities."""
+    dictionary_extractor.save(tmp_path / "dictionary")
+    loaded = DictionaryExtractor.load(tmp_path / "dictionary")
+    assert loaded.labels == dictionary_extractor.labels
+    assert loaded.whole_word == dictionary_extractor.whole_word
+    _, expected = dictionary_extractor(TEST_ORIGINAL_TEXT, detect_repeats=True)
+    _, entities = loaded(TEST_ORIGINAL_TEXT, detect_repeats=True)
+    assert len(entities) > 0
+    assert [str(e) for e in entities] == [str(e) for e in expected]
+
+
+def test_dictionary_extractor_multi(dictionary_extractor, pattern_extractor):
+    """Test the dictionary extractor in the multi extractor."""
+    extractor = MultiExtractor([dictionary_extractor, pattern_extractor])
+    outputs, _ = extractor(TEST_ORIGINAL_TEXT)
+    _, expected = dictionary_extractor(TEST_ORIGINAL_TEXT)
+    assert [str(e) for e in outputs[0][1]] == [str(e) for e in expected]
+
+
+def test_extractor_batch(pattern_extractor):
+    """Test that the batch extraction matches the single text extraction."""
+    texts = [TEST_ORIGINAL_TEXT, "No entities here.", TEST_CASCADE_TEXT]
+    outputs = pattern_extractor.batch(texts, detect_repeats=True)
+    assert len(outputs) == len(texts)
+    for text, (_, entities) in zip(texts, outputs):
+        _, expected = pattern_extractor(text, detect_repeats=True)
+        assert [str(e) for e in entities] == [str(e) for e in expected]
+
+
+@pytest.mark.parametrize("cascade", [False, True])
+def test_multi_extractor_batch(pattern_extractor, cascade):
+    """Test that the multi extractor batch matches the single text extraction."""
+    date_extractor = PatternExtractor(
+        [{"label": "date", "type": "date", "regex": r"(\d{2}-\d{2}-\d{4})"}]
+    )
+    extractor = MultiExtractor([pattern_extractor, date_extractor], cascade=cascade)
+    texts = [TEST_ORIGINAL_TEXT, "No entities here."]
+    outputs = extractor.batch(texts)
+    assert len(outputs) == len(texts)
+    for text, (extractor_outputs, entities) in zip(texts, outputs):
+        expected_outputs, expected = extractor(text)
+        assert len(extractor_outputs) == len(expected_outputs)
+        assert [str(e) for e in entities] == [str(e) for e in expected]
+
+
+@pytest.mark.slow
+def test_ner_extractor_batch(ner_extractor):
+    """Test that the batched NER extraction matches the single text extraction."""
+    texts = [TEST_ORIGINAL_TEXT, "John Doe lives in Ljubljana."]
+    outputs = ner_extractor.batch(texts, batch_size=2)
+    for text, (_, entities) in zip(texts, outputs):
+        _, expected = ner_extractor(text)
+        assert [(e.text, e.label) for e in entities] == [
+            (e.text, e.label) for e in expected
+        ]
+
+
+# =====================================
+# Test Routing Extractor
+# =====================================
+
+TEST_MIXED_TEXT = (
+    "The patient John Doe was admitted to the hospital yesterday morning. "
+    "Pacient Janez Novak je bil včeraj zjutraj sprejet v bolnišnico."
+)
+
+TEST_ROUTING_LABELS = [
+    {"label": "name", "type": "string", "regex": r"John Doe|Janez Novak"}
+]
+
+
+@pytest.fixture(scope="module")
+def language_detector():
+    return LanguageDetector(low_accuracy=True)
+
+
+def _create_routing_extractor(language_detector, created, **kwargs):
+    def create_extractor(lang):
+        created.append(lang)
+        return PatternExtractor(TEST_ROUTING_LABELS, lang=lang)
+
+    return RoutingExtractor(
+        create_extractor,
+        languages=[LANGUAGES.ENGLISH, LANGUAGES.SLOVENIAN],
+        detector=language_detector,
+        **kwargs,
+    )
+
+
+def test_routing_extractor_document(language_detector):
+    """Test that the documents are routed to the extractors of their language."""
+    created = []
+    extractor = _create_routing_extractor(language_detector, created)
+    assert created == []
+
+    outputs = extractor.batch(
+        ["Janez Novak je bil včeraj zjutraj sprejet v bolnišnico.", "Hallo"]
+    )
+    assert [[part[0] for part in parts] for parts, _ in outputs] == [
+        [LANGUAGES.SLOVENIAN],
+        [LANGUAGES.ENGLISH],
+    ]
+    assert [e.text for e in outputs[0][1]] == ["Janez Novak"]
+    assert created == [LANGUAGES.SLOVENIAN, LANGUAGES.ENGLISH]
+
+
+def test_routing_extractor_sentence(language_detector):
+    """Test that the sentences are routed and the entity offsets are restored."""
+    created = []
+    extractor = _create_routing_extractor(
+        language_detector, created, granularity="sentence"
+    )
+    parts, entities = extractor(TEST_MIXED_TEXT)
+
+    split = TEST_MIXED_TEXT.index("Pacient")
+    assert [(lang, start) for lang, start, _ in parts] == [
+        (LANGUAGES.ENGLISH, 0),
+        (LANGUAGES.SLOVENIAN, split),
+    ]
+    assert parts[1][2][0].lang_ == "sl"
+    assert [e.text for e in entities] == ["John Doe", "Janez Novak"]
+    for entity in entities:
+        assert TEST_MIXED_TEXT[entity.start_index : entity.end_index] == entity.text
+
+
+def test_routing_extractor_short_sentences(language_detector):
+    """Test that the short sentences take the language of the preceding sentence."""
+    extractor = _create_routing_extractor(
+        language_detector, [], granularity="sentence"
+    )
+    text = "Janez Novak je bil včeraj zjutraj sprejet v bolnišnico. Hvala.\nOk."
+    assert extractor.route(text) == [(LANGUAGES.SLOVENIAN, 0, len(text))]
+
+
+def test_routing_extractor_invalid():
+    """Test that the invalid routing arguments raise ValueError."""
+    with pytest.raises(ValueError):
+        RoutingExtractor(lambda lang: None, granularity="paragraph")
+    with pytest.raises(ValueError):
+        RoutingExtractor(lambda lang: None, languages=[("xx", "Unknown")])
+    with pytest.raises(ValueError):
+        RoutingExtractor(
+            lambda lang: None,
+            languages=[LANGUAGES.GERMAN],
+            default_lang=LANGUAGES.ENGLISH,
+        )
+
+
+def test_routing_extractor_shares_gliner_model(monkeypatch):
+    """Test that the NER extractors of all languages share the GLiNER model."""
+    from gliner import GLiNER
+
+    loaded = []
+    monkeypatch.setattr(
+        GLiNER, "from_pretrained", lambda *args, **kwargs: loaded.append(args) or object()
+    )
+    extractor = RoutingExtractor(
+        lambda lang: NERExtractor([{"label": "name", "type": "string"}], lang=lang)
+    )
+    english = extractor.get_extractor(LANGUAGES.ENGLISH)
+    german = extractor.get_extractor(LANGUAGES.GERMAN)
+    assert len(loaded) == 1
+    assert (
+        english.pipeline.get_pipe("gliner_spacy").model
+        is german.pipeline.get_pipe("gliner_spacy").model
+    )
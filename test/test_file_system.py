@@ -5,7 +5,14 @@ import json
 
 import pytest
 
-from anonipy.utils.file_system import open_file, write_file, open_json, write_json
+from anonipy.utils.file_system import (
+    open_file,
+    write_file,
+    open_json,
+    write_json,
+    read_text_chunks,
+    write_text_chunks,
+)
 from test.resources.example_outputs import WORD_TEXT, PDF_TEXT, TXT_TEXT
 
 # =====================================
@@ -148,3 +155,92 @@ def test_write_json_creates_dir(tmp_path):
     assert os.path.isfile(path)
     with open(path, "r", encoding="utf-8") as f:
         assert json.load(f) == data
+
+
+# =====================================
+# Test read_text_chunks
+# =====================================
+
+
+def test_read_text_chunks_txt():
+    """Test that the chunks join into the original text."""
+    chunks = list(read_text_chunks(RESOURCES["txt"], chunk_size=64))
+    assert len(chunks) > 1
+    assert "".join(chunks) == TXT_TEXT
+    assert all(len(chunk.encode("utf-8")) <= 64 for chunk in chunks)
+
+
+def test_read_text_chunks_boundaries(tmp_path):
+    """Test that the chunks end at the line and sentence ends."""
+    text = "First sentence. Second one!\nThird line without end"
+    file_path = tmp_path / "file.txt"
+    file_path.write_text(text, encoding="utf-8")
+    chunks = list(read_text_chunks(str(file_path), chunk_size=30))
+    assert chunks == ["First sentence. Second one!\n", "Third line without end"]
+    chunks = list(read_text_chunks(str(file_path), chunk_size=20))
+    assert chunks[0] == "First sentence. "
+
+
+def test_read_text_chunks_multibyte(tmp_path):
+    """Test that the multi-byte characters are not split."""
+    text = "čšžćđ" * 10
+    file_path = tmp_path / "file.txt"
+    file_path.write_text(text, encoding="utf-8")
+    for chunk_size in [1, 3, 7]:
+        chunks = list(read_text_chunks(str(file_path), chunk_size=chunk_size))
+        assert "".join(chunks) == text
+
+
+def test_read_text_chunks_line_ends(tmp_path):
+    """Test that the line ends are translated as in open_file."""
+    file_path = tmp_path / "file.txt"
+    file_path.write_bytes(b"John\r\nDoe\r\nJane\rDoe\n" * 5)
+    expected = open_file(str(file_path))
+    assert expected == "John\nDoe\nJane\nDoe\n" * 5
+    for chunk_size in [1, 2, 5, 6, 1024]:
+        chunks = list(read_text_chunks(str(file_path), chunk_size=chunk_size))
+        assert "".join(chunks) == expected
+
+
+def test_read_text_chunks_empty(tmp_path):
+    """Test that an empty file has no chunks."""
+    file_path = tmp_path / "file.txt"
+    file_path.write_text("")
+    assert list(read_text_chunks(str(file_path))) == []
+
+
+def test_read_text_chunks_errors(tmp_path):
+    """Test the invalid inputs."""
+    with pytest.raises(FileNotFoundError):
+        list(read_text_chunks("/nonexistent/path/file.txt"))
+    file_path = tmp_path / "file.txt"
+    file_path.write_text("data")
+    with pytest.raises(ValueError):
+        list(read_text_chunks(str(file_path), chunk_size=0))
+
+
+# =====================================
+# Test write_text_chunks
+# =====================================
+
+
+def test_write_text_chunks(tmp_path):
+    """Test writing the chunks from a generator."""
+    file_path = str(tmp_path / "file.txt")
+    write_text_chunks((chunk for chunk in ["Hello, ", "World!"]), file_path)
+    with open(file_path, "r", encoding="utf-8") as f:
+        assert f.read() == "Hello, World!"
+
+
+def test_write_text_chunks_type_error(tmp_path):
+    """Test that non-string chunks raise TypeError."""
+    with pytest.raises(TypeError):
+        write_text_chunks(["Hello", 1], str(tmp_path / "file.txt"))
+    with pytest.raises(TypeError):
+        write_text_chunks(["Hello"], 123)
+
+
+def test_write_text_chunks_nonexistent_dir():
+    """Test that writing to a nonexistent directory raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        write_text_chunks(["Hello"], "/nonexistent/dir/file.txt")
@@ -428,3 +428,45 @@ def test_number_generator_generate_uncorrect_type(number_generator):
     entity = TEST_ENTITIES["name"]
     with pytest.raises(ValueError):
         number_generator.generate(entity)
+
+
+def test_number_generator_seed_reproducible():
+    """Test that seeded generators produce the same substitutes."""
+    entity = TEST_ENTITIES["custom"]
+    first = NumberGenerator(seed=42).generate(entity)
+    second = NumberGenerator(seed=42).generate(entity)
+    assert first == second
+
+
+def test_number_generator_generate_batch(number_generator):
+    """Test batch number generation keeps the non-digit characters."""
+    entities = [TEST_ENTITIES["integer"], TEST_ENTITIES["float"], TEST_ENTITIES["custom"]]
+    generated_texts = number_generator.generate_batch(entities)
+    assert len(generated_texts) == len(entities)
+    for entity, generated_text in zip(entities, generated_texts):
+        assert len(generated_text) == len(entity.text)
+        assert re.fullmatch(entity.regex, generated_text)
+
+
+def test_number_generator_generate_batch_uncorrect_type(number_generator):
+    """Test that batch generation with a non-numeric entity raises ValueError."""
+    entities = [TEST_ENTITIES["integer"], TEST_ENTITIES["name"]]
+    with pytest.raises(ValueError):
+        number_generator.generate_batch(entities)
+
+
+def test_number_generator_preserve_luhn():
+    """Test that Luhn valid numbers are replaced with Luhn valid numbers."""
+    entity = Entity(
+        text="4539 1488 0343 6467",
+        label="credit card",
+        start_index=0,
+        end_index=19,
+        type="integer",
+    )
+    generator = NumberGenerator(seed=0)
+    for generated_text in generator.generate_batch([entity] * 20, preserve_luhn=True):
+        digits = [int(d) for d in generated_text if d.isdigit()][::-1]
+        checksum = sum(d if i % 2 == 0 else (d * 2 - 9 if d > 4 else d * 2) for i, d in enumerate(digits))
+        assert checksum % 10 == 0
+        assert generated_text[4] == " "
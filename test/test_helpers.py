@@ -1,7 +1,17 @@
-"""Tests for anonipy.anonymize.helpers.filter_entities."""
+"""Tests for anonipy.anonymize.helpers."""
 
-from anonipy.definitions import Entity
-from anonipy.anonymize.helpers import filter_entities
+import random
+
+import pytest
+
+from anonipy.definitions import Entity, EntityBatch
+from anonipy.anonymize import anonymize
+from anonipy.anonymize.helpers import (
+    filter_entities,
+    merge_entities,
+    create_label_index,
+)
+from anonipy.utils.regex import compile_regex
 
 # =====================================
 # Test filter_entities
@@ -45,3 +55,171 @@ def test_filter_sorted_by_start_index():
     ]
     result = filter_entities(entities)
     assert [e.start_index for e in result] == [0, 5, 10]
+
+
+def test_filter_entity_batch():
+    """Test that the entity batch is filtered as the list of entities."""
+    rng = random.Random(42)
+    text = "x" * 200
+    for _ in range(50):
+        entities = []
+        for _ in range(rng.randint(0, 30)):
+            start = rng.randint(0, 190)
+            end = start + rng.randint(0, 10)
+            entities.append(Entity(text[start:end], rng.choice("ab"), start, end))
+        result = filter_entities(EntityBatch.from_entities(entities, text))
+        assert isinstance(result, EntityBatch)
+        assert result.to_entities() == filter_entities(entities)
+
+
+def test_merge_entity_batches():
+    """Test that the entity batches of the extractors are merged into a batch."""
+    text = "John Doe was born on 2000-01-01."
+    first = [Entity("John", "name", 0, 4), Entity("2000-01-01", "date", 21, 31)]
+    second = [Entity("John Doe", "name", 0, 8)]
+    outputs = [(None, first), (None, second)]
+    batch_outputs = [(None, EntityBatch.from_entities(e, text)) for _, e in outputs]
+    result = merge_entities(batch_outputs)
+    assert isinstance(result, EntityBatch)
+    assert result.to_entities() == merge_entities(outputs)
+
+
+def test_merge_policies():
+    """Test that the merge policies resolve the overlapping entities."""
+    first = [Entity("John", "name", 0, 4, score=0.9), Entity("Doe", "name", 5, 8)]
+    second = [Entity("John Doe", "name", 0, 8, score=0.5)]
+    outputs = [(None, first), (None, second)]
+    assert merge_entities(outputs) == second
+    assert merge_entities(outputs, policy="highest_score") == first
+    assert merge_entities(outputs, policy="priority") == first
+    assert merge_entities(outputs + [(None, second)], policy="union") == [
+        first[0],
+        second[0],
+        first[1],
+    ]
+    with pytest.raises(ValueError):
+        merge_entities(outputs, policy="invalid")
+
+
+@pytest.mark.parametrize("policy", ["longest", "highest_score", "priority"])
+def test_merge_policies_match_greedy_selection(policy):
+    """Test that the merge selects the entities greedily by their priority."""
+    rng = random.Random(42)
+    text = "x" * 200
+    keys = {
+        "longest": lambda e, s: (e.start_index - e.end_index, e.start_index),
+        "highest_score": lambda e, s: (
+            -e.score,
+            e.start_index - e.end_index,
+            e.start_index,
+        ),
+        "priority": lambda e, s: (s, e.start_index - e.end_index, e.start_index),
+    }
+    for _ in range(50):
+        outputs = []
+        for _ in range(rng.randint(2, 3)):
+            entities = []
+            for _ in range(rng.randint(0, 20)):
+                start = rng.randint(0, 190)
+                end = start + rng.randint(1, 10)
+                score = rng.choice([0.5, 0.8, 1.0])
+                entities.append(Entity(text[start:end], "x", start, end, score))
+            outputs.append((None, entities))
+
+        candidates = [(e, s) for s, (_, entities) in enumerate(outputs) for e in entities]
+        expected = []
+        for e, _ in sorted(candidates, key=lambda c: keys[policy](*c)):
+            if all(
+                e.end_index <= k.start_index or k.end_index <= e.start_index
+                for k in expected
+            ):
+                expected.append(e)
+        expected.sort(key=lambda e: e.start_index)
+
+        assert merge_entities(outputs, policy=policy) == expected
+        batch_outputs = [
+            (None, EntityBatch.from_entities(entities, text))
+            for _, entities in outputs
+        ]
+        assert merge_entities(batch_outputs, policy=policy).to_entities() == expected
+
+
+def test_merge_policies_large_group():
+    """Test the selection in a large group of transitively overlapping entities."""
+    text = "x" * 3000
+    # each entity overlaps its neighbours, the later entities score higher
+    entities = [
+        Entity(text[2 * i : 2 * i + 3], "x", 2 * i, 2 * i + 3, score=i / 1000)
+        for i in range(1000)
+    ]
+    outputs = [(None, entities[::2]), (None, entities[1::2])]
+    merged = merge_entities(outputs, policy="highest_score")
+    assert merged == entities[1::2]
+
+
+# =====================================
+# Test anonymize
+# =====================================
+
+
+def test_anonymize_entity_batch():
+    """Test that the entity batch replacements match the list replacements."""
+    text = "John Doe was born on 2000-01-01."
+    batch = EntityBatch.from_entities(
+        [Entity("2000-01-01", "date", 21, 31), Entity("John Doe", "name", 0, 8)],
+        text,
+    ).with_anonymized_texts(["[DATE]", "[NAME]"])
+    anonymized_text, replacements = anonymize(text, batch)
+    expected_text, expected_replacements = anonymize(text, batch.to_replacements())
+    assert anonymized_text == expected_text == "[NAME] was born on [DATE]."
+    assert replacements.to_replacements() == expected_replacements
+
+
+def test_anonymize_overlapping_replacements():
+    """Test that the overlapping replacements raise ValueError."""
+    text = "Call John Doe Smith today."
+    entities = [
+        Entity("John Doe", "name", 5, 13),
+        Entity("John Doe Smith", "name", 5, 19),
+    ]
+    batch = EntityBatch.from_entities(entities, text).with_anonymized_texts(
+        ["[NAME]", "[NAME]"]
+    )
+    with pytest.raises(ValueError):
+        anonymize(text, batch.to_replacements())
+    with pytest.raises(ValueError):
+        anonymize(text, batch)
+    # the adjacent replacements do not overlap
+    adjacent = [
+        {"start_index": 0, "end_index": 4, "anonymized_text": "[A]"},
+        {"start_index": 4, "end_index": 5, "anonymized_text": "[B]"},
+    ]
+    assert anonymize(text, adjacent)[0] == "[A][B]John Doe Smith today."
+
+
+# =====================================
+# Test create_label_index
+# =====================================
+
+
+def test_create_label_index():
+    """Test that the label index maps labels to their attributes."""
+    labels = [
+        {"label": "name", "type": "string", "regex": ".*"},
+        {"label": "ssn", "type": "custom", "regex": r"\d{3}-\d{2}-\d{4}"},
+        {"label": "symptom", "type": "string", "pattern": [[{"LOWER": "pain"}]]},
+    ]
+    label_index = create_label_index(labels)
+    assert set(label_index.keys()) == {"name", "ssn", "symptom"}
+    assert label_index["ssn"]["type"] == "custom"
+    assert label_index["ssn"]["compiled_regex"] is compile_regex(r"\d{3}-\d{2}-\d{4}")
+    assert label_index["symptom"]["compiled_regex"] is None
+
+
+def test_create_label_index_keeps_first_definition():
+    """Test that the first definition of a duplicated label is used."""
+    labels = [
+        {"label": "name", "type": "string", "regex": "first"},
+        {"label": "name", "type": "string", "regex": "second"},
+    ]
+    assert create_label_index(labels)["name"]["regex"] == "first"
@@ -0,0 +1,187 @@
+"""Tests for anonipy.utils.instrumentation."""
+
+import threading
+import warnings
+
+import pytest
+
+from anonipy.anonymize.extractors import PatternExtractor
+from anonipy.anonymize.pipeline import Pipeline
+from anonipy.anonymize.strategies import PseudonymizationStrategy
+from anonipy.utils.instrumentation import (
+    Instrumentation,
+    OpenTelemetryExporter,
+    SpanRecorder,
+    instrumentation,
+)
+
+# =====================================
+# Test Instrumentation
+# =====================================
+
+
+def test_stage_stats():
+    """Test that the stages are aggregated by their name."""
+    registry = Instrumentation(enabled=True)
+    for i in range(3):
+        with registry.stage("extract", chunks=2) as stage:
+            stage.add("entities", i)
+    with registry.stage("write"):
+        pass
+
+    stats = registry.get_stats()
+    assert set(stats) == {"extract", "write"}
+    assert stats["extract"]["calls"] == 3
+    assert stats["extract"]["chunks"] == 6
+    assert stats["extract"]["entities"] == 3
+    assert 0 <= stats["extract"]["min_s"] <= stats["extract"]["max_s"]
+    assert stats["extract"]["mean_s"] == pytest.approx(stats["extract"]["total_s"] / 3)
+
+
+def test_disabled():
+    """Test that the disabled registry records nothing."""
+    registry = Instrumentation()
+    with registry.stage("extract") as stage:
+        stage.add("entities", 5)
+    assert registry.get_stats() == {}
+    # the disabled stages are shared
+    assert registry.stage("a") is registry.stage("b")
+
+
+def test_collect():
+    """Test that collecting resets the stats and restores the enabled state."""
+    registry = Instrumentation()
+    with registry.collect():
+        with registry.stage("extract"):
+            pass
+    assert not registry.enabled
+    assert registry.get_stats()["extract"]["calls"] == 1
+
+    with registry.collect():
+        pass
+    assert registry.get_stats() == {}
+
+
+def test_merge():
+    """Test merging the statistics of multiple runs."""
+    first, second = Instrumentation(enabled=True), Instrumentation(enabled=True)
+    with first.stage("extract", entities=2):
+        pass
+    with second.stage("extract", entities=3):
+        pass
+    with second.stage("write", bytes=100):
+        pass
+
+    merged = Instrumentation()
+    merged.merge(first.get_stats())
+    merged.merge(second.get_stats())
+    stats = merged.get_stats()
+    assert stats["extract"]["calls"] == 2
+    assert stats["extract"]["entities"] == 5
+    assert stats["extract"]["min_s"] == min(
+        first.get_stats()["extract"]["min_s"], second.get_stats()["extract"]["min_s"]
+    )
+    assert stats["write"] == {**second.get_stats()["write"]}
+
+
+def test_threads():
+    """Test that the stages of multiple threads are all recorded."""
+    registry = Instrumentation(enabled=True)
+
+    def work():
+        for _ in range(100):
+            with registry.stage("work") as stage:
+                stage.add("items")
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert registry.get_stats()["work"]["calls"] == 400
+    assert registry.get_stats()["work"]["items"] == 400
+
+
+def test_span_recorder():
+    """Test that the spans are nested and record the errors."""
+    recorder = SpanRecorder()
+    registry = Instrumentation(enabled=True, exporters=[recorder])
+    with registry.stage("pipeline", files=1):
+        with registry.stage("extract") as stage:
+            stage.add("entities", 2)
+    with pytest.raises(RuntimeError):
+        with registry.stage("write"):
+            raise RuntimeError("disk full")
+
+    extract, pipeline, write = recorder.spans
+    assert extract["name"] == "extract"
+    assert extract["parent_id"] == pipeline["span_id"]
+    assert pipeline["parent_id"] is None
+    assert extract["attributes"] == {"entities": 2}
+    assert pipeline["start_time_unix_nano"] <= extract["start_time_unix_nano"]
+    assert extract["end_time_unix_nano"] <= pipeline["end_time_unix_nano"]
+    assert write["status"] == "ERROR"
+    # the failed stages are also aggregated
+    assert registry.get_stats()["write"]["calls"] == 1
+
+    recorder.clear()
+    assert recorder.spans == []
+
+
+def test_opentelemetry_exporter():
+    """Test exporting the stages to the OpenTelemetry tracer."""
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    registry = Instrumentation(
+        enabled=True,
+        exporters=[OpenTelemetryExporter(provider.get_tracer("test"))],
+    )
+    with registry.stage("pipeline"):
+        with registry.stage("extract", entities=2):
+            pass
+
+    extract, pipeline = exporter.get_finished_spans()
+    assert extract.name == "extract"
+    assert extract.attributes["entities"] == 2
+    assert extract.parent.span_id == pipeline.context.span_id
+
+
+def test_pipeline_stages(tmp_path):
+    """Test that the pipeline records the per-stage statistics."""
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    for i in range(3):
+        (input_dir / f"file{i}.txt").write_text(
+            f"Sent on 2024-01-0{i + 1} and 2024-02-0{i + 1}.", encoding="utf-8"
+        )
+    extractor = PatternExtractor(
+        [{"label": "date", "type": "date", "regex": r"\d{4}-\d{2}-\d{2}"}]
+    )
+    strategy = PseudonymizationStrategy(mapping=lambda text, entity: "2000-01-01")
+    pipeline = Pipeline(extractor, strategy)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        with instrumentation.collect():
+            pipeline.anonymize(str(input_dir), str(tmp_path / "output"))
+    stats = instrumentation.get_stats()
+    instrumentation.reset()
+
+    assert stats["pipeline.read"]["files"] == 3
+    assert stats["pipeline.read"]["bytes"] == sum(
+        f.stat().st_size for f in input_dir.iterdir()
+    )
+    assert stats["pipeline.extract"]["entities"] == 6
+    assert stats["pipeline.anonymize"]["replacements"] == 6
+    assert stats["pipeline.write"]["files"] == 3
+    assert stats["pattern.match"]["entities"] == 6
+    assert stats["strategy.mapping"]["replacements"] == 6
+    assert not instrumentation.enabled
@@ -128,3 +128,80 @@ def test_detect_ukrainian(language_detector):
     assert language[0] == "uk"
     assert language[1] == "Ukrainian"
     assert language == LANGUAGES.UKRAINIAN
+
+
+def test_detect_undetectable():
+    """Test that the undetectable language is returned as None."""
+    language_detector = LanguageDetector(low_accuracy=True)
+    assert language_detector.detect("") == (None, None)
+
+
+def test_detect_batch():
+    """Test that the batch detection matches the single text detection."""
+    language_detector = LanguageDetector(low_accuracy=True)
+    texts = [
+        "This test verifies that the method is working correctly",
+        "Ta test preverja, ali metoda deluje pravilno",
+        "This test verifies that the method is working correctly",
+        "",
+    ]
+    languages = language_detector.detect_batch(texts)
+    assert languages == [language_detector.detect(text) for text in texts]
+    assert languages[:2] == [("en", "English"), ("sl", "Slovenian")]
+
+
+def test_detect_cache():
+    """Test that the repeated texts are served from the LRU cache."""
+    language_detector = LanguageDetector(low_accuracy=True, cache_size=2)
+    texts = [
+        "This test verifies that the method is working correctly",
+        "Ta test preverja, ali metoda deluje pravilno",
+        "Dieser Test prüft, ob die Methode korrekt funktioniert",
+    ]
+    language_detector.detect_batch(texts[:2] + texts[:1])
+    assert language_detector.stats == {"hits": 0, "misses": 2}
+    language_detector.detect(texts[0])
+    assert language_detector.stats["hits"] == 1
+    # the least recently used text is evicted
+    language_detector.detect(texts[2])
+    language_detector.detect(texts[1])
+    assert language_detector.stats == {"hits": 1, "misses": 4}
+
+    with pytest.raises(ValueError):
+        LanguageDetector(cache_size=-1)
+
+
+def test_detect_supported_only():
+    """Test that the detected languages are restricted to the supported ones."""
+    language_detector = LanguageDetector(low_accuracy=True, supported_only=True)
+    texts = [
+        "Tämä testi varmistaa, että menetelmä toimii oikein",
+        "This test verifies that the method is working correctly",
+    ]
+    for code, _ in language_detector.detect_batch(texts):
+        assert code in LANGUAGES.supported_languages()
+
+
+def test_detect_languages_subset():
+    """Test the detector of the language subset with the on-demand models."""
+    language_detector = LanguageDetector(
+        languages=[LANGUAGES.ENGLISH, "sl"], preload_models=False
+    )
+    assert language_detector.languages == ["en", "sl"]
+    assert language_detector.detect(
+        "Ta test preverja, ali metoda deluje pravilno"
+    ) == ("sl", "Slovenian")
+    language_detector.unload_models()
+    assert language_detector.detect_batch(
+        ["This test verifies that the method is working correctly"]
+    ) == [("en", "English")]
+
+    with pytest.raises(ValueError):
+        LanguageDetector(languages=["xx"])
+    with pytest.raises(ValueError):
+        LanguageDetector(languages=["en"], supported_only=True)
+    # at least two distinct languages are required
+    with pytest.raises(ValueError):
+        LanguageDetector(languages=["en"])
+    with pytest.raises(ValueError):
+        LanguageDetector(languages=[LANGUAGES.ENGLISH, "en"])
@@ -0,0 +1,143 @@
+"""Tests for anonipy.utils.memory."""
+
+import pytest
+
+from anonipy.utils.memory import (
+    AdaptiveBatcher,
+    get_memory_usage,
+    get_peak_memory_usage,
+    is_out_of_memory_error,
+    parse_memory_size,
+    reset_peak_memory_usage,
+)
+
+# =====================================
+# Test Memory Functions
+# =====================================
+
+
+def test_memory_usage():
+    """Test that the memory usage of the process is probed."""
+    reset_peak_memory_usage()
+    memory = get_memory_usage()
+    assert memory > 0
+    data = bytearray(50 * 1024**2)
+    assert get_peak_memory_usage() >= memory
+    del data
+
+
+@pytest.mark.parametrize(
+    "size, expected",
+    [
+        (1024, 1024),
+        ("1024", 1024),
+        ("1.5GB", 1_500_000_000),
+        ("512 MiB", 512 * 1024**2),
+        ("2gib", 2 * 1024**3),
+    ],
+)
+def test_parse_memory_size(size, expected):
+    """Test the parsing of the memory sizes."""
+    assert parse_memory_size(size) == expected
+
+
+@pytest.mark.parametrize("size", ["", "GB", "1 PB", "-1GB", 0, -5])
+def test_parse_memory_size_invalid(size):
+    """Test that the invalid memory sizes raise ValueError."""
+    with pytest.raises(ValueError):
+        parse_memory_size(size)
+
+
+def test_is_out_of_memory_error():
+    """Test the detection of the out-of-memory errors."""
+    assert is_out_of_memory_error(MemoryError())
+    assert is_out_of_memory_error(RuntimeError("CUDA out of memory. Tried to ..."))
+    assert is_out_of_memory_error(
+        RuntimeError("DefaultCPUAllocator: can't allocate memory")
+    )
+    assert not is_out_of_memory_error(RuntimeError("shape mismatch"))
+    assert not is_out_of_memory_error(ValueError("out of memory"))
+
+
+# =====================================
+# Test AdaptiveBatcher
+# =====================================
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"memory_budget": 0},
+        {"memory_budget": "1GB", "batch_size": 0},
+        {"memory_budget": "1GB", "batch_size": 8, "max_batch_size": 4},
+        {"memory_budget": "1GB", "batch_size": 2, "min_batch_size": 4},
+        {"memory_budget": "1GB", "backoff": 1},
+    ],
+)
+def test_init_invalid(kwargs):
+    """Test that the invalid arguments raise ValueError."""
+    with pytest.raises(ValueError):
+        AdaptiveBatcher(**kwargs)
+
+
+def test_map_grows():
+    """Test that the batch size grows while under the memory budget."""
+    batcher = AdaptiveBatcher(2**50, max_batch_size=16)
+    sizes = []
+
+    def process(batch):
+        sizes.append(len(batch))
+        return [item * 2 for item in batch]
+
+    assert list(batcher.map(process, list(range(100)))) == [i * 2 for i in range(100)]
+    assert sizes[:5] == [1, 2, 4, 8, 16]
+    assert max(sizes) == 16
+    assert batcher.stats["items"] == 100
+    assert batcher.stats["batches"] == len(sizes)
+
+
+def test_map_over_budget():
+    """Test that the batch size backs off when the budget is exceeded."""
+    batcher = AdaptiveBatcher(1, batch_size=8)
+    outputs = list(batcher.map(lambda batch: batch, list(range(20))))
+    assert outputs == list(range(20))
+    assert batcher.batch_size == 1
+    assert batcher.stats["backoffs"] > 0
+
+
+def test_map_out_of_memory():
+    """Test that the batches running out of memory are retried."""
+    batcher = AdaptiveBatcher(2**50, batch_size=16)
+    sizes = []
+
+    def process(batch):
+        sizes.append(len(batch))
+        if len(batch) > 3:
+            raise RuntimeError("CUDA out of memory.")
+        return batch
+
+    assert list(batcher.map(process, list(range(100)))) == list(range(100))
+    # the batch size does not grow back to the sizes that ran out of memory
+    assert sizes[:5] == [16, 8, 4, 2, 3]
+    assert set(sizes[5:-1]) == {3}
+    assert batcher.stats["backoffs"] == 3
+
+
+def test_map_errors():
+    """Test that the other errors and the minimum batch errors are raised."""
+
+    def fail(batch):
+        raise MemoryError()
+
+    with pytest.raises(MemoryError):
+        list(AdaptiveBatcher(2**50, batch_size=4).map(fail, list(range(10))))
+
+    with pytest.raises(KeyError):
+        list(
+            AdaptiveBatcher(2**50, batch_size=4).map(
+                lambda batch: {}[0], list(range(10))
+            )
+        )
+
+    with pytest.raises(ValueError):
+        list(AdaptiveBatcher(2**50).map(lambda batch: [], list(range(10))))
@@ -1,13 +1,17 @@
 """Tests for anonipy.anonymize.pipeline."""
 
 import os
+import csv
+import json
+import time
 import shutil
 import warnings
 
 import pytest
 from transformers import logging
 
-from anonipy.anonymize.pipeline import Pipeline
+from anonipy.anonymize import pipeline as pipeline_module
+from anonipy.anonymize.pipeline import Pipeline, get_shard
 from anonipy.anonymize.extractors import NERExtractor, PatternExtractor, MultiExtractor
 from anonipy.anonymize.strategies import RedactionStrategy
 from anonipy.constants import LANGUAGES
@@ -132,3 +136,342 @@ def test_anonymize_invalid_output_dir(setup):
     pipeline = Pipeline(multi_extractor, strategy)
     with pytest.raises(ValueError):
         pipeline.anonymize(input_dir, input_dir)
+
+
+def test_init_invalid_chunk_size():
+    """Test that a non-positive chunk size raises ValueError."""
+    extractor = PatternExtractor(
+        [{"label": "DATE", "type": "regex", "regex": r"\d{4}-\d{2}-\d{2}"}]
+    )
+    with pytest.raises(ValueError):
+        Pipeline(extractor, RedactionStrategy(), chunk_size=0)
+
+
+def test_anonymize_stream(tmp_path):
+    """Test that streamed files match the files anonymized whole."""
+    extractor = PatternExtractor(
+        [{"label": "DATE", "type": "regex", "regex": r"\d{4}-\d{2}-\d{2}"}]
+    )
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    lines = [f"Line {i} was logged on 2024-01-{i % 28 + 1:02d}.\n" for i in range(200)]
+    (input_dir / "log.txt").write_text("".join(lines), encoding="utf-8")
+    (input_dir / "empty.txt").write_text("No dates here.\n" * 100, encoding="utf-8")
+
+    whole = Pipeline(extractor, RedactionStrategy())
+    streamed = Pipeline(extractor, RedactionStrategy(), chunk_size=256)
+    assert streamed._is_streamed(str(input_dir / "log.txt"))
+
+    whole_mapping = whole.anonymize(str(input_dir), str(tmp_path / "whole"))
+    streamed_mapping = streamed.anonymize(str(input_dir), str(tmp_path / "streamed"))
+
+    assert len(streamed_mapping) == len(whole_mapping) == 1
+    (whole_file,) = (tmp_path / "whole").iterdir()
+    (streamed_file,) = (tmp_path / "streamed").iterdir()
+    assert streamed_file.name == whole_file.name
+    assert streamed_file.read_text(encoding="utf-8") == whole_file.read_text(
+        encoding="utf-8"
+    )
+    assert "2024-01-01" not in streamed_file.read_text(encoding="utf-8")
+
+
+def _create_corpus(input_dir):
+    """Create the input directory with dated and undated files."""
+    for i in range(12):
+        folder = input_dir / f"folder{i % 3}"
+        folder.mkdir(parents=True, exist_ok=True)
+        text = f"Report {i} was filed on 2024-01-{i + 1:02d}.\n"
+        if i % 5 == 0:
+            text = f"Report {i} has no date.\n"
+        (folder / f"report{i}.txt").write_text(text, encoding="utf-8")
+
+
+def test_get_shard():
+    """Test that the shard assignment is deterministic and within range."""
+    paths = [f"folder/file{i}.txt" for i in range(100)]
+    shards = [get_shard(path, 4) for path in paths]
+    assert shards == [get_shard(path, 4) for path in paths]
+    assert set(shards) == {0, 1, 2, 3}
+    assert get_shard("folder/file.txt", 1) == 0
+    assert get_shard(os.path.join("folder", "file.txt"), 4) == get_shard(
+        "folder/file.txt", 4
+    )
+
+
+def test_anonymize_invalid_shards(tmp_path):
+    """Test that invalid shard and workers arguments raise ValueError."""
+    extractor = PatternExtractor(
+        [{"label": "DATE", "type": "regex", "regex": r"\d{4}-\d{2}-\d{2}"}]
+    )
+    pipeline = Pipeline(extractor, RedactionStrategy())
+    _create_corpus(tmp_path / "input")
+    for kwargs in [
+        {"shard_count": 0},
+        {"shard_index": 2, "shard_count": 2},
+        {"shard_index": -1, "shard_count": 2},
+        {"workers": 0},
+    ]:
+        with pytest.raises(ValueError):
+            pipeline.anonymize(str(tmp_path / "input"), str(tmp_path / "out"), **kwargs)
+
+
+@pytest.mark.parametrize("flatten", [False, True])
+def test_anonymize_shards(tmp_path, flatten):
+    """Test that the shards are disjoint and their mappings can be merged."""
+    extractor = PatternExtractor(
+        [{"label": "DATE", "type": "regex", "regex": r"\d{4}-\d{2}-\d{2}"}]
+    )
+    pipeline = Pipeline(extractor, RedactionStrategy())
+    input_dir = tmp_path / "input"
+    _create_corpus(input_dir)
+
+    # the reference run uses the same numbering as the shards
+    reference = pipeline.anonymize(
+        str(input_dir), str(tmp_path / "reference" / "output"), flatten, workers=4
+    )
+    assert len(reference) == 9
+
+    merged = {}
+    for shard_index in range(3):
+        mapping = pipeline.anonymize(
+            str(input_dir),
+            str(tmp_path / f"node{shard_index}" / "output"),
+            flatten,
+            shard_index=shard_index,
+            shard_count=3,
+        )
+        assert not set(mapping) & set(merged)
+        merged.update(mapping)
+
+    assert merged == reference
+    assert len(set(merged.values())) == len(merged)
+    for original, anonymized in reference.items():
+        shard_index = get_shard(os.path.relpath(original, "input"), 3)
+        shard_file = tmp_path / f"node{shard_index}" / anonymized
+        reference_file = tmp_path / "reference" / anonymized
+        assert shard_file.read_text(encoding="utf-8") == reference_file.read_text(
+            encoding="utf-8"
+        )
+
+
+def test_anonymize_workers(tmp_path):
+    """Test that the workers anonymize the files as the sequential run."""
+    extractor = PatternExtractor(
+        [{"label": "DATE", "type": "regex", "regex": r"\d{4}-\d{2}-\d{2}"}]
+    )
+    pipeline = Pipeline(extractor, RedactionStrategy())
+    input_dir = tmp_path / "input"
+    _create_corpus(input_dir)
+
+    sequential = pipeline.anonymize(str(input_dir), str(tmp_path / "sequential"))
+    parallel = pipeline.anonymize(str(input_dir), str(tmp_path / "parallel"), workers=3)
+
+    assert set(sequential) == set(parallel)
+    for original in sequential:
+        sequential_file = tmp_path / sequential[original]
+        parallel_file = tmp_path / parallel[original]
+        assert sequential_file.read_text(encoding="utf-8") == parallel_file.read_text(
+            encoding="utf-8"
+        )
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_anonymize_report(tmp_path, workers):
+    """Test that the run report records the files and is saved as JSON."""
+    extractor = PatternExtractor(
+        [{"label": "DATE", "type": "regex", "regex": r"\d{4}-\d{2}-\d{2}"}]
+    )
+    pipeline = Pipeline(extractor, RedactionStrategy())
+    input_dir = tmp_path / "input"
+    _create_corpus(input_dir)
+    (input_dir / "blank.txt").write_text("  \n", encoding="utf-8")
+    report_path = tmp_path / "report.json"
+
+    mapping = pipeline.anonymize(
+        str(input_dir),
+        str(tmp_path / "output"),
+        workers=workers,
+        report_path=str(report_path),
+    )
+
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    summary = report["summary"]
+    assert summary["files"] == len(report["files"]) == 13
+    assert summary["anonymized"] == len(mapping) == 9
+    assert summary["skipped"] == 4
+    assert summary["skip_reasons"] == {"empty": 1, "no_entities": 3}
+    assert summary["entities"] == summary["entities_per_label"]["DATE"] == 9
+    assert summary["docs_per_s"] > 0 and summary["mb_per_s"] > 0
+    records = {record["file"]: record for record in report["files"]}
+    record = records[os.path.join("folder1", "report1.txt")]
+    assert record["status"] == "anonymized"
+    assert record["entities_per_label"] == {"DATE": 1}
+    assert record["size_bytes"] == os.path.getsize(
+        input_dir / "folder1" / "report1.txt"
+    )
+    assert record["total_s"] >= record["extract_s"] + record["write_s"] > 0
+    assert records["blank.txt"]["skip_reason"] == "empty"
+    assert pipeline.report.get_summary()["files"] == 13
+
+
+def test_anonymize_report_stream(tmp_path):
+    """Test that the run report records the streamed files as CSV."""
+    extractor = PatternExtractor(
+        [{"label": "DATE", "type": "regex", "regex": r"\d{4}-\d{2}-\d{2}"}]
+    )
+    pipeline = Pipeline(extractor, RedactionStrategy(), chunk_size=256)
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    lines = [f"Line {i} was logged on 2024-01-{i % 28 + 1:02d}.\n" for i in range(50)]
+    (input_dir / "log.txt").write_text("".join(lines), encoding="utf-8")
+    report_path = tmp_path / "report.csv"
+
+    pipeline.anonymize(
+        str(input_dir), str(tmp_path / "output"), report_path=str(report_path)
+    )
+
+    with open(report_path, encoding="utf-8", newline="") as f:
+        (row,) = list(csv.DictReader(f))
+    assert row["file"] == "log.txt"
+    assert row["status"] == "anonymized"
+    assert int(row["entities"]) == 50
+    assert json.loads(row["entities_per_label"]) == {"DATE": 50}
+    assert float(row["stream_s"]) > 0
+
+
+def test_anonymize_invalid_report_path(tmp_path):
+    """Test that an unsupported report format raises ValueError."""
+    extractor = PatternExtractor(
+        [{"label": "DATE", "type": "regex", "regex": r"\d{4}-\d{2}-\d{2}"}]
+    )
+    pipeline = Pipeline(extractor, RedactionStrategy())
+    _create_corpus(tmp_path / "input")
+    with pytest.raises(ValueError):
+        pipeline.anonymize(
+            str(tmp_path / "input"), str(tmp_path / "out"), report_path="report.txt"
+        )
+
+
+class _LimitedPatternExtractor(PatternExtractor):
+    """Pattern extractor running out of memory on batches above the limit."""
+
+    def __init__(self, *args, limit=2, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.limit = limit
+        self.batch_sizes = []
+
+    def batch(self, texts, *args, **kwargs):
+        self.batch_sizes.append(len(texts))
+        if len(texts) > self.limit:
+            raise MemoryError()
+        return super().batch(texts, *args, **kwargs)
+
+
+def test_anonymize_memory_budget(tmp_path):
+    """Test that the batched extraction backs off and matches the sequential run."""
+    labels = [{"label": "DATE", "type": "regex", "regex": r"\d{4}-\d{2}-\d{2}"}]
+    extractor = _LimitedPatternExtractor(labels, limit=2)
+    input_dir = tmp_path / "input"
+    _create_corpus(input_dir)
+
+    sequential = Pipeline(PatternExtractor(labels), RedactionStrategy()).anonymize(
+        str(input_dir), str(tmp_path / "sequential")
+    )
+    pipeline = Pipeline(extractor, RedactionStrategy(), memory_budget="64GB")
+    pipeline.batcher.batch_size = 8
+    batched = pipeline.anonymize(str(input_dir), str(tmp_path / "batched"))
+
+    assert batched.keys() == sequential.keys()
+    for original in sequential:
+        assert (tmp_path / batched[original]).read_text(encoding="utf-8") == (
+            tmp_path / sequential[original]
+        ).read_text(encoding="utf-8")
+    # the batch size backs off and does not grow back to the failed sizes
+    assert extractor.batch_sizes[:4] == [8, 4, 2, 3]
+    assert max(extractor.batch_sizes[4:]) == 2
+    assert pipeline.batcher.stats["backoffs"] == 3
+    assert pipeline.report.get_summary()["anonymized"] == 9
+
+
+def test_anonymize_memory_budget_retry_report(tmp_path, monkeypatch):
+    """Test that the retried batches do not add the read time twice."""
+    open_file = pipeline_module.open_file
+
+    def slow_open_file(*args, **kwargs):
+        time.sleep(0.05)
+        return open_file(*args, **kwargs)
+
+    monkeypatch.setattr(pipeline_module, "open_file", slow_open_file)
+    labels = [{"label": "DATE", "type": "regex", "regex": r"\d{4}-\d{2}-\d{2}"}]
+    pipeline = Pipeline(
+        _LimitedPatternExtractor(labels, limit=2),
+        RedactionStrategy(),
+        memory_budget="64GB",
+    )
+    pipeline.batcher.batch_size = 8
+    _create_corpus(tmp_path / "input")
+
+    pipeline.anonymize(str(tmp_path / "input"), str(tmp_path / "output"))
+
+    assert pipeline.batcher.stats["backoffs"] > 0
+    # the files of the retried batches are read more than once
+    for record in pipeline.report.files:
+        assert 0.05 <= record["read_s"] < 0.1
+        assert record["total_s"] >= record["read_s"]
+
+
+class _FailingPatternExtractor(PatternExtractor):
+    """Pattern extractor failing on the texts containing the marker."""
+
+    def __init__(self, *args, marker="Report 3 ", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.marker = marker
+
+    def __call__(self, text, *args, **kwargs):
+        if self.marker in text:
+            raise RuntimeError("the extractor failed")
+        return super().__call__(text, *args, **kwargs)
+
+    def batch(self, texts, *args, **kwargs):
+        if any(self.marker in text for text in texts):
+            raise RuntimeError("the extractor failed")
+        return super().batch(texts, *args, **kwargs)
+
+
+def test_anonymize_memory_budget_error_isolated(tmp_path):
+    """Test that a failing file does not fail the other files of the batch."""
+    labels = [{"label": "DATE", "type": "regex", "regex": r"\d{4}-\d{2}-\d{2}"}]
+    pipeline = Pipeline(
+        _FailingPatternExtractor(labels), RedactionStrategy(), memory_budget="64GB"
+    )
+    pipeline.batcher.batch_size = 16
+    _create_corpus(tmp_path / "input")
+
+    mapping = pipeline.anonymize(str(tmp_path / "input"), str(tmp_path / "output"))
+
+    summary = pipeline.report.get_summary()
+    assert summary["failed"] == 1
+    assert summary["anonymized"] == len(mapping) == 8
+    records = {record["file"]: record for record in pipeline.report.files}
+    record = records[os.path.join("folder0", "report3.txt")]
+    assert record["skip_reason"] == "error: the extractor failed"
+
+
+def test_anonymize_memory_budget_failed(tmp_path):
+    """Test that the files running out of memory are skipped."""
+    labels = [{"label": "DATE", "type": "regex", "regex": r"\d{4}-\d{2}-\d{2}"}]
+    pipeline = Pipeline(
+        _LimitedPatternExtractor(labels, limit=0),
+        RedactionStrategy(),
+        memory_budget=2**40,
+    )
+    _create_corpus(tmp_path / "input")
+
+    mapping = pipeline.anonymize(str(tmp_path / "input"), str(tmp_path / "output"))
+
+    assert mapping == {}
+    summary = pipeline.report.get_summary()
+    assert summary["failed"] == 12
+    assert sum(summary["skip_reasons"].values()) == 12
+    with pytest.raises(ValueError):
+        pipeline.anonymize(str(tmp_path / "input"), str(tmp_path / "out"), workers=2)
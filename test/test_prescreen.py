@@ -0,0 +1,109 @@
+"""Tests for anonipy.utils.prescreen."""
+
+import pytest
+
+from anonipy.definitions import Entity
+from anonipy.utils.prescreen import PreScreener
+
+# =====================================
+# Test Data
+# =====================================
+
+TEST_SAMPLES = [
+    ("The order has been shipped.", []),
+    ("Your request was processed successfully.", []),
+    (
+        "Please contact John Doe.",
+        [Entity("John Doe", "name", 15, 23, 1.0, "string")],
+    ),
+    (
+        "Born on 15-01-1985.",
+        [Entity("15-01-1985", "date", 8, 18, 1.0, "date")],
+    ),
+]
+
+# =====================================
+# Test PreScreener
+# =====================================
+
+
+@pytest.fixture
+def prescreen():
+    return PreScreener(lexicon=["patient", "date of birth"])
+
+
+def test_init_invalid_min_recall():
+    """Test that an invalid recall guard raises ValueError."""
+    with pytest.raises(ValueError):
+        PreScreener(min_recall=1.5)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("The order has been shipped.", False),
+        ("Everything works as expected. Thanks!", False),
+        ("Please contact John Doe.", True),
+        ("Call me at 555 0100.", True),
+        ("Write to someone at example dot com or @handle.", True),
+        ("the PATIENT was discharged.", True),
+        ("state your date of birth.", True),
+        ("Patients are welcome.", False),
+    ],
+)
+def test_may_contain_entities(prescreen, text, expected):
+    """Test the pre-screen heuristics."""
+    assert prescreen.may_contain_entities(text) == expected
+
+
+def test_min_digits():
+    """Test that texts with few digits are skipped when min_digits is raised."""
+    prescreen = PreScreener(min_digits=4)
+    assert not prescreen.may_contain_entities("version 2 is out.")
+    assert prescreen.may_contain_entities("the code is 1234.")
+
+
+def test_min_capitalized_disabled():
+    """Test that capitalization is ignored when min_capitalized is 0."""
+    prescreen = PreScreener(min_capitalized=0)
+    assert not prescreen.may_contain_entities("Please contact John Doe.")
+
+
+def test_screen_stats(prescreen):
+    """Test the skip counters."""
+    for text, _ in TEST_SAMPLES:
+        prescreen(text)
+    assert prescreen.stats == {"screened": 4, "skipped": 2}
+    assert prescreen.skip_rate == 0.5
+    prescreen.reset_stats()
+    assert prescreen.stats == {"screened": 0, "skipped": 0}
+    assert prescreen.skip_rate == 0.0
+
+
+def test_evaluate(prescreen):
+    """Test the evaluation on a labeled sample."""
+    results = prescreen.evaluate(TEST_SAMPLES)
+    assert results == {
+        "samples": 4,
+        "skipped": 2,
+        "skip_rate": 0.5,
+        "entities": 2,
+        "missed_entities": 0,
+        "recall": 1.0,
+        "enabled": True,
+    }
+
+
+def test_evaluate_recall_guard():
+    """Test that the pre-screen is disabled when the recall is too low."""
+    prescreen = PreScreener(min_recall=0.9)
+    samples = TEST_SAMPLES + [
+        ("please contact john.", [Entity("john", "name", 15, 19, 1.0, "string")])
+    ]
+    with pytest.warns(UserWarning):
+        results = prescreen.evaluate(samples)
+    assert results["missed_entities"] == 1
+    assert results["recall"] == pytest.approx(2 / 3)
+    assert not prescreen.enabled
+    assert prescreen("The order has been shipped.")
+    assert prescreen.skip_rate == 0.0
@@ -1,5 +1,7 @@
 """Tests for anonipy.utils.regex."""
 
+import re
+
 import pytest
 
 from anonipy.utils.regex import (
@@ -12,6 +14,10 @@ from anonipy.utils.regex import (
     REGEX_EMAIL_ADDRESS,
     REGEX_PHONE_NUMBER,
     REGEX_WEBSITE_URL,
+    DateMatcher,
+    date_matcher,
+    compile_regex,
+    get_regex_group,
 )
 from anonipy.constants import ENTITY_TYPES
 
@@ -68,3 +74,89 @@ def test_regex_mapping(test_case):
 def test_unknown_type_returns_default():
     """Test that an unknown type returns the default '.*' regex."""
     assert regex_mapping["nonexistent_type_xyz"] == ".*"
+
+
+@pytest.mark.parametrize("test_case", TEST_CASES)
+def test_regex_mapping_get_compiled(test_case):
+    """Test that entity types map to the compiled regex."""
+    compiled = regex_mapping.get_compiled(test_case["entity"])
+    assert compiled is compile_regex(test_case["regex"])
+    assert compiled.pattern == test_case["regex"]
+
+
+# =====================================
+# Test Regex Compilers
+# =====================================
+
+
+def test_compile_regex_cached():
+    """Test that compile_regex returns the same cached object."""
+    assert compile_regex(r"\d{3}") is compile_regex(r"\d{3}")
+    assert isinstance(compile_regex(r"\d{3}"), re.Pattern)
+
+
+def test_compile_regex_date():
+    """Test that REGEX_DATE compiles to the date matcher."""
+    assert compile_regex(REGEX_DATE) is date_matcher
+
+
+def test_compile_regex_pattern_passthrough():
+    """Test that compiled regexes are returned as is."""
+    pattern = re.compile(r"\w+")
+    assert compile_regex(pattern) is pattern
+
+
+@pytest.mark.parametrize(
+    "regex, expected",
+    [("Person: (.*)", ".*"), (".*", ".*"), (re.compile(r"(\d+)-x"), r"\d+")],
+)
+def test_get_regex_group(regex, expected):
+    """Test that get_regex_group returns the first group content."""
+    assert get_regex_group(regex) == expected
+
+
+# =====================================
+# Test Date Matcher
+# =====================================
+
+DATE_TEXTS = [
+    "Date of Birth: 15-01-1985\nDate of Examination: 20-05-2024",
+    "The meeting is on Saturday, June 17, 2023 02:30 PM in the office.",
+    "Termin: Samstag, 17. Juni 2023 14:30 und 12345-06-17 nicht.",
+    "El 17 de junio de 2023 y el sábado, 1 de julio de 2023.",
+    "Зустріч відбудеться 17 червня 2023 року о 14:30.",
+    "Σάββατο, 17 Ιουνίου 2023 και 2023/06/17 14:30:00",
+    "No dates here, only the number 0123456789 and 2023.",
+    "",
+]
+
+
+def test_date_matcher_init():
+    """Test that date_matcher is a DateMatcher instance."""
+    assert isinstance(date_matcher, DateMatcher)
+    assert date_matcher.pattern == REGEX_DATE
+
+
+@pytest.mark.parametrize("text", DATE_TEXTS)
+def test_date_matcher_finditer_equals_regex(text):
+    """Test that date_matcher.finditer returns the same matches as REGEX_DATE."""
+    expected = [(m.span(), m.span(1)) for m in re.finditer(REGEX_DATE, text)]
+    result = [(m.span(), m.span(1)) for m in date_matcher.finditer(text)]
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "text", ["17 June 2023", "2023-06-17 14:30", "June", "x 2023-06-17", ""]
+)
+def test_date_matcher_match_equals_regex(text):
+    """Test that date_matcher.match returns the same match as REGEX_DATE."""
+    expected = re.match(REGEX_DATE, text)
+    result = date_matcher.match(text)
+    assert (result and result.span()) == (expected and expected.span())
+
+
+def test_date_matcher_search():
+    """Test that date_matcher.search returns the first date."""
+    match = date_matcher.search("Born on 17 June 2023.")
+    assert match.group(0) == "17 June 2023"
+    assert date_matcher.search("No dates here.") is None
@@ -0,0 +1,84 @@
+"""Tests for anonipy.definitions.Replacement."""
+
+import json
+import pickle
+
+import pytest
+
+from anonipy.definitions import Entity, Replacement
+from anonipy.anonymize.strategies import (
+    MaskingStrategy,
+    PseudonymizationStrategy,
+    RedactionStrategy,
+)
+from anonipy.utils.file_system import write_json
+
+# =====================================
+# Test Replacement
+# =====================================
+
+
+@pytest.fixture
+def replacement():
+    return Replacement(
+        original_text="John Doe",
+        label="name",
+        start_index=0,
+        end_index=8,
+        anonymized_text="[NAME]",
+    )
+
+
+def test_is_dict(replacement):
+    """Test that the replacement is a dictionary with the given items."""
+    expected = {
+        "original_text": "John Doe",
+        "label": "name",
+        "start_index": 0,
+        "end_index": 8,
+        "anonymized_text": "[NAME]",
+    }
+    assert isinstance(replacement, dict)
+    assert replacement == expected
+    assert list(replacement) == list(expected)
+    assert replacement.copy() == expected
+    replacement.update(anonymized_text="[REDACTED]")
+    assert replacement["anonymized_text"] == "[REDACTED]"
+
+
+def test_optional_keys():
+    """Test that the unset optional keys are not present."""
+    replacement = Replacement(start_index=0, end_index=8, anonymized_text="[NAME]")
+    assert replacement == {
+        "start_index": 0,
+        "end_index": 8,
+        "anonymized_text": "[NAME]",
+    }
+    with pytest.raises(KeyError):
+        replacement["label"]
+
+
+def test_slots_and_pickle(replacement):
+    """Test that the replacement is slotted and can be pickled."""
+    assert not hasattr(replacement, "__dict__")
+    assert pickle.loads(pickle.dumps(replacement)) == replacement
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    [
+        RedactionStrategy(),
+        MaskingStrategy(),
+        PseudonymizationStrategy(mapping=lambda text, entity: "[PSEUDONYM]"),
+    ],
+)
+def test_strategy_replacements_json(strategy, tmp_path):
+    """Test that the replacements of the strategies are serialized to JSON."""
+    text = "John Doe was born on 2000-01-01."
+    entities = [Entity("John Doe", "name", 0, 8), Entity("2000-01-01", "date", 21, 31)]
+    _, replacements = strategy.anonymize(text, entities)
+    assert json.loads(json.dumps(replacements)) == replacements
+
+    path = tmp_path / "replacements.json"
+    write_json(replacements, str(path))
+    assert json.loads(path.read_text(encoding="utf-8")) == replacements
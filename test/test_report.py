@@ -0,0 +1,97 @@
+"""Tests for anonipy.anonymize.report."""
+
+import json
+
+import pytest
+
+from anonipy.anonymize.report import RunReport, create_file_record, record_duration
+
+# =====================================
+# Test RunReport
+# =====================================
+
+
+def _create_record(file, total_s, status="anonymized", skip_reason=None):
+    record = create_file_record(file, 1_000_000)
+    record.update(
+        {
+            "status": status,
+            "skip_reason": skip_reason,
+            "total_s": total_s,
+            "entities": 2 if status == "anonymized" else 0,
+            "entities_per_label": {"name": 2} if status == "anonymized" else {},
+        }
+    )
+    return record
+
+
+def test_init_invalid_slowest_count():
+    """Test that a negative slowest_count raises ValueError."""
+    with pytest.raises(ValueError):
+        RunReport(slowest_count=-1)
+
+
+def test_record_duration():
+    """Test that the stage durations are accumulated."""
+    record = create_file_record("example.txt")
+    with record_duration(record, "extract"):
+        pass
+    first = record["extract_s"]
+    with record_duration(record, "extract"):
+        pass
+    assert record["extract_s"] >= first > 0
+    with record_duration(None, "extract"):
+        pass
+
+
+def test_get_summary_empty():
+    """Test the summary of the report without files."""
+    summary = RunReport().get_summary()
+    assert summary["files"] == 0
+    assert summary["docs_per_s"] == 0
+    assert summary["latency_s"]["total"]["p99"] == 0
+
+
+def test_get_summary():
+    """Test the aggregate statistics of the report."""
+    report = RunReport(slowest_count=2)
+    for i in range(1, 10):
+        report.add_file(_create_record(f"file{i}.txt", i / 10))
+    report.add_file(_create_record("empty.txt", 0.0, "skipped", "empty"))
+    report.add_file(_create_record("broken.txt", 0.0, "failed", "error: broken"))
+
+    summary = report.get_summary()
+    # without the start time, the duration is the sum of the file durations
+    assert summary["duration_s"] == pytest.approx(4.5)
+    assert summary["files"] == 11
+    assert (summary["anonymized"], summary["skipped"], summary["failed"]) == (9, 1, 1)
+    assert summary["skip_reasons"] == {"empty": 1, "error: broken": 1}
+    assert summary["entities_per_label"] == {"name": 18}
+    assert summary["docs_per_s"] == pytest.approx(11 / 4.5)
+    assert summary["mb_per_s"] == pytest.approx(11 / 4.5)
+    assert summary["entities_per_s"] == pytest.approx(18 / 4.5)
+    assert summary["latency_s"]["total"]["p50"] == pytest.approx(0.4)
+    assert summary["latency_s"]["total"]["max"] == pytest.approx(0.9)
+    assert [f["file"] for f in summary["slowest_files"]] == ["file9.txt", "file8.txt"]
+
+
+def test_save(tmp_path):
+    """Test that the report is saved as JSON and CSV."""
+    report = RunReport()
+    report.start()
+    report.add_file(_create_record("b.txt", 0.2))
+    report.add_file(_create_record("a.txt", 0.1))
+    report.stop()
+
+    report.save(str(tmp_path / "report.json"))
+    saved = json.loads((tmp_path / "report.json").read_text(encoding="utf-8"))
+    assert saved["summary"]["files"] == 2
+    assert [record["file"] for record in saved["files"]] == ["a.txt", "b.txt"]
+
+    report.save(str(tmp_path / "nested" / "report.txt"), format="CSV")
+    lines = (tmp_path / "nested" / "report.txt").read_text(encoding="utf-8").splitlines()
+    assert lines[0].startswith("file,output_file,status,skip_reason,size_bytes")
+    assert len(lines) == 3
+
+    with pytest.raises(ValueError):
+        report.save(str(tmp_path / "report.xml"))
@@ -0,0 +1,278 @@
+"""Tests for anonipy.serve."""
+
+import json
+import asyncio
+import threading
+import http.client
+
+import pytest
+
+from anonipy.anonymize.async_anonymizer import AsyncAnonymizer
+from anonipy.anonymize.config import build_extractor, build_strategy
+from anonipy.anonymize.extractors import ExtractorInterface, PatternExtractor
+from anonipy.anonymize.strategies import RedactionStrategy
+from anonipy.serve import AnonymizationServer, _parse_args
+
+# =====================================
+# Test Data
+# =====================================
+
+TEST_TEXT = "John Doe was born on 1995-01-01."
+TEST_LABELS = [{"label": "date", "type": "date", "regex": r"\d{4}-\d{2}-\d{2}"}]
+
+
+class _BlockingExtractor(ExtractorInterface):
+    """Extractor stand-in that blocks until it is released."""
+
+    def __init__(self, extractor):
+        self.extractor = extractor
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self, text, *args, **kwargs):
+        self.started.set()
+        self.release.wait(timeout=10)
+        return self.extractor(text, *args, **kwargs)
+
+
+@pytest.fixture(scope="module")
+def pattern_extractor():
+    return PatternExtractor(TEST_LABELS)
+
+
+def _request(port, method, path, body=None, raw=None):
+    """Send the request and return the status, headers and JSON payload."""
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    try:
+        data = raw if raw is not None else (json.dumps(body) if body else None)
+        connection.request(method, path, body=data)
+        response = connection.getresponse()
+        return response.status, dict(response.getheaders()), json.loads(response.read())
+    finally:
+        connection.close()
+
+
+async def _raw_request(port, data):
+    """Send the raw request bytes and return the response status."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        writer.write(data)
+        await writer.drain()
+        status_line = await reader.readline()
+        return int(status_line.split()[1])
+    finally:
+        writer.close()
+
+
+def _run_server(anonymizer, test, **kwargs):
+    """Run the test coroutine against the started server."""
+
+    async def main():
+        server = AnonymizationServer(anonymizer, port=0, **kwargs)
+        await server.start()
+        try:
+            return await test(server)
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+# =====================================
+# Test AnonymizationServer
+# =====================================
+
+
+def test_health_and_metrics(pattern_extractor):
+    """Test the health and metrics endpoints."""
+
+    async def test(server):
+        health = await asyncio.to_thread(_request, server.port, "GET", "/health")
+        await asyncio.to_thread(
+            _request, server.port, "POST", "/extract", {"text": TEST_TEXT}
+        )
+        metrics = await asyncio.to_thread(_request, server.port, "GET", "/metrics")
+        return health, metrics
+
+    health, metrics = _run_server(AsyncAnonymizer(pattern_extractor), test)
+    assert health[0] == 200 and health[2] == {"status": "ok"}
+    status, _, payload = metrics
+    assert status == 200
+    assert payload["requests"] == {"/health": 1, "/extract": 1, "/metrics": 1}
+    assert payload["responses"] == {"200": 2}
+    assert payload["processed_texts"] == 1
+    assert payload["batches"] == 1
+
+
+def test_extract(pattern_extractor):
+    """Test the extract endpoint."""
+
+    async def test(server):
+        return await asyncio.to_thread(
+            _request, server.port, "POST", "/extract", {"text": TEST_TEXT}
+        )
+
+    status, _, payload = _run_server(AsyncAnonymizer(pattern_extractor), test)
+    assert status == 200
+    assert payload == {
+        "entities": [
+            {
+                "text": "1995-01-01",
+                "label": "date",
+                "start_index": 21,
+                "end_index": 31,
+                "score": 1.0,
+                "type": "date",
+            }
+        ]
+    }
+
+
+def test_anonymize_batches(pattern_extractor):
+    """Test that the concurrent requests are anonymized in batches."""
+    anonymizer = AsyncAnonymizer(
+        pattern_extractor, RedactionStrategy(), max_batch_size=8, max_wait_ms=50
+    )
+    texts = [f"Sent on 2024-01-{i + 1:02d}." for i in range(8)]
+
+    async def test(server):
+        single = await asyncio.gather(
+            *[
+                asyncio.to_thread(
+                    _request, server.port, "POST", "/anonymize", {"text": text}
+                )
+                for text in texts
+            ]
+        )
+        multiple = await asyncio.to_thread(
+            _request, server.port, "POST", "/anonymize", {"texts": texts}
+        )
+        return single, multiple
+
+    single, multiple = _run_server(anonymizer, test)
+    assert [payload["anonymized_text"] for _, _, payload in single] == [
+        "Sent on [REDACTED]."
+    ] * 8
+    status, _, payload = multiple
+    assert status == 200
+    assert [r["anonymized_text"] for r in payload["results"]] == [
+        "Sent on [REDACTED]."
+    ] * 8
+    assert payload["results"][0]["replacements"][0]["original_text"] == "2024-01-01"
+    assert anonymizer.stats["requests"] == 16
+    assert anonymizer.stats["batches"] < 16
+
+
+def test_invalid_requests(pattern_extractor):
+    """Test the responses to the invalid requests."""
+
+    async def test(server):
+        port = server.port
+        return await asyncio.gather(
+            asyncio.to_thread(_request, port, "GET", "/missing"),
+            asyncio.to_thread(_request, port, "GET", "/extract"),
+            asyncio.to_thread(_request, port, "POST", "/extract", raw="not json"),
+            asyncio.to_thread(_request, port, "POST", "/extract", {"texts": [1]}),
+            asyncio.to_thread(_request, port, "POST", "/anonymize", {"text": "a"}),
+            asyncio.to_thread(_request, port, "POST", "/extract", {"text": "a" * 100}),
+        )
+
+    responses = _run_server(AsyncAnonymizer(pattern_extractor), test, max_body_size=64)
+    assert [status for status, _, _ in responses] == [404, 405, 400, 400, 501, 413]
+    assert responses[1][1]["Allow"] == "POST"
+
+
+def test_malformed_requests(pattern_extractor):
+    """Test the responses to the requests the server cannot read."""
+    body = json.dumps({"text": TEST_TEXT}).encode()
+    requests = [
+        # the request line is longer than the stream limit
+        b"GET /" + b"a" * 70000 + b" HTTP/1.1\r\n\r\n",
+        # the header line is longer than the stream limit
+        b"GET /health HTTP/1.1\r\nX-Long: " + b"a" * 70000 + b"\r\n\r\n",
+        # too many header lines
+        b"GET /health HTTP/1.1\r\n" + b"X-Header: a\r\n" * 101 + b"\r\n",
+        # the chunked body
+        b"POST /extract HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n"
+        + f"{len(body):x}\r\n".encode()
+        + body
+        + b"\r\n0\r\n\r\n",
+        # an unsupported transfer encoding
+        b"POST /extract HTTP/1.1\r\nTransfer-Encoding: gzip\r\n\r\n",
+        # a negative content length
+        b"POST /extract HTTP/1.1\r\nContent-Length: -5\r\n\r\n",
+    ]
+
+    async def test(server):
+        return [await _raw_request(server.port, data) for data in requests]
+
+    statuses = _run_server(AsyncAnonymizer(pattern_extractor), test)
+    assert statuses == [400, 431, 431, 411, 501, 400]
+
+
+def test_backpressure(pattern_extractor):
+    """Test that the requests are rejected when the queue is full."""
+    extractor = _BlockingExtractor(pattern_extractor)
+    anonymizer = AsyncAnonymizer(
+        extractor, max_batch_size=1, max_wait_ms=0, max_queue_size=1
+    )
+
+    async def test(server):
+        port = server.port
+        # the first request is processed, the second waits in the queue
+        first = asyncio.create_task(
+            asyncio.to_thread(_request, port, "POST", "/extract", {"text": TEST_TEXT})
+        )
+        await asyncio.to_thread(extractor.started.wait, 10)
+        second = asyncio.create_task(
+            asyncio.to_thread(_request, port, "POST", "/extract", {"text": TEST_TEXT})
+        )
+        while anonymizer.queue_size < 1:
+            await asyncio.sleep(0.01)
+        rejected = await asyncio.to_thread(
+            _request, port, "POST", "/extract", {"text": TEST_TEXT}
+        )
+        extractor.release.set()
+        return await first, await second, rejected, server.get_metrics()
+
+    first, second, rejected, metrics = _run_server(anonymizer, test)
+    assert first[0] == 200 and second[0] == 200
+    assert rejected[0] == 503
+    assert rejected[1]["Retry-After"] == "1"
+    assert metrics["rejected_texts"] == 1
+
+
+def test_parse_args():
+    """Test the command line arguments."""
+    args = _parse_args(["--config", "config.yaml", "--port", "9000"])
+    assert args.config == "config.yaml"
+    assert args.port == 9000
+    assert args.max_queue_size == 1024
+    with pytest.raises(SystemExit):
+        _parse_args([])
+
+
+@pytest.mark.slow
+@pytest.mark.integration
+def test_anonymize_ner():
+    """Test the server with the configured named entity recognition model."""
+    config = {
+        "extractors": [
+            {
+                "type": "NERExtractor",
+                "lang": "ENGLISH",
+                "labels": [{"label": "name", "type": "string"}],
+            }
+        ],
+        "strategy": {"type": "RedactionStrategy"},
+    }
+    anonymizer = AsyncAnonymizer(build_extractor(config), build_strategy(config))
+
+    async def test(server):
+        return await asyncio.to_thread(
+            _request, server.port, "POST", "/anonymize", {"text": TEST_TEXT}
+        )
+
+    status, _, payload = _run_server(anonymizer, test)
+    assert status == 200
+    assert "John Doe" not in payload["anonymized_text"]
@@ -2,7 +2,7 @@
 
 import pytest
 
-from anonipy.definitions import Entity
+from anonipy.definitions import Entity, EntityBatch
 from anonipy.anonymize.strategies import (
     RedactionStrategy,
     MaskingStrategy,
@@ -311,3 +311,23 @@ def test_pseudonymization_strategy_empty_entities(pseudonymization_strategy):
     )
     assert anonymized_text == TEST_TEXT
     assert replacements == []
+
+
+# =====================================
+# Test Entity Batch
+# =====================================
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    ["redaction_strategy", "masking_strategy", "pseudonymization_strategy"],
+)
+def test_strategy_entity_batch(strategy, request):
+    """Test that the strategies anonymize the entity batch as the entity list."""
+    strategy = request.getfixturevalue(strategy)
+    batch = EntityBatch.from_entities(TEST_ENTITIES[::-1], TEST_TEXT)
+    anonymized_text, replacements = strategy.anonymize(TEST_TEXT, batch)
+    expected_text, expected_replacements = strategy.anonymize(TEST_TEXT, TEST_ENTITIES)
+    assert isinstance(replacements, EntityBatch)
+    assert anonymized_text == expected_text
+    assert replacements.to_replacements() == expected_replacements
@@ -0,0 +1,163 @@
+"""Tests for anonipy.anonymize.stream."""
+
+import itertools
+
+import pytest
+
+from anonipy.anonymize import anonymize_stream
+from anonipy.anonymize.stream import StreamAnonymizer
+from anonipy.anonymize.extractors import PatternExtractor
+from anonipy.anonymize.strategies import (
+    PseudonymizationStrategy,
+    RedactionStrategy,
+)
+
+# =====================================
+# Test Data
+# =====================================
+
+TEST_TEXT = "".join(
+    f"[{i:03d}] user john.doe{i % 3}@example.com logged in on 2024-01-{i % 28 + 1:02d}.\n"
+    for i in range(40)
+)
+
+
+def split_text(text, size):
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+@pytest.fixture(scope="module")
+def extractor():
+    return PatternExtractor(
+        [
+            {"label": "email", "type": "email", "regex": r"[\w.]+@example\.com"},
+            {"label": "date", "type": "date", "regex": r"\d{4}-\d{2}-\d{2}"},
+        ]
+    )
+
+
+# =====================================
+# Test StreamAnonymizer
+# =====================================
+
+
+def test_invalid_lookback(extractor):
+    """Test that a negative lookback raises ValueError."""
+    with pytest.raises(ValueError):
+        StreamAnonymizer(extractor, RedactionStrategy(), lookback=-1)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 50, 1000, 100000])
+@pytest.mark.parametrize("lookback", [0, 32, 256])
+def test_anonymize_stream(extractor, chunk_size, lookback):
+    """Test that the stream output matches the anonymized whole text."""
+    strategy = RedactionStrategy()
+    _, entities = extractor(TEST_TEXT)
+    expected, _ = strategy.anonymize(TEST_TEXT, entities)
+
+    chunks = split_text(TEST_TEXT, chunk_size)
+    anonymized_chunks = list(
+        anonymize_stream(iter(chunks), extractor, strategy, lookback=lookback)
+    )
+    if lookback >= 32:
+        # the entities crossing the chunk boundaries are found
+        assert "".join(anonymized_chunks) == expected
+    assert "".join(anonymized_chunks).count("\n") == TEST_TEXT.count("\n")
+
+
+def test_anonymize_stream_incremental(extractor):
+    """Test that the anonymized text is yielded before the stream ends."""
+    stream = StreamAnonymizer(extractor, RedactionStrategy(), lookback=64)
+
+    def chunks():
+        yield from split_text(TEST_TEXT[:500], 100)
+        raise RuntimeError("the stream broke")
+
+    iterator = stream(chunks())
+    first = next(iterator)
+    assert first and TEST_TEXT.startswith(first[:5])
+    with pytest.raises(RuntimeError):
+        list(iterator)
+
+
+def test_anonymize_stream_pseudonyms(extractor):
+    """Test that the entities are replaced consistently across the chunks."""
+    counter = itertools.count()
+    strategy = PseudonymizationStrategy(lambda text, entity: f"<{next(counter)}>")
+    stream = StreamAnonymizer(extractor, strategy, lookback=32)
+    anonymized = "".join(stream(split_text(TEST_TEXT, 64)))
+
+    assert stream.pseudonyms[("john.doe0@example.com", "email")] in anonymized
+    assert anonymized.count(stream.pseudonyms[("john.doe0@example.com", "email")]) == 14
+    assert len(stream.pseudonyms) == 3 + 28
+    assert stream.entities_count == 80
+
+
+def test_anonymize_stream_initial_pseudonyms(extractor):
+    """Test that the initial pseudonyms are reused."""
+    strategy = PseudonymizationStrategy(lambda text, entity: "<new>")
+    stream = StreamAnonymizer(
+        extractor,
+        strategy,
+        pseudonyms={("john.doe1@example.com", "email"): "<known>"},
+    )
+    anonymized = "".join(stream(split_text(TEST_TEXT, 100)))
+    assert anonymized.count("<known>") == 13
+    assert "john.doe1@example.com" not in anonymized
+
+
+def test_anonymize_stream_pseudonyms_bounded(extractor):
+    """Test that the least recently used pseudonyms are removed."""
+    counter = itertools.count()
+    strategy = PseudonymizationStrategy(lambda text, entity: f"<{next(counter)}>")
+    stream = StreamAnonymizer(extractor, strategy, lookback=32, max_pseudonyms=8)
+    anonymized = "".join(stream(split_text(TEST_TEXT, 64)))
+
+    assert len(stream.pseudonyms) == 8
+    # the emails are used on every line and are kept
+    assert {text for text, _ in stream.pseudonyms} >= {
+        f"john.doe{i}@example.com" for i in range(3)
+    }
+    assert anonymized.count(stream.pseudonyms[("john.doe0@example.com", "email")]) == 14
+    assert stream.entities_count == 80
+
+    with pytest.raises(ValueError):
+        StreamAnonymizer(extractor, strategy, max_pseudonyms=-1)
+
+
+def test_anonymize_stream_pseudonyms_per_label():
+    """Test that the same text with different labels is replaced separately."""
+    extractor = PatternExtractor(
+        [
+            {"label": "name", "type": "string", "regex": r"(?<=name )\w+"},
+            {"label": "city", "type": "string", "regex": r"(?<=city )\w+"},
+        ]
+    )
+    strategy = PseudonymizationStrategy(lambda text, entity: f"<{entity.label}>")
+    stream = StreamAnonymizer(extractor, strategy, lookback=16)
+    text = "name Paris.\n" + "no entities here.\n" * 5 + "city Paris.\n"
+    anonymized = "".join(stream(split_text(text, 20)))
+
+    assert anonymized.startswith("name <name>.\n")
+    assert anonymized.endswith("city <city>.\n")
+    assert stream.pseudonyms == {
+        ("Paris", "name"): "<name>",
+        ("Paris", "city"): "<city>",
+    }
+
+
+def test_anonymize_stream_entity_in_context():
+    """Test that the entity starting in the finalized context is anonymized in the buffer."""
+    # the address is longer than the lookback, so it is found only when
+    # its start is already finalized
+    extractor = PatternExtractor(
+        [{"label": "address", "type": "string", "regex": r"Street(?: \w+){5}"}]
+    )
+    text = "x " * 20 + "Street aaaa bbbb cccc dddd eeee" + " y" * 20
+    anonymized = "".join(
+        anonymize_stream(
+            iter(split_text(text, 1)), extractor, RedactionStrategy(), lookback=12
+        )
+    )
+    assert "[REDACTED]" in anonymized
+    assert "eeee" not in anonymized